@@ -0,0 +1,649 @@
+"""
+# Creation Date: 10/18/2026 05:30 PM EDT
+# Last Updated Date: 10/19/2026 09:40 AM EDT
+# Author: Joseph Armstrong (armstrongjoseph08@gmail.com)
+# File Name: benchmark_ufl_data.py
+# Purpose: Benchmarks the UFL PBP parser, the UFL game stats parser,
+    and the UFL season stats aggregations,
+    using the archived games in `usfl_game_logs/`.
+###############################################################################
+"""
+
+import json
+import logging
+import platform
+import tracemalloc
+from argparse import ArgumentParser
+from datetime import UTC, datetime
+from glob import glob
+from os import chdir, getcwd, makedirs
+from os.path import abspath
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+import get_ufl_game_stats
+from get_ufl_game_stats import combine_ufl_game_stats, parse_ufl_game_stats
+from get_ufl_pbp import (
+    PBP_PLAY_HANDLERS,
+    PBP_REGEX,
+    classify_play,
+    get_yardline,
+)
+from parse_ufl_season_stats import (
+    parse_ufl_player_season_stats,
+    parse_ufl_team_season_stats,
+)
+from utils import load_archived_game_json
+
+try:
+    # Not available on Windows.
+    import resource
+except ImportError:
+    resource = None
+
+
+# For these metrics, a higher number is better.
+# For every other metric, a lower number is better.
+HIGHER_IS_BETTER = (
+    "games_per_sec",
+    "plays_per_sec",
+    "calls_per_sec",
+)
+
+
+def get_benchmark_games(game_dirs: list) -> list:
+    """
+    Loads every archived game in `game_dirs`.
+
+    Parameters
+    ----------
+
+    `game_dirs` (list, mandatory):
+        The folders with archived FOX Sports event JSON files.
+
+    Returns
+    ----------
+    A `list` of `tuple`s, with the game ID, season and raw game JSON
+    of each game (sorted by file name).
+    """
+    games_arr = []
+
+    for game_dir in game_dirs:
+        for file_path in sorted(glob(f"{game_dir}/*.json")):
+            try:
+                game_json = load_archived_game_json(file_path)
+                game_id = int(game_json["header"]["id"])
+                season = int(
+                    str(game_json["header"]["eventTime"]).split("-")[0]
+                )
+            except Exception as e:
+                logging.warning(
+                    f"Skipping `{file_path}`. Full exception: {e}"
+                )
+                continue
+            games_arr.append((game_id, season, game_json))
+
+    return games_arr
+
+
+def get_benchmark_yardlines(games_arr: list) -> list:
+    """
+    Gets every (yardline, possession team) pair
+    `parser()` hands to `get_yardline()`.
+
+    Parameters
+    ----------
+
+    `games_arr` (list, mandatory):
+        The output of `get_benchmark_games()`.
+
+    Returns
+    ----------
+    A `list` of `tuple`s, with the yardline and possession team
+    of each play.
+    """
+    yardlines_arr = []
+
+    for _, _, game_json in games_arr:
+        team_abv = {}
+        for side in ("leftTeam", "rightTeam"):
+            team = game_json["header"][side]
+            team_abv[int(team["entityLink"]["layout"]["tokens"]["id"])] = (
+                team["name"]
+            )
+
+        for quarter in game_json["pbp"]["sections"]:
+            for drive in quarter["groups"]:
+                posteam = team_abv.get(
+                    int(drive["entityLink"]["layout"]["tokens"]["id"]), ""
+                )
+                for play in drive["plays"]:
+                    if play.get("subtitle") is not None:
+                        yardlines_arr.append((play["subtitle"], posteam))
+
+    return yardlines_arr
+
+
+def get_benchmark_plays(games_arr: list) -> list:
+    """
+    Gets every play description in `games_arr`,
+    cleaned up the same way `parser()` cleans them up.
+
+    Parameters
+    ----------
+
+    `games_arr` (list, mandatory):
+        The output of `get_benchmark_games()`.
+
+    Returns
+    ----------
+    A `list` of `tuple`s, with the play description,
+    possession team, defensive team and yardline (`yardline_100`)
+    of each play.
+    """
+    plays_arr = []
+
+    for _, _, game_json in games_arr:
+        team_abv = {}
+        for side in ("leftTeam", "rightTeam"):
+            team = game_json["header"][side]
+            team_abv[int(team["entityLink"]["layout"]["tokens"]["id"])] = (
+                team["name"]
+            )
+
+        for quarter in game_json["pbp"]["sections"]:
+            for drive in quarter["groups"]:
+                posteam = team_abv.get(
+                    int(drive["entityLink"]["layout"]["tokens"]["id"]), ""
+                )
+                defteam = "".join(
+                    x for x in team_abv.values() if x != posteam
+                )
+                for play in drive["plays"]:
+                    play_desc = play["playDescription"].replace(
+                        "Face Mask (15 Yards),", "Face Mask,"
+                    ).replace(" forced by. ", " forced by TEAM. ")
+                    for text in (
+                        "Alternative kickoff",
+                        "Alternative Kickoff",
+                        "alternative kickoff",
+                    ):
+                        play_desc = play_desc.replace(text, "")
+
+                    try:
+                        yardline_100 = get_yardline(
+                            play["subtitle"], posteam
+                        )
+                    except Exception:
+                        yardline_100 = 50
+
+                    plays_arr.append(
+                        (play_desc, posteam, defteam, yardline_100)
+                    )
+
+    return plays_arr
+
+
+def bench_parser(plays_arr: list) -> dict:
+    """
+    Runs the play parsing step of `parser()`
+    (`classify_play()`, then that play type's handler)
+    over every play.
+
+    DO NOT CALL DIRECTLY!
+
+    Plays `parser()` can't handle yet (ex. most plays
+    in `usfl_game_logs/`, which were written in an older format)
+    are counted, but aren't included in the throughput numbers.
+    """
+    parsed_plays = 0
+    failed_plays = 0
+    parse_time = 0.0
+
+    for play_desc, posteam, defteam, yardline_100 in plays_arr:
+        start_time = perf_counter()
+        try:
+            play_class = classify_play(play_desc.lower())
+
+            if play_class == "timeout":
+                PBP_REGEX["timeout"].search(play_desc)["timeout_team"]
+            elif play_class is not None:
+                PBP_PLAY_HANDLERS[play_class](
+                    {}, play_desc, posteam, defteam, yardline_100
+                )
+            elif len(play_desc) > 0:
+                raise ValueError(f"Unhandled play: {play_desc}")
+
+            if "penalty" in play_desc.lower():
+                PBP_REGEX["penalty"].search(play_desc)["penalty_type"]
+        except Exception:
+            failed_plays += 1
+            continue
+        parse_time += perf_counter() - start_time
+        parsed_plays += 1
+
+    return {
+        "plays": parsed_plays,
+        "failed_plays": failed_plays,
+        "seconds": parse_time,
+    }
+
+
+def bench_get_yardline(yardlines_arr: list) -> dict:
+    """
+    Runs `get_yardline()` over every play.
+
+    DO NOT CALL DIRECTLY!
+    """
+    start_time = perf_counter()
+    for yardline, posteam in yardlines_arr:
+        try:
+            get_yardline(yardline, posteam)
+        except Exception:
+            pass
+
+    return {
+        "calls": len(yardlines_arr),
+        "seconds": perf_counter() - start_time,
+    }
+
+
+def bench_game_stats(games_arr: list) -> dict:
+    """
+    Runs `parse_ufl_game_stats()` over every game,
+    and keeps track of how much of that time is spent in
+    `fox_sports_player_stats_parser()`.
+
+    DO NOT CALL DIRECTLY!
+    """
+    stats_parser = get_ufl_game_stats.fox_sports_player_stats_parser
+    stats_parser_time = [0.0, 0]
+
+    def timed_stats_parser(*args, **kwargs):
+        start_time = perf_counter()
+        try:
+            return stats_parser(*args, **kwargs)
+        finally:
+            stats_parser_time[0] += perf_counter() - start_time
+            stats_parser_time[1] += 1
+
+    stats_df_arr = {}
+    team_stats_df_arr = {}
+
+    get_ufl_game_stats.fox_sports_player_stats_parser = timed_stats_parser
+    start_time = perf_counter()
+    try:
+        for game_id, season, game_json in games_arr:
+            temp_df, temp_team_df = parse_ufl_game_stats(
+                game_json=game_json,
+                ufl_game_id=game_id,
+                season=season,
+                parse_team_stats=True
+            )
+            if len(temp_df) > 0:
+                stats_df_arr.setdefault(season, []).append(temp_df)
+            if len(temp_team_df) > 0:
+                team_stats_df_arr.setdefault(season, []).append(temp_team_df)
+    finally:
+        get_ufl_game_stats.fox_sports_player_stats_parser = stats_parser
+    game_stats_time = perf_counter() - start_time
+
+    return {
+        "games": len(games_arr),
+        "seconds": game_stats_time,
+        "fox_sports_player_stats_parser_calls": stats_parser_time[1],
+        "fox_sports_player_stats_parser_seconds": stats_parser_time[0],
+        "stats_df_arr": stats_df_arr,
+        "team_stats_df_arr": team_stats_df_arr,
+    }
+
+
+def bench_season_stats(stats_df_arr: dict, team_stats_df_arr: dict) -> dict:
+    """
+    Combines each season's game stats,
+    and runs the season stats aggregations on them.
+
+    DO NOT CALL DIRECTLY!
+    Everything is written to a temporary folder.
+    """
+    combine_time = 0.0
+    player_time = 0.0
+    team_time = 0.0
+    start_dir = getcwd()
+
+    with TemporaryDirectory() as temp_dir:
+        chdir(temp_dir)
+        try:
+            for folder in (
+                "game_stats/player",
+                "game_stats/team",
+                "season_stats/player",
+                "season_stats/team",
+            ):
+                makedirs(folder, exist_ok=True)
+
+            for season in sorted(stats_df_arr.keys()):
+                start_time = perf_counter()
+                combine_ufl_game_stats(
+                    stats_df_arr=stats_df_arr[season],
+                    team_stats_df_arr=team_stats_df_arr.get(season, []),
+                    season=season,
+                    parse_team_stats=True,
+                    save_csv=True
+                )
+                combine_time += perf_counter() - start_time
+
+                start_time = perf_counter()
+                parse_ufl_player_season_stats(season)
+                player_time += perf_counter() - start_time
+
+                start_time = perf_counter()
+                parse_ufl_team_season_stats(season)
+                team_time += perf_counter() - start_time
+        finally:
+            chdir(start_dir)
+
+    return {
+        "seasons": len(stats_df_arr),
+        "combine_ufl_game_stats_seconds": combine_time,
+        "parse_ufl_player_season_stats_seconds": player_time,
+        "parse_ufl_team_season_stats_seconds": team_time,
+    }
+
+
+def run_benchmarks(games_arr: list, repeat: int = 3) -> dict:
+    """
+    Runs every benchmark `repeat` times,
+    and keeps the fastest time for each one.
+
+    Parameters
+    ----------
+
+    `games_arr` (list, mandatory):
+        The output of `get_benchmark_games()`.
+
+    `repeat` (int, optional):
+        How many times each benchmark is run.
+
+    Returns
+    ----------
+    A `dict` with the results of each benchmark.
+    """
+    yardlines_arr = get_benchmark_yardlines(games_arr)
+    plays_arr = get_benchmark_plays(games_arr)
+    timings = {}
+    results = {}
+
+    def add_timing(name: str, seconds: float):
+        timings.setdefault(name, []).append(seconds)
+
+    for _ in range(max(1, repeat)):
+        parser_results = bench_parser(plays_arr)
+        add_timing("parser", parser_results["seconds"])
+
+        yardline_results = bench_get_yardline(yardlines_arr)
+        add_timing("get_yardline", yardline_results["seconds"])
+
+        game_stats_results = bench_game_stats(games_arr)
+        add_timing("parse_ufl_game_stats", game_stats_results["seconds"])
+        add_timing(
+            "fox_sports_player_stats_parser",
+            game_stats_results["fox_sports_player_stats_parser_seconds"]
+        )
+
+        season_results = bench_season_stats(
+            game_stats_results["stats_df_arr"],
+            game_stats_results["team_stats_df_arr"]
+        )
+        for key in (
+            "combine_ufl_game_stats",
+            "parse_ufl_player_season_stats",
+            "parse_ufl_team_season_stats",
+        ):
+            add_timing(key, season_results[f"{key}_seconds"])
+
+    for key, seconds_arr in timings.items():
+        results[key] = {
+            "best_seconds": float(np.min(seconds_arr)),
+            "mean_seconds": float(np.mean(seconds_arr)),
+        }
+
+    parser_seconds = results["parser"]["best_seconds"]
+    results["parser"]["plays"] = parser_results["plays"]
+    results["parser"]["failed_plays"] = parser_results["failed_plays"]
+    results["parser"]["plays_per_sec"] = (
+        parser_results["plays"] / parser_seconds if parser_seconds > 0 else 0
+    )
+
+    yardline_seconds = results["get_yardline"]["best_seconds"]
+    results["get_yardline"]["calls"] = yardline_results["calls"]
+    results["get_yardline"]["calls_per_sec"] = (
+        yardline_results["calls"] / yardline_seconds
+        if yardline_seconds > 0 else 0
+    )
+
+    game_stats_seconds = results["parse_ufl_game_stats"]["best_seconds"]
+    results["parse_ufl_game_stats"]["games"] = game_stats_results["games"]
+    results["parse_ufl_game_stats"]["games_per_sec"] = (
+        game_stats_results["games"] / game_stats_seconds
+        if game_stats_seconds > 0 else 0
+    )
+    results["fox_sports_player_stats_parser"]["calls"] = (
+        game_stats_results["fox_sports_player_stats_parser_calls"]
+    )
+    results["season_stats"] = {"seasons": season_results["seasons"]}
+
+    return results
+
+
+def get_peak_memory(games_arr: list) -> dict:
+    """
+    Runs every benchmark once more with `tracemalloc`,
+    to get the peak memory use (in MB) of each one.
+
+    This is done separately from `run_benchmarks()`,
+    because `tracemalloc` slows everything down.
+
+    Parameters
+    ----------
+
+    `games_arr` (list, mandatory):
+        The output of `get_benchmark_games()`.
+
+    Returns
+    ----------
+    A `dict` with the peak memory use of each benchmark.
+    """
+    peak_memory = {}
+    yardlines_arr = get_benchmark_yardlines(games_arr)
+    plays_arr = get_benchmark_plays(games_arr)
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        bench_parser(plays_arr)
+        peak_memory["parser"] = tracemalloc.get_traced_memory()[1]
+
+        tracemalloc.reset_peak()
+        bench_get_yardline(yardlines_arr)
+        peak_memory["get_yardline"] = tracemalloc.get_traced_memory()[1]
+
+        tracemalloc.reset_peak()
+        game_stats_results = bench_game_stats(games_arr)
+        peak_memory["parse_ufl_game_stats"] = (
+            tracemalloc.get_traced_memory()[1]
+        )
+
+        tracemalloc.reset_peak()
+        bench_season_stats(
+            game_stats_results["stats_df_arr"],
+            game_stats_results["team_stats_df_arr"]
+        )
+        peak_memory["season_stats"] = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    peak_memory = {
+        key: round(value / (1024 * 1024), 2)
+        for key, value in peak_memory.items()
+    }
+
+    if resource is not None:
+        # `ru_maxrss` is in KB on Linux, and in bytes on macOS.
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if platform.system() == "Darwin":
+            max_rss /= 1024
+        peak_memory["process_max_rss"] = round(max_rss / 1024, 2)
+
+    return peak_memory
+
+
+def get_benchmark_metrics(results: dict) -> dict:
+    """
+    Flattens benchmark results into `{"section.metric": value}`,
+    so two runs can be compared.
+
+    Parameters
+    ----------
+
+    `results` (dict, mandatory):
+        Benchmark results (as saved by this script).
+
+    Returns
+    ----------
+    A `dict` with every numeric metric in `results`.
+    """
+    metrics = {}
+
+    for key, value in results["benchmarks"].items():
+        for metric, metric_value in value.items():
+            if metric.endswith("_seconds") or metric.endswith("_per_sec"):
+                metrics[f"{key}.{metric}"] = metric_value
+
+    for key, value in results["peak_memory_mb"].items():
+        metrics[f"peak_memory_mb.{key}"] = value
+
+    return metrics
+
+
+def compare_benchmarks(
+    results: dict,
+    baseline: dict,
+    max_regression: float = None,
+) -> bool:
+    """
+    Prints how each metric changed compared to a baseline run.
+
+    Parameters
+    ----------
+
+    `results` (dict, mandatory):
+        The results of this run.
+
+    `baseline` (dict, mandatory):
+        The results of the baseline run.
+
+    `max_regression` (float, optional):
+        If set, any metric that got worse by more than this percentage
+        counts as a regression.
+
+    Returns
+    ----------
+    `True` if no metric regressed by more than `max_regression`,
+    `False` otherwise.
+    """
+    new_metrics = get_benchmark_metrics(results)
+    old_metrics = get_benchmark_metrics(baseline)
+    passed = True
+
+    print(f"{'metric':<55} {'baseline':>12} {'current':>12} {'change':>9}")
+    for metric, new_value in new_metrics.items():
+        if metric not in old_metrics:
+            continue
+        old_value = old_metrics[metric]
+
+        if old_value == 0:
+            print(f"{metric:<55} {old_value:>12.4f} {new_value:>12.4f}")
+            continue
+
+        change = (new_value - old_value) / old_value * 100
+        # Positive `regression` numbers always mean "worse".
+        if metric.endswith(HIGHER_IS_BETTER):
+            regression = -change
+        else:
+            regression = change
+
+        flag = ""
+        if max_regression is not None and regression > max_regression:
+            flag = "  REGRESSION"
+            passed = False
+
+        print(
+            f"{metric:<55} {old_value:>12.4f} {new_value:>12.4f} "
+            + f"{change:>+8.1f}%{flag}"
+        )
+
+    return passed
+
+
+if __name__ == "__main__":
+    arg_parser = ArgumentParser()
+
+    arg_parser.add_argument(
+        "--game_dir", default=["usfl_game_logs"], nargs="+"
+    )
+    arg_parser.add_argument(
+        "--repeat", default=3, type=int
+    )
+    arg_parser.add_argument(
+        "--output", default="benchmark_results.json", type=str
+    )
+    arg_parser.add_argument(
+        "--baseline", default=None, type=str
+    )
+    arg_parser.add_argument(
+        "--max_regression", default=None, type=float
+    )
+
+    args = arg_parser.parse_args()
+
+    games_arr = get_benchmark_games(args.game_dir)
+    if len(games_arr) == 0:
+        raise FileNotFoundError(f"No games found in {args.game_dir}.")
+
+    # The parsers log every play they can't fully handle.
+    logging.disable(logging.WARNING)
+    benchmark_results = {
+        "created": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "game_dirs": args.game_dir,
+        "games": len(games_arr),
+        "repeat": args.repeat,
+        "benchmarks": run_benchmarks(games_arr, repeat=args.repeat),
+        "peak_memory_mb": get_peak_memory(games_arr),
+    }
+    logging.disable(logging.NOTSET)
+
+    with open(args.output, "w+") as f:
+        f.write(json.dumps(benchmark_results, indent=4))
+
+    print(json.dumps(benchmark_results["benchmarks"], indent=4))
+    print(json.dumps(benchmark_results["peak_memory_mb"], indent=4))
+    print(f"Results saved to `{abspath(args.output)}`.")
+
+    if args.baseline is not None:
+        with open(args.baseline, "r") as f:
+            baseline_results = json.loads(f.read())
+
+        if compare_benchmarks(
+            benchmark_results,
+            baseline_results,
+            max_regression=args.max_regression
+        ) is False:
+            raise SystemExit(1)
@@ -0,0 +1,227 @@
+"""
+# Creation Date: 10/18/2026 03:00 PM EDT
+# Last Updated Date: 10/19/2026 10:40 AM EDT
+# Author: Joseph Armstrong (armstrongjoseph08@gmail.com)
+# File Name: get_ufl_game_data.py
+# Purpose: Allows one to get UFL play-by-play (PBP) data
+    and UFL game stats, while only downloading each game once.
+###############################################################################
+"""
+
+import logging
+from argparse import ArgumentParser, BooleanOptionalAction
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from os import mkdir
+
+import pandas as pd
+from tqdm import tqdm
+
+from get_ufl_game_stats import (
+    combine_ufl_game_stats,
+    get_game_stats_manifest_entry,
+    parse_ufl_game_stats,
+    save_raw_game_json,
+)
+from get_ufl_pbp import combine_ufl_pbp, get_week_num, parser
+from utils import get_fox_api_key, get_played_ufl_games, get_ufl_event_json
+
+
+def get_ufl_game_data(
+    season: int,
+    parse_team_stats: bool = False,
+    save_csv: bool = False,
+    save_parquet: bool = False,
+    save_json: bool = False,
+    max_workers: int = 8,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Retrieves UFL play-by-play (PBP) data and UFL game stats
+    in one pass.
+
+    Both `get_ufl_pbp()` and `get_ufl_game_stats()`
+    need the same FOX Sports event data for each game.
+    This downloads each game once,
+    and hands the same JSON to both parsers.
+
+    Parameters
+    ----------
+
+    `season` (int, mandatory):
+        Mandatory argument.
+        Indicates the season you want UFL data from.
+
+    `parse_team_stats` (bool, optional):
+        Optional argument.
+        If set to `True`, `get_ufl_game_data()` will parse
+        team game stats at the same time.
+
+    `save_csv` (bool, optional):
+        Optional argument.
+        If set to `True`, `get_ufl_game_data()` will save
+        the resulting `DataFrame`s to `.csv` files.
+
+    `save_parquet` (bool, optional):
+        Optional argument.
+        If set to `True`, `get_ufl_game_data()` will save
+        the resulting `DataFrame`s to `.parquet` files.
+
+    `save_json` (bool, optional):
+        Optional argument.
+        If set to `True`, `get_ufl_game_data()` will save
+        the raw `.json` files for each UFL game.
+
+    `max_workers` (int, optional):
+        Optional argument.
+        How many games can be downloaded at the same time.
+
+    Returns
+    ----------
+    A `tuple` with two pandas `DataFrame`s,
+    UFL PBP data and UFL player game stats (in that order).
+    """
+    fox_key = get_fox_api_key()
+    pbp_df = pd.DataFrame()
+    pbp_df_arr = []
+
+    stats_df = pd.DataFrame()
+    stats_df_arr = []
+    team_stats_df_arr = []
+    # Every game in the game stats files this saves
+    # (see `load_game_stats_manifest()`).
+    manifest = {}
+
+    schedule_df = get_played_ufl_games(season)
+
+    ufl_game_id_arr = schedule_df["ufl_game_id"].to_numpy()
+    ufl_game_type_arr = schedule_df["season_type"].to_numpy()
+    week_title_arr = schedule_df["week_title"].to_numpy()
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        game_json_iter = executor.map(
+            lambda x: get_ufl_event_json(
+                ufl_game_id=x,
+                fox_key=fox_key
+            ),
+            ufl_game_id_arr
+        )
+
+        for g, game_json in enumerate(
+            tqdm(game_json_iter, total=len(ufl_game_id_arr))
+        ):
+            ufl_game_id = ufl_game_id_arr[g]
+
+            if save_json is True:
+                save_raw_game_json(
+                    game_json=game_json,
+                    ufl_game_id=ufl_game_id
+                )
+
+            plays_df = parser(
+                game_json=game_json,
+                ufl_game_id=ufl_game_id,
+                season=season,
+                season_type=ufl_game_type_arr[g],
+                week=get_week_num(week_title_arr[g])
+            )
+            pbp_df_arr.append(plays_df)
+
+            temp_df, temp_team_df = parse_ufl_game_stats(
+                game_json=game_json,
+                ufl_game_id=ufl_game_id,
+                season=season,
+                parse_team_stats=parse_team_stats
+            )
+            manifest[str(ufl_game_id)] = get_game_stats_manifest_entry(
+                game_json=game_json,
+                parse_team_stats=parse_team_stats
+            )
+
+            if len(temp_df) > 0:
+                stats_df_arr.append(temp_df)
+            if len(temp_team_df) > 0:
+                team_stats_df_arr.append(temp_team_df)
+
+            del game_json
+            del plays_df
+            del temp_df
+            del temp_team_df
+
+    del fox_key
+
+    pbp_df = combine_ufl_pbp(
+        pbp_df_arr=pbp_df_arr,
+        season=season,
+        save_csv=save_csv,
+        save_parquet=save_parquet
+    )
+
+    if len(stats_df_arr) > 0:
+        stats_df = combine_ufl_game_stats(
+            stats_df_arr=stats_df_arr,
+            team_stats_df_arr=team_stats_df_arr,
+            season=season,
+            parse_team_stats=parse_team_stats,
+            save_csv=save_csv,
+            save_parquet=save_parquet,
+            manifest=manifest
+        )
+    else:
+        logging.warning(
+            f"No boxscores found for the {season} UFL season."
+        )
+
+    return pbp_df, stats_df
+
+
+if __name__ == "__main__":
+    now = datetime.now()
+
+    try:
+        mkdir("game_stats/player")
+    except Exception as e:
+        logging.warning(
+            f"Unhandled exception {e}"
+        )
+
+    try:
+        mkdir("game_stats/team")
+    except Exception as e:
+        logging.warning(
+            f"Unhandled exception {e}"
+        )
+    arg_parser = ArgumentParser()
+
+    arg_parser.add_argument(
+        "--save_csv", default=False, action=BooleanOptionalAction
+    )
+    arg_parser.add_argument(
+        "--save_parquet", default=False, action=BooleanOptionalAction
+    )
+    arg_parser.add_argument(
+        "--save_json", default=False, action=BooleanOptionalAction
+    )
+    arg_parser.add_argument(
+        "--max_workers", default=8, type=int
+    )
+
+    args = arg_parser.parse_args()
+
+    if now.month >= 3:
+        get_ufl_game_data(
+            season=now.year,
+            parse_team_stats=True,
+            save_csv=args.save_csv,
+            save_parquet=args.save_parquet,
+            save_json=args.save_json,
+            max_workers=args.max_workers,
+        )
+    else:
+        get_ufl_game_data(
+            season=now.year-1,
+            parse_team_stats=True,
+            save_csv=args.save_csv,
+            save_parquet=args.save_parquet,
+            save_json=args.save_json,
+            max_workers=args.max_workers,
+        )
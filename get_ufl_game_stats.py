@@ -1,6 +1,6 @@
 """
 # Creation Date: 04/01/2024 03:00 PM EDT
-# Last Updated Date: 05/17/2024 06:45 PM EDT
+# Last Updated Date: 10/19/2026 12:10 PM EDT
 # Author: Joseph Armstrong (armstrongjoseph08@gmail.com)
 # File Name: get_ufl_schedules.py
 # Purpose: Allows one to get UFL schedule data.
@@ -9,16 +9,308 @@
 
 from argparse import ArgumentParser, BooleanOptionalAction
 from datetime import UTC, datetime
+from hashlib import sha256
 import json
 import logging
 from os import mkdir
+from os.path import exists
 # import time
 
+import numpy as np
 import pandas as pd
-import requests
 from tqdm import tqdm
 
-from utils import get_fox_api_key
+from ufl_teams import get_event_teams
+from utils import (
+    get_archived_ufl_games,
+    get_fox_api_key,
+    get_played_ufl_games,
+    get_ufl_event_json,
+    load_archived_game_json,
+    write_file_atomic,
+)
+
+# The version of the game stats parser.
+# Bump this whenever a change to the parser changes its output,
+# so `get_ufl_game_stats(incremental=True)` reparses every game.
+GAME_STATS_PARSE_VERSION = 2
+
+# Where the game stats manifest for each season is saved
+# (see `load_game_stats_manifest()`).
+GAME_STATS_MANIFEST_PATH = "game_stats/{season}_ufl_game_stats_manifest.json"
+
+# How every player game stat is read from a FOX Sports boxscore.
+# Each column maps to `(stat type, source column index, parser, dtype)`.
+# - The stat type is the boxscore table the stat is in (ex. "PASSING").
+# - The source column index is where the stat is in each row of that table.
+# - The parser turns that column's text into numbers
+#   (see `parse_stat_text()`).
+# - The dtype is what the column is stored as.
+#   Not every player has every stat, so whole numbers are stored
+#   as nullable pandas integers (`Int16`) instead of `float64`.
+PLAYER_GAME_STATS_SCHEMA = {
+    # Passing
+    "passing_COMP": ("PASSING", 1, "made", "Int16"),
+    "passing_ATT": ("PASSING", 1, "attempted", "Int16"),
+    "passing_YDS": ("PASSING", 3, "int", "Int16"),
+    "passing_TD": ("PASSING", 5, "int", "Int16"),
+    "passing_INT": ("PASSING", 6, "int", "Int16"),
+    "passing_NFL_QBR": ("PASSING", 7, "float", "float32"),
+    # Rushing
+    "rushing_ATT": ("RUSHING", 1, "int", "Int16"),
+    "rushing_YDS": ("RUSHING", 2, "int", "Int16"),
+    "rushing_TD": ("RUSHING", 4, "int", "Int16"),
+    "rushing_LONG": ("RUSHING", 5, "int", "Int16"),
+    # Receiving
+    "receiving_REC": ("RECEIVING", 1, "int", "Int16"),
+    "receiving_YDS": ("RECEIVING", 2, "int", "Int16"),
+    "receiving_TD": ("RECEIVING", 4, "int", "Int16"),
+    "receiving_LONG": ("RECEIVING", 5, "int", "Int16"),
+    "receiving_TGT": ("RECEIVING", 6, "int", "Int16"),
+    # Defense
+    "defense_TAK": ("DEFENSIVE", 1, "int", "Int16"),
+    "defense_SOLO": ("DEFENSIVE", 2, "int", "Int16"),
+    "defense_SACKS": ("DEFENSIVE", 3, "float", "float32"),
+    "defense_TFL": ("DEFENSIVE", 4, "int", "Int16"),
+    "defense_INT": ("DEFENSIVE", 5, "int", "Int16"),
+    "defense_PD": ("DEFENSIVE", 6, "int", "Int16"),
+    "defense_TD": ("DEFENSIVE", 7, "int", "Int16"),
+    # Fumbles
+    "fumbles_FUM": ("FUMBLES", 1, "int", "Int16"),
+    "fumbles_FUM_LOST": ("FUMBLES", 2, "int", "Int16"),
+    "defense_FF": ("FUMBLES", 3, "int", "Int16"),
+    "defense_FR": ("FUMBLES", 4, "int", "Int16"),
+    # Kick Return
+    "kick_return_KR": ("KICK RETURN", 1, "int", "Int16"),
+    "kick_return_YDS": ("KICK RETURN", 2, "int", "Int16"),
+    "kick_return_LONG": ("KICK RETURN", 4, "int", "Int16"),
+    "kick_return_TD": ("KICK RETURN", 5, "int", "Int16"),
+    # Punt Return
+    "punt_return_PR": ("PUNT RETURN", 1, "int", "Int16"),
+    "punt_return_YDS": ("PUNT RETURN", 2, "int", "Int16"),
+    "punt_return_LONG": ("PUNT RETURN", 4, "int", "Int16"),
+    "punt_return_TD": ("PUNT RETURN", 5, "int", "Int16"),
+    # Kicking (FG)
+    "kicking_FGM": ("KICKING", 1, "made", "Int16"),
+    "kicking_FGA": ("KICKING", 1, "attempted", "Int16"),
+    # FOX Sports shows "-" if a kicker didn't attempt a field goal.
+    "kicking_FG%": ("KICKING", 2, "float_or_na", "float32"),
+    "kicking_FG_LONG": ("KICKING", 3, "int_or_zero", "Int16"),
+    # Punting
+    "punting_NO": ("PUNTING", 1, "int", "Int16"),
+    "punting_AVG": ("PUNTING", 2, "float", "float32"),
+    "punting_IN_20": ("PUNTING", 3, "int", "Int16"),
+    "punting_TB": ("PUNTING", 4, "int", "Int16"),
+    "punting_LONG": ("PUNTING", 5, "int", "Int16"),
+    "punting_BLK": ("PUNTING", 6, "int", "Int16"),
+}
+
+# Every stat category (boxscore table) in a FOX Sports boxscore
+# that `fox_sports_player_stats_parser()` knows how to parse,
+# and the `(column, source column index)` of every stat in it.
+FOX_SPORTS_STAT_TYPES = {
+    stat_type: tuple(
+        (column, x[1])
+        for column, x in PLAYER_GAME_STATS_SCHEMA.items()
+        if x[0] == stat_type
+    )
+    for stat_type in dict.fromkeys(
+        x[0] for x in PLAYER_GAME_STATS_SCHEMA.values()
+    )
+}
+
+# The dtype of every stat column in player game stats,
+# including the ones calculated from other stats.
+PLAYER_GAME_STATS_DTYPES = {
+    column: x[3] for column, x in PLAYER_GAME_STATS_SCHEMA.items()
+} | {
+    "passing_COMP%": "float32",
+    "passing_Y/A": "float32",
+    "passing_AY/A": "float32",
+    "passing_Y/C": "float32",
+    "passing_CFB_QBR": "float32",
+    "rushing_AVG": "float32",
+    "receiving_AVG": "float32",
+    "receiving_CATCH%": "float32",
+    "receiving_YDS/TGT": "float32",
+    "defense_AST": "Int16",
+    "punting_GROSS_YDS": "float32",
+    "kick_return_AVG": "float32",
+    "punt_return_AVG": "float32",
+}
+
+# The dtype of every column that identifies a game, team or player.
+GAME_STATS_ID_DTYPES = {
+    "season": "int64",
+    "league": "str",
+    "game_id": "int64",
+    "team_id": "int64",
+    "team_abv": "str",
+    "team_analytics_id": "str",
+    "team_name": "str",
+    "team_nickname": "str",
+    "score": "str",
+    "player_id": "int64",
+    "player_name": "str",
+    "last_updated": "str",
+}
+
+# How every team game stat is read from the "MATCHUP" section
+# of a FOX Sports boxscore.
+# Each column maps to `(row title, parser, dtype)`.
+TEAM_GAME_STATS_SCHEMA = {
+    "time_of_possession": ("Time Of Possession", "text", "str"),
+    "total_drives": ("Total Drives", "int", "Int16"),
+    "total_plays": ("Total Plays", "int", "Int16"),
+    "total_yards": ("Total Yards", "int", "Int16"),
+    "yards_per_play": ("Yards Per Play", "float", "float32"),
+    "redzone_TDs": ("Red Zone TDs", "int", "Int16"),
+    "redzone_attempts": ("Red Zone Attempts", "int", "Int16"),
+    # "Total" is in the "TURNOVERS" part of the "MATCHUP" section.
+    "turnovers": ("Total", "int", "Int16"),
+}
+
+# Team game stats that are added up from player game stats.
+TEAM_GAME_STATS_SUM_COLUMNS = (
+    "passing_COMP",
+    "passing_ATT",
+    "passing_YDS",
+    "passing_TD",
+    "passing_INT",
+    "rushing_ATT",
+    "rushing_YDS",
+    "rushing_TD",
+    # "receiving_TGT",
+    # "receiving_REC",
+    # "receiving_YDS",
+    # "receiving_TD",
+    "fumbles_FUM",
+    "fumbles_FUM_LOST",
+    "defense_TAK",
+    "defense_SOLO",
+    "defense_AST",
+    "defense_TFL",
+    "defense_SACKS",
+    "defense_INT",
+    "defense_PD",
+    "defense_TD",
+    "defense_FF",
+    "defense_FR",
+    "kicking_FGM",
+    "kicking_FGA",
+    "punting_NO",
+    "punting_GROSS_YDS",
+    "punting_AVG",
+    "punting_IN_20",
+    "punting_TB",
+    "punting_BLK",
+    "kick_return_KR",
+    "kick_return_YDS",
+    # "kick_return_AVG",
+    "kick_return_TD",
+    "punt_return_PR",
+    "punt_return_YDS",
+    # "punt_return_AVG",
+    "punt_return_TD",
+)
+
+# Team game stats that are the best (highest) player game stat.
+TEAM_GAME_STATS_MAX_COLUMNS = (
+    "kicking_FG_LONG",
+    "rushing_LONG",
+    # "receiving_LONG",
+    "punting_LONG",
+    "kick_return_LONG",
+    "punt_return_LONG",
+)
+
+# The dtype of every stat column in team game stats.
+TEAM_GAME_STATS_DTYPES = {
+    column: x[2] for column, x in TEAM_GAME_STATS_SCHEMA.items()
+} | {
+    column: PLAYER_GAME_STATS_DTYPES[column]
+    for column in TEAM_GAME_STATS_SUM_COLUMNS + TEAM_GAME_STATS_MAX_COLUMNS
+}
+
+
+def parse_stat_text(text: list, parser: str) -> np.ndarray:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Converts a whole column of boxscore text into numbers.
+
+    Parameters
+    ----------
+
+    `text` (list, mandatory):
+        The text of one stat, for every player (or team).
+        Players without this stat are `None`.
+
+    `parser` (str, mandatory):
+        How this text is converted. One of:
+        - `"int"`/`"float"`: a number.
+        - `"float_or_na"`: a number, or `NaN` if it isn't a number.
+        - `"int_or_zero"`: a number, or `0` if it isn't a number.
+        - `"made"`/`"attempted"`: one half of a `"made/attempted"` stat
+            (ex. `"17/27"`).
+        - `"text"`: left as is.
+
+    Returns
+    ----------
+    A NumPy array with the converted stat.
+    Numbers are `float64`, and missing stats are `NaN`.
+    """
+    if parser == "text":
+        return np.array(text, dtype=object)
+    elif parser == "int" or parser == "float":
+        return np.array(
+            [np.nan if x is None else float(x) for x in text],
+            dtype="float64"
+        )
+    elif parser == "float_or_na":
+        return pd.to_numeric(
+            pd.Series(text, dtype=object), errors="coerce"
+        ).to_numpy(dtype="float64")
+    elif parser == "int_or_zero":
+        numbers = pd.to_numeric(
+            pd.Series(text, dtype=object), errors="coerce"
+        ).to_numpy(dtype="float64")
+        is_text = np.array([x is not None for x in text], dtype=bool)
+        return np.where(np.isnan(numbers) & is_text, 0, numbers)
+    elif parser == "made" or parser == "attempted":
+        split_index = 0 if parser == "made" else 1
+        return np.array(
+            [
+                np.nan if x is None else float(x.split("/")[split_index])
+                for x in text
+            ],
+            dtype="float64"
+        )
+
+    raise ValueError(f"Unhandled stat parser {parser}")
+
+
+def divide_stats(
+    numerator: np.ndarray,
+    denominator: np.ndarray,
+    decimals: int,
+) -> np.ndarray:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Calculates a rate stat (ex. `passing_COMP%`),
+    for every player with a `denominator` above `0`.
+    Everyone else gets `NaN`.
+    """
+    return np.round(
+        np.divide(
+            numerator,
+            denominator,
+            out=np.full(len(denominator), np.nan),
+            where=denominator > 0
+        ),
+        decimals
+    )
 
 
 def fox_sports_player_stats_parser(
@@ -34,7 +326,6 @@ def fox_sports_player_stats_parser(
 
     This is a helper function that parses player stats
     """
-    stats_df = pd.DataFrame()
     stat_columns = [
         "team_id",
         "team_abv",
@@ -111,713 +402,646 @@ def fox_sports_player_stats_parser(
         "punt_return_TD",
     ]
 
-    passing_df = pd.DataFrame()
-    passing_df_arr = []
+    # Every stat category (and player) is read in one pass,
+    # into one record (`dict`) of boxscore text per player.
+    # Each column is then converted all at once (see `parse_stat_text()`).
+    player_records = {}
+    # FOX Sports can list a player more than once in the same table
+    # (ex. "FUMBLES"). Rows that are copies of an earlier row
+    # are dropped, so they aren't counted twice.
+    # Rows that differ get their own records,
+    # and are added up once every column has been converted.
+    extra_records = []
+    seen_rows = set()
 
-    rushing_df = pd.DataFrame()
-    rushing_df_arr = []
+    for stat in data:
+        stat_type = stat["boxscoreTable"]["headers"][0]["columns"][0]["text"]
 
-    receiving_df = pd.DataFrame()
-    receiving_df_arr = []
+        if stat_type not in FOX_SPORTS_STAT_TYPES:
+            raise ValueError(f"Unhandled stat type {stat_type}")
 
-    defense_df = pd.DataFrame()
-    defense_df_arr = []
+        stat_columns_arr = FOX_SPORTS_STAT_TYPES[stat_type]
 
-    fumbles_df = pd.DataFrame()
-    fumbles_df_arr = []
+        for player in stat["boxscoreTable"]["rows"]:
+            columns = player["columns"]
 
-    kick_return_df = pd.DataFrame()
-    kick_return_df_arr = []
+            if columns[0]["text"] == "TOTALS":
+                break
 
-    punt_return_df = pd.DataFrame()
-    punt_return_df_arr = []
+            player_id = player["entityLink"]["layout"]["tokens"]["id"]
+            player_name = player["entityLink"]["title"]
+            row_key = (
+                stat_type,
+                player_id,
+                player_name,
+                tuple(x["text"] for x in columns),
+            )
 
-    kicking_df = pd.DataFrame()
-    kicking_df_arr = []
+            if row_key in seen_rows:
+                continue
+            seen_rows.add(row_key)
 
-    punting_df = pd.DataFrame()
-    punting_df_arr = []
+            if (player_id, player_name) not in player_records:
+                player_records[(player_id, player_name)] = {
+                    "player_id": player_id,
+                    "player_name": player_name,
+                }
+            row = player_records[(player_id, player_name)]
 
-    temp_df = pd.DataFrame()
+            if stat_columns_arr[0][0] in row:
+                row = {
+                    "player_id": player_id,
+                    "player_name": player_name,
+                }
+                extra_records.append(row)
 
-    for stat in data:
-        stat_type = stat["boxscoreTable"]["headers"][0]["columns"][0]["text"]
+            for column, source_index in stat_columns_arr:
+                row[column] = columns[source_index]["text"]
 
-        if stat_type == "PASSING":
-            # print("\n PASSING")
-            for player in stat["boxscoreTable"]["rows"]:
+    if len(player_records) == 0:
+        raise ValueError(
+            "There isn't enough data here to make it worth " +
+            "parsing this game."
+        )
 
-                if player["columns"][0]["text"] == "TOTALS":
-                    break
+    # Players are sorted the same way
+    # merging each stat category used to sort them.
+    records_arr = [
+        player_records[x] for x in sorted(player_records)
+    ] + extra_records
+    player_id_arr = [x["player_id"] for x in records_arr]
+    player_name_arr = [x["player_name"] for x in records_arr]
+    stats = {
+        column: parse_stat_text([x.get(column) for x in records_arr], parser)
+        for column, (_, _, parser, _) in PLAYER_GAME_STATS_SCHEMA.items()
+    }
 
-                player_id = player["entityLink"]["layout"]["tokens"]["id"]
+    if len(extra_records) > 0:
+        stats_df_groupby = pd.DataFrame(
+            {"player_id": player_id_arr, "player_name": player_name_arr}
+            | stats
+        ).groupby(["player_id", "player_name"], sort=True)
+        long_columns = [x for x in stats if x.endswith("_LONG")]
+        stats_df = stats_df_groupby.sum(min_count=1)
+        stats_df[long_columns] = stats_df_groupby[long_columns].max()
+        stats_df = stats_df.reset_index()
 
-                player_name = player["entityLink"]["title"]
+        player_id_arr = stats_df["player_id"].to_list()
+        player_name_arr = stats_df["player_name"].to_list()
+        stats = {x: stats_df[x].to_numpy() for x in stats}
 
-                temp_df = pd.DataFrame(
-                    {
-                        "team_id": team_id,
-                        "team_abv": team_abv,
-                        "team_analytics_id": team_analytics_id,
-                        "team_name": team_name,
-                        "team_nickname": team_nickname,
-                        "player_id": player_id,
-                        "player_name": player_name,
-                    },
-                    index=[0],
-                )
+        del stats_df_groupby
 
-                temp_df["passing_COMP/ATT"] = player["columns"][1]["text"]
-                # temp_df["passing_COMP%"] = player["columns"][2]["text"]
-                temp_df["passing_YDS"] = player["columns"][3]["text"]
-                # temp_df["passing_YDS/ATT"] = player["columns"][4]["text"]
-                temp_df["passing_TD"] = player["columns"][5]["text"]
-                temp_df["passing_INT"] = player["columns"][6]["text"]
-                temp_df["passing_NFL_QBR"] = player["columns"][7]["text"]
+    # Passing
+    stats["passing_COMP%"] = divide_stats(
+        stats["passing_COMP"], stats["passing_ATT"], 4
+    )
+    stats["passing_Y/A"] = divide_stats(
+        stats["passing_YDS"], stats["passing_ATT"], 3
+    )
+    stats["passing_AY/A"] = divide_stats(
+        (
+            stats["passing_YDS"] +
+            (stats["passing_TD"] * 20) +
+            (stats["passing_INT"] * 45)
+        ),
+        stats["passing_ATT"],
+        3
+    )
+    stats["passing_Y/C"] = divide_stats(
+        stats["passing_YDS"], stats["passing_COMP"], 3
+    )
+    stats["passing_CFB_QBR"] = divide_stats(
+        (
+            (stats["passing_YDS"] * 8.4) +
+            (stats["passing_TD"] * 330) +
+            (stats["passing_COMP"] * 100) -
+            (stats["passing_INT"] * 200)
+        ),
+        stats["passing_ATT"],
+        3
+    )
 
-                passing_df_arr.append(temp_df)
+    # Rushing
+    stats["rushing_AVG"] = divide_stats(
+        stats["rushing_YDS"], stats["rushing_ATT"], 3
+    )
 
-                del temp_df
+    # Receiving
+    stats["receiving_AVG"] = divide_stats(
+        stats["receiving_YDS"], stats["receiving_REC"], 3
+    )
+    stats["receiving_CATCH%"] = divide_stats(
+        stats["receiving_REC"], stats["receiving_TGT"], 4
+    )
+    stats["receiving_YDS/TGT"] = divide_stats(
+        stats["receiving_YDS"], stats["receiving_TGT"], 3
+    )
 
-        elif stat_type == "RUSHING":
-            # print("\n RUSHING")
-            for player in stat["boxscoreTable"]["rows"]:
+    # Defense
+    stats["defense_AST"] = stats["defense_TAK"] - stats["defense_SOLO"]
 
-                if player["columns"][0]["text"] == "TOTALS":
-                    break
+    # Kick returns
+    stats["kick_return_AVG"] = divide_stats(
+        stats["kick_return_YDS"], stats["kick_return_KR"], 3
+    )
 
-                player_id = player["entityLink"]["layout"]["tokens"]["id"]
+    # Punt Returns
+    stats["punt_return_AVG"] = divide_stats(
+        stats["punt_return_YDS"], stats["punt_return_PR"], 3
+    )
 
-                player_name = player["entityLink"]["title"]
+    # Kicking (FG)
+    # stats["kicking_FG%"] = divide_stats(
+    #     stats["kicking_FGM"], stats["kicking_FGA"], 4
+    # )
 
-                temp_df = pd.DataFrame(
-                    {
-                        "team_id": team_id,
-                        "team_abv": team_abv,
-                        "team_analytics_id": team_analytics_id,
-                        "team_name": team_name,
-                        "team_nickname": team_nickname,
-                        "player_id": player_id,
-                        "player_name": player_name,
-                    },
-                    index=[0],
-                )
+    # Punting
+    # FOX Sports only gives us the punting average,
+    # so gross punting yards are rebuilt from it.
+    stats["punting_GROSS_YDS"] = np.where(
+        stats["punting_NO"] > 0,
+        np.round(stats["punting_NO"] * stats["punting_AVG"], 0),
+        np.nan
+    )
 
-                temp_df["rushing_ATT"] = player["columns"][1]["text"]
-                temp_df["rushing_YDS"] = player["columns"][2]["text"]
-                # temp_df["rushing_AVG"] = player["columns"][3]["text"]
-                temp_df["rushing_TD"] = player["columns"][4]["text"]
-                temp_df["rushing_LONG"] = player["columns"][5]["text"]
-
-                rushing_df_arr.append(temp_df)
-
-                del temp_df
-
-        elif stat_type == "RECEIVING":
-            # print("\n RECEIVING")
-            for player in stat["boxscoreTable"]["rows"]:
-
-                if player["columns"][0]["text"] == "TOTALS":
-                    break
-
-                player_id = player["entityLink"]["layout"]["tokens"]["id"]
-
-                player_name = player["entityLink"]["title"]
-                temp_df = pd.DataFrame(
-                    {
-                        "team_id": team_id,
-                        "team_abv": team_abv,
-                        "team_analytics_id": team_analytics_id,
-                        "team_name": team_name,
-                        "team_nickname": team_nickname,
-                        "player_id": player_id,
-                        "player_name": player_name,
-                    },
-                    index=[0],
-                )
+    # Every column is converted to its dtype once,
+    # when the `DataFrame` is made.
+    stats_df = pd.DataFrame(
+        {
+            "team_id": team_id,
+            "team_abv": team_abv,
+            "team_analytics_id": team_analytics_id,
+            "team_name": team_name,
+            "team_nickname": team_nickname,
+            "player_id": player_id_arr,
+            "player_name": player_name_arr,
+        } | {
+            column: pd.array(stats[column], dtype=dtype)
+            for column, dtype in PLAYER_GAME_STATS_DTYPES.items()
+        }
+    )
+    stats_df = stats_df.reindex(columns=stat_columns)
 
-                temp_df["receiving_REC"] = player["columns"][1]["text"]
-                temp_df["receiving_YDS"] = player["columns"][2]["text"]
-                # temp_df["receiving_AVG"] = player["columns"][3]["text"]
-                temp_df["receiving_TD"] = player["columns"][4]["text"]
-                temp_df["receiving_LONG"] = player["columns"][5]["text"]
-                temp_df["receiving_TGT"] = player["columns"][6]["text"]
-
-                receiving_df_arr.append(temp_df)
-
-                del temp_df
-
-        elif stat_type == "DEFENSIVE":
-            # print("\n DEFENSIVE")
-            for player in stat["boxscoreTable"]["rows"]:
-                if player["columns"][0]["text"] == "TOTALS":
-                    break
-
-                player_id = player["entityLink"]["layout"]["tokens"]["id"]
-
-                player_name = player["entityLink"]["title"]
-
-                temp_df = pd.DataFrame(
-                    {
-                        "team_id": team_id,
-                        "team_abv": team_abv,
-                        "team_analytics_id": team_analytics_id,
-                        "team_name": team_name,
-                        "team_nickname": team_nickname,
-                        "player_id": player_id,
-                        "player_name": player_name,
-                    },
-                    index=[0],
-                )
-                temp_df["defense_TAK"] = int(player["columns"][1]["text"])
-                temp_df["defense_SOLO"] = int(player["columns"][2]["text"])
-                temp_df["defense_SACKS"] = float(player["columns"][3]["text"])
-                temp_df["defense_TFL"] = int(player["columns"][4]["text"])
-                temp_df["defense_INT"] = int(player["columns"][5]["text"])
-                temp_df["defense_PD"] = int(player["columns"][6]["text"])
-                temp_df["defense_TD"] = int(player["columns"][7]["text"])
-
-                defense_df_arr.append(temp_df)
-
-                del temp_df
-
-        elif stat_type == "FUMBLES":
-            # print("\n FUMBLES")
-            for player in stat["boxscoreTable"]["rows"]:
-                if player["columns"][0]["text"] == "TOTALS":
-                    break
-
-                player_id = player["entityLink"]["layout"]["tokens"]["id"]
-
-                player_name = player["entityLink"]["title"]
-
-                temp_df = pd.DataFrame(
-                    {
-                        "team_id": team_id,
-                        "team_abv": team_abv,
-                        "team_analytics_id": team_analytics_id,
-                        "team_name": team_name,
-                        "team_nickname": team_nickname,
-                        "player_id": player_id,
-                        "player_name": player_name,
-                    },
-                    index=[0],
-                )
-                temp_df["fumbles_FUM"] = int(player["columns"][1]["text"])
-                temp_df["fumbles_FUM_LOST"] = int(
-                    player["columns"][2]["text"]
-                )
-                temp_df["defense_FF"] = int(player["columns"][3]["text"])
-                temp_df["defense_FR"] = int(player["columns"][4]["text"])
-
-                fumbles_df_arr.append(temp_df)
-
-                del temp_df
-
-        elif stat_type == "KICK RETURN":
-            # print("\n KICK RETURN")
-            for player in stat["boxscoreTable"]["rows"]:
-                if player["columns"][0]["text"] == "TOTALS":
-                    break
-
-                player_id = player["entityLink"]["layout"]["tokens"]["id"]
-
-                player_name = player["entityLink"]["title"]
-
-                temp_df = pd.DataFrame(
-                    {
-                        "team_id": team_id,
-                        "team_abv": team_abv,
-                        "team_analytics_id": team_analytics_id,
-                        "team_name": team_name,
-                        "team_nickname": team_nickname,
-                        "player_id": player_id,
-                        "player_name": player_name,
-                    },
-                    index=[0],
-                )
+    # stats_df.to_csv('test.csv', index=False)
+    return stats_df
 
-                temp_df["kick_return_KR"] = int(player["columns"][1]["text"])
-                temp_df["kick_return_YDS"] = int(player["columns"][2]["text"])
-                # temp_df["kick_return_AVG"] = player["columns"][3]["text"]
-                temp_df["kick_return_LONG"] = int(player["columns"][4]["text"])
-                temp_df["kick_return_TD"] = int(player["columns"][5]["text"])
-
-                kick_return_df_arr.append(temp_df)
-
-                del temp_df
-
-        elif stat_type == "PUNT RETURN":
-            # print("\n PUNT RETURN")
-            for player in stat["boxscoreTable"]["rows"]:
-                if player["columns"][0]["text"] == "TOTALS":
-                    break
-
-                player_id = player["entityLink"]["layout"]["tokens"]["id"]
-
-                player_name = player["entityLink"]["title"]
-
-                temp_df = pd.DataFrame(
-                    {
-                        "team_id": team_id,
-                        "team_abv": team_abv,
-                        "team_analytics_id": team_analytics_id,
-                        "team_name": team_name,
-                        "team_nickname": team_nickname,
-                        "player_id": player_id,
-                        "player_name": player_name,
-                    },
-                    index=[0],
-                )
 
-                temp_df["punt_return_PR"] = int(player["columns"][1]["text"])
-                temp_df["punt_return_YDS"] = int(player["columns"][2]["text"])
-                # temp_df["punt_return_AVG"] = player["columns"][3]["text"]
-                temp_df["punt_return_LONG"] = int(player["columns"][4]["text"])
-                temp_df["punt_return_TD"] = int(player["columns"][5]["text"])
-
-                punt_return_df_arr.append(temp_df)
-
-                del temp_df
-
-        elif stat_type == "KICKING":
-            # print("\n KICKING")
-            for player in stat["boxscoreTable"]["rows"]:
-                if player["columns"][0]["text"] == "TOTALS":
-                    break
-
-                player_id = player["entityLink"]["layout"]["tokens"]["id"]
-
-                player_name = player["entityLink"]["title"]
-
-                temp_df = pd.DataFrame(
-                    {
-                        "team_id": team_id,
-                        "team_abv": team_abv,
-                        "team_analytics_id": team_analytics_id,
-                        "team_name": team_name,
-                        "team_nickname": team_nickname,
-                        "player_id": player_id,
-                        "player_name": player_name,
-                    },
-                    index=[0],
-                )
-                temp_df["kicking_FG"] = player["columns"][1]["text"]
-                temp_df["kicking_FG%"] = player["columns"][2]["text"]
-                try:
-                    temp_df["kicking_FG_LONG"] = int(
-                        player["columns"][3]["text"]
-                    )
-                except Exception:
-                    temp_df["kicking_FG_LONG"] = 0
-                kicking_df_arr.append(temp_df)
-
-                del temp_df
-
-        elif stat_type == "PUNTING":
-            # print("\n PUNTING")
-            for player in stat["boxscoreTable"]["rows"]:
-                if player["columns"][0]["text"] == "TOTALS":
-                    break
-
-                player_id = player["entityLink"]["layout"]["tokens"]["id"]
-
-                player_name = player["entityLink"]["title"]
-
-                temp_df = pd.DataFrame(
-                    {
-                        "team_id": team_id,
-                        "team_abv": team_abv,
-                        "team_analytics_id": team_analytics_id,
-                        "team_name": team_name,
-                        "team_nickname": team_nickname,
-                        "player_id": player_id,
-                        "player_name": player_name,
-                    },
-                    index=[0],
-                )
+def save_raw_game_json(game_json: dict, ufl_game_id: int) -> None:
+    """
+    Saves the raw `.json` file for a UFL game
+    to `raw_game_json/`.
 
-                temp_df["punting_NO"] = int(player["columns"][1]["text"])
-                temp_df["punting_AVG"] = float(player["columns"][2]["text"])
-                temp_df["punting_IN_20"] = int(player["columns"][3]["text"])
-                temp_df["punting_TB"] = int(player["columns"][4]["text"])
-                temp_df["punting_LONG"] = int(player["columns"][5]["text"])
-                temp_df["punting_BLK"] = int(player["columns"][6]["text"])
+    Parameters
+    ----------
 
-                punting_df_arr.append(temp_df)
+    `game_json` (dict, mandatory):
+        The raw game JSON from FOX Sports.
 
-                del temp_df
+    `ufl_game_id` (int, mandatory):
+        The UFL game ID of this game.
+    """
+    game_id = int(ufl_game_id)
+    with open(f"raw_game_json/ufl_game_{game_id:03d}.json", "w+") as f:
+        f.write(json.dumps(game_json, indent=4))
 
-        else:
-            raise ValueError(f"Unhandled stat type {stat_type}")
 
-    # Passing
-    if len(passing_df_arr) > 0:
-        passing_df = pd.concat(passing_df_arr, ignore_index=True)
-
-        passing_df[["passing_COMP", "passing_ATT"]] = passing_df[
-            "passing_COMP/ATT"].str.split("/", expand=True)
-        passing_df.drop(
-            columns=["passing_COMP/ATT"],
-            inplace=True
-        )
-        passing_df = passing_df.astype(
-            {
-                "passing_COMP": "uint16",
-                "passing_ATT": "uint16",
-                "passing_YDS": "int16",
-                "passing_TD": "uint16",
-                "passing_INT": "uint16",
-            }
-        )
-        passing_df.loc[passing_df["passing_ATT"] > 0, "passing_COMP%"] = round(
-            passing_df["passing_COMP"] / passing_df["passing_ATT"],
-            4
-        )
-        passing_df.loc[passing_df["passing_ATT"] > 0, "passing_Y/A"] = round(
-            passing_df["passing_YDS"] / passing_df["passing_ATT"],
-            3
-        )
-        passing_df.loc[passing_df["passing_ATT"] > 0, "passing_AY/A"] = round(
-            (
-                passing_df["passing_YDS"] +
-                (passing_df["passing_TD"] * 20) +
-                (passing_df["passing_INT"] * 45)
-            ) / passing_df["passing_ATT"],
-            3
-        )
-        passing_df.loc[passing_df["passing_COMP"] > 0, "passing_Y/C"] = round(
-            passing_df["passing_YDS"] / passing_df["passing_COMP"],
-            3
-        )
-        passing_df.loc[
-            passing_df["passing_ATT"] > 0, "passing_CFB_QBR"
-        ] = round(
-            (
-                (passing_df["passing_YDS"] * 8.4) +
-                (passing_df["passing_TD"] * 330) +
-                (passing_df["passing_COMP"] * 100) -
-                (passing_df["passing_INT"] * 200)
-            ) / passing_df["passing_ATT"],
-            3
-        )
+def parse_ufl_game_stats(
+    game_json: dict,
+    ufl_game_id: int,
+    season: int,
+    parse_team_stats: bool = False,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Parses the boxscore of a single UFL game.
 
-    # Rushing
-    if len(rushing_df_arr) > 0:
-        rushing_df = pd.concat(rushing_df_arr, ignore_index=True)
-        rushing_df = rushing_df.astype(
-            {
-                "rushing_ATT": "uint16",
-                "rushing_YDS": "int16",
-                "rushing_TD": "uint16",
-                "rushing_LONG": "int16",
-            }
-        )
+    Parameters
+    ----------
 
-        rushing_df.loc[rushing_df["rushing_ATT"] > 0, "rushing_AVG"] = round(
-            rushing_df["rushing_YDS"] / rushing_df["rushing_ATT"],
-            3
-        )
+    `game_json` (dict, mandatory):
+        The raw game JSON from FOX Sports.
 
-    # Receiving
-    if len(receiving_df_arr) > 0:
-        receiving_df = pd.concat(receiving_df_arr, ignore_index=True)
-        receiving_df = receiving_df.astype(
-            {
-                "receiving_REC": "uint16",
-                "receiving_YDS": "int16",
-                "receiving_TD": "uint16",
-                "receiving_LONG": "int16",
-                "receiving_TGT": "uint16",
-            }
-        )
-        receiving_df.loc[
-            receiving_df["receiving_REC"] > 0, "receiving_AVG"
-        ] = round(
-            receiving_df["receiving_YDS"] / receiving_df["receiving_REC"],
-            3
-        )
+    `ufl_game_id` (int, mandatory):
+        The UFL game ID of this game.
 
-        receiving_df.loc[
-            receiving_df["receiving_TGT"] > 0, "receiving_CATCH%"
-        ] = round(
-            receiving_df["receiving_REC"] / receiving_df["receiving_TGT"],
-            4
-        )
+    `season` (int, mandatory):
+        The UFL season this game is from.
 
-        receiving_df.loc[
-            receiving_df["receiving_TGT"] > 0, "receiving_YDS/TGT"
-        ] = round(
-            receiving_df["receiving_YDS"] / receiving_df["receiving_TGT"],
-            3
-        )
+    `parse_team_stats` (bool, optional):
+        If set to `True`, team stats will be parsed as well.
 
-    # Defense
-    if len(defense_df_arr) > 0:
-        defense_df = pd.concat(defense_df_arr, ignore_index=True)
-        defense_df["defense_AST"] = (
-            defense_df["defense_TAK"] - defense_df["defense_SOLO"]
-        )
+    Returns
+    ----------
+    A `tuple` with two pandas `DataFrame`s,
+    player game stats and team game stats (in that order).
+    Both are empty if this game doesn't have a boxscore yet.
+    """
+    stats_df = pd.DataFrame()
+    stats_df_arr = []
 
-    # Fumbles
-    if len(fumbles_df_arr) > 0:
-        fumbles_df = pd.concat(fumbles_df_arr, ignore_index=True)
+    team_stats_df = pd.DataFrame()
+    team_stats_df_arr = []
 
-    # Kick returns
-    if len(kick_return_df_arr) > 0:
-        kick_return_df = pd.concat(kick_return_df_arr, ignore_index=True)
-        kick_return_df = kick_return_df.astype(
-            {
-                "kick_return_KR": "uint16",
-                "kick_return_YDS": "int16",
-                "kick_return_LONG": "int16",
-                "kick_return_TD": "int16",
-            }
-        )
-        kick_return_df.loc[
-            kick_return_df["kick_return_KR"] > 0, "kick_return_AVG"
-        ] = (
-            round(
-                kick_return_df["kick_return_YDS"] /
-                kick_return_df["kick_return_KR"],
-                3
+    if "boxscore" not in game_json:
+        return stats_df, team_stats_df
+
+    # Team stat declarations, because the way FOX Sports
+    # stores this info is so cringe and bad,
+    # we have to populate these variables
+    # to make this code run fast.
+    # Each team stat maps to `[away stat, home stat]`.
+    team_stats = {x: [None, None] for x in TEAM_GAME_STATS_SCHEMA}
+    team_stat_titles = {
+        x[0]: column for column, x in TEAM_GAME_STATS_SCHEMA.items()
+    }
+
+    league_id = game_json["header"]["analyticsSport"]
+
+    game_datetime = game_json["header"]["eventTime"]
+    game_datetime = datetime.fromisoformat(game_datetime)
+
+    away_team, home_team = get_event_teams(game_json)
+
+    away_team_id = away_team["team_id"]
+    away_team_abv = away_team["team_abv"]
+    away_team_analytics_id = away_team["team_analytics_id"]
+    away_team_name = away_team["team_name"]
+    away_team_nickname = away_team["team_nickname"]
+    try:
+        away_team_score = int(game_json["header"]["leftTeam"]["score"])
+    except Exception:
+        away_team_score = 0
+    away_team_loser_flag = game_json["header"]["leftTeam"]["isLoser"]
+
+    home_team_id = home_team["team_id"]
+    home_team_abv = home_team["team_abv"]
+    home_team_analytics_id = home_team["team_analytics_id"]
+    home_team_name = home_team["team_name"]
+    home_team_nickname = home_team["team_nickname"]
+    try:
+        home_team_score = int(game_json["header"]["leftTeam"]["score"])
+    except Exception:
+        home_team_score = 0
+    home_team_loser_flag = game_json["header"]["leftTeam"]["isLoser"]
+
+    for team in game_json["boxscore"]["boxscoreSections"]:
+
+        if team["title"] == "MATCHUP" and parse_team_stats is True:
+
+            for b in team["boxscoreMatchup"]:
+
+                if b["title"] == "POSSESSION" or b["title"] == "TURNOVERS":
+                    # Yes, this is how nested team stats are.
+                    for r in b["rows"]:
+                        if r["title"] in team_stat_titles:
+                            team_stats[team_stat_titles[r["title"]]] = [
+                                r["leftStat"],
+                                r["rightStat"],
+                            ]
+            temp_df = pd.DataFrame(
+                {
+                    "season": season,
+                    "league": league_id,
+                    "team_id": [home_team_id, away_team_id],
+                    "game_id": [ufl_game_id, ufl_game_id],
+                },
             )
-        )
+            for column, (_, parser, dtype) in TEAM_GAME_STATS_SCHEMA.items():
+                away_stat, home_stat = team_stats[column]
+                temp_df[column] = pd.array(
+                    parse_stat_text([home_stat, away_stat], parser),
+                    dtype=dtype
+                )
+            team_stats_df_arr.append(temp_df)
 
-    # Punt Returns
-    if len(punt_return_df_arr) > 0:
-        punt_return_df = pd.concat(punt_return_df_arr, ignore_index=True)
-        punt_return_df = punt_return_df.astype(
-            {
-                "punt_return_PR": "uint16",
-                "punt_return_YDS": "int16",
-                "punt_return_LONG": "int16",
-                "punt_return_TD": "int16",
-            }
-        )
-        punt_return_df.loc[
-            punt_return_df["punt_return_PR"] > 0, "punt_return_AVG"
-        ] = (
-            round(
-                punt_return_df["punt_return_YDS"] /
-                punt_return_df["punt_return_PR"],
-                3
+            del temp_df
+
+        elif team["title"] == "MATCHUP" and parse_team_stats is False:
+            pass
+
+        elif team["title"] == away_team_nickname:
+            # print(away_team_nickname)
+            temp_df = fox_sports_player_stats_parser(
+                team["boxscoreItems"],
+                away_team_id,
+                away_team_abv,
+                away_team_analytics_id,
+                away_team_name,
+                away_team_nickname,
             )
-        )
 
-    # Kicking (FG)
-    if len(kicking_df_arr) > 0:
-        kicking_df = pd.concat(kicking_df_arr, ignore_index=True)
-        kicking_df[["kicking_FGM", "kicking_FGA"]] = kicking_df[
-            "kicking_FG"].str.split("/", expand=True)
-        kicking_df.drop(
-            columns=["kicking_FG"],
-            inplace=True
-        )
-        kicking_df = kicking_df.astype(
-            {
-                "kicking_FGM": "uint16",
-                "kicking_FGA": "uint16",
-                "kicking_FG_LONG": "uint16"
-            }
-        )
-        # kicking_df.loc[kicking_df["kicking_FGA"] > 0, "kicking_FG%"] = round(
-        #     kicking_df["kicking_FGM"] / kicking_df["kicking_FGA"],
-        #     4
-        # )
+            if away_team_loser_flag is False:
+                temp_df["score"] = f"W {away_team_score}-{home_team_score}"
+            else:
+                temp_df["score"] = f"L {away_team_score}-{home_team_score}"
+            temp_df["game_id"] = ufl_game_id
+            temp_df["season"] = season
+            temp_df["league"] = league_id
+            stats_df_arr.append(temp_df)
+
+            del temp_df
+
+        elif team["title"] == home_team_nickname:
+            temp_df = fox_sports_player_stats_parser(
+                team["boxscoreItems"],
+                home_team_id,
+                home_team_abv,
+                home_team_analytics_id,
+                home_team_name,
+                home_team_nickname,
+            )
 
-    # Punting
-    if len(punting_df_arr) > 0:
-        punting_df = pd.concat(punting_df_arr, ignore_index=True)
-        punting_df = punting_df.astype(
-            {
-                "punting_NO": "uint16",
-                "punting_AVG": "float16",
-                "punting_IN_20": "uint16",
-                "punting_TB": "uint16",
-                "punting_LONG": "uint16",
-                "punting_BLK": "uint16",
-            }
-        )
-        punting_df.loc[
-            punting_df["punting_NO"] > 0, "punting_GROSS_YDS"
-        ] = punting_df["punting_NO"] * punting_df["punting_AVG"]
+            if home_team_loser_flag is False:
+                temp_df["score"] = f"W {home_team_score}-{away_team_score}"
+            else:
+                temp_df["score"] = f"L {home_team_score}-{away_team_score}"
+            temp_df["game_id"] = ufl_game_id
+            temp_df["season"] = season
+            temp_df["league"] = league_id
+            stats_df_arr.append(temp_df)
 
-        punting_df = punting_df.round({"punting_GROSS_YDS": 0})
-        # punting_df = punting_df.round({"punting_GROSS_YDS": 0})
-    if len(passing_df) == 0 and rushing_df == 0:
-        raise ValueError(
-            "There isn't enough data here to make it worth " +
-            "parsing this game."
-        )
+            del temp_df
 
-    if len(passing_df) > 0:
-        stats_df = pd.merge(
-            left=passing_df,
-            right=rushing_df,
-            how="outer",
-            on=[
-                "team_id",
-                "team_abv",
-                "team_analytics_id",
-                "team_name",
-                "team_nickname",
-                "player_id",
-                "player_name"
-            ]
-        )
+        else:
+            bad_title = team["title"]
+            raise ValueError(f"Unhandled boxscore type {bad_title}")
 
-    if len(receiving_df) > 0:
-        stats_df = stats_df.merge(
-            right=receiving_df,
-            how="outer",
-            on=[
-                "team_id",
-                "team_abv",
-                "team_analytics_id",
-                "team_name",
-                "team_nickname",
-                "player_id",
-                "player_name"
-            ]
-        )
+    if len(stats_df_arr) > 0:
+        stats_df = pd.concat(stats_df_arr, ignore_index=True)
 
-    if len(defense_df) > 0:
-        stats_df = stats_df.merge(
-            right=defense_df,
-            how="outer",
-            on=[
-                "team_id",
-                "team_abv",
-                "team_analytics_id",
-                "team_name",
-                "team_nickname",
-                "player_id",
-                "player_name"
-            ]
-        )
+    if len(team_stats_df_arr) > 0:
+        team_stats_df = pd.concat(team_stats_df_arr, ignore_index=True)
 
-    if len(fumbles_df) > 0:
-        stats_df = stats_df.merge(
-            right=fumbles_df,
-            how="outer",
-            on=[
-                "team_id",
-                "team_abv",
-                "team_analytics_id",
-                "team_name",
-                "team_nickname",
-                "player_id",
-                "player_name"
-            ]
-        )
+    return stats_df, team_stats_df
 
-    if len(kick_return_df) > 0:
-        stats_df = stats_df.merge(
-            right=kick_return_df,
-            how="outer",
-            on=[
-                "team_id",
-                "team_abv",
-                "team_analytics_id",
-                "team_name",
-                "team_nickname",
-                "player_id",
-                "player_name"
-            ]
-        )
 
-    if len(punt_return_df) > 0:
-        stats_df = stats_df.merge(
-            right=punt_return_df,
-            how="outer",
-            on=[
-                "team_id",
-                "team_abv",
-                "team_analytics_id",
-                "team_name",
-                "team_nickname",
-                "player_id",
-                "player_name"
-            ]
+def get_game_json_hash(game_json: dict) -> str:
+    """
+    Hashes the raw JSON of a game,
+    so `get_ufl_game_stats()` can tell if a game has changed
+    since it was last parsed.
+
+    Parameters
+    ----------
+
+    `game_json` (dict, mandatory):
+        The raw game JSON from FOX Sports.
+
+    Returns
+    ----------
+    The SHA-256 hash of this game, as a `str`.
+    """
+    return sha256(
+        json.dumps(game_json, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+def get_game_stats_manifest_entry(
+    game_json: dict,
+    parse_team_stats: bool,
+) -> dict:
+    """
+    Makes the game stats manifest entry for a game that was just parsed
+    (see `load_game_stats_manifest()`).
+
+    Parameters
+    ----------
+
+    `game_json` (dict, mandatory):
+        The raw game JSON from FOX Sports.
+
+    `parse_team_stats` (bool, mandatory):
+        If team game stats were parsed from this game as well.
+
+    Returns
+    ----------
+    A `dict` with the manifest entry for this game.
+    """
+    return {
+        "payload_hash": get_game_json_hash(game_json),
+        "parse_version": GAME_STATS_PARSE_VERSION,
+        "parse_team_stats": parse_team_stats,
+        "last_parsed": datetime.now(UTC).isoformat(),
+    }
+
+
+def load_game_stats_manifest(season: int) -> dict:
+    """
+    Loads the game stats manifest for a season.
+
+    The manifest keeps track of every game that has been parsed
+    into this season's game stats files. Each game (by UFL game ID, as a
+    `str`) has the `payload_hash` of the game when it was parsed
+    (see `get_game_json_hash()`), the `parse_version`
+    (see `GAME_STATS_PARSE_VERSION`), if team stats were parsed
+    (`parse_team_stats`), and when it was parsed (`last_parsed`).
+
+    Parameters
+    ----------
+
+    `season` (int, mandatory):
+        The UFL season you want the manifest for.
+
+    Returns
+    ----------
+    A `dict` with every game in the manifest.
+    Empty if there isn't a manifest for this season,
+    or if it can't be read.
+    """
+    manifest_path = GAME_STATS_MANIFEST_PATH.format(season=season)
+
+    if not exists(manifest_path):
+        return {}
+
+    try:
+        with open(manifest_path, "r") as f:
+            return json.loads(f.read())["games"]
+    except Exception as e:
+        logging.warning(
+            f"Could not read `{manifest_path}`. Full exception: {e}"
         )
+        return {}
 
-    if len(kicking_df) > 0:
-        stats_df = stats_df.merge(
-            right=kicking_df,
-            how="outer",
-            on=[
-                "team_id",
-                "team_abv",
-                "team_analytics_id",
-                "team_name",
-                "team_nickname",
-                "player_id",
-                "player_name"
-            ]
+
+def save_game_stats_manifest(manifest: dict, season: int) -> None:
+    """
+    Saves the game stats manifest for a season.
+    See `load_game_stats_manifest()`.
+
+    Parameters
+    ----------
+
+    `manifest` (dict, mandatory):
+        Every game in the manifest.
+
+    `season` (int, mandatory):
+        The UFL season this manifest is for.
+    """
+    manifest_path = GAME_STATS_MANIFEST_PATH.format(season=season)
+
+    write_file_atomic(
+        manifest_path,
+        json.dumps({"season": season, "games": manifest}, indent=4)
+    )
+
+
+def load_ufl_game_stats(
+    season: int,
+    parse_team_stats: bool = False,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Loads the game stats files that were already saved for a season.
+    `.parquet` files are used if they exist, and `.csv` files if not.
+
+    Parameters
+    ----------
+
+    `season` (int, mandatory):
+        The UFL season you want game stats from.
+
+    `parse_team_stats` (bool, optional):
+        If set to `True`, team game stats will be loaded as well.
+
+    Returns
+    ----------
+    A `tuple` with two pandas `DataFrame`s,
+    player game stats and team game stats (in that order).
+    Either one is `None` if it isn't saved on this computer.
+    """
+    stats_df = None
+    team_stats_df = None
+
+    for stats_type, dtypes in (
+        ("player", GAME_STATS_ID_DTYPES | PLAYER_GAME_STATS_DTYPES),
+        ("team", GAME_STATS_ID_DTYPES | TEAM_GAME_STATS_DTYPES),
+    ):
+        if stats_type == "team" and parse_team_stats is False:
+            continue
+
+        file_path = (
+            f"game_stats/{stats_type}/{season}_ufl_{stats_type}_game_stats"
         )
+        temp_df = None
 
-    if len(punting_df) > 0:
-        stats_df = stats_df.merge(
-            right=punting_df,
-            how="outer",
-            on=[
-                "team_id",
-                "team_abv",
-                "team_analytics_id",
-                "team_name",
-                "team_nickname",
-                "player_id",
-                "player_name"
-            ]
+        if exists(f"{file_path}.parquet"):
+            temp_df = pd.read_parquet(f"{file_path}.parquet")
+        elif exists(f"{file_path}.csv"):
+            temp_df = pd.read_csv(f"{file_path}.csv")
+
+        if temp_df is not None:
+            temp_df = temp_df.astype(
+                {x: y for x, y in dtypes.items() if x in temp_df.columns}
+            )
+
+        if stats_type == "player":
+            stats_df = temp_df
+        else:
+            team_stats_df = temp_df
+
+    return stats_df, team_stats_df
+
+
+def upsert_ufl_game_stats(
+    previous_df: pd.DataFrame,
+    new_df: pd.DataFrame,
+    ufl_game_id_arr: list = None,
+) -> pd.DataFrame:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Replaces every row in `previous_df` from a game in `new_df`
+    with the rows in `new_df`.
+    If `ufl_game_id_arr` is set, the result is sorted in that game order
+    (games that aren't in `ufl_game_id_arr` go last).
+    """
+    stats_df = pd.concat(
+        [
+            previous_df[~previous_df["game_id"].isin(new_df["game_id"])],
+            new_df,
+        ],
+        ignore_index=True
+    )
+
+    if ufl_game_id_arr is not None:
+        game_order = {x: g for g, x in enumerate(ufl_game_id_arr)}
+        stats_df = stats_df.sort_values(
+            by="game_id",
+            key=lambda x: x.map(game_order).fillna(len(game_order)),
+            kind="stable",
+            ignore_index=True,
         )
 
-    stats_df = stats_df.reindex(columns=stat_columns)
-    # stats_df.to_csv('test.csv', index=False)
     return stats_df
 
 
-def get_ufl_game_stats(
+def combine_ufl_game_stats(
+    stats_df_arr: list,
+    team_stats_df_arr: list,
     season: int,
     parse_team_stats: bool = False,
     save_csv: bool = False,
     save_parquet: bool = False,
-    save_json: bool = True,
-):
+    previous_stats_df: pd.DataFrame = None,
+    previous_team_stats_df: pd.DataFrame = None,
+    ufl_game_id_arr: list = None,
+    manifest: dict = None,
+) -> pd.DataFrame:
     """
-    Retrieves UFL game stats,
-    and parses them into a pandas `DataFrame`.
+    Combines parsed UFL games into season-long game stats files,
+    and saves them if requested.
+
+    Parameters
+    ----------
+
+    `stats_df_arr` (list, mandatory):
+        A `list` of player game stats `DataFrame`s
+        from `parse_ufl_game_stats()`.
+
+    `team_stats_df_arr` (list, mandatory):
+        A `list` of team game stats `DataFrame`s
+        from `parse_ufl_game_stats()`.
 
     `season` (int, mandatory):
-        Mandatory argument.
-        Indicates the season you want UFL roster data from.
+        The UFL season these games are from.
 
     `parse_team_stats` (bool, optional):
-        Optional argument.
-        If set to `True`, `get_ufl_standings()` will parse
-        team game stats at the same time.
+        If set to `True`, team game stats will be combined as well.
 
     `save_csv` (bool, optional):
-        Optional argument.
-        If set to `True`, `get_ufl_standings()` will save
-        the resulting `DataFrame` to a `.csv` file.
+        If set to `True`, the resulting `DataFrame`s
+        will be saved to `.csv` files.
 
     `save_parquet` (bool, optional):
-        Optional argument.
-        If set to `True`, `get_ufl_standings()` will save
-        the resulting `DataFrame` to a `.parquet` file.
-
-    `save_json` (bool, optional):
-        Optional argument.
-        If set to `True`, `get_ufl_standings()` will save
-        the raw `.json` files for each UFL game.
+        If set to `True`, the resulting `DataFrame`s
+        will be saved to `.parquet` files.
+
+    `previous_stats_df` (pd.DataFrame, optional):
+        Player game stats that were already saved for this season
+        (see `load_ufl_game_stats()`).
+        If set, the games in `stats_df_arr` are upserted into it:
+        rows for those games are replaced, and every other row is kept
+        as-is.
+
+    `previous_team_stats_df` (pd.DataFrame, optional):
+        Team game stats that were already saved for this season.
+        Upserted the same way as `previous_stats_df`.
+
+    `ufl_game_id_arr` (list, optional):
+        Every game in this season, in schedule order.
+        If set, upserted rows are sorted in this order.
+
+    `manifest` (dict, optional):
+        The game stats manifest entry of every game in the saved files
+        (see `get_game_stats_manifest_entry()`).
+        Whenever files are saved, this is saved as the manifest
+        for this season, so the manifest always describes
+        the saved files. If not set, an empty manifest is saved,
+        and the next incremental run parses every game again.
 
     Returns
     ----------
-    A pandas `DataFrame` object with UFL game stats.
-
+    A pandas `DataFrame` object with UFL player game stats.
     """
-    fox_key = get_fox_api_key()
     columns_order = [
         "season",
         "league",
@@ -889,259 +1113,11 @@ def get_ufl_game_stats(
         "punt_return_TD",
         "last_updated",
     ]
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4)"
-        + " AppleWebKit/537.36 (KHTML, like Gecko) "
-        + "Chrome/147.0.7727.56 Safari/537.36",
-        # "Referer": "https://www.theufl.com/",
-    }
     now = datetime.now(UTC).isoformat()
-    # temp_df = pd.DataFrame()
-    stats_df = pd.DataFrame()
-    stats_df_arr = []
-
     team_stats_df = pd.DataFrame()
-    team_stats_df_arr = []
-
-    schedule_df = pd.read_parquet(
-        "https://github.com/armstjc/ufl-data-repository/releases/"
-        + f"download/ufl-schedule/{season}_ufl_schedule.parquet"
-    )
-
-    # schedule_df = schedule_df[
-    #     (schedule_df["away_score"] > -1) | (schedule_df["home_score"] > -1)
-    # ]
-    schedule_df = schedule_df.astype(
-        {
-            "game_date":"datetime64[ms]"
-        },
-    )
-
-    schedule_df = schedule_df[
-        schedule_df["game_date"] <= datetime.now()
-    ]
-
-    if len(schedule_df) == 0:
-        schedule_df = pd.read_parquet(
-            "https://github.com/armstjc/ufl-data-repository/releases/"
-            + f"download/ufl-schedule/{season}_ufl_schedule.parquet"
-        )
-        schedule_df = schedule_df[
-            schedule_df["week_num"] == 1
-        ]
-
-    ufl_game_id_arr = schedule_df["ufl_game_id"].to_numpy()
-
-    for g_id in tqdm(ufl_game_id_arr):
-        # Team stat declarations, because the way FOX Sports
-        # stores this info is so cringe and bad,
-        # we have to populate these variables
-        # to make this code run fast.
-        away_time_of_possession = None
-        away_total_drives = None
-        away_total_plays = None
-        away_total_yards = None
-        away_yards_per_play = None
-        away_rz_td = None
-        away_rz_att = None
-        away_turnovers = None
-        # away_fum_lost = None
-        # away_interceptions = None
-
-        home_time_of_possession = None
-        home_total_drives = None
-        home_total_plays = None
-        home_total_yards = None
-        home_yards_per_play = None
-        home_rz_td = None
-        home_rz_att = None
-        home_turnovers = None
-        # home_fum_lost = None
-        # home_interceptions = None
-
-        url = (
-            "https://api.foxsports.com/bifrost/v1/ufl/event/"
-            + f"{g_id}/data?apikey={fox_key}"
-        )
-        response = requests.get(url=url, headers=headers)
-        game_id = int(g_id)
-        game_json = json.loads(response.text)
-
-        if save_json is True:
-            with open(f"raw_game_json/ufl_game_{game_id:03d}.json", "w+") as f:
-                f.write(json.dumps(game_json, indent=4))
-
-        league_id = game_json["header"]["analyticsSport"]
-
-        game_datetime = game_json["header"]["eventTime"]
-        game_datetime = datetime.fromisoformat(game_datetime)
-
-        away_team_id = int(
-            game_json[
-                "header"]["leftTeam"]["entityLink"]["layout"]["tokens"]["id"]
-        )
-        away_team_abv = game_json["header"]["leftTeam"]["name"]
-        away_team_analytics_id = game_json["header"]["leftTeam"]["entityLink"][
-            "analyticsName"
-        ]
-        away_team_name = game_json["header"]["leftTeam"]["alternateName"]
-        away_team_nickname = str(
-            game_json["header"]["leftTeam"]["longName"]
-        ).upper()
-        try:
-            away_team_score = int(game_json["header"]["leftTeam"]["score"])
-        except Exception:
-            away_team_score = 0
-        away_team_loser_flag = game_json["header"]["leftTeam"]["isLoser"]
-
-        home_team_id = int(
-            game_json[
-                "header"]["rightTeam"]["entityLink"]["layout"]["tokens"]["id"]
-        )
-        home_team_abv = game_json["header"]["rightTeam"]["name"]
-        home_team_analytics_id = game_json[
-            "header"]["rightTeam"]["entityLink"]["analyticsName"]
-        home_team_name = game_json["header"]["rightTeam"]["alternateName"]
-        home_team_nickname = str(
-            game_json["header"]["rightTeam"]["longName"]
-        ).upper()
-        try:
-            home_team_score = int(game_json["header"]["leftTeam"]["score"])
-        except Exception:
-            home_team_score = 0
-        home_team_loser_flag = game_json["header"]["leftTeam"]["isLoser"]
-
-        if "boxscore" in game_json:
-            pass
-        else:
-            continue
-
-        for team in game_json["boxscore"]["boxscoreSections"]:
-
-            if team["title"] == "MATCHUP" and parse_team_stats is True:
-
-                for b in team["boxscoreMatchup"]:
-
-                    if b["title"] == "POSSESSION" or b["title"] == "TURNOVERS":
-                        # Yes, this is how nested team stats are.
-                        for r in b["rows"]:
-                            # "POSSESSION"
-                            if r["title"] == "Time Of Possession":
-                                away_time_of_possession = r["leftStat"]
-                                home_time_of_possession = r["rightStat"]
-
-                            elif r["title"] == "Total Drives":
-                                away_total_drives = r["leftStat"]
-                                home_total_drives = r["rightStat"]
-
-                            elif r["title"] == "Total Plays":
-                                away_total_plays = r["leftStat"]
-                                home_total_plays = r["rightStat"]
-
-                            elif r["title"] == "Total Yards":
-                                away_total_yards = r["leftStat"]
-                                home_total_yards = r["rightStat"]
-
-                            elif r["title"] == "Yards Per Play":
-                                away_yards_per_play = r["leftStat"]
-                                home_yards_per_play = r["rightStat"]
-
-                            elif r["title"] == "Red Zone TDs":
-                                away_rz_td = r["leftStat"]
-                                home_rz_td = r["rightStat"]
-
-                            elif r["title"] == "Red Zone Attempts":
-                                away_rz_att = r["leftStat"]
-                                home_rz_att = r["rightStat"]
-
-                            # "TURNOVERS"
-                            elif r["title"] == "Total":
-                                away_turnovers = r["leftStat"]
-                                home_turnovers = r["rightStat"]
-                            # elif r["title"] == "Fumbles Lost":
-                            #     away_fum_lost = r["leftStat"]
-                            #     home_fum_lost = r["rightStat"]
-                            # elif r["title"] == "Interceptions":
-                            #     away_interceptions = r["leftStat"]
-                            #     home_interceptions = r["rightStat"]
-                temp_df = pd.DataFrame(
-                    {
-                        "season": season,
-                        "league": league_id,
-                        "team_id": [home_team_id, away_team_id],
-                        "game_id": [g_id, g_id],
-                        "time_of_possession": [
-                            home_time_of_possession,
-                            away_time_of_possession
-                        ],
-                        "total_drives": [home_total_drives, away_total_drives],
-                        "total_plays": [home_total_plays, away_total_plays],
-                        "total_yards": [home_total_yards, away_total_yards],
-                        "yards_per_play": [
-                            home_yards_per_play,
-                            away_yards_per_play
-                        ],
-                        "redzone_TDs": [home_rz_td, away_rz_td],
-                        "redzone_attempts": [home_rz_att, away_rz_att],
-                        "turnovers": [home_turnovers, away_turnovers]
-
-                    },
-                )
-                team_stats_df_arr.append(temp_df)
-
-                del temp_df
-
-            elif team["title"] == "MATCHUP" and parse_team_stats is False:
-                pass
-
-            elif team["title"] == away_team_nickname:
-                # print(away_team_nickname)
-                temp_df = fox_sports_player_stats_parser(
-                    team["boxscoreItems"],
-                    away_team_id,
-                    away_team_abv,
-                    away_team_analytics_id,
-                    away_team_name,
-                    away_team_nickname,
-                )
-
-                if away_team_loser_flag is False:
-                    temp_df["score"] = f"W {away_team_score}-{home_team_score}"
-                else:
-                    temp_df["score"] = f"L {away_team_score}-{home_team_score}"
-                temp_df["game_id"] = g_id
-                stats_df_arr.append(temp_df)
-
-                del temp_df
-
-            elif team["title"] == home_team_nickname:
-                temp_df = fox_sports_player_stats_parser(
-                    team["boxscoreItems"],
-                    home_team_id,
-                    home_team_abv,
-                    home_team_analytics_id,
-                    home_team_name,
-                    home_team_nickname,
-                )
-
-                if home_team_loser_flag is False:
-                    temp_df["score"] = f"W {home_team_score}-{away_team_score}"
-                else:
-                    temp_df["score"] = f"L {home_team_score}-{away_team_score}"
-                temp_df["game_id"] = g_id
-                stats_df_arr.append(temp_df)
-
-                del temp_df
-
-            else:
-                bad_title = team["title"]
-                raise ValueError(f"Unhandled boxscore type {bad_title}")
-
-    del fox_key
 
     stats_df = pd.concat(stats_df_arr, ignore_index=True)
     stats_df["season"] = season
-    stats_df["league"] = league_id
     # stats_df["game_id"] =
     stats_df["last_updated"] = now
 
@@ -1153,59 +1129,11 @@ def get_ufl_game_stats(
         # print(team_stats_df)
         team_stats_sum = stats_df.groupby(
             ["season", "league", "team_id", "game_id"], as_index=False
-        )[[
-            "passing_COMP",
-            "passing_ATT",
-            "passing_YDS",
-            "passing_TD",
-            "passing_INT",
-            "rushing_ATT",
-            "rushing_YDS",
-            "rushing_TD",
-            # "receiving_TGT",
-            # "receiving_REC",
-            # "receiving_YDS",
-            # "receiving_TD",
-            "fumbles_FUM",
-            "fumbles_FUM_LOST",
-            "defense_TAK",
-            "defense_SOLO",
-            "defense_AST",
-            "defense_TFL",
-            "defense_SACKS",
-            "defense_INT",
-            "defense_PD",
-            "defense_TD",
-            "defense_FF",
-            "defense_FR",
-            "kicking_FGM",
-            "kicking_FGA",
-            "punting_NO",
-            "punting_GROSS_YDS",
-            "punting_AVG",
-            "punting_IN_20",
-            "punting_TB",
-            "punting_BLK",
-            "kick_return_KR",
-            "kick_return_YDS",
-            # "kick_return_AVG",
-            "kick_return_TD",
-            "punt_return_PR",
-            "punt_return_YDS",
-            # "punt_return_AVG",
-            "punt_return_TD",
-        ]].sum()
+        )[list(TEAM_GAME_STATS_SUM_COLUMNS)].sum()
 
         team_stats_max = stats_df.groupby(
             ["season", "league", "team_id", "game_id"],
-        )[[
-            "kicking_FG_LONG",
-            "rushing_LONG",
-            # "receiving_LONG",
-            "punting_LONG",
-            "kick_return_LONG",
-            "punt_return_LONG",
-        ]].max()
+        )[list(TEAM_GAME_STATS_MAX_COLUMNS)].max()
 
         team_stats_df = team_stats_df.merge(
             team_stats_sum,
@@ -1219,10 +1147,30 @@ def get_ufl_game_stats(
             on=["season", "league", "team_id", "game_id"]
         )
 
-        # print(team_stats_df)
+        team_stats_df = team_stats_df.astype(TEAM_GAME_STATS_DTYPES)
+        # Lets season stats tell which games changed since they were made.
+        team_stats_df["last_updated"] = now
 
     # print(stats_df.columns)
     stats_df = stats_df[columns_order]
+    stats_df = stats_df.astype(GAME_STATS_ID_DTYPES | PLAYER_GAME_STATS_DTYPES)
+
+    if previous_stats_df is not None:
+        stats_df = upsert_ufl_game_stats(
+            previous_df=previous_stats_df,
+            new_df=stats_df,
+            ufl_game_id_arr=ufl_game_id_arr
+        )
+
+    if parse_team_stats is True and previous_team_stats_df is not None:
+        # Team game stats are sorted by team, like the merges above sort them.
+        team_stats_df = upsert_ufl_game_stats(
+            previous_df=previous_team_stats_df,
+            new_df=team_stats_df,
+        ).sort_values(
+            by=["season", "league", "team_id", "game_id"],
+            ignore_index=True
+        )
 
     if save_csv is True:
         stats_df.to_csv(
@@ -1246,6 +1194,190 @@ def get_ufl_game_stats(
                 index=False
             )
 
+    # The manifest only describes games that are in saved files.
+    if save_csv is True or save_parquet is True:
+        save_game_stats_manifest(
+            manifest if manifest is not None else {}, season
+        )
+
+    return stats_df
+
+
+def get_ufl_game_stats(
+    season: int,
+    parse_team_stats: bool = False,
+    save_csv: bool = False,
+    save_parquet: bool = False,
+    save_json: bool = True,
+    offline: bool = False,
+    incremental: bool = False,
+) -> pd.DataFrame:
+    """
+    Retrieves UFL game stats,
+    and parses them into a pandas `DataFrame`.
+
+    `season` (int, mandatory):
+        Mandatory argument.
+        Indicates the season you want UFL roster data from.
+
+    `parse_team_stats` (bool, optional):
+        Optional argument.
+        If set to `True`, `get_ufl_standings()` will parse
+        team game stats at the same time.
+
+    `save_csv` (bool, optional):
+        Optional argument.
+        If set to `True`, `get_ufl_standings()` will save
+        the resulting `DataFrame` to a `.csv` file.
+
+    `save_parquet` (bool, optional):
+        Optional argument.
+        If set to `True`, `get_ufl_standings()` will save
+        the resulting `DataFrame` to a `.parquet` file.
+
+    `save_json` (bool, optional):
+        Optional argument.
+        If set to `True`, `get_ufl_standings()` will save
+        the raw `.json` files for each UFL game.
+        Ignored if `offline` is `True`.
+
+    `offline` (bool, optional):
+        Optional argument.
+        If set to `True`, `get_ufl_game_stats()` will rebuild this season
+        from archived games (`raw_game_json/`, `usfl_game_logs/`)
+        instead of the FOX Sports API.
+        No API key or internet connection is needed.
+
+    `incremental` (bool, optional):
+        Optional argument.
+        If set to `True`, `get_ufl_game_stats()` will only parse games
+        that changed since they were last parsed
+        (see `load_game_stats_manifest()`),
+        and upsert them into the game stats files
+        that were already saved for this season.
+        Every game is still downloaded, but unchanged games
+        are skipped. If this season's game stats files aren't saved
+        on this computer, every game is parsed.
+
+    Returns
+    ----------
+    A pandas `DataFrame` object with UFL game stats.
+
+    """
+    stats_df_arr = []
+    team_stats_df_arr = []
+
+    manifest = {}
+    previous_stats_df = None
+    previous_team_stats_df = None
+    parsed_games = {}
+
+    if incremental is True:
+        previous_stats_df, previous_team_stats_df = load_ufl_game_stats(
+            season=season,
+            parse_team_stats=parse_team_stats
+        )
+
+        if previous_stats_df is None or (
+            parse_team_stats is True and previous_team_stats_df is None
+        ):
+            logging.warning(
+                f"The {season} UFL game stats files aren't saved "
+                + "on this computer, parsing every game instead."
+            )
+            previous_stats_df = None
+            previous_team_stats_df = None
+        else:
+            manifest = load_game_stats_manifest(season)
+
+    if offline is True:
+        schedule_df = get_archived_ufl_games(season)
+        # These games are already archived.
+        save_json = False
+    else:
+        fox_key = get_fox_api_key()
+        schedule_df = get_played_ufl_games(season)
+
+    ufl_game_id_arr = schedule_df["ufl_game_id"].to_numpy()
+
+    for g, g_id in enumerate(tqdm(ufl_game_id_arr)):
+        if offline is True:
+            game_json = load_archived_game_json(
+                schedule_df["file_path"].iloc[g]
+            )
+        else:
+            game_json = get_ufl_event_json(
+                ufl_game_id=g_id,
+                fox_key=fox_key
+            )
+
+        if save_json is True:
+            save_raw_game_json(game_json=game_json, ufl_game_id=g_id)
+
+        manifest_entry = get_game_stats_manifest_entry(
+            game_json=game_json,
+            parse_team_stats=parse_team_stats
+        )
+        previous_entry = manifest.get(str(g_id), {})
+
+        if (
+            previous_entry.get("payload_hash") ==
+            manifest_entry["payload_hash"] and
+            previous_entry.get("parse_version") == GAME_STATS_PARSE_VERSION
+            and (
+                parse_team_stats is False or
+                previous_entry.get("parse_team_stats") is True
+            )
+        ):
+            del game_json
+            continue
+
+        temp_df, temp_team_df = parse_ufl_game_stats(
+            game_json=game_json,
+            ufl_game_id=g_id,
+            season=season,
+            parse_team_stats=parse_team_stats
+        )
+        parsed_games[str(g_id)] = manifest_entry
+
+        if len(temp_df) > 0:
+            stats_df_arr.append(temp_df)
+        if len(temp_team_df) > 0:
+            team_stats_df_arr.append(temp_team_df)
+
+        del game_json
+        del temp_df
+        del temp_team_df
+
+    if offline is False:
+        del fox_key
+
+    if previous_stats_df is not None and len(stats_df_arr) == 0:
+        logging.info(
+            f"No {season} UFL games have changed "
+            + "since they were last parsed."
+        )
+        return previous_stats_df
+
+    logging.info(
+        f"Parsed {len(parsed_games)} of {len(ufl_game_id_arr)} games."
+    )
+
+    stats_df = combine_ufl_game_stats(
+        stats_df_arr=stats_df_arr,
+        team_stats_df_arr=team_stats_df_arr,
+        season=season,
+        parse_team_stats=parse_team_stats,
+        save_csv=save_csv,
+        save_parquet=save_parquet,
+        previous_stats_df=previous_stats_df,
+        previous_team_stats_df=previous_team_stats_df,
+        ufl_game_id_arr=ufl_game_id_arr,
+        manifest=manifest | parsed_games
+    )
+
+    return stats_df
+
 
 if __name__ == "__main__":
     now = datetime.now()
@@ -1274,16 +1406,37 @@ if __name__ == "__main__":
     parser.add_argument(
         "--save_json", default=False, action=BooleanOptionalAction
     )
+    parser.add_argument(
+        "--offline", default=False, action=BooleanOptionalAction
+    )
+    parser.add_argument(
+        "--incremental", default=False, action=BooleanOptionalAction
+    )
+    parser.add_argument(
+        "--season", default=None, type=int
+    )
 
     args = parser.parse_args()
 
-    if now.month >= 3:
+    if args.season is not None:
+        get_ufl_game_stats(
+            season=args.season,
+            parse_team_stats=True,
+            save_csv=args.save_csv,
+            save_parquet=args.save_parquet,
+            save_json=args.save_json,
+            offline=args.offline,
+            incremental=args.incremental,
+        )
+    elif now.month >= 3:
         get_ufl_game_stats(
             season=now.year,
             parse_team_stats=True,
             save_csv=args.save_csv,
             save_parquet=args.save_parquet,
             save_json=args.save_json,
+            offline=args.offline,
+            incremental=args.incremental,
         )
     else:
         get_ufl_game_stats(
@@ -1292,4 +1445,6 @@ if __name__ == "__main__":
             save_csv=args.save_csv,
             save_parquet=args.save_parquet,
             save_json=args.save_json,
+            offline=args.offline,
+            incremental=args.incremental,
         )
@@ -1,6 +1,6 @@
 """
 # Creation Date: 04/01/2024 03:00 PM EDT
-# Last Updated Date: 05/17/2024 06:45 PM EDT
+# Last Updated Date: 10/19/2026 09:15 AM EDT
 # Author: Joseph Armstrong (armstrongjoseph08@gmail.com)
 # File Name: get_ufl_schedules.py
 # Purpose: Allows one to get UFL play-by-play (PBP) data.
@@ -9,25 +9,36 @@
 
 import json
 import logging
-import re
 from argparse import ArgumentParser, BooleanOptionalAction
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import UTC, datetime
 from glob import glob
 
 # from os import mkdir
 # import time
 import pandas as pd
-import requests
 import numpy as np
+import pyarrow as pa
 from tqdm import tqdm
 
-from utils import get_fox_api_key, format_folder_path
+from pbp_regex import PBP_REGEX
+from ufl_teams import get_event_teams
+from utils import (
+    format_folder_path,
+    get_archived_ufl_games,
+    get_fox_api_key,
+    get_played_ufl_games,
+    get_ufl_event_json,
+    load_archived_game_json,
+)
 
 
 def get_yardline(yardline: str, posteam: str):
     """ """
     try:
-        yardline_temp = re.findall("([0-9]+)", yardline)[0]
+        yardline_temp = PBP_REGEX["yardline_number"].search(
+            yardline
+        )["yardline_number"]
     except Exception as e:
         logging.info(
             f"Cannot get a yardline number with {yardline}." + f"Full exception {e}"
@@ -48,4189 +59,8086 @@ def get_yardline(yardline: str, posteam: str):
     return yardline_100
 
 
-def parser(
-    game_json: dict,
-    ufl_game_id: int,
-    season: int,
-    season_type: str,
-    week: int,
-) -> pd.DataFrame:
-    """ """
-    # Static data
-    pbp_df = pd.DataFrame()
-    pbp_df_arr = []
-
-    temp_df = pd.DataFrame()
-
-    away_team_id = int(
-        game_json["header"]["leftTeam"]["entityLink"]["layout"]["tokens"]["id"]
-    )
-    away_team_abv = game_json["header"]["leftTeam"]["name"]
+def append_play_to_columns(
+    pbp_columns: dict,
+    play_dict: dict,
+    play_count: int
+) -> None:
+    """
+    DO NOT CALL DIRECTLY!
 
-    home_team_id = int(
-        game_json["header"]["rightTeam"]["entityLink"]["layout"]["tokens"]["id"]
-    )
-    home_team_abv = game_json["header"]["rightTeam"]["name"]
+    Appends a single parsed play to a columnar play buffer
+    (a `dict` of per-column `list`s), so `parser()`
+    only has to build one `DataFrame` per game.
 
-    game_id = f"{season}_{week:02d}_{away_team_abv}_{home_team_abv}"
+    Parameters
+    ----------
 
-    stadium = game_json["header"]["venueName"]
-    game_datetime_str = game_json["header"]["eventTime"]
-    game_datetime = datetime.strptime(game_datetime_str, "%Y-%m-%dT%H:%M:%SZ")
-    # Volatile data
-    play_id = 0
-    drive_id = 0
-    posteam = ""
-    posteam_type = ""
-    defteam = ""
+    `pbp_columns` (dict, mandatory):
+        The columnar play buffer. Modified in place.
 
-    game_half = ""
-    quarter_num = 0
-    half_num = 0
+    `play_dict` (dict, mandatory):
+        The play that is being added to `pbp_columns`.
 
-    total_away_score = 0
-    total_home_score = 0
+    `play_count` (int, mandatory):
+        How many plays are already in `pbp_columns`.
+        Used to back-fill columns that first appear in this play.
+    """
+    for key, value in play_dict.items():
+        if key not in pbp_columns:
+            pbp_columns[key] = [None] * play_count
+        pbp_columns[key].append(value)
+
+    if len(pbp_columns) > len(play_dict):
+        for key, column in pbp_columns.items():
+            if key not in play_dict:
+                column.append(None)
+
+
+def parse_end_quarter_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
 
-    away_timeouts_remaining = 3
-    home_timeouts_remaining = 3
+    Parses `"end_quarter"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
 
-    quarter_seconds_remaining = 900
-    half_seconds_remaining = 1800
-    game_seconds_remaining = 3600
+    temp_dict["is_quarter_end"] = True
 
-    home_opening_kickoff = 0
+    return tacklers_arr, sack_players_arr
 
-    if "pbp" in game_json:
-        pass
-    else:
-        return pbp_df
 
-    for quarter in game_json["pbp"]["sections"]:
-        if quarter["title"] == "1ST QUARTER":
-            quarter_num = 1
-            half_num = 1
-            game_half = "Half1"
-        elif quarter["title"] == "2ND QUARTER":
-            quarter_num = 2
-            half_num = 1
-            game_half = "Half1"
-        elif quarter["title"] == "3RD QUARTER":
-            quarter_num = 3
-            half_num = 2
-            game_half = "Half1"
-            away_timeouts_remaining = 3
-            home_timeouts_remaining = 3
-        elif quarter["title"] == "4TH QUARTER":
-            quarter_num = 4
-            half_num = 2
-            game_half = "Half1"
-        elif quarter["title"] == "OVERTIME":
-            quarter_num = 5
-            half_num = 3
-            game_half = "Overtime"
-        else:
-            q_title = quarter["title"]
-            raise ValueError(f"Unhandled quarter name {q_title}")
+def parse_end_game_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
 
-        for drive in quarter["groups"]:
+    Parses `"end_game"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
 
-            # Variables that have to be cleared every drive
-            is_drive_inside20 = 0
-            posteam_score = 0
-            defteam_score = 0
-            score_differential = 0
-            posteam_score_post = 0
-            defteam_score_post = 0
-            score_differential_post = 0
-            posteam_timeouts_remaining = 0
-            defteam_timeouts_remaining = 0
-            drive_first_downs = 0
-            drive_ended_with_score = 0
+    temp_dict["is_quarter_end"] = True
 
-            drive_id = drive["id"]
-            fixed_drive_result = drive["title"]
-            drive_desc = drive["subtitle"]
+    return tacklers_arr, sack_players_arr
 
-            if " · " in drive_desc:
-                drive_desc = drive_desc.split(" · ")
-            elif " • " in drive_desc:
-                drive_desc = drive_desc.split(" • ")
-            elif " Â· " in drive_desc:
-                drive_desc = drive_desc.split(" Â· ")
-            # print(drive_desc)
-            drive_play_count = int(drive_desc[0].replace(" plays", ""))
-            # drive_yards = int(drive_desc[1].replace(" yards", ""))
-            drive_time_of_possession = drive_desc[2]
-            drive_min, drive_sec = drive_time_of_possession.split(":")
 
-            pos_team_temp = int(drive["entityLink"]["layout"]["tokens"]["id"])
-            if pos_team_temp == away_team_id:
-                posteam = away_team_abv
-                defteam = home_team_abv
-                posteam_type = "away"
-                posteam_timeouts_remaining = away_timeouts_remaining
-                defteam_timeouts_remaining = home_timeouts_remaining
-            elif pos_team_temp == home_team_id:
-                posteam = home_team_abv
-                defteam = away_team_abv
-                posteam_type = "home"
-                posteam_timeouts_remaining = home_timeouts_remaining
-                defteam_timeouts_remaining = away_timeouts_remaining
-            else:
-                ValueError(f"Unhandled team ID {pos_team_temp}")
+def parse_two_minute_warning_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
 
-            if posteam == away_team_abv:
-                posteam_score = total_away_score
-                defteam_score = total_home_score
-            elif posteam == home_team_abv:
-                posteam_score = total_home_score
-                defteam_score = total_away_score
+    Parses `"two_minute_warning"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
 
-            for play in drive["plays"]:
-                play_id += 1
-                tacklers_arr = []
-                sack_players_arr = []
-                score_differential = posteam_score_post - defteam_score_post
-                posteam_score = posteam_score_post
-                defteam_score = defteam_score_post
+    return tacklers_arr, sack_players_arr
 
-                play_id = int(play["id"])
-                try:
-                    down_and_distance_temp = play["title"]
-                except Exception:
-                    down_and_distance_temp = ""
-                down = 0
-                yds_to_go = 0
-                try:
-                    down, yds_to_go = down_and_distance_temp.lower().split(" and ")
-                    down = int(down)
-                    yds_to_go = int(yds_to_go)
-                except Exception as e:
-                    logging.info("Could not parse down and distance" + f"\nreason: {e}")
-                    down = 0
-                    yds_to_go = 0
 
-                try:
-                    yrdln = play["subtitle"]
-                except Exception:
-                    yrdln = None
+def parse_tv_timeout_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
 
-                time = play["timeOfPlay"]
-                time_min, time_sec = time.split(":")
-                time_min = int(time_min)
-                time_sec = int(time_sec)
+    Parses `"tv_timeout"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
 
-                play_desc = play["playDescription"]
+    return tacklers_arr, sack_players_arr
 
-                # PBP text clean up
-                # play_desc = play_desc.replace("[", "")
-                # play_desc = play_desc.replace("]", "")
-                play_desc = play_desc.replace(
-                    "Face Mask (15 Yards),",
-                    "Face Mask,"
-                )
-                play_desc = play_desc.replace(
-                    " forced by. ",
-                    " forced by TEAM. "
-                )
-                if yrdln is not None:
-                    side_of_field = re.sub(r"([0-9\s]+)", r"", yrdln)
-                    yardline_100 = get_yardline(yrdln, posteam)
 
-                else:
-                    side_of_field = "50"
-                    yardline_100 = 50
+def parse_timeout_no_team_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
 
-                # Quarter number
-                temp_quarter = ""
-                temp_quarter_num = 0
-                temp_half_num = 0
-                temp_game_half = ""
+    Parses `"timeout_no_team"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
 
-                try:
-                    temp_quarter = play["periodOfPlay"]
-                    temp_quarter_num = int(temp_quarter[0])
-                except Exception:
-                    logging.info("No temp quarter found.")
+    return tacklers_arr, sack_players_arr
 
-                drive_quarter_start = quarter_num
 
-                if temp_quarter_num != 0:
-                    drive_quarter_start = temp_quarter_num
-                    play_quarter_num = temp_quarter_num
-                else:
-                    play_quarter_num = drive_quarter_start
+def parse_conversion_pass_catch_tackled_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
 
-                del temp_quarter, temp_quarter_num
-                del temp_half_num, temp_game_half
+    Parses `"conversion_pass_catch_tackled"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    play_match = PBP_REGEX[
+        "conversion_pass_catch_made_tackled"
+    ].search(play_desc)
+    if "one" in play_match["conversion_type"].lower():
+        temp_dict["is_one_point_attempt"] = True
+    elif "two" in play_match["conversion_type"].lower():
+        temp_dict["is_two_point_attempt"] = True
+    elif "three" in play_match["conversion_type"].lower():
+        temp_dict["is_three_point_attempt"] = True
+
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["receiver_player_name"] = play_match[
+        "receiver_player_name"
+    ]
+    success_or_failure = play_match[
+        "conversion_result"
+    ].lower()
+
+    if (
+        "suc" in success_or_failure and
+        "one" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_one_point_attempt_success"] = True
+    elif (
+        "suc" in success_or_failure and
+        "two" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_two_point_attempt_success"] = True
+    elif (
+        "suc" in success_or_failure and
+        "three" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_three_point_attempt_success"] = True
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_conversion_pass_interception_pushed_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
 
-                if half_num == 1:
-                    quarter_seconds_remaining = (time_min * 60) + time_sec
-                    half_seconds_remaining = (
-                        ((2 - play_quarter_num) * 900) +
-                        (time_min * 60) + time_sec
-                    )
-                    game_seconds_remaining = (
-                        ((4 - play_quarter_num) * 900) +
-                        (time_min * 60) + time_sec
-                    )
-                elif half_num == 2:
-                    quarter_seconds_remaining = (time_min * 60) + time_sec
-                    half_seconds_remaining = (
-                        ((4 - play_quarter_num) * 900) +
-                        (time_min * 60) + time_sec
-                    )
-                    game_seconds_remaining = (
-                        ((4 - play_quarter_num) * 900) +
-                        (time_min * 60) + time_sec
-                    )
-                elif half_num == 3:
-                    quarter_seconds_remaining = 0
-                    half_seconds_remaining = 0
-                    game_seconds_remaining = 0
+    Parses `"conversion_pass_interception_pushed_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_defensive_two_point_attempt"] = True
+    play_match = PBP_REGEX[
+        "conversion_pass_intercept_pushed_out_bounds"
+    ].search(play_desc)
+    if "one" in play_match["conversion_type"].lower():
+        temp_dict["is_one_point_attempt"] = True
+    elif "two" in play_match["conversion_type"].lower():
+        temp_dict["is_two_point_attempt"] = True
+    elif "three" in play_match["conversion_type"].lower():
+        temp_dict["is_three_point_attempt"] = True
+
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["interception_player_name"] = play_match[
+        "interception_player_name"
+    ]
+    success_or_failure = play_match[
+        "conversion_result"
+    ].lower()
 
-                temp_df = pd.DataFrame(
-                    {
-                        "season": game_datetime.year,
-                        "play_id": play_id,
-                        "game_id": game_id,
-                        "home_team": home_team_abv,
-                        "away_team": away_team_abv,
-                        "season_type": season_type,
-                        "week": week,
-                        "posteam": posteam,
-                        "posteam_type": posteam_type,
-                        "defteam": defteam,
-                        "side_of_field": side_of_field,
-                        "yardline_100": yardline_100,
-                        "game_date": game_datetime.strftime("%Y-%m-%d"),
-                        "quarter_seconds_remaining": quarter_seconds_remaining,
-                        "half_seconds_remaining": half_seconds_remaining,
-                        "game_seconds_remaining": game_seconds_remaining,
-                        "game_half": game_half,
-                        "is_quarter_end": False,
-                        "drive": drive_id,
-                        "is_scoring_play": False,
-                        "qtr": quarter_num,
-                        "down": down,
-                        "is_goal_to_go": False,
-                        "time": time,
-                        "yrdln": yrdln,
-                        "ydstogo": yds_to_go,
-                        "ydsnet": 0,
-                        "desc": play_desc,
-                        "play_type": None,
-                        "yards_gained": 0,
-                        "is_shotgun": False,
-                        "is_no_huddle": False,
-                        "is_qb_dropback": False,
-                        "is_qb_kneel": False,
-                        "is_qb_spike": False,
-                        "is_qb_scramble": False,
-                        "pass_length": None,
-                        "pass_location": None,
-                        "air_yards": None,
-                        "yards_after_catch": None,
-                        "run_location": None,
-                        "run_gap": None,
-                        "field_goal_result": None,
-                        "kick_distance": None,
-                        "extra_point_result": None,
-                        "two_point_conv_result": None,
-                        "home_timeouts_remaining": home_timeouts_remaining,
-                        "away_timeouts_remaining": away_timeouts_remaining,
-                        "is_timeout": False,
-                        "timeout_team": None,
-                        "td_team": None,
-                        "td_player_name": None,
-                        "td_player_id": None,
-                        "posteam_timeouts_remaining":
-                            posteam_timeouts_remaining,
-                        "defteam_timeouts_remaining":
-                            defteam_timeouts_remaining,
-                        "total_home_score": total_home_score,
-                        "total_away_score": total_away_score,
-                        "posteam_score": posteam_score,
-                        "defteam_score": defteam_score,
-                        "score_differential": score_differential,
-                        "posteam_score_post": posteam_score_post,
-                        "defteam_score_post": defteam_score_post,
-                        "score_differential_post": defteam_score_post,
-                        "is_4th_and_12_onside_play": False,
-                        "is_punt_blocked": False,
-                        "is_first_down_rush": False,
-                        "is_first_down_pass": False,
-                        "is_first_down_penalty": False,
-                        "is_third_down_converted": False,
-                        "is_third_down_failed": False,
-                        "is_fourth_down_converted": False,
-                        "is_fourth_down_failed": False,
-                        "is_incomplete_pass": False,
-                        "is_touchback": False,
-                        "is_interception": False,
-                        "is_punt_inside_twenty": False,
-                        "is_punt_in_endzone": False,
-                        "is_punt_out_of_bounds": False,
-                        "is_punt_downed": False,
-                        "is_punt_fair_catch": False,
-                        "is_kickoff_inside_twenty": False,
-                        "is_kickoff_in_endzone": False,
-                        "is_kickoff_out_of_bounds": False,
-                        "is_kickoff_downed": False,
-                        "is_kickoff_fair_catch": False,
-                        "is_fumble_forced": False,
-                        "is_fumble_not_forced": False,
-                        "is_fumble_out_of_bounds": False,
-                        "is_solo_tackle": False,
-                        "is_safety": False,
-                        "is_penalty": False,
-                        "is_tackled_for_loss": False,
-                        "is_fumble_lost": False,
-                        "is_own_kickoff_recovery": False,
-                        "is_own_kickoff_recovery_td": False,
-                        "is_qb_hit": False,
-                        "is_rush_attempt": False,
-                        "is_pass_attempt": False,
-                        "is_sack": False,
-                        "is_touchdown": False,
-                        "is_pass_touchdown": False,
-                        "is_rush_touchdown": False,
-                        "is_return_touchdown": False,
-                        "is_extra_point_attempt": False,
-                        "is_one_point_attempt": False,
-                        "is_one_point_attempt_success": False,
-                        "is_two_point_attempt": False,
-                        "is_two_point_attempt_success": False,
-                        "is_three_point_attempt": False,
-                        "is_three_point_attempt_success": False,
-                        "is_field_goal_attempt": False,
-                        "is_kickoff_attempt": False,
-                        "is_punt_attempt": False,
-                        "is_fumble": False,
-                        "is_complete_pass": False,
-                        "is_assist_tackle": False,
-                        "is_lateral_reception": False,
-                        "is_lateral_rush": False,
-                        "is_lateral_return": False,
-                        "is_lateral_recovery": False,
-                        "passer_player_id": None,
-                        "passer_player_name": None,
-                        "passing_yards": None,
-                        "receiver_player_id": None,
-                        "receiver_player_name": None,
-                        "receiving_yards": None,
-                        "rusher_player_id": None,
-                        "rusher_player_name": None,
-                        "rushing_yards": None,
-                        "lateral_receiver_player_id": None,
-                        "lateral_receiver_player_name": None,
-                        "lateral_receiving_yards": None,
-                        "lateral_rusher_player_id": None,
-                        "lateral_rusher_player_name": None,
-                        "lateral_rushing_yards": None,
-                        "lateral_sack_player_id": None,
-                        "lateral_sack_player_name": None,
-                        "interception_player_id": None,
-                        "interception_player_name": None,
-                        "lateral_interception_player_id": None,
-                        "lateral_interception_player_name": None,
-                        "punt_returner_player_id": None,
-                        "punt_returner_player_name": None,
-                        "lateral_punt_returner_player_id": None,
-                        "lateral_punt_returner_player_name": None,
-                        "kickoff_returner_player_name": None,
-                        "kickoff_returner_player_id": None,
-                        "lateral_kickoff_returner_player_id": None,
-                        "lateral_kickoff_returner_player_name": None,
-                        "punter_player_id": None,
-                        "punter_player_name": None,
-                        "kicker_player_name": None,
-                        "kicker_player_id": None,
-                        "own_kickoff_recovery_player_id": None,
-                        "own_kickoff_recovery_player_name": None,
-                        "blocked_player_id": None,
-                        "blocked_player_name": None,
-                        "long_snapper_player_id": None,
-                        "long_snapper_player_name": None,
-                        "holder_player_id": None,
-                        "holder_player_name": None,
-                        "tackle_for_loss_1_player_id": None,
-                        "tackle_for_loss_1_player_name": None,
-                        "tackle_for_loss_2_player_id": None,
-                        "tackle_for_loss_2_player_name": None,
-                        "qb_hit_1_player_id": None,
-                        "qb_hit_1_player_name": None,
-                        "qb_hit_2_player_id": None,
-                        "qb_hit_2_player_name": None,
-                        "forced_fumble_player_1_team": None,
-                        "forced_fumble_player_1_player_id": None,
-                        "forced_fumble_player_1_player_name": None,
-                        "forced_fumble_player_2_team": None,
-                        "forced_fumble_player_2_player_id": None,
-                        "forced_fumble_player_2_player_name": None,
-                        "solo_tackle_1_team": None,
-                        "solo_tackle_2_team": None,
-                        "solo_tackle_1_player_id": None,
-                        "solo_tackle_2_player_id": None,
-                        "solo_tackle_1_player_name": None,
-                        "solo_tackle_2_player_name": None,
-                        "assist_tackle_1_player_id": None,
-                        "assist_tackle_1_player_name": None,
-                        "assist_tackle_1_team": None,
-                        "assist_tackle_2_player_id": None,
-                        "assist_tackle_2_player_name": None,
-                        "assist_tackle_2_team": None,
-                        "assist_tackle_3_player_id": None,
-                        "assist_tackle_3_player_name": None,
-                        "assist_tackle_3_team": None,
-                        "assist_tackle_4_player_id": None,
-                        "assist_tackle_4_player_name": None,
-                        "assist_tackle_4_team": None,
-                        "tackle_with_assist": None,
-                        "tackle_with_assist_1_player_id": None,
-                        "tackle_with_assist_1_player_name": None,
-                        "tackle_with_assist_1_team": None,
-                        "tackle_with_assist_2_player_id": None,
-                        "tackle_with_assist_2_player_name": None,
-                        "tackle_with_assist_2_team": None,
-                        "pass_defense_1_player_id": None,
-                        "pass_defense_1_player_name": None,
-                        "pass_defense_2_player_id": None,
-                        "pass_defense_2_player_name": None,
-                        "fumbled_1_team": None,
-                        "fumbled_1_player_id": None,
-                        "fumbled_1_player_name": None,
-                        "fumbled_2_player_id": None,
-                        "fumbled_2_player_name": None,
-                        "fumbled_2_team": None,
-                        "fumble_recovery_1_team": None,
-                        "fumble_recovery_1_yards": None,
-                        "fumble_recovery_1_player_id": None,
-                        "fumble_recovery_1_player_name": None,
-                        "fumble_recovery_2_team": None,
-                        "fumble_recovery_2_yards": None,
-                        "fumble_recovery_2_player_id": None,
-                        "fumble_recovery_2_player_name": None,
-                        "sack_player_id": None,
-                        "sack_player_name": None,
-                        "half_sack_1_player_id": None,
-                        "half_sack_1_player_name": None,
-                        "half_sack_2_player_id": None,
-                        "half_sack_2_player_name": None,
-                        "return_team": None,
-                        "return_yards": None,
-                        "penalty_team": None,
-                        "penalty_player_id": None,
-                        "penalty_player_name": None,
-                        "penalty_yards": None,
-                        "replay_or_challenge": None,
-                        "replay_or_challenge_result": None,
-                        "penalty_type": None,
-                        "is_defensive_two_point_attempt": False,
-                        "is_defensive_two_point_conv": False,
-                        "is_defensive_extra_point_attempt": False,
-                        "is_defensive_extra_point_conv": False,
-                        "safety_player_name": None,
-                        "safety_player_id": None,
-                        "extra_point_player_id": None,
-                        "extra_point_player_name": None,
-                        "extra_point_result": None,
-                        "series": None,
-                        "series_success": None,
-                        "series_result": None,
-                        "start_time": game_datetime.strftime("%H:%M:%S"),
-                        "time_of_day": None,
-                        "stadium": None,
-                        "weather": None,
-                        "special_teams_play": False,
-                        "st_play_type": None,
-                        "end_yard_line": None,
-                        "game_stadium": None,
-                        "aborted_play": False,
-                        "success": False,
-                        "is_out_of_bounds": False,
-                    },
-                    index=[0],
-                )
+    return tacklers_arr, sack_players_arr
 
-                if yardline_100 == yds_to_go:
-                    # This is auto-set to `0`,
-                    # unless it's an actual goal to go situation.
-                    temp_df["is_goal_to_go"] = True
 
-                # PBP clean up, replay official overturns play
-                if (
-                    "the replay official reviewed" in play_desc.lower() and
-                    "and the play was overturned." in play_desc.lower()
-                ):
-                    play_desc = play_desc.split(
-                        "and the play was overturned."
-                    )[-1]
-                if (
-                    "challenged the" in play_desc.lower() and
-                    "and the play was overturned." in play_desc.lower()
-                ):
-                    play_desc = play_desc.split(
-                        "and the play was overturned."
-                    )[-1]
+def parse_conversion_pass_interception_defensive_recovery_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
 
-                # Handler for aborted plays (fumbled snap)
-                if "fumbles (aborted)." in play_desc.lower():
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+ \(aborted\)\. Fumble [RECOVERED|recovered]+ by ([a-zA-Z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
+    Parses `"conversion_pass_interception_defensive_recovery"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
 
-                    play_desc = re.sub(
-                        r"([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+ \(aborted\)\. Fumble [RECOVERED|recovered]+ by ([a-zA-Z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\.",
-                        "",
-                        play_desc
-                    )
+    temp_dict["is_defensive_two_point_attempt"] = True
+    play_match = PBP_REGEX[
+        "conversion_pass_intercept_defensive_recovery_succeeds"
+    ].search(play_desc)
 
-                    temp_df["fumbled_2_team"] = posteam
-                    temp_df["fumbled_2_player_name"] = play_arr[0][0]
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][1]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][2]
-                    temp_df["fumble_recovery_1_yards"] = 0
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["interception_player_name"] = play_match[
+        "interception_player_name"
+    ]
+    success_or_failure = play_match[
+        "conversion_result"
+    ].lower()
+    if (
+        "suc" in success_or_failure and
+        "one" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_one_point_attempt_success"] = True
+    elif (
+        "suc" in success_or_failure and
+        "two" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_two_point_attempt_success"] = True
+    elif (
+        "suc" in success_or_failure and
+        "three" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_three_point_attempt_success"] = True
+
+    if "suc" in play_match["defensive_conversion_result"]:
+        temp_dict["is_defensive_two_point_attempt"] = True
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_conversion_pass_catch_pushed_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
 
-                # 4th and 12 onside play
-                if "alternative kickoff" in play_desc.lower():
-                    play_desc = play_desc.replace(
-                        "Alternative kickoff", ""
-                    )
-                    play_desc = play_desc.replace(
-                        "Alternative Kickoff", ""
-                    )
-                    play_desc = play_desc.replace(
-                        "alternative kickoff", ""
-                    )
-                    temp_df["is_4th_and_12_onside_play"] = True
-
-                # Time management
-                if ("end quarter" in play_desc.lower()):
-                    temp_df["is_quarter_end"] = True
-                elif ("end game" in play_desc.lower()):
-                    temp_df["is_quarter_end"] = True
-                elif ("two minute warning" in play_desc.lower()):
-                    pass
-                elif ("timeout #" in play_desc.lower()):
-                    temp_df["is_timeout"] = True
-
-                    play_arr = re.findall(
-                        r"Timeout #([1-3]) by ([a-zA-Z]+)\.",
-                        play_desc
-                    )
-                    temp_df["timeout_team"] = play_arr[0][1]
-                    if play_arr[0][1] == away_team_abv:
-                        away_timeouts_remaining -= 1
-                    elif play_arr[0][1] == home_team_abv:
-                        home_timeouts_remaining -= 1
-                    else:
-                        temp_team = play_arr[0][1]
-                        raise ValueError(
-                            f"Unhandled team abbreviation {temp_team}"
-                        )
-                    # if play_arr[0][1] == posteam:
-                    #     posteam_timeouts_remaining -= 1
-                    # elif play_arr[0][1] == defteam:
-                    #     defteam_timeouts_remaining -= 1
-                    # else:
-                    #     temp_team = play_arr[0][1]
-                    #     raise ValueError(
-                    #         f"Unhandled team abbreviation {temp_team}"
-                    #     )
-                elif ("tv timeout" in play_desc.lower()):
-                    pass
-                elif (play_desc.lower() == "timeout"):
-                    pass
-                # Conversions
-                elif (
-                    "-point conversion attempt" in play_desc.lower() and
-                    "pass" in play_desc.lower() and
-                    "catch made" in play_desc.lower() and
-                    "for yards" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    play_arr = re.findall(
-                        r"([A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. ([a-zA-Z\'\.\-\,\; ]+) steps back to pass\. Catch made by ([a-zA-Z\'\.\-\,\; ]+) for yards\. Tackled by ([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. ([A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ ([a-zA-Z]+)\.",
-                        play_desc
-                    )
-                    if "one" in play_arr[0][0].lower():
-                        temp_df["is_one_point_attempt"] = True
-                    elif "two" in play_arr[0][0].lower():
-                        temp_df["is_two_point_attempt"] = True
-                    elif "three" in play_arr[0][0].lower():
-                        temp_df["is_three_point_attempt"] = True
-
-                    temp_df["passer_player_name"] = play_arr[0][1]
-                    temp_df["receiver_player_name"] = play_arr[0][2]
-                    success_or_failure = play_arr[0][6].lower()
-
-                    if (
-                        "suc" in success_or_failure and
-                        "one" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_one_point_attempt_success"] = True
-                    elif (
-                        "suc" in success_or_failure and
-                        "two" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_two_point_attempt_success"] = True
-                    elif (
-                        "suc" in success_or_failure and
-                        "three" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_three_point_attempt_success"] = True
-                elif (
-                    "-point conversion attempt" in play_desc.lower() and
-                    "pass" in play_desc.lower() and
-                    "intercept" in play_desc.lower() and
-                    "pushed out of bounds by" in play_desc.lower()
-                ):
-                    temp_df["is_defensive_two_point_attempt"] = True
-                    play_arr = re.findall(
-                        r"([A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. ([a-zA-Z\'\.\-\,\; ]+) steps back to pass\. ([a-zA-Z\'\.\-\,\; ]+) intercepts the ball\. Pushed out of bounds by ([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. ([A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ ([a-zA-Z]+)\. [DEFENSIVE|defensive]+ [CONVERSION|conversion]+ [RECOVERY|recovery]+ ([a-zA-Z]+)\.",
-                        play_desc
-                    )
-                    if "one" in play_arr[0][0].lower():
-                        temp_df["is_one_point_attempt"] = True
-                    elif "two" in play_arr[0][0].lower():
-                        temp_df["is_two_point_attempt"] = True
-                    elif "three" in play_arr[0][0].lower():
-                        temp_df["is_three_point_attempt"] = True
-
-                    temp_df["passer_player_name"] = play_arr[0][1]
-                    temp_df["interception_player_name"] = play_arr[0][2]
-                    success_or_failure = play_arr[0][6].lower()
-                elif (
-                    "-point conversion attempt" in play_desc.lower() and
-                    "pass" in play_desc.lower() and
-                    "intercept" in play_desc.lower() and
-                    "defensive conversion recovery succeeds" in play_desc.lower()
-                ):
-                    temp_df["is_defensive_two_point_attempt"] = True
-                    play_arr = re.findall(
-                        r"([A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. ([a-zA-Z\'\.\-\,\; ]+) steps back to pass\. ([a-zA-Z\'\.\-\,\; ]+) intercepts the ball\. ([A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ ([a-zA-Z]+)\. [DEFENSIVE|defensive]+ [CONVERSION|conversion]+ [RECOVERY|recovery]+ ([a-zA-Z]+)\.",
-                        play_desc
-                    )
+    Parses `"conversion_pass_catch_pushed_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    play_match = PBP_REGEX[
+        "conversion_pass_catch_made_pushed_out_bounds"
+    ].search(play_desc)
+    if "one" in play_match["conversion_type"].lower():
+        temp_dict["is_one_point_attempt"] = True
+    elif "two" in play_match["conversion_type"].lower():
+        temp_dict["is_two_point_attempt"] = True
+    elif "three" in play_match["conversion_type"].lower():
+        temp_dict["is_three_point_attempt"] = True
+
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["receiver_player_name"] = play_match[
+        "receiver_player_name"
+    ]
+    tacklers_arr = play_match["tacklers"]
+    success_or_failure = play_match[
+        "conversion_result"
+    ].lower()
+
+    if (
+        "suc" in success_or_failure and
+        "one" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_one_point_attempt_success"] = True
+    elif (
+        "suc" in success_or_failure and
+        "two" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_two_point_attempt_success"] = True
+    elif (
+        "suc" in success_or_failure and
+        "three" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_three_point_attempt_success"] = True
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_conversion_pass_catch_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"conversion_pass_catch"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    play_match = PBP_REGEX[
+        "conversion_pass_catch_made"
+    ].search(play_desc)
+    if "one" in play_match["conversion_type"].lower():
+        temp_dict["is_one_point_attempt"] = True
+    elif "two" in play_match["conversion_type"].lower():
+        temp_dict["is_two_point_attempt"] = True
+    elif "three" in play_match["conversion_type"].lower():
+        temp_dict["is_three_point_attempt"] = True
+
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["receiver_player_name"] = play_match[
+        "receiver_player_name"
+    ]
+    success_or_failure = play_match[
+        "conversion_result"
+    ].lower()
+
+    if (
+        "suc" in success_or_failure and
+        "one" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_one_point_attempt_success"] = True
+    elif (
+        "suc" in success_or_failure and
+        "two" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_two_point_attempt_success"] = True
+    elif (
+        "suc" in success_or_failure and
+        "three" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_three_point_attempt_success"] = True
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_conversion_pass_interception_tackled_defensive_recovery_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"conversion_pass_interception_tackled_defensive_recovery"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    play_match = PBP_REGEX[
+        "conversion_pass_intercepts_ball_tackled_defensive_recovery"
+    ].search(play_desc)
+    if "one" in play_match["conversion_type"].lower():
+        temp_dict["is_one_point_attempt"] = True
+    elif "two" in play_match["conversion_type"].lower():
+        temp_dict["is_two_point_attempt"] = True
+    elif "three" in play_match["conversion_type"].lower():
+        temp_dict["is_three_point_attempt"] = True
+
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["interception_player_name"] = play_match[
+        "interception_player_name"
+    ]
+    success_or_failure = play_match[
+        "conversion_result"
+    ].lower()
+
+    if (
+        "suc" in success_or_failure and
+        "one" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_one_point_attempt_success"] = True
+    elif (
+        "suc" in success_or_failure and
+        "two" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_two_point_attempt_success"] = True
+    elif (
+        "suc" in success_or_failure and
+        "three" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_three_point_attempt_success"] = True
+
+    if "suc" in play_match["defensive_conversion_result"]:
+        temp_dict["is_defensive_two_point_conv"] = True
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_conversion_rush_fumble_defensive_recovery_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"conversion_rush_fumble_defensive_recovery"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_defensive_two_point_attempt"] = True
+    play_match = PBP_REGEX[
+        "conversion_rushed_up_middle_fumbles_forced_recovers_fumble_tackled_defensive_recovery"
+    ].search(play_desc)
+    if "one" in play_match["conversion_type"].lower():
+        temp_dict["is_one_point_attempt"] = True
+    elif "two" in play_match["conversion_type"].lower():
+        temp_dict["is_two_point_attempt"] = True
+    elif "three" in play_match["conversion_type"].lower():
+        temp_dict["is_three_point_attempt"] = True
+
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "fumbled_1_player_name"
+    ]
+    temp_dict["forced_fumble_player_1_team"] = defteam
+    temp_dict["forced_fumble_player_1_player_name"] = play_match[
+        "forced_fumble_player_1_player_name"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+    tacklers_arr = play_match["tacklers"]
+
+    success_or_failure = play_match[
+        "conversion_result"
+    ].lower()
+
+    if (
+        "suc" in success_or_failure and
+        "one" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_one_point_attempt_success"] = True
+    elif (
+        "suc" in success_or_failure and
+        "two" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_two_point_attempt_success"] = True
+    elif (
+        "suc" in success_or_failure and
+        "three" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_three_point_attempt_success"] = True
+
+    if "suc" in play_match["defensive_conversion_result"]:
+        temp_dict["is_defensive_two_point_conv"] = True
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_conversion_rush_up_middle_tackled_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"conversion_rush_up_middle_tackled"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    play_match = PBP_REGEX[
+        "conversion_rushed_up_middle_tackled"
+    ].search(play_desc)
+    if "one" in play_match["conversion_type"].lower():
+        temp_dict["is_one_point_attempt"] = True
+    elif "two" in play_match["conversion_type"].lower():
+        temp_dict["is_two_point_attempt"] = True
+    elif "three" in play_match["conversion_type"].lower():
+        temp_dict["is_three_point_attempt"] = True
+
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    # temp_dict["run_location"] = play_arr[0][1]
+    # temp_dict["run_gap"] = play_arr[0][2]
+
+    success_or_failure = play_match[
+        "conversion_result"
+    ].lower()
+
+    if (
+        "suc" in success_or_failure and
+        "one" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_one_point_attempt_success"] = True
+    elif (
+        "suc" in success_or_failure and
+        "two" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_two_point_attempt_success"] = True
+    elif (
+        "suc" in success_or_failure and
+        "three" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_three_point_attempt_success"] = True
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_conversion_rush_tackled_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"conversion_rush_tackled"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    play_match = PBP_REGEX[
+        "conversion_rushed_tackled"
+    ].search(play_desc)
+
+    if play_match is None:
+        play_match = PBP_REGEX[
+            "conversion_rushed_tackled_alt"
+        ].search(play_desc)
+        if "one" in play_match["conversion_type"].lower():
+            temp_dict["is_one_point_attempt"] = True
+        elif "two" in play_match["conversion_type"].lower():
+            temp_dict["is_two_point_attempt"] = True
+        elif "three" in play_match["conversion_type"].lower():
+            temp_dict["is_three_point_attempt"] = True
+
+        temp_dict["rusher_player_name"] = play_match[
+            "rusher_player_name"
+        ]
+        # temp_dict["run_location"] = play_arr[0][1]
+        # temp_dict["run_gap"] = play_arr[0][2]
+
+        success_or_failure = play_match[
+            "conversion_result"
+        ].lower()
+    else:
+        if "one" in play_match["conversion_type"].lower():
+            temp_dict["is_one_point_attempt"] = True
+        elif "two" in play_match["conversion_type"].lower():
+            temp_dict["is_two_point_attempt"] = True
+        elif "three" in play_match["conversion_type"].lower():
+            temp_dict["is_three_point_attempt"] = True
+
+        temp_dict["rusher_player_name"] = play_match[
+            "rusher_player_name"
+        ]
+        temp_dict["run_location"] = play_match[
+            "rusher_player_name"
+        ]
+        temp_dict["run_gap"] = play_match["run_gap"]
+
+        success_or_failure = play_match[
+            "conversion_result"
+        ].lower()
+
+    if (
+        "suc" in success_or_failure and
+        "one" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_one_point_attempt_success"] = True
+    elif (
+        "suc" in success_or_failure and
+        "two" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_two_point_attempt_success"] = True
+    elif (
+        "suc" in success_or_failure and
+        "three" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_three_point_attempt_success"] = True
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_conversion_rush_up_middle_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"conversion_rush_up_middle"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    play_match = PBP_REGEX[
+        "conversion_rushed_up_middle"
+    ].search(play_desc)
+    if "one" in play_match["conversion_type"].lower():
+        temp_dict["is_one_point_attempt"] = True
+    elif "two" in play_match["conversion_type"].lower():
+        temp_dict["is_two_point_attempt"] = True
+    elif "three" in play_match["conversion_type"].lower():
+        temp_dict["is_three_point_attempt"] = True
+
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = "middle"
+    # temp_dict["run_gap"] = play_arr[0][2]
+
+    success_or_failure = play_match[
+        "conversion_result"
+    ].lower()
+
+    if (
+        "suc" in success_or_failure and
+        "one" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_one_point_attempt_success"] = True
+    elif (
+        "suc" in success_or_failure and
+        "two" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_two_point_attempt_success"] = True
+    elif (
+        "suc" in success_or_failure and
+        "three" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_three_point_attempt_success"] = True
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_conversion_rush_pushed_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"conversion_rush_pushed_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    play_match = PBP_REGEX[
+        "conversion_rushed_pushed_out_bounds"
+    ].search(play_desc)
+    # if len(play_arr) == 0:
+    #     play_arr = re.findall(
+    #         r"([A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. ([a-zA-Z\'\.\-\,\; ]+) rushed ([a-zA-Z]+) ([a-zA-Z]+) to ([A-Za-z0-9\s]+) for yard[s]?\. Pushed out of bounds by ([a-zA-Z\;\'\.\-\, ]+) at ([A-Za-z0-9\s]+)\. ([A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ ([a-zA-Z]+)\.",
+    #         play_desc
+    #     )
+    #     temp_dict["rusher_player_name"] = play_arr[0][1]
+    #     temp_dict["run_location"] = play_arr[0][1]
+    #     temp_dict["run_gap"] = play_arr[0][2]
+
+    #     success_or_failure = play_arr[0][6].lower()
+    # else:
+    #     temp_dict["rusher_player_name"] = play_arr[0][1]
+    #     temp_dict["run_location"] = play_arr[0][1]
+    #     temp_dict["run_gap"] = play_arr[0][2]
+
+    #     success_or_failure = play_arr[0][6].lower()
+
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_gap"] = play_match["run_gap"]
+
+    success_or_failure = play_match[
+        "conversion_result"
+    ].lower()
+
+    if "one" in play_match["conversion_type"].lower():
+        temp_dict["is_one_point_attempt"] = True
+    elif "two" in play_match["conversion_type"].lower():
+        temp_dict["is_two_point_attempt"] = True
+    elif "three" in play_match["conversion_type"].lower():
+        temp_dict["is_three_point_attempt"] = True
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_conversion_rush_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"conversion_rush"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    play_match = PBP_REGEX[
+        "conversion_rushed"
+    ].search(play_desc)
+    if play_match is None:
+        play_match = PBP_REGEX[
+            "conversion_rushed_alt"
+        ].search(play_desc)
+        temp_dict["rusher_player_name"] = play_match[
+            "rusher_player_name"
+        ]
+        # temp_dict["run_location"] = play_arr[0][1]
+        # temp_dict["run_gap"] = play_arr[0][2]
+
+        success_or_failure = play_match[
+            "conversion_result"
+        ].lower()
+    else:
+        temp_dict["rusher_player_name"] = play_match[
+            "rusher_player_name"
+        ]
+        temp_dict["run_location"] = play_match[
+            "rusher_player_name"
+        ]
+        temp_dict["run_gap"] = play_match["run_gap"]
+
+        success_or_failure = play_match[
+            "conversion_result"
+        ].lower()
+    if "one" in play_match["conversion_type"].lower():
+        temp_dict["is_one_point_attempt"] = True
+    elif "two" in play_match["conversion_type"].lower():
+        temp_dict["is_two_point_attempt"] = True
+    elif "three" in play_match["conversion_type"].lower():
+        temp_dict["is_three_point_attempt"] = True
+
+    if (
+        "suc" in success_or_failure and
+        "one" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_one_point_attempt_success"] = True
+    elif (
+        "suc" in success_or_failure and
+        "two" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_two_point_attempt_success"] = True
+    elif (
+        "suc" in success_or_failure and
+        "three" in play_match["conversion_type"].lower()
+    ):
+        temp_dict["is_three_point_attempt_success"] = True
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_incomplete_intended_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"incomplete_intended"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    # If we're here,
+    # its because we're handling an aborted snap,
+    # that was thrown away (presumably)
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_incomplete_pass"] = True
+
+    temp_dict["passer_player_name"] = temp_dict["fumbled_2_player_name"]
+
+    play_match = PBP_REGEX[
+        "steps_back_pass_incomplete_intended"
+    ].search(play_desc)
+    temp_dict["pass_length"] = play_match["pass_length"]
+    temp_dict["pass_location"] = play_match["pass_location"]
+    temp_dict["receiver_player_name"] = play_match[
+        "receiver_player_name"
+    ]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_steps_back_pass_incomplete_intended_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"steps_back_pass_incomplete_intended"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_incomplete_pass"] = True
+    play_match = PBP_REGEX[
+        "steps_back_pass_incomplete_intended_2"
+    ].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["pass_length"] = play_match["pass_length"]
+    temp_dict["pass_location"] = play_match["pass_location"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_steps_back_pass_incomplete_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"steps_back_pass_incomplete"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_incomplete_pass"] = True
+    play_desc = play_desc.replace("[", "")
+    play_desc = play_desc.replace("]", "")
+    play_match = PBP_REGEX[
+        "steps_back_pass_incomplete"
+    ].search(play_desc)
+    if play_match is None:
+        play_match = PBP_REGEX[
+            "steps_back_pass_incomplete_alt"
+        ].search(play_desc)
+        temp_dict["passer_player_name"] = play_match[
+            "passer_player_name"
+        ]
+        temp_dict["pass_length"] = "middle"
+        temp_dict["pass_location"] = play_match[
+            "pass_location"
+        ]
+        temp_dict["receiver_player_name"] = play_match[
+            "receiver_player_name"
+        ]
+        temp_dict["pass_defense_1_player_name"] = play_match[
+            "pass_defense_1_player_name"
+        ]
+    else:
+        temp_dict["passer_player_name"] = play_match[
+            "passer_player_name"
+        ]
+        temp_dict["pass_length"] = play_match["pass_length"]
+        temp_dict["pass_location"] = play_match[
+            "pass_location"
+        ]
+        temp_dict["receiver_player_name"] = play_match[
+            "receiver_player_name"
+        ]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_complete_touchdown_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_complete_touchdown"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_complete_pass"] = True
+    temp_dict["is_pass_touchdown"] = True
+    play_match = PBP_REGEX[
+        "pass_complete_touchdown"
+    ].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["pass_length"] = play_match["pass_length"]
+    temp_dict["pass_location"] = play_match["pass_location"]
+    temp_dict["receiver_player_name"] = play_match[
+        "receiver_player_name"
+    ]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_complete_touchdown_2_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_complete_touchdown_2"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_complete_pass"] = True
+    temp_dict["is_pass_touchdown"] = True
+    play_match = PBP_REGEX[
+        "pass_complete_touchdown_2"
+    ].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["pass_length"] = play_match["pass_length"]
+    temp_dict["pass_location"] = play_match["pass_location"]
+    temp_dict["receiver_player_name"] = play_match[
+        "receiver_player_name"
+    ]
+    temp_dict["receiving_yards"] = int(play_match[
+        "receiving_yards"
+    ])
+    temp_dict["passing_yards"] = int(play_match[
+        "receiving_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "receiving_yards"
+    ])
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_catch_lateral_tackled_fumble_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_catch_lateral_tackled_fumble"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    # Full play for this madness:
+    #
+    # 'E.Perry pass short right complete.
+    # Catch made by J.Adams for 5 yards.
+    # Lateral to K.Lassiter to MEM 31 for -4 yards.
+    # K.Lassiter FUMBLES.
+    # Fumble RECOVERED by MEM-J.Kibodi at MEM 26.
+    # J.Kibodi FUMBLES.
+    # Fumble RECOVERED by DC-A.Mintze at MEM 24.
+    # Tackled by N.Henderson at MEM 24.'
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_complete_pass"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumble_not_forced"] = True
+    temp_dict["is_lateral_reception"] = True
+    play_match = PBP_REGEX[
+        "pass_catch_made_forced_lateral_tackled_fumbles"
+    ].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["pass_length"] = play_match["pass_length"]
+    temp_dict["pass_location"] = play_match["pass_location"]
+    temp_dict["receiver_player_name"] = play_match[
+        "receiver_player_name"
+    ]
+    temp_dict["receiving_yards"] = int(play_match[
+        "receiving_yards"
+    ])
+    temp_dict["passing_yards"] = int(play_match[
+        "receiving_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "receiving_yards"
+    ])
+    temp_dict["lateral_receiver_player_name"] = play_match[
+        "lateral_receiver_player_name"
+    ]
+    temp_dict["lateral_receiving_yards"] = int(play_match[
+        "lateral_receiving_yards"
+    ])
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "fumbled_1_player_name"
+    ]
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_2 = play_match["yardline_2"]
+
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_yl_2 = get_yardline(temp_yl_2, posteam)
+    temp_dict["fumble_recovery_1_yards"] = temp_yl_1 - temp_yl_2
+
+    temp_dict["fumbled_2_team"] = posteam
+    temp_dict["fumbled_2_player_name"] = play_match[
+        "fumbled_2_player_name"
+    ]
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_2_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+
+    tacklers_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_complete_fumble_forced_recovered_tackled_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_complete_fumble_forced_recovered_tackled"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_complete_pass"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumble_forced"] = True
+
+    play_match = PBP_REGEX[
+        "pass_complete_fumble_forced_recovered_tackled"
+    ].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["pass_length"] = play_match["pass_length"]
+    temp_dict["pass_location"] = play_match["pass_location"]
+    temp_dict["receiver_player_name"] = play_match[
+        "receiver_player_name"
+    ]
+    temp_dict["receiving_yards"] = int(play_match[
+        "receiving_yards"
+    ])
+    temp_dict["passing_yards"] = int(play_match[
+        "receiving_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "receiving_yards"
+    ])
+
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "fumbled_1_player_name"
+    ]
+
+    temp_dict["forced_fumble_player_1_team"] = defteam
+    temp_dict["forced_fumble_player_1_player_name"] = play_match[
+        "forced_fumble_player_1_player_name"
+    ]
+
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_2 = play_match["yardline_2"]
+
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_yl_2 = get_yardline(temp_yl_2, posteam)
+    temp_dict["fumble_recovery_1_yards"] = temp_yl_2 - temp_yl_1
+
+    # tacklers_arr = play_arr[0][10]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_complete_fumble_forced_recovered_tackled_2_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_complete_fumble_forced_recovered_tackled_2"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_complete_pass"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumble_forced"] = True
+
+    play_match = PBP_REGEX[
+        "pass_complete_fumble_forced_recovered_tackled_2"
+    ].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["pass_length"] = play_match["pass_length"]
+    temp_dict["pass_location"] = play_match["pass_location"]
+    temp_dict["receiver_player_name"] = play_match[
+        "receiver_player_name"
+    ]
+    temp_dict["receiving_yards"] = int(play_match[
+        "receiving_yards"
+    ])
+    temp_dict["passing_yards"] = int(play_match[
+        "receiving_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "receiving_yards"
+    ])
+
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "fumbled_1_player_name"
+    ]
+
+    temp_dict["forced_fumble_player_1_team"] = defteam
+    # temp_dict["forced_fumble_player_1_player_name"] = play_arr[0][6]
+
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_2 = play_match["yardline_2"]
+
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_yl_2 = get_yardline(temp_yl_2, posteam)
+    temp_dict["fumble_recovery_1_yards"] = temp_yl_2 - temp_yl_1
+
+    tacklers_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_complete_fumble_forced_recovered_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_complete_fumble_forced_recovered"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_complete_pass"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumble_forced"] = True
+
+    play_match = PBP_REGEX[
+        "pass_complete_fumble_forced_recovered_tackled_3"
+    ].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["pass_length"] = play_match["pass_length"]
+    temp_dict["pass_location"] = play_match["pass_location"]
+    temp_dict["receiver_player_name"] = play_match[
+        "receiver_player_name"
+    ]
+    temp_dict["receiving_yards"] = int(play_match[
+        "receiving_yards"
+    ])
+    temp_dict["passing_yards"] = int(play_match[
+        "receiving_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "receiving_yards"
+    ])
+
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "fumbled_1_player_name"
+    ]
+
+    temp_dict["forced_fumble_player_1_team"] = defteam
+    temp_dict["forced_fumble_player_1_player_name"] = play_match[
+        "forced_fumble_player_1_player_name"
+    ]
+
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+
+    temp_dict["fumble_recovery_1_yards"] = 0
+
+    # tacklers_arr = play_arr[0][10]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_complete_fumble_forced_recovered_lateral_tackled_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_complete_fumble_forced_recovered_lateral_tackled"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_complete_pass"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumble_forced"] = True
+
+    play_match = PBP_REGEX[
+        "pass_complete_fumble_forced_recovered_lateral_tackled"
+    ].search(play_desc)
+    if play_match is None:
+        play_match = PBP_REGEX[
+            "pass_complete_fumble_forced_recovered_lateral_tackled_alt"
+        ].search(play_desc)
+
+        temp_dict["passer_player_name"] = play_match[
+            "passer_player_name"
+        ]
+        temp_dict["pass_length"] = play_match["pass_length"]
+        temp_dict["pass_location"] = play_match[
+            "pass_location"
+        ]
+        temp_dict["receiver_player_name"] = play_match[
+            "receiver_player_name"
+        ]
+        temp_dict["receiving_yards"] = int(play_match[
+            "receiving_yards"
+        ])
+        temp_dict["passing_yards"] = int(play_match[
+            "receiving_yards"
+        ])
+        temp_dict["yards_gained"] = int(play_match[
+            "receiving_yards"
+        ])
+
+        temp_dict["lateral_receiver_player_name"] = play_match[
+            "lateral_receiver_player_name"
+        ]
+        temp_dict["lateral_receiving_yards"] = int(play_match[
+            "lateral_receiving_yards"
+        ])
+
+        temp_dict["fumbled_1_team"] = posteam
+        temp_dict["fumbled_1_player_name"] = play_match[
+            "fumbled_1_player_name"
+        ]
+
+        temp_dict["forced_fumble_player_1_team"] = defteam
+        temp_dict["forced_fumble_player_1_player_name"] = play_match[
+            "forced_fumble_player_1_player_name"
+        ]
+
+        temp_dict["fumble_recovery_1_team"] = play_match[
+            "fumble_recovery_1_team"
+        ]
+        temp_dict["fumble_recovery_1_player_name"] = play_match[
+            "fumble_recovery_1_player_name"
+        ]
+
+        temp_yl_1 = play_match["yardline_1"]
+        temp_yl_2 = play_match["yardline_2"]
+
+        temp_yl_1 = get_yardline(temp_yl_1, posteam)
+        temp_yl_2 = get_yardline(temp_yl_2, posteam)
+        temp_dict["fumble_recovery_1_yards"] = temp_yl_2 - temp_yl_1
+
+        tacklers_arr = play_match["tacklers"]
+    else:
+        temp_dict["passer_player_name"] = play_match[
+            "passer_player_name"
+        ]
+        temp_dict["pass_length"] = play_match["pass_length"]
+        temp_dict["pass_location"] = play_match[
+            "pass_location"
+        ]
+        temp_dict["receiver_player_name"] = play_match[
+            "receiver_player_name"
+        ]
+        temp_dict["receiving_yards"] = int(play_match[
+            "receiving_yards"
+        ])
+        temp_dict["passing_yards"] = int(play_match[
+            "receiving_yards"
+        ])
+        temp_dict["yards_gained"] = int(play_match[
+            "receiving_yards"
+        ])
+
+        temp_dict["fumbled_1_team"] = posteam
+        temp_dict["fumbled_1_player_name"] = play_match[
+            "fumbled_1_player_name"
+        ]
+
+        temp_dict["forced_fumble_player_1_team"] = defteam
+        temp_dict["forced_fumble_player_1_player_name"] = play_match[
+            "forced_fumble_player_1_player_name"
+        ]
+
+        temp_dict["fumble_recovery_1_team"] = play_match[
+            "fumble_recovery_1_team"
+        ]
+        temp_dict["fumble_recovery_1_player_name"] = play_match[
+            "fumble_recovery_1_player_name"
+        ]
+
+        temp_dict["lateral_receiver_player_name"] = play_match[
+            "lateral_receiver_player_name"
+        ]
+        temp_dict["lateral_receiving_yards"] = int(play_match[
+            "lateral_receiving_yards"
+        ])
+
+        temp_yl_1 = play_match["yardline_1"]
+        temp_yl_2 = play_match["yardline_2"]
+
+        temp_yl_1 = get_yardline(temp_yl_1, posteam)
+        temp_yl_2 = get_yardline(temp_yl_2, posteam)
+        temp_dict["fumble_recovery_1_yards"] = temp_yl_2 - temp_yl_1
+
+        tacklers_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_complete_fumble_forced_recovered_tackled_3_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_complete_fumble_forced_recovered_tackled_3"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_complete_pass"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumble_forced"] = True
+
+    play_match = PBP_REGEX[
+        "pass_complete_fumble_forced_recovered_tackled_4"
+    ].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["pass_length"] = play_match["pass_length"]
+    temp_dict["pass_location"] = play_match["pass_location"]
+    temp_dict["receiver_player_name"] = play_match[
+        "receiver_player_name"
+    ]
+    temp_dict["receiving_yards"] = 0
+    temp_dict["passing_yards"] =   0
+    temp_dict["yards_gained"] =    0
+
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "fumbled_1_player_name"
+    ]
+
+    temp_dict["forced_fumble_player_1_team"] = defteam
+    temp_dict["forced_fumble_player_1_player_name"] = play_match[
+        "forced_fumble_player_1_player_name"
+    ]
+
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_2 = play_match["yardline_2"]
+
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_yl_2 = get_yardline(temp_yl_2, posteam)
+    temp_dict["fumble_recovery_1_yards"] = temp_yl_2 - temp_yl_1
+
+    tacklers_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_complete_fumble_forced_recovered_tackled_4_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_complete_fumble_forced_recovered_tackled_4"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_complete_pass"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumble_forced"] = True
+
+    play_match = PBP_REGEX[
+        "pass_complete_fumble_forced_recovered_tackled_5"
+    ].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["pass_length"] = play_match["pass_length"]
+    temp_dict["pass_location"] = play_match["pass_location"]
+    temp_dict["receiver_player_name"] = play_match[
+        "receiver_player_name"
+    ]
+    temp_dict["receiving_yards"] = int(play_match[
+        "receiving_yards"
+    ])
+    temp_dict["passing_yards"] = int(play_match[
+        "receiving_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "receiving_yards"
+    ])
+
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "fumbled_1_player_name"
+    ]
+
+    temp_dict["forced_fumble_player_1_team"] = defteam
+    temp_dict["forced_fumble_player_1_player_name"] = play_match[
+        "forced_fumble_player_1_player_name"
+    ]
+
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_2 = play_match["yardline_2"]
+
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_yl_2 = get_yardline(temp_yl_2, posteam)
+    temp_dict["fumble_recovery_1_yards"] = temp_yl_2 - temp_yl_1
+
+    tacklers_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_complete_ran_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_complete_ran_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_complete_pass"] = True
+    temp_dict["is_out_of_bounds"] = True
+    play_match = PBP_REGEX[
+        "pass_complete_ran_out_bounds"
+    ].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["pass_length"] = play_match["pass_length"]
+    temp_dict["pass_location"] = play_match["pass_location"]
+    temp_dict["receiver_player_name"] = play_match[
+        "receiver_player_name"
+    ]
+    # temp_dict["receiving_yards"] = int(play_arr[0][4])
+    # temp_dict["passing_yards"] = int(play_arr[0][4])
+    # temp_dict["yards_gained"] = int(play_arr[0][4])
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_complete_ran_out_bounds_2_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_complete_ran_out_bounds_2"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_complete_pass"] = True
+    temp_dict["is_out_of_bounds"] = True
+    play_match = PBP_REGEX[
+        "pass_complete_ran_out_bounds_2"
+    ].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["pass_length"] = play_match["pass_length"]
+    temp_dict["pass_location"] = play_match["pass_location"]
+    temp_dict["receiver_player_name"] = play_match[
+        "receiver_player_name"
+    ]
+    temp_dict["receiving_yards"] = int(play_match[
+        "receiving_yards"
+    ])
+    temp_dict["passing_yards"] = int(play_match[
+        "receiving_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "receiving_yards"
+    ])
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_complete_lateral_fumble_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_complete_lateral_fumble_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_complete_pass"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumble_not_forced"] = True
+    temp_dict["is_lateral_reception"] = True
+    play_match = PBP_REGEX[
+        "pass_complete_lateral_fumbles_out_bounds"
+    ].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["pass_length"] = play_match["pass_length"]
+    temp_dict["pass_location"] = play_match["pass_location"]
+    temp_dict["receiver_player_name"] = play_match[
+        "receiver_player_name"
+    ]
+    temp_dict["receiving_yards"] = int(play_match[
+        "receiving_yards"
+    ])
+    temp_dict["passing_yards"] = int(play_match[
+        "receiving_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "receiving_yards"
+    ])
+    temp_dict["lateral_receiver_player_name"] = play_match[
+        "lateral_receiver_player_name"
+    ]
+    temp_dict["lateral_receiving_yards"] = int(play_match[
+        "lateral_receiving_yards"
+    ])
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "fumbled_1_player_name"
+    ]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_complete_tackled_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_complete_tackled"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_complete_pass"] = True
+    play_match = PBP_REGEX[
+        "pass_complete_tackled"
+    ].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["pass_length"] = play_match["pass_length"]
+    temp_dict["pass_location"] = play_match["pass_location"]
+    temp_dict["receiver_player_name"] = play_match[
+        "receiver_player_name"
+    ]
+    # temp_dict["receiving_yards"] = int(play_arr[0][4])
+    # temp_dict["passing_yards"] = int(play_arr[0][4])
+    # temp_dict["yards_gained"] = int(play_arr[0][4])
+
+    tacklers_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_complete_tackled_2_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_complete_tackled_2"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_complete_pass"] = True
+    play_match = PBP_REGEX[
+        "pass_complete_tackled_2"
+    ].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["pass_length"] = play_match["pass_length"]
+    temp_dict["pass_location"] = play_match["pass_location"]
+    temp_dict["receiver_player_name"] = play_match[
+        "receiver_player_name"
+    ]
+    temp_dict["receiving_yards"] = int(play_match[
+        "receiving_yards"
+    ])
+    temp_dict["passing_yards"] = int(play_match[
+        "receiving_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "receiving_yards"
+    ])
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_complete_lateral_tackled_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_complete_lateral_tackled"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_complete_pass"] = True
+    play_match = PBP_REGEX[
+        "pass_complete_lateral_tackled"
+    ].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["pass_length"] = play_match["pass_length"]
+    temp_dict["pass_location"] = play_match["pass_location"]
+    temp_dict["receiver_player_name"] = play_match[
+        "receiver_player_name"
+    ]
+    temp_dict["receiving_yards"] = int(play_match[
+        "receiving_yards"
+    ])
+    temp_dict["passing_yards"] = int(play_match[
+        "receiving_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "receiving_yards"
+    ])
+    # "lateral_receiver_player_name": None,
+    # "lateral_receiving_yards": None,
+
+    temp_dict["lateral_receiver_player_name"] = play_match[
+        "lateral_receiver_player_name"
+    ]
+    temp_dict["lateral_receiving_yards"] = play_match[
+        "lateral_receiving_yards"
+    ]
+
+    tacklers_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_complete_tackled_3_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_complete_tackled_3"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_complete_pass"] = True
+    play_match = PBP_REGEX[
+        "pass_complete_tackled_3"
+    ].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["pass_length"] = play_match["pass_length"]
+    temp_dict["pass_location"] = play_match["pass_location"]
+    temp_dict["receiver_player_name"] = play_match[
+        "receiver_player_name"
+    ]
+    temp_dict["receiving_yards"] = int(play_match[
+        "receiving_yards"
+    ])
+    temp_dict["passing_yards"] = int(play_match[
+        "receiving_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "receiving_yards"
+    ])
+
+    tacklers_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_complete_fumble_forced_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_complete_fumble_forced_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_complete_pass"] = True
+    temp_dict["is_out_of_bounds"] = False
+    temp_dict["is_fumble"] = False
+    temp_dict["is_fumbled_forced"] = False
+    temp_dict["is_fumbled_out_of_bounds"] = False
+    play_match = PBP_REGEX[
+        "pass_complete_fumbles_forced_out_bounds"
+    ].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["pass_length"] = play_match["pass_length"]
+    temp_dict["pass_location"] = play_match["pass_location"]
+    temp_dict["receiver_player_name"] = play_match[
+        "receiver_player_name"
+    ]
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "fumbled_1_player_name"
+    ]
+    temp_dict["forced_fumble_player_1_team"] = defteam
+    temp_dict["forced_fumble_player_1_player_name"] = play_match[
+        "forced_fumble_player_1_player_name"
+    ]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_complete_fumble_forced_out_bounds_2_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_complete_fumble_forced_out_bounds_2"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_complete_pass"] = True
+    temp_dict["is_out_of_bounds"] = False
+    temp_dict["is_fumble"] = False
+    temp_dict["is_fumbled_forced"] = False
+    temp_dict["is_fumbled_out_of_bounds"] = False
+    play_match = PBP_REGEX[
+        "pass_complete_fumbles_forced_out_bounds_2"
+    ].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["pass_length"] = play_match["pass_length"]
+    temp_dict["pass_location"] = play_match["pass_location"]
+    temp_dict["receiver_player_name"] = play_match[
+        "receiver_player_name"
+    ]
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "fumbled_1_player_name"
+    ]
+    temp_dict["forced_fumble_player_1_team"] = defteam
+    temp_dict["forced_fumble_player_1_player_name"] = play_match[
+        "forced_fumble_player_1_player_name"
+    ]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_complete_pushed_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_complete_pushed_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_complete_pass"] = True
+    temp_dict["is_out_of_bounds"] = False
+    play_match = PBP_REGEX[
+        "pass_complete_pushed_out_bounds"
+    ].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["pass_length"] = play_match["pass_length"]
+    temp_dict["pass_location"] = play_match["pass_location"]
+    temp_dict["receiver_player_name"] = play_match[
+        "receiver_player_name"
+    ]
+    # temp_dict["receiving_yards"] = int(play_arr[0][4])
+    # temp_dict["passing_yards"] = int(play_arr[0][4])
+    # temp_dict["yards_gained"] = int(play_arr[0][4])
+
+    tacklers_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_complete_pushed_out_bounds_2_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_complete_pushed_out_bounds_2"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_complete_pass"] = True
+    temp_dict["is_out_of_bounds"] = False
+    play_match = PBP_REGEX[
+        "pass_complete_pushed_out_bounds_2"
+    ].search(play_desc)
+    if play_match is None:
+        play_match = PBP_REGEX[
+            "pass_complete_pushed_out_bounds_alt"
+        ].search(play_desc)
+        temp_dict["passer_player_name"] = play_match[
+            "passer_player_name"
+        ]
+        temp_dict["pass_length"] = play_match["pass_length"]
+        temp_dict["pass_location"] = play_match[
+            "pass_location"
+        ]
+        temp_dict["receiver_player_name"] = play_match[
+            "receiver_player_name"
+        ]
+        temp_dict["receiving_yards"] = int(play_match[
+            "receiving_yards"
+        ])
+        temp_dict["passing_yards"] = int(play_match[
+            "receiving_yards"
+        ])
+        temp_dict["yards_gained"] = int(play_match[
+            "receiving_yards"
+        ])
+
+        tacklers_arr = play_match["tacklers"]
+    else:
+        temp_dict["passer_player_name"] = play_match[
+            "passer_player_name"
+        ]
+        temp_dict["pass_length"] = play_match["pass_length"]
+        temp_dict["pass_location"] = play_match[
+            "pass_location"
+        ]
+        temp_dict["receiver_player_name"] = play_match[
+            "receiver_player_name"
+        ]
+        temp_dict["receiving_yards"] = int(play_match[
+            "receiving_yards"
+        ])
+        temp_dict["passing_yards"] = int(play_match[
+            "receiving_yards"
+        ])
+        temp_dict["yards_gained"] = int(play_match[
+            "receiving_yards"
+        ])
+
+        tacklers_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_interception_touchback_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_interception_touchback"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_incomplete_pass"] = True
+    temp_dict["is_interception"] = True
+    temp_dict["is_out_of_bounds"] = True
+    temp_dict["is_touchback"] = True
+    play_match = PBP_REGEX[
+        "pass_intercepted_touchback"
+    ].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["pass_length"] = play_match["pass_length"]
+    temp_dict["pass_location"] = play_match["pass_location"]
+
+    temp_dict["interception_player_name"] = play_match[
+        "interception_player_name"
+    ]
+    # tacklers_arr = play_arr[0][6]
+    # temp_yl_1 = play_arr[0][5]
+    # temp_yl_2 = play_arr[0][7]
+
+    # temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    # temp_yl_2 = get_yardline(temp_yl_2, posteam)
+
+    temp_dict["return_team"] = defteam
+    temp_dict["return_yards"] = 0
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_interception_ran_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_interception_ran_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_incomplete_pass"] = True
+    temp_dict["is_interception"] = True
+    temp_dict["is_out_of_bounds"] = True
+    play_match = PBP_REGEX[
+        "pass_intercepted_ran_out_bounds"
+    ].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["pass_length"] = play_match["pass_length"]
+    temp_dict["pass_location"] = play_match["pass_location"]
+
+    temp_dict["interception_player_name"] = play_match[
+        "interception_player_name"
+    ]
+    # tacklers_arr = play_arr[0][6]
+    # temp_yl_1 = play_arr[0][5]
+    # temp_yl_2 = play_arr[0][7]
+
+    # temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    # temp_yl_2 = get_yardline(temp_yl_2, posteam)
+
+    temp_dict["return_team"] = defteam
+    temp_dict["return_yards"] = 0
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_interception_pushed_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_interception_pushed_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_incomplete_pass"] = True
+    temp_dict["is_interception"] = True
+    temp_dict["is_out_of_bounds"] = True
+    play_match = PBP_REGEX[
+        "pass_intercepted_pushed_out_bounds"
+    ].search(play_desc)
+
+    if play_match is None:
+        play_match = PBP_REGEX[
+            "pass_intercepted_pushed_out_bounds_alt"
+        ].search(play_desc)
+        temp_dict["passer_player_name"] = play_match[
+            "passer_player_name"
+        ]
+        temp_dict["pass_length"] = play_match["pass_length"]
+        temp_dict["pass_location"] = play_match[
+            "pass_location"
+        ]
+
+        temp_dict["qb_hit_1_player_name"] = play_match[
+            "qb_hit_1_player_name"
+        ]
+        temp_dict["interception_player_name"] = play_match[
+            "interception_player_name"
+        ]
+
+        tacklers_arr = play_match["tacklers"]
+        temp_yl_1 = play_match["yardline_1"]
+        temp_yl_2 = play_match["yardline_2"]
+
+        temp_yl_1 = get_yardline(temp_yl_1, posteam)
+        temp_yl_2 = get_yardline(temp_yl_2, posteam)
+
+        temp_dict["return_team"] = defteam
+        temp_dict["return_yards"] = temp_yl_2 - temp_yl_1
+    else:
+        temp_dict["passer_player_name"] = play_match[
+            "passer_player_name"
+        ]
+        temp_dict["pass_length"] = play_match["pass_length"]
+        temp_dict["pass_location"] = play_match[
+            "pass_location"
+        ]
+
+        temp_dict["interception_player_name"] = play_match[
+            "interception_player_name"
+        ]
+        tacklers_arr = play_match["tacklers"]
+        temp_yl_1 = play_match["yardline_1"]
+        temp_yl_2 = play_match["yardline_2"]
+
+        temp_yl_1 = get_yardline(temp_yl_1, posteam)
+        temp_yl_2 = get_yardline(temp_yl_2, posteam)
+
+        temp_dict["return_team"] = defteam
+        temp_dict["return_yards"] = temp_yl_2 - temp_yl_1
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_interception_lateral_touchdown_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_interception_lateral_touchdown"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_incomplete_pass"] = True
+    temp_dict["is_interception"] = True
+    temp_dict["is_return_touchdown"] = True
+    play_match = PBP_REGEX[
+        "pass_intercepted_lateral_touchdown"
+    ].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["pass_length"] = play_match["pass_length"]
+    temp_dict["pass_location"] = play_match["pass_location"]
+
+    temp_dict["interception_player_name"] = play_match[
+        "interception_player_name"
+    ]
+    temp_dict["lateral_interception_player_name"] = play_match[
+        "lateral_interception_player_name"
+    ]
+
+    # tacklers_arr = play_arr[0][9]
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_2 = play_match["yardline_2"]
+
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_yl_2 = get_yardline(temp_yl_2, posteam)
+
+    temp_dict["return_team"] = defteam
+    temp_dict["return_yards"] = temp_yl_2 - temp_yl_1
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_interception_touchdown_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_interception_touchdown"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_incomplete_pass"] = True
+    temp_dict["is_interception"] = True
+    temp_dict["is_return_touchdown"] = True
+    play_match = PBP_REGEX[
+        "pass_intercepted_touchdown"
+    ].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["pass_length"] = play_match["pass_length"]
+    temp_dict["pass_location"] = play_match["pass_location"]
+
+    temp_dict["interception_player_name"] = play_match[
+        "interception_player_name"
+    ]
+    temp_yl_1 = play_match["yardline_1"]
+
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+
+    temp_dict["return_team"] = defteam
+    temp_dict["return_yards"] = 100 - temp_yl_1
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_interception_lateral_tackled_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_interception_lateral_tackled"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_incomplete_pass"] = True
+    temp_dict["is_interception"] = True
+    temp_dict["is_lateral_return"] = True
+    play_match = PBP_REGEX[
+        "pass_intercepted_lateral_tackled"
+    ].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["pass_length"] = play_match["pass_length"]
+    temp_dict["pass_location"] = play_match["pass_location"]
+
+    temp_dict["interception_player_name"] = play_match[
+        "interception_player_name"
+    ]
+    temp_dict["lateral_interception_player_name"] = play_match[
+        "lateral_interception_player_name"
+    ]
+
+    tacklers_arr = play_match["tacklers"]
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_2 = play_match["yardline_2"]
+
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_yl_2 = get_yardline(temp_yl_2, posteam)
+
+    temp_dict["return_team"] = defteam
+    temp_dict["return_yards"] = temp_yl_2 - temp_yl_1
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_interception_lateral_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_interception_lateral_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_incomplete_pass"] = True
+    temp_dict["is_interception"] = True
+    temp_dict["is_lateral_return"] = True
+    play_match = PBP_REGEX[
+        "pass_intercepted_lateral_tackled"
+    ].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["pass_length"] = play_match["pass_length"]
+    temp_dict["pass_location"] = play_match["pass_location"]
+
+    temp_dict["interception_player_name"] = play_match[
+        "interception_player_name"
+    ]
+    temp_dict["lateral_interception_player_name"] = play_match[
+        "lateral_interception_player_name"
+    ]
+
+    tacklers_arr = play_match["tacklers"]
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_2 = play_match["yardline_2"]
+
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_yl_2 = get_yardline(temp_yl_2, posteam)
+
+    temp_dict["return_team"] = defteam
+    temp_dict["return_yards"] = temp_yl_2 - temp_yl_1
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_interception_tackled_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_interception_tackled"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_incomplete_pass"] = True
+    temp_dict["is_interception"] = True
+    play_match = PBP_REGEX[
+        "pass_intercepted_tackled"
+    ].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["pass_length"] = play_match["pass_length"]
+    temp_dict["pass_location"] = play_match["pass_location"]
+
+    temp_dict["interception_player_name"] = play_match[
+        "interception_player_name"
+    ]
+    # tacklers_arr = play_arr[0][6]
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_2 = play_match["yardline_2"]
+
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_yl_2 = get_yardline(temp_yl_2, posteam)
+
+    temp_dict["return_team"] = defteam
+    temp_dict["return_yards"] = temp_yl_2 - temp_yl_1
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_interception_tackled_2_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_interception_tackled_2"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_incomplete_pass"] = True
+    temp_dict["is_interception"] = True
+    play_match = PBP_REGEX[
+        "pass_intercepted_tackled_2"
+    ].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["pass_length"] = play_match["pass_length"]
+    temp_dict["pass_location"] = play_match["pass_location"]
+
+    temp_dict["interception_player_name"] = play_match[
+        "interception_player_name"
+    ]
+    tacklers_arr = play_match["tacklers"]
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_2 = play_match["yardline_2"]
+
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_yl_2 = get_yardline(temp_yl_2, posteam)
+
+    temp_dict["return_team"] = defteam
+    temp_dict["return_yards"] = temp_yl_2 - temp_yl_1
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_spike_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"spike"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_incomplete_pass"] = True
+    temp_dict["is_qb_spike"] = True
+
+    play_match = PBP_REGEX["spikes_ball"].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_sack_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_sack"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_sack"] = True
+    play_match = PBP_REGEX["pass_sacked"].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    # temp_dict["yards_gained"] = int(play_arr[0][2])
+    tacklers_arr = play_match["tacklers"]
+    sack_players_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_pass_sack_2_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"pass_sack_2"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_pass_attempt"] = True
+    temp_dict["is_sack"] = True
+    play_match = PBP_REGEX["pass_sacked_2"].search(play_desc)
+    temp_dict["passer_player_name"] = play_match[
+        "passer_player_name"
+    ]
+    temp_dict["yards_gained"] = int(play_match["yards_gained"])
+    tacklers_arr = play_match["tacklers"]
+    sack_players_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_rush_up_middle_fumble_forced_recovered_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"rush_up_middle_fumble_forced_recovered"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["run_location"] = "middle"
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumble_forced"] = True
+    play_match = PBP_REGEX[
+        "rushed_up_middle_fumbles_forced_fumble_recovered_tackled_pushed_out_bounds"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "fumbled_1_player_name"
+    ]
+
+    temp_dict["forced_fumble_player_1_team"] = defteam
+    temp_dict["forced_fumble_player_1_player_name"] = play_match[
+        "forced_fumble_player_1_player_name"
+    ]
+
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_rush_up_middle_fumble_forced_recovered_tackled_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"rush_up_middle_fumble_forced_recovered_tackled"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["run_location"] = "middle"
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumble_forced"] = True
+    play_match = PBP_REGEX[
+        "rushed_up_middle_fumbles_forced_fumble_recovered_tackled"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    # temp_dict["run_location"] = play_arr[0][1]
+    # temp_dict["run_gap"] = play_arr[0][2]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "fumbled_1_player_name"
+    ]
+
+    temp_dict["forced_fumble_player_1_team"] = defteam
+    temp_dict["forced_fumble_player_1_player_name"] = play_match[
+        "forced_fumble_player_1_player_name"
+    ]
+
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+
+    tacklers_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_rush_fumble_forced_recovered_tackled_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"rush_fumble_forced_recovered_tackled"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["run_location"] = "middle"
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumble_forced"] = True
+    play_match = PBP_REGEX[
+        "rushed_fumbles_forced_fumble_recovered_tackled"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = play_match["run_location"]
+    temp_dict["run_gap"] = play_match["run_gap"]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "fumbled_1_player_name"
+    ]
+
+    temp_dict["forced_fumble_player_1_team"] = defteam
+    temp_dict["forced_fumble_player_1_player_name"] = play_match[
+        "forced_fumble_player_1_player_name"
+    ]
+
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "forced_fumble_player_1_player_name"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+
+    tacklers_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_rush_up_middle_tackled_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"rush_up_middle_tackled"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["run_location"] = "middle"
+    temp_dict["is_rush_attempt"] = True
+    play_match = PBP_REGEX[
+        "rushed_up_middle_tackled"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    # temp_dict["rushing_yards"] = int(play_arr[0][1])
+    # temp_dict["yards_gained"] = int(play_arr[0][1])
+    tacklers_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_rush_up_middle_tackled_2_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"rush_up_middle_tackled_2"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["run_location"] = "middle"
+    temp_dict["is_rush_attempt"] = True
+    play_match = PBP_REGEX[
+        "rushed_up_middle_tackled_2"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+    tacklers_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_rush_tackled_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"rush_tackled"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    play_match = PBP_REGEX["rushed_tackled"].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = play_match["run_location"]
+    temp_dict["run_gap"] = play_match["run_gap"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_rush_tackled_2_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"rush_tackled_2"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    play_match = PBP_REGEX[
+        "rushed_tackled_2"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = play_match["run_location"]
+    temp_dict["run_gap"] = play_match["run_gap"]
+    # temp_dict["rushing_yards"] = int(play_arr[0][3])
+    # temp_dict["yards_gained"] = int(play_arr[0][3])
+    tacklers_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_rush_ran_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"rush_ran_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    play_match = PBP_REGEX[
+        "rushed_ran_out_bounds"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = play_match["run_location"]
+    temp_dict["run_gap"] = play_match["run_gap"]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_rush_tackled_3_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"rush_tackled_3"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    play_match = PBP_REGEX[
+        "rushed_tackled_3"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = play_match["run_location"]
+    temp_dict["run_gap"] = play_match["run_gap"]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_rush_fumble_forced_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"rush_fumble_forced_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumble_not_forced"] = True
+    temp_dict["is_touchback"] = True
+    play_match = PBP_REGEX[
+        "rushed_fumbles_forced_recovered_out_bounds"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = play_match["run_location"]
+    temp_dict["run_gap"] = play_match["run_gap"]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "fumbled_1_player_name"
+    ]
+
+    temp_dict["forced_fumble_player_1_team"] = defteam
+    temp_dict["forced_fumble_player_1_player_name"] = play_match[
+        "forced_fumble_player_1_player_name"
+    ]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_rush_fumble_recovered_tackled_touchback_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"rush_fumble_recovered_tackled_touchback"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumble_not_forced"] = True
+    temp_dict["is_touchback"] = True
+    play_match = PBP_REGEX[
+        "rushed_fumbles_fumble_recovered_tackled_touchback"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = play_match["run_location"]
+    temp_dict["run_gap"] = play_match["run_gap"]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "fumbled_1_player_name"
+    ]
+
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+    temp_dict["fumble_recovery_1_yards"] = 0
+    tacklers_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_rush_fumble_recovered_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"rush_fumble_recovered"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_return_touchdown"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumbled_forced"] = True
+    play_match = PBP_REGEX[
+        "rushed_fumbles_fumble_recovered_forced"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = play_match["run_location"]
+    temp_dict["run_gap"] = play_match["run_gap"]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "fumbled_1_player_name"
+    ]
+
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+    temp_dict["fumble_recovery_1_yards"] = 0
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_rush_tackled_4_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"rush_tackled_4"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    play_match = PBP_REGEX[
+        "rushed_tackled_4"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = play_match["run_location"]
+    temp_dict["run_gap"] = play_match["run_gap"]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+    tacklers_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_rush_pushed_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"rush_pushed_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_out_of_bounds"] = True
+    play_match = PBP_REGEX[
+        "rushed_pushed_out_bounds"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = play_match["run_location"]
+    temp_dict["run_gap"] = play_match["run_gap"]
+    # temp_dict["rushing_yards"] = int(play_arr[0][3])
+    # temp_dict["yards_gained"] = int(play_arr[0][3])
+    tacklers_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_rush_up_middle_pushed_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"rush_up_middle_pushed_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_out_of_bounds"] = True
+    play_match = PBP_REGEX[
+        "rushed_up_middle_pushed_out_bounds"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = "middle"
+    # temp_dict["run_gap"] = play_arr[0][2]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+    tacklers_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_rush_lateral_pushed_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"rush_lateral_pushed_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_lateral_rush"] = True
+    temp_dict["is_out_of_bounds"] = True
+    play_match = PBP_REGEX[
+        "rushed_lateral_pushed_out_bounds"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = play_match["run_location"]
+    temp_dict["run_gap"] = play_match["run_gap"]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["lateral_rusher_player_name"] = play_match[
+        "lateral_rusher_player_name"
+    ]
+    temp_dict["lateral_rushing_yards"] = int(play_match[
+        "lateral_rushing_yards"
+    ])
+    temp_dict["yards_gained"] += int(play_match[
+        "lateral_rushing_yards"
+    ])
+
+    tacklers_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_rush_fumble_forced_recovered_pushed_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"rush_fumble_forced_recovered_pushed_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_out_of_bounds"] = True
+    play_match = PBP_REGEX[
+        "rushed_fumbles_forced_fumble_recovered_pushed_out_bounds"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = play_match["run_location"]
+    temp_dict["run_gap"] = play_match["run_gap"]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "fumbled_1_player_name"
+    ]
+
+    temp_dict["forced_fumble_player_1_team"] = defteam
+    temp_dict["forced_fumble_player_1_play"] = play_match[
+        "forced_fumble_player_1_play"
+    ]
+
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+    temp_dict["fumble_recovery_1_yards"] = 0
+
+    tacklers_arr = play_match["fumbled_1_player_name"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_rush_pushed_out_bounds_2_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"rush_pushed_out_bounds_2"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_out_of_bounds"] = True
+    play_match = PBP_REGEX[
+        "rushed_pushed_out_bounds_2"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = play_match["run_location"]
+    temp_dict["run_gap"] = play_match["run_gap"]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+    tacklers_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_rush_up_middle_touchdown_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"rush_up_middle_touchdown"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_rush_touchdown"] = True
+    play_match = PBP_REGEX[
+        "rushed_up_middle_touchdown"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["rushing_yards"] = 0
+    temp_dict["yards_gained"] = 0
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_rush_up_middle_touchdown_2_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"rush_up_middle_touchdown_2"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_rush_touchdown"] = True
+    play_match = PBP_REGEX[
+        "rushed_up_middle_touchdown_2"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_rush_touchdown_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"rush_touchdown"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_rush_touchdown"] = True
+    play_match = PBP_REGEX[
+        "rushed_touchdown"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = play_match["run_location"]
+    temp_dict["run_gap"] = play_match["run_gap"]
+    temp_dict["rushing_yards"] = yardline_100
+    temp_dict["yards_gained"] = yardline_100
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_rush_fumble_forced_recovered_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"rush_fumble_forced_recovered"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_return_touchdown"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumbled_forced"] = True
+    play_match = PBP_REGEX[
+        "rushed_fumbles_forced_fumble_recovered"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = play_match["run_location"]
+    temp_dict["run_gap"] = play_match["run_gap"]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "fumbled_1_player_name"
+    ]
+
+    temp_dict["forced_fumble_player_1_team"] = defteam
+    temp_dict["forced_fumble_player_1_play"] = play_match[
+        "forced_fumble_player_1_play"
+    ]
+
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+    temp_dict["fumble_recovery_1_yards"] = 0
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_rush_fumble_forced_recovered_touchdown_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"rush_fumble_forced_recovered_touchdown"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_return_touchdown"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumbled_forced"] = True
+    play_match = PBP_REGEX[
+        "rushed_fumbles_forced_fumble_recovered_touchdown"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = play_match["run_location"]
+    temp_dict["run_gap"] = play_match["run_gap"]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "fumbled_1_player_name"
+    ]
+
+    temp_dict["forced_fumble_player_1_team"] = defteam
+    temp_dict["forced_fumble_player_1_play"] = play_match[
+        "forced_fumble_player_1_play"
+    ]
+
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+    temp_dict["fumble_recovery_1_yards"] = 0
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_rush_fumble_forced_out_bounds_2_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"rush_fumble_forced_out_bounds_2"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_return_touchdown"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumbled_forced"] = True
+    play_match = PBP_REGEX[
+        "rushed_fumbles_forced_recovered_out_bounds_2"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = play_match["run_location"]
+    temp_dict["run_gap"] = play_match["run_gap"]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "fumbled_1_player_name"
+    ]
+
+    temp_dict["forced_fumble_player_1_team"] = defteam
+    temp_dict["forced_fumble_player_1_play"] = play_match[
+        "forced_fumble_player_1_play"
+    ]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_rush_touchdown_2_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"rush_touchdown_2"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_rush_touchdown"] = True
+    play_match = PBP_REGEX[
+        "rushed_touchdown_2"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = play_match["run_location"]
+    temp_dict["run_gap"] = play_match["run_gap"]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_scramble_up_middle_tackled_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"scramble_up_middle_tackled"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_qb_scramble"] = True
+    play_match = PBP_REGEX[
+        "scrambles_up_middle_tackled"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = "middle"
+    temp_dict["run_gap"] = "middle"
+    tacklers_arr = play_match["tacklers"]
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_dict["rushing_yards"] = yardline_100 - temp_yl_1
+    temp_dict["yards_gained"] = yardline_100 - temp_yl_1
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_scramble_forced_fumble_recovered_tackled_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"scramble_forced_fumble_recovered_tackled"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_qb_scramble"] = True
+    play_match = PBP_REGEX[
+        "scrambles_forced_fumble_recovered_tackled"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["rushing_yards"] = 0
+    temp_dict["yards_gained"] =  0
+    temp_dict["run_location"] = "middle"
+
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "fumbled_1_player_name"
+    ]
+
+    temp_dict["forced_fumble_player_1_team"] = defteam
+    temp_dict["forced_fumble_player_1_play"] = play_match[
+        "forced_fumble_player_1_play"
+    ]
+
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+    temp_dict["fumble_recovery_1_yards"] = 0
+
+    tacklers_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_scramble_tackled_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"scramble_tackled"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_qb_scramble"] = True
+    play_match = PBP_REGEX[
+        "scrambles_tackled"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = play_match["run_location"]
+    temp_dict["run_gap"] = play_match["run_gap"]
+    tacklers_arr = play_match["tacklers"]
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_dict["rushing_yards"] = yardline_100 - temp_yl_1
+    temp_dict["yards_gained"] = yardline_100 - temp_yl_1
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_scramble_up_middle_forced_fumble_recovered_tackled_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"scramble_up_middle_forced_fumble_recovered_tackled"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_qb_scramble"] = True
+    play_match = PBP_REGEX[
+        "scrambles_up_middle_forced_fumble_recovered_tackled"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["run_location"] = "middle"
+
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "fumbled_1_player_name"
+    ]
+
+    temp_dict["forced_fumble_player_1_team"] = defteam
+    temp_dict["forced_fumble_player_1_play"] = play_match[
+        "forced_fumble_player_1_play"
+    ]
+
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+    temp_dict["fumble_recovery_1_yards"] = 0
+
+    tacklers_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_scramble_up_middle_tackled_2_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"scramble_up_middle_tackled_2"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_qb_scramble"] = True
+    play_match = PBP_REGEX[
+        "scrambles_up_middle_tackled_2"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["run_location"] = "middle"
+
+    tacklers_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_scramble_pushed_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"scramble_pushed_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_qb_scramble"] = True
+    temp_dict["is_out_of_bounds"] = True
+    play_match = PBP_REGEX[
+        "scrambles_pushed_out_bounds"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = play_match["run_location"]
+    temp_dict["run_gap"] = play_match["run_gap"]
+    # temp_dict["rushing_yards"] = int(play_arr[0][3])
+    # temp_dict["yards_gained"] = int(play_arr[0][3])
+
+    tacklers_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_scramble_up_middle_pushed_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"scramble_up_middle_pushed_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_qb_scramble"] = True
+    temp_dict["is_out_of_bounds"] = True
+    play_match = PBP_REGEX[
+        "scrambles_up_middle_pushed_out_bounds"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = "middle"
+    # temp_dict["run_gap"] = play_arr[0][2]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+
+    tacklers_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_scramble_up_middle_touchdown_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"scramble_up_middle_touchdown"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_qb_scramble"] = True
+    temp_dict["is_touchdown"] = True
+    temp_dict["is_rush_touchdown"] = True
+    play_match = PBP_REGEX[
+        "scrambles_up_middle_touchdown"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = 'middle'
+    # temp_dict["run_gap"] = play_arr[0][2]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_scramble_touchdown_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"scramble_touchdown"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_qb_scramble"] = True
+    temp_dict["is_touchdown"] = True
+    temp_dict["is_rush_touchdown"] = True
+    play_match = PBP_REGEX[
+        "scrambles_touchdown"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = play_match["run_location"]
+    temp_dict["run_gap"] = play_match["run_gap"]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_scramble_pushed_out_bounds_2_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"scramble_pushed_out_bounds_2"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_qb_scramble"] = True
+    temp_dict["is_out_of_bounds"] = True
+    play_match = PBP_REGEX[
+        "scrambles_pushed_out_bounds_2"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = play_match["run_location"]
+    temp_dict["run_gap"] = play_match["run_gap"]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+
+    tacklers_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_scramble_tackled_fumble_forced_recovered_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"scramble_tackled_fumble_forced_recovered"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_qb_scramble"] = True
+    play_match = PBP_REGEX[
+        "scrambles_tackled_fumbles_forced_recovered"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = play_match["run_location"]
+    temp_dict["run_gap"] = play_match["run_gap"]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "fumbled_1_player_name"
+    ]
+
+    temp_dict["forced_fumble_player_1_team"] = defteam
+    temp_dict["forced_fumble_player_1_play"] = play_match[
+        "forced_fumble_player_1_play"
+    ]
+
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+    temp_dict["fumble_recovery_1_yards"] = 0
+
+    # tacklers_arr = play_arr[0][4]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_scramble_tackled_2_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"scramble_tackled_2"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_qb_scramble"] = True
+    play_match = PBP_REGEX[
+        "scrambles_tackled_2"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = play_match["run_location"]
+    temp_dict["run_gap"] = play_match["run_gap"]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+
+    # tacklers_arr = play_arr[0][4]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_scramble_tackled_fumble_forced_recovered_2_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"scramble_tackled_fumble_forced_recovered_2"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_qb_scramble"] = True
+    play_match = PBP_REGEX[
+        "scrambles_tackled_fumbles_forced_fumble_recovered"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = play_match["run_location"]
+    temp_dict["run_gap"] = play_match["run_gap"]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "fumbled_1_player_name"
+    ]
+
+    temp_dict["forced_fumble_player_1_team"] = defteam
+    temp_dict["forced_fumble_player_1_player_name"] = play_match[
+        "forced_fumble_player_1_player_name"
+    ]
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+
+    tacklers_arr = play_match["tacklers"]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_scramble_up_middle_ran_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"scramble_up_middle_ran_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_qb_scramble"] = True
+    play_match = PBP_REGEX[
+        "scrambles_up_middle_ran_out_bounds"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = "middle"
+    # temp_dict["run_gap"] = play_arr[0][2]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_scramble_ran_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"scramble_ran_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_rush_attempt"] = True
+    temp_dict["is_qb_scramble"] = True
+    play_match = PBP_REGEX[
+        "scrambles_ran_out_bounds"
+    ].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_dict["run_location"] = play_match["run_location"]
+    temp_dict["run_gap"] = play_match["run_gap"]
+    temp_dict["rushing_yards"] = int(play_match[
+        "rushing_yards"
+    ])
+    temp_dict["yards_gained"] = int(play_match[
+        "rushing_yards"
+    ])
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_kneel_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"kneel"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_qb_kneel"] = True
+    temp_dict["is_rush_attempt"] = True
+    play_match = PBP_REGEX["kneels"].search(play_desc)
+    temp_dict["rusher_player_name"] = play_match[
+        "rusher_player_name"
+    ]
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_dict["rushing_yards"] = yardline_100 - temp_yl_1
+    temp_dict["yards_gained"] = yardline_100 - temp_yl_1
+    del temp_yl_1
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_field_goal_end_zone_touchdown_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"field_goal_end_zone_touchdown"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_field_goal_attempt"] = True
+    temp_dict["is_return_touchdown"] = True
+    temp_dict["return_team"] = defteam
+
+    play_match = PBP_REGEX[
+        "field_goal_attempt_returned_end_zone_touchdown"
+    ].search(play_desc)
+
+    temp_dict["kicker_player_name"] = play_match[
+        "kicker_player_name"
+    ]
+    if play_match["kick_distance"] is None:
+        temp_dict["kick_distance"] = yardline_100 + 10 + 7
+    else:
+        temp_dict["kick_distance"] = int(play_match[
+            "kick_distance"
+        ])
+    temp_dict["field_goal_result"] = "miss"
+    temp_dict["long_snapper_player_name"] = play_match[
+        "long_snapper_player_name"
+    ]
+    temp_dict["holder_player_name"] = play_match[
+        "holder_player_name"
+    ]
+    temp_dict["punt_returner_player_name"] = play_match[
+        "punt_returner_player_name"
+    ]
+    temp_dict["return_yards"] = 100
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_four_point_field_goal_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"four_point_field_goal"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_4pt_field_goal_attempt"] = True
+    temp_dict["is_field_goal_attempt"] = True
+    play_match = PBP_REGEX[
+        "four_point_field_goal_attempt_penalty_on_play"
+    ].search(play_desc)
+    temp_dict["kicker_player_name"] = play_match[
+        "kicker_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_dict["field_goal_result"] = play_match[
+        "field_goal_result"
+    ]
+    temp_dict["long_snapper_player_name"] = play_match[
+        "long_snapper_player_name"
+    ]
+    temp_dict["holder_player_name"] = play_match[
+        "holder_player_name"
+    ]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_field_goal_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"field_goal"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_field_goal_attempt"] = True
+    play_match = PBP_REGEX[
+        "field_goal_attempt_penalty_on_play"
+    ].search(play_desc)
+    temp_dict["kicker_player_name"] = play_match[
+        "kicker_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_dict["field_goal_result"] = play_match[
+        "field_goal_result"
+    ]
+    temp_dict["long_snapper_player_name"] = play_match[
+        "long_snapper_player_name"
+    ]
+    temp_dict["holder_player_name"] = play_match[
+        "holder_player_name"
+    ]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_field_goal_penalty_on_play_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"field_goal_penalty_on_play"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_field_goal_attempt"] = True
+    play_match = PBP_REGEX[
+        "field_goal_attempt_penalty_on_play_2"
+    ].search(play_desc)
+    if play_match is None:
+        play_match = PBP_REGEX[
+            "field_goal_attempt_penalty_on_play"
+        ].search(play_desc)
+        temp_dict["kicker_player_name"] = play_match[
+            "kicker_player_name"
+        ]
+        temp_dict["kick_distance"] = int(play_match[
+            "kick_distance"
+        ])
+        temp_dict["field_goal_result"] = play_match[
+            "field_goal_result"
+        ]
+        temp_dict["long_snapper_player_name"] = play_match[
+            "long_snapper_player_name"
+        ]
+        temp_dict["holder_player_name"] = play_match[
+            "holder_player_name"
+        ]
+    else:
+        temp_dict["kicker_player_name"] = play_match[
+            "kicker_player_name"
+        ]
+        # temp_dict["kick_distance"] = int(play_arr[0][1])
+        temp_dict["field_goal_result"] = play_match[
+            "field_goal_result"
+        ]
+        temp_dict["long_snapper_player_name"] = play_match[
+            "long_snapper_player_name"
+        ]
+        temp_dict["holder_player_name"] = play_match[
+            "holder_player_name"
+        ]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_kickoff_muff_catch_fumble_recovered_tackled_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"kickoff_muff_catch_fumble_recovered_tackled"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_kickoff_attempt"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumble_not_forced"] = True
+
+    play_match = PBP_REGEX[
+        "kicks_muffs_catch_fumble_recovered_tackled"
+    ].search(play_desc)
+
+    temp_dict["kicker_player_name"] = play_match[
+        "kicker_player_name"
+    ]
+    # temp_dict["kick_distance"] = int(play_arr[0][1])
+    temp_dict["kickoff_returner_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_2 = play_match["yardline_2"]
+
+    tacklers_arr = play_match["tacklers"]
+
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_yl_2 = get_yardline(temp_yl_2, posteam)
+    # test = temp_yl_1 - temp_yl_2
+    temp_dict["fumble_recovery_1_yards"] = temp_yl_1 - temp_yl_2
+    temp_dict["return_yards"] = 0
+
+    if temp_yl_2 > 80:
+        temp_dict["is_kickoff_inside_twenty"] = True
+    del temp_yl_1, temp_yl_2
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_kickoff_fumble_forced_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"kickoff_fumble_forced_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_kickoff_attempt"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumble_forced"] = True
+
+    play_match = PBP_REGEX[
+        "kicks_fumbles_forced_out_bounds"
+    ].search(play_desc)
+
+    temp_dict["kicker_player_name"] = play_match[
+        "kicker_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_dict["kickoff_returner_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+
+    temp_dict["forced_fumble_player_1_team"] = defteam
+    temp_dict["forced_fumble_player_1_player_name"] = play_match[
+        "forced_fumble_player_1_player_name"
+    ]
+
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+
+    if temp_yl_1 > 80:
+        temp_dict["is_kickoff_inside_twenty"] = True
+    del temp_yl_1
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_kickoff_fumble_forced_recovered_pushed_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"kickoff_fumble_forced_recovered_pushed_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_kickoff_attempt"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumble_forced"] = True
+
+    play_match = PBP_REGEX[
+        "kicks_fumbles_forced_fumble_recovered_pushed_out_bounds"
+    ].search(play_desc)
+
+    temp_dict["kicker_player_name"] = play_match[
+        "kicker_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_dict["kickoff_returner_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+
+    temp_dict["forced_fumble_player_1_team"] = defteam
+    temp_dict["forced_fumble_player_1_player_name"] = play_match[
+        "forced_fumble_player_1_player_name"
+    ]
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_2 = play_match["yardline_2"]
+
+    # tacklers_arr = play_arr[0][8]
+
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_yl_2 = get_yardline(temp_yl_2, posteam)
+    # test = temp_yl_1 - temp_yl_2
+    temp_dict["fumble_recovery_1_yards"] = temp_yl_1 -  temp_yl_2
+    temp_dict["return_yards"] = 0
+
+    if temp_yl_1 > 80:
+        temp_dict["is_kickoff_inside_twenty"] = True
+    del temp_yl_1
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_kickoff_pushed_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"kickoff_pushed_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_kickoff_attempt"] = True
+    temp_dict["is_out_of_bounds"] = True
+    play_match = PBP_REGEX[
+        "kicks_returns_kickoff_pushed_out_bounds"
+    ].search(play_desc)
+    temp_dict["kicker_player_name"] = play_match[
+        "kicker_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_yl_1 = play_match["yardline_1"]
+    temp_dict["kickoff_returner_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+    tacklers_arr = play_match["tacklers"]
+    temp_yl_2 = play_match["yardline_2"]
+
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_yl_2 = get_yardline(temp_yl_2, posteam)
+    temp_dict["return_yards"] = temp_yl_1 - temp_yl_2
+
+    if temp_yl_2 > 80:
+        temp_dict["is_kickoff_inside_twenty"] = True
+    del temp_yl_1, temp_yl_2
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_kickoff_muff_catch_fumble_recovered_ran_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"kickoff_muff_catch_fumble_recovered_ran_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_kickoff_attempt"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumble_not_forced"] = True
+
+    play_match = PBP_REGEX[
+        "kicks_muffs_catch_fumble_recovered_ran_out_bounds"
+    ].search(play_desc)
+
+    temp_dict["kicker_player_name"] = play_match[
+        "kicker_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_dict["kickoff_returner_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+
+    temp_yl_1 = play_match["yardline_1"]
+    # temp_yl_2 = play_arr[0][9]
+
+    # tacklers_arr = play_arr[0][8]
+
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    # temp_yl_2 = get_yardline(temp_yl_2, posteam)
+    temp_dict["fumble_recovery_1_yards"] = 0
+    temp_dict["return_yards"] = 0
+
+    if temp_yl_1 > 80:
+        temp_dict["is_kickoff_inside_twenty"] = True
+    del temp_yl_1
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_kickoff_muff_catch_fumble_recovered_pushed_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"kickoff_muff_catch_fumble_recovered_pushed_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_kickoff_attempt"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumble_not_forced"] = True
+
+    play_match = PBP_REGEX[
+        "kicks_muffs_catch_fumble_recovered_pushed_out_bounds"
+    ].search(play_desc)
+
+    temp_dict["kicker_player_name"] = play_match[
+        "kicker_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_dict["kickoff_returner_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_2 = play_match["yardline_2"]
+
+    tacklers_arr = play_match["tacklers"]
+
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_yl_2 = get_yardline(temp_yl_2, posteam)
+    # test = temp_yl_1 - temp_yl_2
+    temp_dict["fumble_recovery_1_yards"] = temp_yl_1 - temp_yl_2
+    temp_dict["return_yards"] = 0
+
+    if temp_yl_2 > 80:
+        temp_dict["is_kickoff_inside_twenty"] = True
+    del temp_yl_1, temp_yl_2
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_kickoff_muff_catch_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"kickoff_muff_catch_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_kickoff_attempt"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumble_not_forced"] = True
+
+    play_match = PBP_REGEX[
+        "kicks_muffs_catch_out_bounds"
+    ].search(play_desc)
+
+    temp_dict["kicker_player_name"] = play_match[
+        "kicker_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_dict["kickoff_returner_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+
+    # temp_dict["fumble_recovery_1_team"] = play_arr[0][5]
+    # temp_dict["fumble_recovery_1_player_name"] = play_arr[0][6]
+
+    temp_yl_1 = play_match["yardline_1"]
+    # temp_yl_2 = play_arr[0][9]
+
+    # tacklers_arr = play_arr[0][8]
+
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    # temp_yl_2 = get_yardline(temp_yl_2, posteam)
+    temp_dict["fumble_recovery_1_yards"] = 0
+    temp_dict["return_yards"] = 0
+
+    if temp_yl_1 > 80:
+        temp_dict["is_kickoff_inside_twenty"] = True
+    del temp_yl_1
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_kickoff_muff_catch_fumble_recovered_tackled_2_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"kickoff_muff_catch_fumble_recovered_tackled_2"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_kickoff_attempt"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumble_not_forced"] = True
+
+    play_match = PBP_REGEX[
+        "kicks_muffs_catch_fumble_recovered_tackled_2"
+    ].search(play_desc)
+
+    temp_dict["kicker_player_name"] = play_match[
+        "kicker_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_dict["kickoff_returner_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_2 = play_match["yardline_2"]
+
+    tacklers_arr = play_match["tacklers"]
+
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_yl_2 = get_yardline(temp_yl_2, posteam)
+    # test = temp_yl_1 - temp_yl_2
+    temp_dict["fumble_recovery_1_yards"] = temp_yl_1 - temp_yl_2
+    temp_dict["return_yards"] = 0
+
+    if temp_yl_2 > 80:
+        temp_dict["is_kickoff_inside_twenty"] = True
+    del temp_yl_1, temp_yl_2
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_kickoff_fumble_forced_recovered_tackled_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"kickoff_fumble_forced_recovered_tackled"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_kickoff_attempt"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumble_forced"] = True
+
+    play_match = PBP_REGEX[
+        "kicks_returns_kickoff_fumbles_forced_fumble_recovered_tackled"
+    ].search(play_desc)
+
+    temp_dict["kicker_player_name"] = play_match[
+        "kicker_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_dict["kickoff_returner_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "fumbled_1_player_name"
+    ]
+
+    temp_dict["forced_fumble_player_1_team"] = defteam
+    temp_dict["forced_fumble_player_1_player_name"] = play_match[
+        "forced_fumble_player_1_player_name"
+    ]
+
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_2 = play_match["yardline_2"]
+
+    tacklers_arr = play_match["tacklers"]
+
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_yl_2 = get_yardline(temp_yl_2, posteam)
+    temp_dict["fumble_recovery_1_yards"] = temp_yl_2 - temp_yl_1
+    temp_dict["return_yards"] = 0
+
+    if temp_yl_2 > 80:
+        temp_dict["is_kickoff_inside_twenty"] = True
+    del temp_yl_1, temp_yl_2
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_kickoff_fumble_forced_recovered_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"kickoff_fumble_forced_recovered"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_kickoff_attempt"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumble_forced"] = True
+
+    play_match = PBP_REGEX[
+        "kicks_returns_kickoff_fumbles_forced_fumble_recovered"
+    ].search(play_desc)
+
+    temp_dict["kicker_player_name"] = play_match[
+        "kicker_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_dict["kickoff_returner_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "fumbled_1_player_name"
+    ]
+
+    temp_dict["forced_fumble_player_1_team"] = defteam
+    temp_dict["forced_fumble_player_1_player_name"] = play_match[
+        "forced_fumble_player_1_player_name"
+    ]
+
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+
+    # temp_yl_1 = play_arr[0][9]
+    temp_yl_2 = play_match["yardline_2"]
+
+    # tacklers_arr = play_arr[0][10]
+
+    # temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_yl_2 = get_yardline(temp_yl_2, posteam)
+    temp_dict["fumble_recovery_1_yards"] = 0
+    temp_dict["return_yards"] = 0
+
+    if temp_yl_2 > 80:
+        temp_dict["is_kickoff_inside_twenty"] = True
+    del temp_yl_2
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_kickoff_fumble_recovered_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"kickoff_fumble_recovered"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_kickoff_attempt"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumble_forced"] = True
+
+    play_match = PBP_REGEX[
+        "kicks_returns_kickoff_fumbles_fumble_recovered_tackled"
+    ].search(play_desc)
+
+    temp_dict["kicker_player_name"] = play_match[
+        "kicker_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_dict["kickoff_returner_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+
+    temp_dict["fumbled_1_team"] = posteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "fumbled_1_player_name"
+    ]
+
+    # temp_dict["forced_fumble_player_1_team"] = defteam
+    # temp_dict["forced_fumble_player_1_player_name"] = play_arr[0][6]
+
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+
+    # temp_yl_1 = play_arr[0][9]
+    temp_yl_2 = play_match["yardline_2"]
+
+    # tacklers_arr = play_arr[0][10]
+
+    # temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_yl_2 = get_yardline(temp_yl_2, posteam)
+    temp_dict["fumble_recovery_1_yards"] = 0
+    temp_dict["return_yards"] = 0
+
+    if temp_yl_2 > 80:
+        temp_dict["is_kickoff_inside_twenty"] = True
+    del temp_yl_2
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_kickoff_lateral_tackled_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"kickoff_lateral_tackled"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_kickoff_attempt"] = True
+    temp_dict["is_lateral_return"] = True
+    play_match = PBP_REGEX[
+        "kicks_returns_kickoff_lateral_tackled"
+    ].search(play_desc)
+    temp_dict["kicker_player_name"] = play_match[
+        "kicker_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_yl_1 = play_match["yardline_1"]
+    temp_dict["kickoff_returner_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+    tacklers_arr = play_match["tacklers"]
+    temp_yl_2 = play_match["yardline_2"]
+    temp_dict["lateral_kickoff_returner_player_name"] = play_match[
+        "lateral_kickoff_returner_player_name"
+    ]
+
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_yl_2 = get_yardline(temp_yl_2, posteam)
+    temp_dict["return_yards"] = temp_yl_1 - temp_yl_2
+
+    if temp_yl_2 > 80:
+        temp_dict["is_kickoff_inside_twenty"] = True
+    del temp_yl_1, temp_yl_2
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_kickoff_tackled_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"kickoff_tackled"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_kickoff_attempt"] = True
+    play_match = PBP_REGEX[
+        "kicks_returns_kickoff_tackled"
+    ].search(play_desc)
+    temp_dict["kicker_player_name"] = play_match[
+        "kicker_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_yl_1 = play_match["yardline_1"]
+    temp_dict["kickoff_returner_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+    tacklers_arr = play_match["tacklers"]
+    temp_yl_2 = play_match["yardline_2"]
+
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_yl_2 = get_yardline(temp_yl_2, posteam)
+    temp_dict["return_yards"] = temp_yl_1 - temp_yl_2
+
+    if temp_yl_2 > 80:
+        temp_dict["is_kickoff_inside_twenty"] = True
+    del temp_yl_1, temp_yl_2
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_kickoff_ran_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"kickoff_ran_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_kickoff_attempt"] = True
+    # temp_dict["is_touchback"] = True
+    play_match = PBP_REGEX[
+        "kicks_returns_kickoff_ran_out_bounds"
+    ].search(play_desc)
+    temp_dict["kicker_player_name"] = play_match[
+        "kicker_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+
+    temp_dict["kickoff_returner_player_name"] = play_match[
+        "yardline_1"
+    ]
+    temp_dict["return_yards"] = 0
+    if temp_yl_1 > 80:
+        temp_dict["is_kickoff_inside_twenty"] = True
+    del temp_yl_1
 
-                    temp_df["passer_player_name"] = play_arr[0][1]
-                    temp_df["interception_player_name"] = play_arr[0][2]
-                    success_or_failure = play_arr[0][4].lower()
-                    if (
-                        "suc" in success_or_failure and
-                        "one" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_one_point_attempt_success"] = True
-                    elif (
-                        "suc" in success_or_failure and
-                        "two" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_two_point_attempt_success"] = True
-                    elif (
-                        "suc" in success_or_failure and
-                        "three" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_three_point_attempt_success"] = True
-
-                    if "suc" in play_arr[0][5]:
-                        temp_df["is_defensive_two_point_attempt"] = True
-                elif (
-                    "-point conversion attempt" in play_desc.lower() and
-                    "pass" in play_desc.lower() and
-                    "catch made" in play_desc.lower() and
-                    "for yards" in play_desc.lower() and
-                    "pushed out of bounds by" in play_desc.lower()
-                ):
-                    play_arr = re.findall(
-                        r"([A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. ([a-zA-Z\'\.\-\,\; ]+) steps back to pass\. Catch made by ([a-zA-Z\'\.\-\,\; ]+) for yards\. Pushed out of bounds by ([a-zA-Z\'\.\-\,\; ]+) at ([A-Z0-9 ]+)\. ([A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ ([a-zA-Z]+)\.",
-                        play_desc
-                    )
-                    if "one" in play_arr[0][0].lower():
-                        temp_df["is_one_point_attempt"] = True
-                    elif "two" in play_arr[0][0].lower():
-                        temp_df["is_two_point_attempt"] = True
-                    elif "three" in play_arr[0][0].lower():
-                        temp_df["is_three_point_attempt"] = True
-
-                    temp_df["passer_player_name"] = play_arr[0][1]
-                    temp_df["receiver_player_name"] = play_arr[0][2]
-                    tacklers_arr = play_arr[0][3]
-                    success_or_failure = play_arr[0][6].lower()
-
-                    if (
-                        "suc" in success_or_failure and
-                        "one" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_one_point_attempt_success"] = True
-                    elif (
-                        "suc" in success_or_failure and
-                        "two" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_two_point_attempt_success"] = True
-                    elif (
-                        "suc" in success_or_failure and
-                        "three" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_three_point_attempt_success"] = True
-                elif (
-                    "-point conversion attempt" in play_desc.lower() and
-                    "pass" in play_desc.lower() and
-                    "catch made" in play_desc.lower() and
-                    "for yards" in play_desc.lower()
-                ):
-                    play_arr = re.findall(
-                        r"([A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. ([a-zA-Z\'\.\-\,\; ]+) steps back to pass\. Catch made by ([a-zA-Z\'\.\-\,\; ]+) for yards\. ([A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ ([a-zA-Z]+)\.",
-                        play_desc
-                    )
-                    if "one" in play_arr[0][0].lower():
-                        temp_df["is_one_point_attempt"] = True
-                    elif "two" in play_arr[0][0].lower():
-                        temp_df["is_two_point_attempt"] = True
-                    elif "three" in play_arr[0][0].lower():
-                        temp_df["is_three_point_attempt"] = True
-
-                    temp_df["passer_player_name"] = play_arr[0][1]
-                    temp_df["receiver_player_name"] = play_arr[0][2]
-                    success_or_failure = play_arr[0][4].lower()
-
-                    if (
-                        "suc" in success_or_failure and
-                        "one" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_one_point_attempt_success"] = True
-                    elif (
-                        "suc" in success_or_failure and
-                        "two" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_two_point_attempt_success"] = True
-                    elif (
-                        "suc" in success_or_failure and
-                        "three" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_three_point_attempt_success"] = True
-                elif (
-                    "-point conversion attempt" in play_desc.lower() and
-                    "pass" in play_desc.lower() and
-                    "intercepts the ball" in play_desc.lower() and
-                    "tackled by at" in play_desc.lower() and
-                    "defensive conversion recovery" in play_desc.lower()
-                ):
-                    play_arr = re.findall(
-                        r"([A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. ([a-zA-Z\'\.\-\,\; ]+) steps back to pass\. ([a-zA-Z\'\.\-\,\; ]+) intercepts the ball\. Tackled by at ([A-Za-z0-9\s]+)\. ([A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ ([a-zA-Z]+)\. [DEFENSIVE|defensive]+ [CONVERSION|conversion]+ [RECOVERY|recovery]+ ([A-Z]+)\.",
-                        play_desc
-                    )
-                    if "one" in play_arr[0][0].lower():
-                        temp_df["is_one_point_attempt"] = True
-                    elif "two" in play_arr[0][0].lower():
-                        temp_df["is_two_point_attempt"] = True
-                    elif "three" in play_arr[0][0].lower():
-                        temp_df["is_three_point_attempt"] = True
-
-                    temp_df["passer_player_name"] = play_arr[0][1]
-                    temp_df["interception_player_name"] = play_arr[0][2]
-                    success_or_failure = play_arr[0][5].lower()
-
-                    if (
-                        "suc" in success_or_failure and
-                        "one" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_one_point_attempt_success"] = True
-                    elif (
-                        "suc" in success_or_failure and
-                        "two" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_two_point_attempt_success"] = True
-                    elif (
-                        "suc" in success_or_failure and
-                        "three" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_three_point_attempt_success"] = True
-
-                    if "suc" in play_arr[0][6]:
-                        temp_df["is_defensive_two_point_conv"] = True
-                elif (
-                    "-point conversion attempt" in play_desc.lower() and
-                    "rushed up the middle" in play_desc.lower() and
-                    "fumbles" in play_desc.lower() and
-                    "forced by" in play_desc.lower() and
-                    "recovers the fumble" in play_desc.lower() and
-                    "tackled by" in play_desc.lower() and
-                    "defensive conversion recovery" in play_desc.lower()
-                ):
-                    temp_df["is_defensive_two_point_attempt"] = True
-                    play_arr = re.findall(
-                        r"([A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. ([a-zA-Z\'\.\-\, ]+) rushed up the middle to ([A-Za-z0-9\s]+) for yard[s]?\. ([a-zA-Z\'\.\-\, ]+) [FUMBLES|fumbles]+\, forced by ([a-zA-Z\'\.\-\, ]+)\. ([a-zA-Z\'\.\-\, ]+) recovers the fumble\. Tackled by ([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. ([A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ ([a-zA-Z]+)\. [DEFENSIVE|defensive]+ [CONVERSION|conversion]+ [RECOVERY|recovery]+ ([A-Z]+)\.",
-                        play_desc
-                    )
-                    if "one" in play_arr[0][0].lower():
-                        temp_df["is_one_point_attempt"] = True
-                    elif "two" in play_arr[0][0].lower():
-                        temp_df["is_two_point_attempt"] = True
-                    elif "three" in play_arr[0][0].lower():
-                        temp_df["is_three_point_attempt"] = True
-
-                    temp_df["rusher_player_name"] = play_arr[0][1]
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][3]
-                    temp_df["forced_fumble_player_1_team"] = defteam
-                    temp_df["forced_fumble_player_1_player_name"] = play_arr[0][4]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][5]
-                    tacklers_arr = play_arr[0][6]
-
-                    success_or_failure = play_arr[0][9].lower()
-
-                    if (
-                        "suc" in success_or_failure and
-                        "one" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_one_point_attempt_success"] = True
-                    elif (
-                        "suc" in success_or_failure and
-                        "two" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_two_point_attempt_success"] = True
-                    elif (
-                        "suc" in success_or_failure and
-                        "three" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_three_point_attempt_success"] = True
-
-                    if "suc" in play_arr[0][10]:
-                        temp_df["is_defensive_two_point_conv"] = True
-                elif (
-                    "-point conversion attempt" in play_desc.lower() and
-                    "rushed up the middle" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    play_arr = re.findall(
-                        r"([A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. ([a-zA-Z\'\.\-\,\; ]+) rushed up the middle to ([A-Za-z0-9\s]+) for yard[s]?\. Tackled by ([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. ([A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ ([a-zA-Z]+)\.",
-                        play_desc
-                    )
-                    if "one" in play_arr[0][0].lower():
-                        temp_df["is_one_point_attempt"] = True
-                    elif "two" in play_arr[0][0].lower():
-                        temp_df["is_two_point_attempt"] = True
-                    elif "three" in play_arr[0][0].lower():
-                        temp_df["is_three_point_attempt"] = True
-
-                    temp_df["rusher_player_name"] = play_arr[0][1]
-                    # temp_df["run_location"] = play_arr[0][1]
-                    # temp_df["run_gap"] = play_arr[0][2]
-
-                    success_or_failure = play_arr[0][6].lower()
-
-                    if (
-                        "suc" in success_or_failure and
-                        "one" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_one_point_attempt_success"] = True
-                    elif (
-                        "suc" in success_or_failure and
-                        "two" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_two_point_attempt_success"] = True
-                    elif (
-                        "suc" in success_or_failure and
-                        "three" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_three_point_attempt_success"] = True
-                elif (
-                    "-point conversion attempt" in play_desc.lower() and
-                    "rushed" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    play_arr = re.findall(
-                        r"([A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. ([a-zA-Z\'\.\-\,\; ]+) rushed ([a-zA-Z]+) ([a-zA-Z]+) to ([A-Za-z0-9\s]+) for yard[s]?\. Tackled by ([a-zA-Z\;\'\.\-\, ]+) at ([A-Za-z0-9\s]+)\. ([A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ ([a-zA-Z]+)\.",
-                        play_desc
-                    )
+    return tacklers_arr, sack_players_arr
 
-                    if len(play_arr) == 0:
-                        play_arr = re.findall(
-                            r"([A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. ([a-zA-Z\'\.\-\,\; ]+) rushed to ([A-Za-z0-9\s]+) for yard[s]?\. Tackled by ([a-zA-Z\;\'\.\-\, ]+) at ([A-Za-z0-9\s]+)\. ([A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ ([a-zA-Z]+)\.",
-                            play_desc
-                        )
-                        if "one" in play_arr[0][0].lower():
-                            temp_df["is_one_point_attempt"] = True
-                        elif "two" in play_arr[0][0].lower():
-                            temp_df["is_two_point_attempt"] = True
-                        elif "three" in play_arr[0][0].lower():
-                            temp_df["is_three_point_attempt"] = True
-
-                        temp_df["rusher_player_name"] = play_arr[0][1]
-                        # temp_df["run_location"] = play_arr[0][1]
-                        # temp_df["run_gap"] = play_arr[0][2]
-
-                        success_or_failure = play_arr[0][6].lower()
-                    else:
-                        if "one" in play_arr[0][0].lower():
-                            temp_df["is_one_point_attempt"] = True
-                        elif "two" in play_arr[0][0].lower():
-                            temp_df["is_two_point_attempt"] = True
-                        elif "three" in play_arr[0][0].lower():
-                            temp_df["is_three_point_attempt"] = True
-
-                        temp_df["rusher_player_name"] = play_arr[0][1]
-                        temp_df["run_location"] = play_arr[0][1]
-                        temp_df["run_gap"] = play_arr[0][2]
-
-                        success_or_failure = play_arr[0][8].lower()
-
-                    if (
-                        "suc" in success_or_failure and
-                        "one" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_one_point_attempt_success"] = True
-                    elif (
-                        "suc" in success_or_failure and
-                        "two" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_two_point_attempt_success"] = True
-                    elif (
-                        "suc" in success_or_failure and
-                        "three" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_three_point_attempt_success"] = True
-                elif (
-                    "-point conversion attempt" in play_desc.lower() and
-                    "rushed up the middle" in play_desc.lower()
-                ):
-                    play_arr = re.findall(
-                        r"([A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. ([a-zA-Z\'\.\-\,\; ]+) rushed up the middle to ([A-Za-z0-9\s]+) for yard[s]?\. ([A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ ([a-zA-Z]+)\.",
-                        play_desc
-                    )
-                    if "one" in play_arr[0][0].lower():
-                        temp_df["is_one_point_attempt"] = True
-                    elif "two" in play_arr[0][0].lower():
-                        temp_df["is_two_point_attempt"] = True
-                    elif "three" in play_arr[0][0].lower():
-                        temp_df["is_three_point_attempt"] = True
-
-                    temp_df["rusher_player_name"] = play_arr[0][1]
-                    temp_df["run_location"] = "middle"
-                    # temp_df["run_gap"] = play_arr[0][2]
-
-                    success_or_failure = play_arr[0][4].lower()
-
-                    if (
-                        "suc" in success_or_failure and
-                        "one" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_one_point_attempt_success"] = True
-                    elif (
-                        "suc" in success_or_failure and
-                        "two" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_two_point_attempt_success"] = True
-                    elif (
-                        "suc" in success_or_failure and
-                        "three" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_three_point_attempt_success"] = True
-                elif (
-                    "-point conversion attempt" in play_desc.lower() and
-                    "rushed" in play_desc.lower() and
-                    "pushed out of bounds by " in play_desc.lower()
-                ):
-                    play_arr = re.findall(
-                        r"([A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. ([a-zA-Z\'\.\-\,\; ]+) rushed to ([A-Za-z0-9\s]+) for yard[s]?\. Pushed out of bounds by ([a-zA-Z\;\'\.\-\, ]+) at ([A-Za-z0-9\s]+)\. ([A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ ([a-zA-Z]+)\.",
-                        play_desc
-                    )
-                    # if len(play_arr) == 0:
-                    #     play_arr = re.findall(
-                    #         r"([A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. ([a-zA-Z\'\.\-\,\; ]+) rushed ([a-zA-Z]+) ([a-zA-Z]+) to ([A-Za-z0-9\s]+) for yard[s]?\. Pushed out of bounds by ([a-zA-Z\;\'\.\-\, ]+) at ([A-Za-z0-9\s]+)\. ([A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ ([a-zA-Z]+)\.",
-                    #         play_desc
-                    #     )
-                    #     temp_df["rusher_player_name"] = play_arr[0][1]
-                    #     temp_df["run_location"] = play_arr[0][1]
-                    #     temp_df["run_gap"] = play_arr[0][2]
 
-                    #     success_or_failure = play_arr[0][6].lower()
-                    # else:
-                    #     temp_df["rusher_player_name"] = play_arr[0][1]
-                    #     temp_df["run_location"] = play_arr[0][1]
-                    #     temp_df["run_gap"] = play_arr[0][2]
-
-                    #     success_or_failure = play_arr[0][6].lower()
-
-                    temp_df["rusher_player_name"] = play_arr[0][1]
-                    temp_df["run_location"] = play_arr[0][1]
-                    temp_df["run_gap"] = play_arr[0][2]
-
-                    success_or_failure = play_arr[0][6].lower()
-
-                    if "one" in play_arr[0][0].lower():
-                        temp_df["is_one_point_attempt"] = True
-                    elif "two" in play_arr[0][0].lower():
-                        temp_df["is_two_point_attempt"] = True
-                    elif "three" in play_arr[0][0].lower():
-                        temp_df["is_three_point_attempt"] = True
-                elif (
-                    "-point conversion attempt" in play_desc.lower() and
-                    "rushed" in play_desc.lower()
-                ):
-                    play_arr = re.findall(
-                        r"([A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. ([a-zA-Z\'\.\-\,\; ]+) rushed ([a-zA-Z]+) ([a-zA-Z]+) to ([A-Za-z0-9\s]+) for yard[s]?\. ([A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ ([a-zA-Z]+)\.",
-                        play_desc
-                    )
-                    if len(play_arr) == 0:
-                        play_arr = re.findall(
-                            r"([A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. ([a-zA-Z\'\.\-\,\; ]+) rushed to ([A-Za-z0-9\s]+) for yard[s]?\. ([A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ ([a-zA-Z]+)\.",
-                            play_desc
-                        )
-                        temp_df["rusher_player_name"] = play_arr[0][1]
-                        # temp_df["run_location"] = play_arr[0][1]
-                        # temp_df["run_gap"] = play_arr[0][2]
+def parse_kickoff_touchdown_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
 
-                        success_or_failure = play_arr[0][4].lower()
-                    else:
-                        temp_df["rusher_player_name"] = play_arr[0][1]
-                        temp_df["run_location"] = play_arr[0][1]
-                        temp_df["run_gap"] = play_arr[0][2]
-
-                        success_or_failure = play_arr[0][6].lower()
-                    if "one" in play_arr[0][0].lower():
-                        temp_df["is_one_point_attempt"] = True
-                    elif "two" in play_arr[0][0].lower():
-                        temp_df["is_two_point_attempt"] = True
-                    elif "three" in play_arr[0][0].lower():
-                        temp_df["is_three_point_attempt"] = True
-
-                    if (
-                        "suc" in success_or_failure and
-                        "one" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_one_point_attempt_success"] = True
-                    elif (
-                        "suc" in success_or_failure and
-                        "two" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_two_point_attempt_success"] = True
-                    elif (
-                        "suc" in success_or_failure and
-                        "three" in play_arr[0][0].lower()
-                    ):
-                        temp_df["is_three_point_attempt_success"] = True
-                # Pass Plays
-                elif (
-                    "steps back to pass" not in play_desc.lower() and
-                    "incomplete" in play_desc.lower() and
-                    "intended for" in play_desc.lower()
-                ):
-                    # If we're here,
-                    # its because we're handling an aborted snap,
-                    # that was thrown away (presumably)
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_incomplete_pass"] = True
+    Parses `"kickoff_touchdown"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_kickoff_attempt"] = True
+    # temp_dict["is_touchback"] = True
+    play_match = PBP_REGEX[
+        "kicks_returns_kickoff_touchdown"
+    ].search(play_desc)
+    temp_dict["kicker_player_name"] = play_match[
+        "kicker_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+
+    temp_dict["kickoff_returner_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+    temp_dict["return_yards"] = 100 - temp_yl_1
+    if temp_yl_1 > 80:
+        temp_dict["is_kickoff_inside_twenty"] = True
+    del temp_yl_1
 
-                    temp_df["passer_player_name"] = temp_df["fumbled_2_player_name"]
+    return tacklers_arr, sack_players_arr
 
-                    play_arr = re.findall(
-                        r"[PASS|pass]+ incomplete ([A-Za-z]+) ([A-Za-z]+) intended for ([a-zA-Z\'\.\-\,\; ]+)",
-                        play_desc
-                    )
-                    temp_df["pass_length"] = play_arr[0][0]
-                    temp_df["pass_location"] = play_arr[0][1]
-                    temp_df["receiver_player_name"] = play_arr[0][2]
-                elif (
-                    "steps back to pass" in play_desc.lower() and
-                    "incomplete" in play_desc.lower() and
-                    "intended for." in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_incomplete_pass"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) steps back to pass\. Pass incomplete ([a-zA-Z]+) ([a-zA-Z]+) intended for\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0][0]
-                    temp_df["pass_length"] = play_arr[0][1]
-                    temp_df["pass_location"] = play_arr[0][2]
-                elif (
-                    "steps back to pass" in play_desc.lower() and
-                    "incomplete" in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_incomplete_pass"] = True
-                    play_desc = play_desc.replace("[", "")
-                    play_desc = play_desc.replace("]", "")
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) steps back to pass\. Pass incomplete ([a-zA-Z]+) ([a-zA-Z]+) intended for \(?([a-zA-Z\'\.\-\,\; ]+)\)?\.",
-                        play_desc
-                    )
-                    if len(play_arr) == 0:
-                        play_arr = re.findall(
-                            r"([a-zA-Z\'\.\-\,\; ]+) steps back to pass\. Pass incomplete ([a-zA-Z]+) intended for ([a-zA-Z\'\.\-\,\; ]+) \(([a-zA-Z\'\.\-\,\; ]+)\)?\.",
-                            play_desc
-                        )
-                        temp_df["passer_player_name"] = play_arr[0][0]
-                        temp_df["pass_length"] = "middle"
-                        temp_df["pass_location"] = play_arr[0][1]
-                        temp_df["receiver_player_name"] = play_arr[0][2]
-                        temp_df["pass_defense_1_player_name"] = play_arr[0][3]
-                    else:
-                        temp_df["passer_player_name"] = play_arr[0][0]
-                        temp_df["pass_length"] = play_arr[0][1]
-                        temp_df["pass_location"] = play_arr[0][2]
-                        temp_df["receiver_player_name"] = play_arr[0][3]
-                elif (
-                    "pass" in play_desc.lower() and
-                    "complete" in play_desc.lower() and
-                    "touchdown" in play_desc.lower() and
-                    "for yards" in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_complete_pass"] = True
-                    temp_df["is_pass_touchdown"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) " +
-                        r"complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by ([a-zA-Z\'\.\-\,\; ]+) for " +
-                        r"yard[s]?\. TOUCHDOWN\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0][0]
-                    temp_df["pass_length"] = play_arr[0][1]
-                    temp_df["pass_location"] = play_arr[0][2]
-                    temp_df["receiver_player_name"] = play_arr[0][3]
-                elif (
-                    "pass" in play_desc.lower() and
-                    "complete" in play_desc.lower() and
-                    "touchdown" in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_complete_pass"] = True
-                    temp_df["is_pass_touchdown"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) " +
-                        r"complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by ([a-zA-Z\'\.\-\,\; ]+) for " +
-                        r"([0-9\-]+) yard[s]?\. TOUCHDOWN\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0][0]
-                    temp_df["pass_length"] = play_arr[0][1]
-                    temp_df["pass_location"] = play_arr[0][2]
-                    temp_df["receiver_player_name"] = play_arr[0][3]
-                    temp_df["receiving_yards"] = int(play_arr[0][4])
-                    temp_df["passing_yards"] = int(play_arr[0][4])
-                    temp_df["yards_gained"] = int(play_arr[0][4])
-                elif (
-                    "pass" in play_desc.lower() and
-                    "catch made by" in play_desc.lower() and
-                    play_desc.lower().count("fumbles.") == 2 and
-                    "forced" not in play_desc.lower() and
-                    "lateral" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    # Full play for this madness:
-                    #
-                    # 'E.Perry pass short right complete.
-                    # Catch made by J.Adams for 5 yards.
-                    # Lateral to K.Lassiter to MEM 31 for -4 yards.
-                    # K.Lassiter FUMBLES.
-                    # Fumble RECOVERED by MEM-J.Kibodi at MEM 26.
-                    # J.Kibodi FUMBLES.
-                    # Fumble RECOVERED by DC-A.Mintze at MEM 24.
-                    # Tackled by N.Henderson at MEM 24.'
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_complete_pass"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumble_not_forced"] = True
-                    temp_df["is_lateral_reception"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by ([a-zA-Z\'\.\-\,\; ]+) for ([0-9\-]+) yard[s]?\. Lateral to ([a-zA-Z\'\.\-\,\; ]+) to ([A-Za-z0-9\s]+) for ([0-9\-]+) yard[s]?\. ([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\. Fumble [RECOVERED|recovered]+ by ([a-zA-Z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. ([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\. Fumble [RECOVERED|recovered]+ by ([a-zA-Z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0][0]
-                    temp_df["pass_length"] = play_arr[0][1]
-                    temp_df["pass_location"] = play_arr[0][2]
-                    temp_df["receiver_player_name"] = play_arr[0][3]
-                    temp_df["receiving_yards"] = int(play_arr[0][4])
-                    temp_df["passing_yards"] = int(play_arr[0][4])
-                    temp_df["yards_gained"] = int(play_arr[0][4])
-                    temp_df["lateral_receiver_player_name"] = play_arr[0][5]
-                    temp_df["lateral_receiving_yards"] = int(play_arr[0][7])
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][8]
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][9]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][9]
-
-                    temp_yl_1 = play_arr[0][11]
-                    temp_yl_2 = play_arr[0][15]
-
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                    temp_df["fumble_recovery_1_yards"] = temp_yl_1 - temp_yl_2
-
-                    temp_df["fumbled_2_team"] = posteam
-                    temp_df["fumbled_2_player_name"] = play_arr[0][12]
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][13]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][14]
-
-                    tacklers_arr = play_arr[0][16]
-                elif (
-                    "pass" in play_desc.lower() and
-                    "complete" in play_desc.lower() and
-                    "fumble" in play_desc.lower() and
-                    "forced by" in play_desc.lower() and
-                    "recovered by" in play_desc.lower() and
-                    "tackled by at" in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_complete_pass"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumble_forced"] = True
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by ([a-zA-Z\'\.\-\,\; ]+) for ([0-9\-]+) yard[s]?\. ([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by ([a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by ([a-zA-Z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Tackled by at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0][0]
-                    temp_df["pass_length"] = play_arr[0][1]
-                    temp_df["pass_location"] = play_arr[0][2]
-                    temp_df["receiver_player_name"] = play_arr[0][3]
-                    temp_df["receiving_yards"] = int(play_arr[0][4])
-                    temp_df["passing_yards"] = int(play_arr[0][4])
-                    temp_df["yards_gained"] = int(play_arr[0][4])
-
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][5]
-
-                    temp_df["forced_fumble_player_1_team"] = defteam
-                    temp_df["forced_fumble_player_1_player_name"] = play_arr[0][6]
-
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][7]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][8]
-
-                    temp_yl_1 = play_arr[0][9]
-                    temp_yl_2 = play_arr[0][10]
-
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                    temp_df["fumble_recovery_1_yards"] = temp_yl_2 - temp_yl_1
-
-                    # tacklers_arr = play_arr[0][10]
-                elif (
-                    "pass" in play_desc.lower() and
-                    "complete" in play_desc.lower() and
-                    "fumble" in play_desc.lower() and
-                    "forced by." in play_desc.lower() and
-                    "recovered by" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_complete_pass"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumble_forced"] = True
+def parse_kickoff_touchback_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by ([a-zA-Z\'\.\-\,\; ]+) for ([0-9\-]+) yard[s]?\. ([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by\. Fumble [RECOVERED|recovered]+ by ([a-zA-Z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0][0]
-                    temp_df["pass_length"] = play_arr[0][1]
-                    temp_df["pass_location"] = play_arr[0][2]
-                    temp_df["receiver_player_name"] = play_arr[0][3]
-                    temp_df["receiving_yards"] = int(play_arr[0][4])
-                    temp_df["passing_yards"] = int(play_arr[0][4])
-                    temp_df["yards_gained"] = int(play_arr[0][4])
-
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][5]
-
-                    temp_df["forced_fumble_player_1_team"] = defteam
-                    # temp_df["forced_fumble_player_1_player_name"] = play_arr[0][6]
-
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][6]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][7]
-
-                    temp_yl_1 = play_arr[0][8]
-                    temp_yl_2 = play_arr[0][10]
-
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                    temp_df["fumble_recovery_1_yards"] = temp_yl_2 - temp_yl_1
-
-                    tacklers_arr = play_arr[0][9]
-                elif (
-                    "pass" in play_desc.lower() and
-                    "complete" in play_desc.lower() and
-                    "fumble" in play_desc.lower() and
-                    "forced by" in play_desc.lower() and
-                    "recovered by" in play_desc.lower() and
-                    "tackled by" not in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_complete_pass"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumble_forced"] = True
+    Parses `"kickoff_touchback"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_kickoff_attempt"] = True
+    temp_dict["is_touchback"] = True
+    play_match = PBP_REGEX["kicks_touchback"].search(play_desc)
+    temp_dict["kicker_player_name"] = play_match[
+        "kicker_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    if temp_yl_1 > 80:
+        temp_dict["is_kickoff_inside_twenty"] = True
+    del temp_yl_1
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_kickoff_fair_catch_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by ([a-zA-Z\'\.\-\,\; ]+) for ([0-9\-]+) yard[s]?\. ([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by ([a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by ([a-zA-Z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0][0]
-                    temp_df["pass_length"] = play_arr[0][1]
-                    temp_df["pass_location"] = play_arr[0][2]
-                    temp_df["receiver_player_name"] = play_arr[0][3]
-                    temp_df["receiving_yards"] = int(play_arr[0][4])
-                    temp_df["passing_yards"] = int(play_arr[0][4])
-                    temp_df["yards_gained"] = int(play_arr[0][4])
-
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][5]
-
-                    temp_df["forced_fumble_player_1_team"] = defteam
-                    temp_df["forced_fumble_player_1_player_name"] = play_arr[0][6]
-
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][7]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][8]
-
-                    temp_df["fumble_recovery_1_yards"] = 0
-
-                    # tacklers_arr = play_arr[0][10]
-                elif (
-                    "pass" in play_desc.lower() and
-                    "complete" in play_desc.lower() and
-                    "fumble" in play_desc.lower() and
-                    "forced by" in play_desc.lower() and
-                    "recovered by" in play_desc.lower()  and
-                    "lateral to" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_complete_pass"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumble_forced"] = True
+    Parses `"kickoff_fair_catch"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_kickoff_attempt"] = True
+    temp_dict["is_touchback"] = True
+    play_match = PBP_REGEX[
+        "kicks_fair_catch"
+    ].search(play_desc)
+    temp_dict["kicker_player_name"] = play_match[
+        "kicker_player_name"
+    ]
+    temp_dict["kickoff_returner_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    # if temp_yl_1 > 80:
+    #     temp_dict["is_kickoff_inside_twenty"] = True
+    del temp_yl_1
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_punt_fumble_forced_recovered_tackled_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by ([a-zA-Z\'\.\-\,\; ]+) for ([0-9\-]+) yard[s]?\. ([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by ([a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by ([a-zA-Z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Lateral to ([a-zA-Z\'\.\-\,\; ]+) to ([A-Za-z0-9\s]+) for ([\-0-9]+) yard[s]?\. Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    if len(play_arr) == 0:
-                        play_arr = re.findall(
-                            r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by ([a-zA-Z\'\.\-\,\; ]+) for ([0-9\-]+) yard[s]?\. Lateral to ([a-zA-Z\'\.\-\,\; ]+) to ([A-Za-z0-9\s]+) for ([\-0-9]+) yard[s]?\. ([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by ([a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by ([a-zA-Z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                            play_desc
-                        )
+    Parses `"punt_fumble_forced_recovered_tackled"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_punt_attempt"] = True
+
+    play_match = PBP_REGEX[
+        "punt_returned_from_fumbles_forced_fumble_recovered_tackled"
+    ].search(play_desc)
+    temp_dict["punter_player_name"] = play_match[
+        "punter_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_dict["long_snapper_player_name"] = play_match[
+        "long_snapper_player_name"
+    ]
+    temp_dict["kickoff_returner_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+    temp_dict["fumbled_1_team"] = defteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "fumbled_1_player_name"
+    ]
+    temp_dict["forced_fumble_player_1_team"] = posteam
+    temp_dict["forced_fumble_player_1_player_name"] = play_match[
+        "forced_fumble_player_1_player_name"
+    ]
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_2 = play_match["yardline_2"]
+
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_yl_2 = get_yardline(temp_yl_2, posteam)
+    temp_dict["fumble_recovery_1_yards"] = temp_yl_1 - temp_yl_2
+    temp_dict["return_yards"] = 0
+
+    if temp_yl_2 > 80:
+        temp_dict["is_punt_inside_twenty"] = True
+    del temp_yl_1, temp_yl_2
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_punt_fumble_forced_recovered_tackled_2_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"punt_fumble_forced_recovered_tackled_2"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_punt_attempt"] = True
+
+    play_match = PBP_REGEX[
+        "punts_returned_punt_from_fumbles_forced_fumble_recovered_tackled"
+    ].search(play_desc)
+    if play_match is None:
+        play_match = PBP_REGEX[
+            "punts_returned_punt_from_fumbles_forced_fumble_recovered_tackled_alt"
+        ].search(play_desc)
+        temp_dict["punter_player_name"] = play_match[
+            "punter_player_name"
+        ]
+        # temp_dict["kick_distance"] = int(play_arr[0][1])
+        temp_dict["long_snapper_player_name"] = play_match[
+            "long_snapper_player_name"
+        ]
+        temp_dict["kickoff_returner_player_name"] = play_match[
+            "kickoff_returner_player_name"
+        ]
+        temp_dict["fumbled_1_team"] = defteam
+        temp_dict["fumbled_1_player_name"] = play_match[
+            "fumbled_1_player_name"
+        ]
+        temp_dict["forced_fumble_player_1_team"] = posteam
+        temp_dict["forced_fumble_player_1_player_name"] = play_match[
+            "forced_fumble_player_1_player_name"
+        ]
+        temp_dict["fumble_recovery_1_team"] = play_match[
+            "fumble_recovery_1_team"
+        ]
+        temp_dict["fumble_recovery_1_player_name"] = play_match[
+            "fumble_recovery_1_player_name"
+        ]
+
+        temp_yl_1 = play_match["yardline_1"]
+        temp_yl_2 = play_match["yardline_2"]
+
+        temp_yl_1 = get_yardline(temp_yl_1, posteam)
+        temp_yl_2 = get_yardline(temp_yl_2, posteam)
+        temp_dict["fumble_recovery_1_yards"] = temp_yl_1 - temp_yl_2
+        temp_dict["return_yards"] = 0
+        tacklers_arr = play_match["yardline_2"]
+    else:
+        temp_dict["punter_player_name"] = play_match[
+            "punter_player_name"
+        ]
+        # temp_dict["kick_distance"] = int(play_arr[0][1])
+        temp_dict["long_snapper_player_name"] = play_match[
+            "long_snapper_player_name"
+        ]
+        temp_dict["kickoff_returner_player_name"] = play_match[
+            "kickoff_returner_player_name"
+        ]
+        temp_dict["fumbled_1_team"] = defteam
+        temp_dict["fumbled_1_player_name"] = play_match[
+            "fumbled_1_player_name"
+        ]
+        temp_dict["forced_fumble_player_1_team"] = posteam
+        temp_dict["forced_fumble_player_1_player_name"] = play_match[
+            "forced_fumble_player_1_player_name"
+        ]
+        temp_dict["fumble_recovery_1_team"] = play_match[
+            "fumble_recovery_1_team"
+        ]
+        temp_dict["fumble_recovery_1_player_name"] = play_match[
+            "fumble_recovery_1_player_name"
+        ]
+
+        temp_yl_1 = play_match["yardline_1"]
+        temp_yl_2 = play_match["yardline_2"]
+
+        temp_yl_1 = get_yardline(temp_yl_1, posteam)
+        temp_yl_2 = get_yardline(temp_yl_2, posteam)
+        temp_dict["fumble_recovery_1_yards"] = temp_yl_1 - temp_yl_2
+        temp_dict["return_yards"] = 0
+        tacklers_arr = play_match["tacklers"]
+    if temp_yl_2 > 80:
+        temp_dict["is_punt_inside_twenty"] = True
+    del temp_yl_1, temp_yl_2
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_punt_fumble_forced_recovered_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"punt_fumble_forced_recovered"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_punt_attempt"] = True
+
+    play_match = PBP_REGEX[
+        "punt_returned_from_fumbles_forced_fumble_recovered"
+    ].search(play_desc)
+    temp_dict["punter_player_name"] = play_match[
+        "punter_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_dict["long_snapper_player_name"] = play_match[
+        "long_snapper_player_name"
+    ]
+    temp_dict["kickoff_returner_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+    temp_dict["fumbled_1_team"] = defteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "fumbled_1_player_name"
+    ]
+    temp_dict["forced_fumble_player_1_team"] = posteam
+    temp_dict["forced_fumble_player_1_player_name"] = play_match[
+        "forced_fumble_player_1_player_name"
+    ]
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+
+    # temp_yl_1 = play_arr[0][10]
+    temp_yl_2 = play_match["yardline_2"]
+
+    # temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_yl_2 = get_yardline(temp_yl_2, posteam)
+    # temp_dict["fumble_recovery_1_yards"] = temp_yl_1 - temp_yl_2
+    temp_dict["fumble_recovery_1_yards"] = 0
+    temp_dict["return_yards"] = 0
+
+    if temp_yl_2 > 80:
+        temp_dict["is_punt_inside_twenty"] = True
+    del temp_yl_2
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_punt_tackled_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"punt_tackled"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_punt_attempt"] = True
+
+    play_match = PBP_REGEX[
+        "punts_returned_punt_from_tackled"
+    ].search(play_desc)
+    temp_dict["punter_player_name"] = play_match[
+        "punter_player_name"
+    ]
+    # temp_dict["kick_distance"] = int(play_arr[0][1])
+    temp_dict["long_snapper_player_name"] = play_match[
+        "long_snapper_player_name"
+    ]
+    temp_dict["kickoff_returner_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+    tacklers_arr = play_match["tacklers"]
+    # temp_yl_1 = play_arr[0][5]
+    # temp_yl_2 = play_arr[0][7]
+
+    # temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    # temp_yl_2 = get_yardline(temp_yl_2, posteam)
+    # temp_dict["return_yards"] = temp_yl_1 - temp_yl_2
+
+    # if temp_yl_2 > 80:
+    #     temp_dict["is_punt_inside_twenty"] = True
+    # del temp_yl_1, temp_yl_2
+
+    return tacklers_arr, sack_players_arr
 
-                        temp_df["passer_player_name"] = play_arr[0][0]
-                        temp_df["pass_length"] = play_arr[0][1]
-                        temp_df["pass_location"] = play_arr[0][2]
-                        temp_df["receiver_player_name"] = play_arr[0][3]
-                        temp_df["receiving_yards"] = int(play_arr[0][4])
-                        temp_df["passing_yards"] = int(play_arr[0][4])
-                        temp_df["yards_gained"] = int(play_arr[0][4])
 
-                        temp_df["lateral_receiver_player_name"] = play_arr[0][5]
-                        temp_df["lateral_receiving_yards"] = int(play_arr[0][7])
+def parse_punt_tackled_2_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"punt_tackled_2"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_punt_attempt"] = True
+
+    play_match = PBP_REGEX[
+        "punt_returned_from_tackled"
+    ].search(play_desc)
+    temp_dict["punter_player_name"] = play_match[
+        "punter_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_dict["long_snapper_player_name"] = play_match[
+        "long_snapper_player_name"
+    ]
+    temp_dict["kickoff_returner_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+    tacklers_arr = play_match["tacklers"]
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_2 = play_match["yardline_2"]
+
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_yl_2 = get_yardline(temp_yl_2, posteam)
+    temp_dict["return_yards"] = temp_yl_1 - temp_yl_2
+
+    if temp_yl_2 > 80:
+        temp_dict["is_punt_inside_twenty"] = True
+    del temp_yl_1, temp_yl_2
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_punt_muff_catch_fumble_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"punt_muff_catch_fumble_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_punt_attempt"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumble_not_forced"] = True
+
+    play_match = PBP_REGEX[
+        "punts_muffs_catch_fumbles_out_bounds"
+    ].search(play_desc)
+    temp_dict["punter_player_name"] = play_match[
+        "punter_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_dict["long_snapper_player_name"] = play_match[
+        "long_snapper_player_name"
+    ]
+    temp_dict["kickoff_returner_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+    temp_dict["fumbled_1_team"] = defteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+
+    # temp_dict["fumble_recovery_1_team"] = play_arr[0][5]
+    # temp_dict["fumble_recovery_1_player_name"] = play_arr[0][6]
+    # tacklers_arr = play_arr[0][8]
+    # temp_yl_1 = play_arr[0][7]
+    temp_yl_2 = play_match["yardline_2"]
+
+    # temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_yl_2 = get_yardline(temp_yl_2, posteam)
+    # temp_dict["fumble_recovery_1_yards"] = temp_yl_1 - temp_yl_2
+    temp_dict["return_yards"] = 0
+
+    if temp_yl_2 > 80:
+        temp_dict["is_punt_inside_twenty"] = True
+    del temp_yl_2
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_punt_muff_catch_fumble_recovered_tackled_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"punt_muff_catch_fumble_recovered_tackled"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_punt_attempt"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumble_not_forced"] = True
+
+    play_match = PBP_REGEX[
+        "punts_muffs_catch_fumble_recovered_tackled"
+    ].search(play_desc)
+    temp_dict["punter_player_name"] = play_match[
+        "punter_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_dict["long_snapper_player_name"] = play_match[
+        "long_snapper_player_name"
+    ]
+    temp_dict["kickoff_returner_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+    temp_dict["fumbled_1_team"] = defteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+    # tacklers_arr = play_arr[0][8]
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_2 = play_match["yardline_2"]
+
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_yl_2 = get_yardline(temp_yl_2, posteam)
+    temp_dict["fumble_recovery_1_yards"] = temp_yl_1 - temp_yl_2
+    temp_dict["return_yards"] = 0
+
+    if temp_yl_2 > 80:
+        temp_dict["is_punt_inside_twenty"] = True
+    del temp_yl_1, temp_yl_2
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_punt_muff_catch_fumble_recovered_tackled_2_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"punt_muff_catch_fumble_recovered_tackled_2"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_punt_attempt"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumble_not_forced"] = True
+
+    play_match = PBP_REGEX[
+        "punts_muffs_catch_fumble_recovered_tackled_2"
+    ].search(play_desc)
+    temp_dict["punter_player_name"] = play_match[
+        "punter_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_dict["long_snapper_player_name"] = play_match[
+        "long_snapper_player_name"
+    ]
+    temp_dict["kickoff_returner_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+    temp_dict["fumbled_1_team"] = defteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+    tacklers_arr = play_match["tacklers"]
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_2 = play_match["yardline_2"]
+
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_yl_2 = get_yardline(temp_yl_2, posteam)
+    temp_dict["fumble_recovery_1_yards"] = temp_yl_1 - temp_yl_2
+    temp_dict["return_yards"] = 0
+
+    if temp_yl_2 > 80:
+        temp_dict["is_punt_inside_twenty"] = True
+    del temp_yl_1, temp_yl_2
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_punt_muff_catch_fumble_recovered_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"punt_muff_catch_fumble_recovered"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_punt_attempt"] = True
+    temp_dict["is_fumble"] = True
+    temp_dict["is_fumble_not_forced"] = True
+
+    play_match = PBP_REGEX[
+        "punts_muffs_catch_fumble_recovered"
+    ].search(play_desc)
+    temp_dict["punter_player_name"] = play_match[
+        "punter_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_dict["long_snapper_player_name"] = play_match[
+        "long_snapper_player_name"
+    ]
+    temp_dict["kickoff_returner_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+    temp_dict["fumbled_1_team"] = defteam
+    temp_dict["fumbled_1_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+
+    temp_dict["fumble_recovery_1_team"] = play_match[
+        "fumble_recovery_1_team"
+    ]
+    temp_dict["fumble_recovery_1_player_name"] = play_match[
+        "fumble_recovery_1_player_name"
+    ]
+    # tacklers_arr = play_arr[0][8]
+    # temp_yl_1 = play_arr[0][7]
+    temp_yl_2 = play_match["yardline_2"]
+
+    # temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_yl_2 = get_yardline(temp_yl_2, posteam)
+    temp_dict["fumble_recovery_1_yards"] = 0
+    temp_dict["return_yards"] = 0
+
+    if temp_yl_2 > 80:
+        temp_dict["is_punt_inside_twenty"] = True
+    del temp_yl_2
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_punt_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"punt_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_punt_attempt"] = True
+    temp_dict["is_punt_out_of_bounds"] = True
+
+    play_match = PBP_REGEX[
+        "punts_returned_punt_from_out_bounds"
+    ].search(play_desc)
+    temp_dict["punter_player_name"] = play_match[
+        "punter_player_name"
+    ]
+    temp_dict["kick_distance"] = 0
+    temp_dict["long_snapper_player_name"] = play_match[
+        "long_snapper_player_name"
+    ]
+
+    # temp_yl_1 = play_arr[0][2]
+    # temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    # if temp_yl_1 > 80:
+    #     temp_dict["is_punt_inside_twenty"] = True
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_punt_out_bounds_2_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"punt_out_bounds_2"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_punt_attempt"] = True
+    temp_dict["is_punt_out_of_bounds"] = True
+
+    play_match = PBP_REGEX[
+        "punt_returned_from_out_bounds"
+    ].search(play_desc)
+    temp_dict["punter_player_name"] = play_match[
+        "punter_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_dict["long_snapper_player_name"] = play_match[
+        "long_snapper_player_name"
+    ]
+
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    if temp_yl_1 > 80:
+        temp_dict["is_punt_inside_twenty"] = True
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_punt_touchback_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"punt_touchback"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_punt_attempt"] = True
+    temp_dict["is_touchback"] = True
+    temp_dict["is_punt_in_endzone"] = True
+
+    play_match = PBP_REGEX["punt_touchback"].search(play_desc)
+    temp_dict["punter_player_name"] = play_match[
+        "punter_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_dict["long_snapper_player_name"] = play_match[
+        "long_snapper_player_name"
+    ]
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_punt_fair_catch_play_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"punt_fair_catch_play"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_punt_attempt"] = True
+    temp_dict["is_punt_downed"] = True
+
+    play_match = PBP_REGEX[
+        "punts_fair_catch_play"
+    ].search(play_desc)
+    temp_dict["punter_player_name"] = play_match[
+        "punter_player_name"
+    ]
+    # temp_dict["kick_distance"] = int(play_arr[0][1])
+    temp_dict["long_snapper_player_name"] = play_match[
+        "long_snapper_player_name"
+    ]
+    temp_dict["punt_returner_player_name"] = play_match[
+        "punt_returner_player_name"
+    ]
+
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    if temp_yl_1 > 80:
+        temp_dict["is_punt_inside_twenty"] = True
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_punt_fair_catch_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Parses `"punt_fair_catch"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_punt_attempt"] = True
+    temp_dict["is_punt_downed"] = True
+
+    play_match = PBP_REGEX["punt_fair_catch"].search(play_desc)
+    temp_dict["punter_player_name"] = play_match[
+        "punter_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_dict["long_snapper_player_name"] = play_match[
+        "long_snapper_player_name"
+    ]
+    temp_dict["punt_returner_player_name"] = play_match[
+        "punt_returner_player_name"
+    ]
+
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    if temp_yl_1 > 80:
+        temp_dict["is_punt_inside_twenty"] = True
+
+    return tacklers_arr, sack_players_arr
+
+
+def parse_punt_downed_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
 
-                        temp_df["fumbled_1_team"] = posteam
-                        temp_df["fumbled_1_player_name"] = play_arr[0][8]
+    Parses `"punt_downed"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
 
-                        temp_df["forced_fumble_player_1_team"] = defteam
-                        temp_df["forced_fumble_player_1_player_name"] = play_arr[0][9]
+    temp_dict["is_punt_attempt"] = True
+    temp_dict["is_punt_downed"] = True
 
-                        temp_df["fumble_recovery_1_team"] = play_arr[0][10]
-                        temp_df["fumble_recovery_1_player_name"] = play_arr[0][11]
+    play_match = PBP_REGEX["punts_downed"].search(play_desc)
+    temp_dict["punter_player_name"] = play_match[
+        "punter_player_name"
+    ]
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
 
-                        temp_yl_1 = play_arr[0][12]
-                        temp_yl_2 = play_arr[0][14]
+    temp_dict["kick_distance"] = yardline_100 - temp_yl_1
+    temp_dict["long_snapper_player_name"] = play_match[
+        "long_snapper_player_name"
+    ]
 
-                        temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                        temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                        temp_df["fumble_recovery_1_yards"] = temp_yl_2 - temp_yl_1
+    if temp_yl_1 > 80:
+        temp_dict["is_punt_inside_twenty"] = True
 
-                        tacklers_arr = play_arr[0][13]
-                    else:
-                        temp_df["passer_player_name"] = play_arr[0][0]
-                        temp_df["pass_length"] = play_arr[0][1]
-                        temp_df["pass_location"] = play_arr[0][2]
-                        temp_df["receiver_player_name"] = play_arr[0][3]
-                        temp_df["receiving_yards"] = int(play_arr[0][4])
-                        temp_df["passing_yards"] = int(play_arr[0][4])
-                        temp_df["yards_gained"] = int(play_arr[0][4])
-
-                        temp_df["fumbled_1_team"] = posteam
-                        temp_df["fumbled_1_player_name"] = play_arr[0][5]
-
-                        temp_df["forced_fumble_player_1_team"] = defteam
-                        temp_df["forced_fumble_player_1_player_name"] = play_arr[0][6]
-
-                        temp_df["fumble_recovery_1_team"] = play_arr[0][7]
-                        temp_df["fumble_recovery_1_player_name"] = play_arr[0][8]
-
-                        temp_df["lateral_receiver_player_name"] = play_arr[0][10]
-                        temp_df["lateral_receiving_yards"] = int(play_arr[0][12])
-
-                        temp_yl_1 = play_arr[0][9]
-                        temp_yl_2 = play_arr[0][14]
-
-                        temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                        temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                        temp_df["fumble_recovery_1_yards"] = temp_yl_2 - temp_yl_1
-
-                        tacklers_arr = play_arr[0][13]
-                elif (
-                    "pass" in play_desc.lower() and
-                    "complete" in play_desc.lower() and
-                    "for yards" in play_desc.lower() and
-                    "fumble" in play_desc.lower() and
-                    "forced by" in play_desc.lower() and
-                    "recovered by" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_complete_pass"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumble_forced"] = True
+    return tacklers_arr, sack_players_arr
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by ([a-zA-Z\'\.\-\,\; ]+) for yard[s]?\. ([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by ([a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by ([a-zA-Z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0][0]
-                    temp_df["pass_length"] = play_arr[0][1]
-                    temp_df["pass_location"] = play_arr[0][2]
-                    temp_df["receiver_player_name"] = play_arr[0][3]
-                    temp_df["receiving_yards"] = 0
-                    temp_df["passing_yards"] =   0
-                    temp_df["yards_gained"] =    0
-
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][4]
-
-                    temp_df["forced_fumble_player_1_team"] = defteam
-                    temp_df["forced_fumble_player_1_player_name"] = play_arr[0][5]
-
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][6]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][7]
-
-                    temp_yl_1 = play_arr[0][8]
-                    temp_yl_2 = play_arr[0][10]
-
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                    temp_df["fumble_recovery_1_yards"] = temp_yl_2 - temp_yl_1
-
-                    tacklers_arr = play_arr[0][9]
-                elif (
-                    "pass" in play_desc.lower() and
-                    "complete" in play_desc.lower() and
-                    "fumble" in play_desc.lower() and
-                    "forced by" in play_desc.lower() and
-                    "recovered by" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_complete_pass"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumble_forced"] = True
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by ([a-zA-Z\'\.\-\,\; ]+) for ([0-9\-]+) yard[s]?\. ([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by ([a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by ([a-zA-Z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0][0]
-                    temp_df["pass_length"] = play_arr[0][1]
-                    temp_df["pass_location"] = play_arr[0][2]
-                    temp_df["receiver_player_name"] = play_arr[0][3]
-                    temp_df["receiving_yards"] = int(play_arr[0][4])
-                    temp_df["passing_yards"] = int(play_arr[0][4])
-                    temp_df["yards_gained"] = int(play_arr[0][4])
-
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][5]
-
-                    temp_df["forced_fumble_player_1_team"] = defteam
-                    temp_df["forced_fumble_player_1_player_name"] = play_arr[0][6]
-
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][7]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][8]
-
-                    temp_yl_1 = play_arr[0][9]
-                    temp_yl_2 = play_arr[0][11]
-
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                    temp_df["fumble_recovery_1_yards"] = temp_yl_2 - temp_yl_1
-
-                    tacklers_arr = play_arr[0][10]
-                elif (
-                    "pass" in play_desc.lower() and
-                    "complete" in play_desc.lower() and
-                    "for yards" in play_desc.lower() and
-                    "ran out of bounds" in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_complete_pass"] = True
-                    temp_df["is_out_of_bounds"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by ([a-zA-Z\'\.\-\,\; ]+) for yard[s]?\. ([a-zA-Z\'\.\-\,\; ]+) ran out of bounds\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0][0]
-                    temp_df["pass_length"] = play_arr[0][1]
-                    temp_df["pass_location"] = play_arr[0][2]
-                    temp_df["receiver_player_name"] = play_arr[0][3]
-                    # temp_df["receiving_yards"] = int(play_arr[0][4])
-                    # temp_df["passing_yards"] = int(play_arr[0][4])
-                    # temp_df["yards_gained"] = int(play_arr[0][4])
-                elif (
-                    "pass" in play_desc.lower() and
-                    "complete" in play_desc.lower() and
-                    "ran out of bounds" in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_complete_pass"] = True
-                    temp_df["is_out_of_bounds"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by ([a-zA-Z\'\.\-\,\; ]+) for ([0-9\-]+) yard[s]?\. ([a-zA-Z\'\.\-\,\; ]+) ran out of bounds\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0][0]
-                    temp_df["pass_length"] = play_arr[0][1]
-                    temp_df["pass_location"] = play_arr[0][2]
-                    temp_df["receiver_player_name"] = play_arr[0][3]
-                    temp_df["receiving_yards"] = int(play_arr[0][4])
-                    temp_df["passing_yards"] = int(play_arr[0][4])
-                    temp_df["yards_gained"] = int(play_arr[0][4])
-                elif (
-                    "pass" in play_desc.lower() and
-                    "complete" in play_desc.lower() and
-                    "lateral to" in play_desc.lower() and
-                    "fumbles." in play_desc.lower() and
-                    " out of bounds." in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_complete_pass"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumble_not_forced"] = True
-                    temp_df["is_lateral_reception"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by ([a-zA-Z\'\.\-\,\; ]+) for ([0-9\-]+) yard[s]?\. Lateral to ([a-zA-Z\'\.\-\,\; ]+) to ([A-Za-z0-9\s]+) for ([\-0-9]+) yard[s]?\. ([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\. Out of bounds\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0][0]
-                    temp_df["pass_length"] = play_arr[0][1]
-                    temp_df["pass_location"] = play_arr[0][2]
-                    temp_df["receiver_player_name"] = play_arr[0][3]
-                    temp_df["receiving_yards"] = int(play_arr[0][4])
-                    temp_df["passing_yards"] = int(play_arr[0][4])
-                    temp_df["yards_gained"] = int(play_arr[0][4])
-                    temp_df["lateral_receiver_player_name"] = play_arr[0][5]
-                    temp_df["lateral_receiving_yards"] = int(play_arr[0][7])
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][8]
-                elif (
-                    "pass" in play_desc.lower() and
-                    "complete" in play_desc.lower() and
-                    "for yards" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_complete_pass"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by ([a-zA-Z\'\.\-\,\; ]+) for yard[s]?\. Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0][0]
-                    temp_df["pass_length"] = play_arr[0][1]
-                    temp_df["pass_location"] = play_arr[0][2]
-                    temp_df["receiver_player_name"] = play_arr[0][3]
-                    # temp_df["receiving_yards"] = int(play_arr[0][4])
-                    # temp_df["passing_yards"] = int(play_arr[0][4])
-                    # temp_df["yards_gained"] = int(play_arr[0][4])
-
-                    tacklers_arr = play_arr[0][4]
-                elif (
-                    "pass" in play_desc.lower() and
-                    "complete" in play_desc.lower() and
-                    "tackled by at" in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_complete_pass"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) " +
-                        r"complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by ([a-zA-Z\'\.\-\,\; ]+) for " +
-                        r"([0-9\-]+) yard[s]?\. " +
-                        r"Tackled by at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0][0]
-                    temp_df["pass_length"] = play_arr[0][1]
-                    temp_df["pass_location"] = play_arr[0][2]
-                    temp_df["receiver_player_name"] = play_arr[0][3]
-                    temp_df["receiving_yards"] = int(play_arr[0][4])
-                    temp_df["passing_yards"] = int(play_arr[0][4])
-                    temp_df["yards_gained"] = int(play_arr[0][4])
-                elif (
-                    "pass" in play_desc.lower() and
-                    "complete" in play_desc.lower() and
-                    "lateral to" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_complete_pass"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by ([a-zA-Z\'\.\-\,\; ]+) for ([0-9\-]+) yard[s]?\. Lateral to ([a-zA-Z\'\.\-\,\; ]+) to ([A-Za-z0-9\s]+) for ([\-0-9]+) yard[s]?\. Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0][0]
-                    temp_df["pass_length"] = play_arr[0][1]
-                    temp_df["pass_location"] = play_arr[0][2]
-                    temp_df["receiver_player_name"] = play_arr[0][3]
-                    temp_df["receiving_yards"] = int(play_arr[0][4])
-                    temp_df["passing_yards"] = int(play_arr[0][4])
-                    temp_df["yards_gained"] = int(play_arr[0][4])
-                    # "lateral_receiver_player_name": None,
-                    # "lateral_receiving_yards": None,
-
-                    temp_df["lateral_receiver_player_name"] = play_arr[0][5]
-                    temp_df["lateral_receiving_yards"] = play_arr[0][7]
-
-                    tacklers_arr = play_arr[0][8]
-                elif (
-                    "pass" in play_desc.lower() and
-                    "complete" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_complete_pass"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) " +
-                        r"complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by ([a-zA-Z\'\.\-\,\; ]+) for " +
-                        r"([0-9\-]+) yard[s]?\. " +
-                        r"Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0][0]
-                    temp_df["pass_length"] = play_arr[0][1]
-                    temp_df["pass_location"] = play_arr[0][2]
-                    temp_df["receiver_player_name"] = play_arr[0][3]
-                    temp_df["receiving_yards"] = int(play_arr[0][4])
-                    temp_df["passing_yards"] = int(play_arr[0][4])
-                    temp_df["yards_gained"] = int(play_arr[0][4])
-
-                    tacklers_arr = play_arr[0][5]
-                elif (
-                    "pass" in play_desc.lower() and
-                    "complete" in play_desc.lower() and
-                    "fumbles" in play_desc.lower() and
-                    play_desc.lower().count("fumbles, ") == 2 and
-                    "forced by" in play_desc.lower() and
-                    "out of bounds." in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_complete_pass"] = True
-                    temp_df["is_out_of_bounds"] = False
-                    temp_df["is_fumble"] = False
-                    temp_df["is_fumbled_forced"] = False
-                    temp_df["is_fumbled_out_of_bounds"] = False
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by ([a-zA-Z\'\.\-\,\; ]+) for ([0-9\-]+) yard[s]?\. ([a-zA-Z\'\.\-\,\; ]+) FUMBLES\, forced by ([a-zA-Z\'\.\-\,\; ]+)\. ([a-zA-Z\'\.\-\,\; ]+) FUMBLES\, out of bounds\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0][0]
-                    temp_df["pass_length"] = play_arr[0][1]
-                    temp_df["pass_location"] = play_arr[0][2]
-                    temp_df["receiver_player_name"] = play_arr[0][3]
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][5]
-                    temp_df["forced_fumble_player_1_team"] = defteam
-                    temp_df["forced_fumble_player_1_player_name"] = play_arr[0][6]
-                elif (
-                    "pass" in play_desc.lower() and
-                    "complete" in play_desc.lower() and
-                    "fumbles" in play_desc.lower() and
-                    "forced by" in play_desc.lower() and
-                    "out of bounds." in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_complete_pass"] = True
-                    temp_df["is_out_of_bounds"] = False
-                    temp_df["is_fumble"] = False
-                    temp_df["is_fumbled_forced"] = False
-                    temp_df["is_fumbled_out_of_bounds"] = False
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by ([a-zA-Z\'\.\-\,\; ]+) for ([0-9\-]+) yard[s]?\. ([a-zA-Z\'\.\-\,\; ]+) FUMBLES\, forced by ([a-zA-Z\'\.\-\,\; ]+)\. Out of bounds\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0][0]
-                    temp_df["pass_length"] = play_arr[0][1]
-                    temp_df["pass_location"] = play_arr[0][2]
-                    temp_df["receiver_player_name"] = play_arr[0][3]
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][5]
-                    temp_df["forced_fumble_player_1_team"] = defteam
-                    temp_df["forced_fumble_player_1_player_name"] = play_arr[0][6]
-                elif (
-                    "pass" in play_desc.lower() and
-                    "complete" in play_desc.lower() and
-                    "for yards" in play_desc.lower() and
-                    "pushed out of bounds by" in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_complete_pass"] = True
-                    temp_df["is_out_of_bounds"] = False
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by ([a-zA-Z\'\.\-\,\; ]+) for yard[s]?\. Pushed out of bounds by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0][0]
-                    temp_df["pass_length"] = play_arr[0][1]
-                    temp_df["pass_location"] = play_arr[0][2]
-                    temp_df["receiver_player_name"] = play_arr[0][3]
-                    # temp_df["receiving_yards"] = int(play_arr[0][4])
-                    # temp_df["passing_yards"] = int(play_arr[0][4])
-                    # temp_df["yards_gained"] = int(play_arr[0][4])
-
-                    tacklers_arr = play_arr[0][4]
-                elif (
-                    "pass" in play_desc.lower() and
-                    "complete" in play_desc.lower() and
-                    "pushed out of bounds by" in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_complete_pass"] = True
-                    temp_df["is_out_of_bounds"] = False
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) " +
-                        r"complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by ([a-zA-Z\'\.\-\,\; ]+) for " +
-                        r"([0-9\-]+) yard[s]?\. " +
-                        r"Pushed out of bounds by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    if len(play_arr) == 0:
-                        play_arr = re.findall(
-                            r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Pushed out of bounds by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\. Catch made by ([a-zA-Z\'\.\-\,\; ]+) for ([0-9\-]+) yard[s]?\.",
-                            play_desc
-                        )
-                        temp_df["passer_player_name"] = play_arr[0][0]
-                        temp_df["pass_length"] = play_arr[0][1]
-                        temp_df["pass_location"] = play_arr[0][2]
-                        temp_df["receiver_player_name"] = play_arr[0][5]
-                        temp_df["receiving_yards"] = int(play_arr[0][6])
-                        temp_df["passing_yards"] = int(play_arr[0][6])
-                        temp_df["yards_gained"] = int(play_arr[0][6])
-
-                        tacklers_arr = play_arr[0][3]
-                    else:
-                        temp_df["passer_player_name"] = play_arr[0][0]
-                        temp_df["pass_length"] = play_arr[0][1]
-                        temp_df["pass_location"] = play_arr[0][2]
-                        temp_df["receiver_player_name"] = play_arr[0][3]
-                        temp_df["receiving_yards"] = int(play_arr[0][4])
-                        temp_df["passing_yards"] = int(play_arr[0][4])
-                        temp_df["yards_gained"] = int(play_arr[0][4])
-
-                        tacklers_arr = play_arr[0][5]
-                elif (
-                    "pass" in play_desc.lower() and
-                    "intercepted" in play_desc.lower() and
-                    "touchback." in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_incomplete_pass"] = True
-                    temp_df["is_interception"] = True
-                    temp_df["is_out_of_bounds"] = True
-                    temp_df["is_touchback"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) [INTERCEPTED|intercepted]+ at ([A-Za-z0-9\s]+)[\[\] a-zA-Z\'\.\-\,\s]*\. Intercepted by ([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Touchback\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0][0]
-                    temp_df["pass_length"] = play_arr[0][1]
-                    temp_df["pass_location"] = play_arr[0][2]
-
-                    temp_df["interception_player_name"] = play_arr[0][4]
-                    # tacklers_arr = play_arr[0][6]
-                    # temp_yl_1 = play_arr[0][5]
-                    # temp_yl_2 = play_arr[0][7]
-
-                    # temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    # temp_yl_2 = get_yardline(temp_yl_2, posteam)
-
-                    temp_df["return_team"] = defteam
-                    temp_df["return_yards"] = 0
-                elif (
-                    "pass" in play_desc.lower() and
-                    "intercepted" in play_desc.lower() and
-                    "ran out of bounds." in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_incomplete_pass"] = True
-                    temp_df["is_interception"] = True
-                    temp_df["is_out_of_bounds"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) [INTERCEPTED|intercepted]+ at ([A-Za-z0-9\s]+)[\[\] a-zA-Z\'\.\-\,\s]*\. Intercepted by ([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. ([a-zA-Z\'\.\-\,\; ]+) ran out of bounds\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0][0]
-                    temp_df["pass_length"] = play_arr[0][1]
-                    temp_df["pass_location"] = play_arr[0][2]
-
-                    temp_df["interception_player_name"] = play_arr[0][4]
-                    # tacklers_arr = play_arr[0][6]
-                    # temp_yl_1 = play_arr[0][5]
-                    # temp_yl_2 = play_arr[0][7]
-
-                    # temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    # temp_yl_2 = get_yardline(temp_yl_2, posteam)
-
-                    temp_df["return_team"] = defteam
-                    temp_df["return_yards"] = 0
-                elif (
-                    "pass" in play_desc.lower() and
-                    "intercepted" in play_desc.lower() and
-                    "pushed out of bounds by" in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_incomplete_pass"] = True
-                    temp_df["is_interception"] = True
-                    temp_df["is_out_of_bounds"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) [INTERCEPTED|intercepted]+ at ([A-Za-z0-9\s]+)\. Intercepted by ([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Pushed out of bounds by ([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
+def parse_punt_downed_2_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
 
-                    if len(play_arr) == 0:
-                        play_arr = re.findall(
-                            r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) [INTERCEPTED|intercepted]+ at ([A-Za-z0-9\s]+) \[([a-zA-Z\'\.\-\,\; ]+)\]\. Intercepted by ([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Pushed out of bounds by ([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\.",
-                            play_desc
-                        )
-                        temp_df["passer_player_name"] = play_arr[0][0]
-                        temp_df["pass_length"] = play_arr[0][1]
-                        temp_df["pass_location"] = play_arr[0][2]
+    Parses `"punt_downed_2"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
 
-                        temp_df["qb_hit_1_player_name"] = play_arr[0][4]
-                        temp_df["interception_player_name"] = play_arr[0][5]
+    temp_dict["is_punt_attempt"] = True
+    temp_dict["is_punt_downed"] = True
 
-                        tacklers_arr = play_arr[0][7]
-                        temp_yl_1 = play_arr[0][6]
-                        temp_yl_2 = play_arr[0][8]
+    play_match = PBP_REGEX["punt_downed"].search(play_desc)
+    temp_dict["punter_player_name"] = play_match[
+        "punter_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_dict["long_snapper_player_name"] = play_match[
+        "long_snapper_player_name"
+    ]
 
-                        temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                        temp_yl_2 = get_yardline(temp_yl_2, posteam)
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    if temp_yl_1 > 80:
+        temp_dict["is_punt_inside_twenty"] = True
 
-                        temp_df["return_team"] = defteam
-                        temp_df["return_yards"] = temp_yl_2 - temp_yl_1
-                    else:
-                        temp_df["passer_player_name"] = play_arr[0][0]
-                        temp_df["pass_length"] = play_arr[0][1]
-                        temp_df["pass_location"] = play_arr[0][2]
-
-                        temp_df["interception_player_name"] = play_arr[0][4]
-                        tacklers_arr = play_arr[0][6]
-                        temp_yl_1 = play_arr[0][5]
-                        temp_yl_2 = play_arr[0][7]
-
-                        temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                        temp_yl_2 = get_yardline(temp_yl_2, posteam)
-
-                        temp_df["return_team"] = defteam
-                        temp_df["return_yards"] = temp_yl_2 - temp_yl_1
-                elif (
-                    "pass" in play_desc.lower() and
-                    "intercepted" in play_desc.lower() and
-                    "lateral to" in play_desc.lower() and
-                    "touchdown" in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_incomplete_pass"] = True
-                    temp_df["is_interception"] = True
-                    temp_df["is_return_touchdown"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) [INTERCEPTED|intercepted]+ at ([A-Za-z0-9\s]+)[\[\] a-zA-Z\'\.\-\,\s]*\. Intercepted by ([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Lateral to ([a-zA-Z\'\.\-\,\; ]+) to ([A-Za-z0-9\s]+) for ([\-0-9]+) yard[s]?\. [TOUCHDOWN|touchdown]+\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0][0]
-                    temp_df["pass_length"] = play_arr[0][1]
-                    temp_df["pass_location"] = play_arr[0][2]
-
-                    temp_df["interception_player_name"] = play_arr[0][4]
-                    temp_df["lateral_interception_player_name"] = play_arr[0][6]
-
-                    # tacklers_arr = play_arr[0][9]
-                    temp_yl_1 = play_arr[0][5]
-                    temp_yl_2 = play_arr[0][7]
-
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_yl_2 = get_yardline(temp_yl_2, posteam)
-
-                    temp_df["return_team"] = defteam
-                    temp_df["return_yards"] = temp_yl_2 - temp_yl_1
-                elif (
-                    "pass" in play_desc.lower() and
-                    "intercepted" in play_desc.lower() and
-                    "touchdown" in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_incomplete_pass"] = True
-                    temp_df["is_interception"] = True
-                    temp_df["is_return_touchdown"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) [INTERCEPTED|intercepted]+ at ([A-Za-z0-9\s]+)[\[\] a-zA-Z\'\.\-\,\s]*\. Intercepted by ([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. [TOUCHDOWN|touchdown]+\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0][0]
-                    temp_df["pass_length"] = play_arr[0][1]
-                    temp_df["pass_location"] = play_arr[0][2]
-
-                    temp_df["interception_player_name"] = play_arr[0][4]
-                    temp_yl_1 = play_arr[0][5]
-
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-
-                    temp_df["return_team"] = defteam
-                    temp_df["return_yards"] = 100 - temp_yl_1
-                elif (
-                    "pass" in play_desc.lower() and
-                    "intercepted" in play_desc.lower() and
-                    "lateral to" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_incomplete_pass"] = True
-                    temp_df["is_interception"] = True
-                    temp_df["is_lateral_return"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) [INTERCEPTED|intercepted]+ at ([A-Za-z0-9\s]+)[\[\] a-zA-Z\'\.\-\,\s]*\. Intercepted by ([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Lateral to ([a-zA-Z\'\.\-\,\; ]+) to ([A-Za-z0-9\s]+) for ([\-0-9]+) yard[s]?\. Tackled by ([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0][0]
-                    temp_df["pass_length"] = play_arr[0][1]
-                    temp_df["pass_location"] = play_arr[0][2]
-
-                    temp_df["interception_player_name"] = play_arr[0][4]
-                    temp_df["lateral_interception_player_name"] = play_arr[0][6]
-
-                    tacklers_arr = play_arr[0][9]
-                    temp_yl_1 = play_arr[0][5]
-                    temp_yl_2 = play_arr[0][10]
-
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_yl_2 = get_yardline(temp_yl_2, posteam)
-
-                    temp_df["return_team"] = defteam
-                    temp_df["return_yards"] = temp_yl_2 - temp_yl_1
-                elif (
-                    "pass" in play_desc.lower() and
-                    "intercepted" in play_desc.lower() and
-                    "lateral to" in play_desc.lower() and
-                    "recovered by" not in play_desc.lower() and
-                    "out of bounds" in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_incomplete_pass"] = True
-                    temp_df["is_interception"] = True
-                    temp_df["is_lateral_return"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) [INTERCEPTED|intercepted]+ at ([A-Za-z0-9\s]+)[\[\] a-zA-Z\'\.\-\,\s]*\. Intercepted by ([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Lateral to ([a-zA-Z\'\.\-\,\; ]+) to ([A-Za-z0-9\s]+) for ([\-0-9]+) yard[s]?\. Tackled by ([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0][0]
-                    temp_df["pass_length"] = play_arr[0][1]
-                    temp_df["pass_location"] = play_arr[0][2]
-
-                    temp_df["interception_player_name"] = play_arr[0][4]
-                    temp_df["lateral_interception_player_name"] = play_arr[0][6]
-
-                    tacklers_arr = play_arr[0][9]
-                    temp_yl_1 = play_arr[0][5]
-                    temp_yl_2 = play_arr[0][10]
-
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_yl_2 = get_yardline(temp_yl_2, posteam)
-
-                    temp_df["return_team"] = defteam
-                    temp_df["return_yards"] = temp_yl_2 - temp_yl_1
-                elif (
-                    "pass" in play_desc.lower() and
-                    "intercepted" in play_desc.lower() and
-                    "tackled by at" in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_incomplete_pass"] = True
-                    temp_df["is_interception"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) [INTERCEPTED|intercepted]+ at ([A-Za-z0-9\s]+)[\[\] a-zA-Z\'\.\-\,\s]*\. Intercepted by ([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Tackled by at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0][0]
-                    temp_df["pass_length"] = play_arr[0][1]
-                    temp_df["pass_location"] = play_arr[0][2]
-
-                    temp_df["interception_player_name"] = play_arr[0][4]
-                    # tacklers_arr = play_arr[0][6]
-                    temp_yl_1 = play_arr[0][5]
-                    temp_yl_2 = play_arr[0][6]
-
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_yl_2 = get_yardline(temp_yl_2, posteam)
-
-                    temp_df["return_team"] = defteam
-                    temp_df["return_yards"] = temp_yl_2 - temp_yl_1
-                elif (
-                    "pass" in play_desc.lower() and
-                    "intercepted" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_incomplete_pass"] = True
-                    temp_df["is_interception"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) pass ([a-zA-Z]+) ([a-zA-Z]+) [INTERCEPTED|intercepted]+ at ([A-Za-z0-9\s]+)[\[\] a-zA-Z\'\.\-\,\s]*\. Intercepted by ([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Tackled by ([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0][0]
-                    temp_df["pass_length"] = play_arr[0][1]
-                    temp_df["pass_location"] = play_arr[0][2]
-
-                    temp_df["interception_player_name"] = play_arr[0][4]
-                    tacklers_arr = play_arr[0][6]
-                    temp_yl_1 = play_arr[0][5]
-                    temp_yl_2 = play_arr[0][7]
-
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_yl_2 = get_yardline(temp_yl_2, posteam)
-
-                    temp_df["return_team"] = defteam
-                    temp_df["return_yards"] = temp_yl_2 - temp_yl_1
-                elif ("spikes the ball" in play_desc.lower()):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_incomplete_pass"] = True
-                    temp_df["is_qb_spike"] = True
-
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) spikes the ball\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0]
-                # Pass (sacks)
-                elif (
-                    "pass" in play_desc.lower() and
-                    "sacked at" in play_desc.lower() and
-                    "for yards" in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_sack"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) steps back to pass\. Sacked at ([A-Za-z0-9\s]+) for yard[s]? \(([a-zA-Z\'\.\;\-\, ]+)\)\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0][0]
-                    # temp_df["yards_gained"] = int(play_arr[0][2])
-                    tacklers_arr = play_arr[0][2]
-                    sack_players_arr = play_arr[0][2]
-                elif (
-                    "pass" in play_desc.lower() and
-                    "sacked at" in play_desc.lower()
-                ):
-                    temp_df["is_pass_attempt"] = True
-                    temp_df["is_sack"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) steps back to pass\. Sacked at ([A-Za-z0-9\s]+) for ([\-0-9]+) yard[s]? \(([a-zA-Z\'\.\;\-\, ]+)\)\.",
-                        play_desc
-                    )
-                    temp_df["passer_player_name"] = play_arr[0][0]
-                    temp_df["yards_gained"] = int(play_arr[0][2])
-                    tacklers_arr = play_arr[0][3]
-                    sack_players_arr = play_arr[0][3]
-                # Run plays
-                elif (
-                    "rushed up the middle for" in play_desc.lower() and
-                    "fumbles" in play_desc.lower() and
-                    "forced by" in play_desc.lower() and
-                    "fumble recovered by" in play_desc.lower() and
-                    "tackled by" not in play_desc.lower() and
-                    "pushed out of bounds by" not in play_desc.lower()
-                ):
-                    temp_df["run_location"] = "middle"
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumble_forced"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) rushed up the middle for ([\-0-9]+) yard[s]?\. ([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by ([a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by ([A-Za-z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["rushing_yards"] = int(play_arr[0][1])
-                    temp_df["yards_gained"] = int(play_arr[0][1])
-
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][2]
-
-                    temp_df["forced_fumble_player_1_team"] = defteam
-                    temp_df["forced_fumble_player_1_player_name"] = play_arr[0][3]
-
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][4]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][5]
-                elif (
-                    "rushed up the middle for" in play_desc.lower() and
-                    "fumbles" in play_desc.lower() and
-                    "forced by" in play_desc.lower() and
-                    "fumble recovered by" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    temp_df["run_location"] = "middle"
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumble_forced"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) rushed up the middle for ([\-0-9]+) yard[s]?\. ([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by ([a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by ([A-Za-z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Tackled by ([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    # temp_df["run_location"] = play_arr[0][1]
-                    # temp_df["run_gap"] = play_arr[0][2]
-                    temp_df["rushing_yards"] = int(play_arr[0][1])
-                    temp_df["yards_gained"] = int(play_arr[0][1])
-
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][2]
-
-                    temp_df["forced_fumble_player_1_team"] = defteam
-                    temp_df["forced_fumble_player_1_player_name"] = play_arr[0][6]
-
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][4]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][5]
-
-                    tacklers_arr = play_arr[0][7]
-                elif (
-                    "rushed" in play_desc.lower() and
-                    "fumbles" in play_desc.lower() and
-                    "forced by" in play_desc.lower() and
-                    "fumble recovered by" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    temp_df["run_location"] = "middle"
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumble_forced"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) rushed ([a-zA-Z]+) ([a-zA-Z]+) for ([\-0-9]+) yard[s]?\. ([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by ([a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by ([A-Za-z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Tackled by ([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = play_arr[0][1]
-                    temp_df["run_gap"] = play_arr[0][2]
-                    temp_df["rushing_yards"] = int(play_arr[0][3])
-                    temp_df["yards_gained"] = int(play_arr[0][3])
+    return tacklers_arr, sack_players_arr
 
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][4]
 
-                    temp_df["forced_fumble_player_1_team"] = defteam
-                    temp_df["forced_fumble_player_1_player_name"] = play_arr[0][6]
+def parse_punt_pushed_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
 
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][6]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][7]
+    Parses `"punt_pushed_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
 
-                    tacklers_arr = play_arr[0][9]
-                elif (
-                    "rushed up the middle for yards" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    temp_df["run_location"] = "middle"
-                    temp_df["is_rush_attempt"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) rushed up the middle " +
-                        r"for yard[s]?\. " +
-                        r"Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    # temp_df["rushing_yards"] = int(play_arr[0][1])
-                    # temp_df["yards_gained"] = int(play_arr[0][1])
-                    tacklers_arr = play_arr[0][1]
-                elif (
-                    "rushed up the middle for" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    temp_df["run_location"] = "middle"
-                    temp_df["is_rush_attempt"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) rushed up the middle " +
-                        r"for ([\-0-9]+) yard[s]?\. " +
-                        r"Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["rushing_yards"] = int(play_arr[0][1])
-                    temp_df["yards_gained"] = int(play_arr[0][1])
-                    tacklers_arr = play_arr[0][2]
-                elif (
-                    "rushed" in play_desc.lower() and
-                    "tackled by at" in play_desc.lower() and
-                    "for yards" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) rushed " +
-                        r"([a-zA-Z]+) ([a-zA-Z]+) " +
-                        r"for yard[s]?\. " +
-                        r"Tackled by at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = play_arr[0][1]
-                    temp_df["run_gap"] = play_arr[0][2]
-                elif (
-                    "rushed" in play_desc.lower() and
-                    "tackled by" in play_desc.lower() and
-                    "for yards" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) rushed " +
-                        r"([a-zA-Z]+) ([a-zA-Z]+) " +
-                        r"for yard[s]?\. " +
-                        r"Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = play_arr[0][1]
-                    temp_df["run_gap"] = play_arr[0][2]
-                    # temp_df["rushing_yards"] = int(play_arr[0][3])
-                    # temp_df["yards_gained"] = int(play_arr[0][3])
-                    tacklers_arr = play_arr[0][3]
-                elif (
-                    "rushed" in play_desc.lower() and
-                    "ran out of bounds." in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) rushed ([a-zA-Z]+) ([a-zA-Z]+) for ([\-0-9]+) yard[s]?\. ([a-zA-Z\'\.\-\,\; ]+) ran out of bounds\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = play_arr[0][1]
-                    temp_df["run_gap"] = play_arr[0][2]
-                    temp_df["rushing_yards"] = int(play_arr[0][3])
-                    temp_df["yards_gained"] = int(play_arr[0][3])
-                elif (
-                    "rushed" in play_desc.lower() and
-                    "tackled by at" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) rushed " +
-                        r"([a-zA-Z]+) ([a-zA-Z]+) " +
-                        r"for ([\-0-9]+) yard[s]?\. " +
-                        r"Tackled by at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = play_arr[0][1]
-                    temp_df["run_gap"] = play_arr[0][2]
-                    temp_df["rushing_yards"] = int(play_arr[0][3])
-                    temp_df["yards_gained"] = int(play_arr[0][3])
-                elif (
-                    "rushed" in play_desc.lower() and
-                    "fumbles" in play_desc.lower() and
-                    play_desc.lower().count("fumbles") == 2 and
-                    "forced by" in play_desc.lower() and
-                    "recovered by" not in play_desc.lower() and
-                    "out of bounds" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumble_not_forced"] = True
-                    temp_df["is_touchback"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) rushed ([a-zA-Z]+) ([a-zA-Z]+) for ([\-0-9]+) yard[s]?\. ([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by ([a-zA-Z\'\.\-\,\; ]+)\. ([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, out of bounds\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = play_arr[0][1]
-                    temp_df["run_gap"] = play_arr[0][2]
-                    temp_df["rushing_yards"] = int(play_arr[0][3])
-                    temp_df["yards_gained"] = int(play_arr[0][3])
-
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][4]
-
-                    temp_df["forced_fumble_player_1_team"] = defteam
-                    temp_df["forced_fumble_player_1_player_name"] = play_arr[0][5]
-                elif (
-                    "rushed" in play_desc.lower() and
-                    "fumbles" in play_desc.lower() and
-                    "fumble recovered by" in play_desc.lower() and
-                    "tackled by" in play_desc.lower() and
-                    "touchback" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumble_not_forced"] = True
-                    temp_df["is_touchback"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) rushed ([a-zA-Z]+) ([a-zA-Z]+) for ([\-0-9]+) yard[s]?\. ([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\. Fumble RECOVERED by ([A-Za-z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\. Touchback\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = play_arr[0][1]
-                    temp_df["run_gap"] = play_arr[0][2]
-                    temp_df["rushing_yards"] = int(play_arr[0][3])
-                    temp_df["yards_gained"] = int(play_arr[0][3])
-
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][4]
-
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][5]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][6]
-                    temp_df["fumble_recovery_1_yards"] = 0
-                    tacklers_arr = play_arr[0][8]
-                elif (
-                    "rushed" in play_desc.lower() and
-                    "fumbles" in play_desc.lower() and
-                    "fumble recovered by" in play_desc.lower() and
-                    "forced by" not in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_return_touchdown"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumbled_forced"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) rushed ([a-zA-Z]+) ([a-zA-Z]+) for ([\-0-9]+) yard[s]?\. ([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\. Fumble [RECOVERED|recovered]+ by ([A-Z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = play_arr[0][1]
-                    temp_df["run_gap"] = play_arr[0][2]
-                    temp_df["rushing_yards"] = int(play_arr[0][3])
-                    temp_df["yards_gained"] = int(play_arr[0][3])
-
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][4]
-
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][5]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][6]
-                    temp_df["fumble_recovery_1_yards"] = 0
-                elif (
-                    "rushed" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) rushed " +
-                        r"([a-zA-Z]+) ([a-zA-Z]+) " +
-                        r"for ([\-0-9]+) yard[s]?\. " +
-                        r"Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = play_arr[0][1]
-                    temp_df["run_gap"] = play_arr[0][2]
-                    temp_df["rushing_yards"] = int(play_arr[0][3])
-                    temp_df["yards_gained"] = int(play_arr[0][3])
-                    tacklers_arr = play_arr[0][4]
-                elif (
-                    "rushed" in play_desc.lower() and
-                    "for yards" in play_desc.lower() and
-                    "pushed out of bounds by" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_out_of_bounds"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) rushed ([a-zA-Z]+) ([a-zA-Z]+) for yard[s]?\. Pushed out of bounds by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = play_arr[0][1]
-                    temp_df["run_gap"] = play_arr[0][2]
-                    # temp_df["rushing_yards"] = int(play_arr[0][3])
-                    # temp_df["yards_gained"] = int(play_arr[0][3])
-                    tacklers_arr = play_arr[0][3]
-                elif (
-                    "rushed up the middle" in play_desc.lower() and
-                    "pushed out of bounds by" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_out_of_bounds"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) rushed up the middle for ([\-0-9]+) yard[s]?\. Pushed out of bounds by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = "middle"
-                    # temp_df["run_gap"] = play_arr[0][2]
-                    temp_df["rushing_yards"] = int(play_arr[0][1])
-                    temp_df["yards_gained"] = int(play_arr[0][1])
-                    tacklers_arr = play_arr[0][2]
-                elif (
-                    "rushed" in play_desc.lower() and
-                    "lateral to " in play_desc.lower() and
-                    "pushed out of bounds by" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_lateral_rush"] = True
-                    temp_df["is_out_of_bounds"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) rushed ([a-zA-Z]+) ([a-zA-Z]+) for ([\-0-9]+) yard[s]?\. Lateral to ([a-zA-Z\'\.\-\,\; ]+) to ([A-Za-z0-9\s]+) for ([0-9\-]) yard[s]?\. Pushed out of bounds by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = play_arr[0][1]
-                    temp_df["run_gap"] = play_arr[0][2]
-                    temp_df["rushing_yards"] = int(play_arr[0][3])
-                    temp_df["yards_gained"] = int(play_arr[0][3])
-                    temp_df["lateral_rusher_player_name"] = play_arr[0][4]
-                    temp_df["lateral_rushing_yards"] = int(play_arr[0][6])
-                    temp_df["yards_gained"] += int(play_arr[0][6])
-
-                    tacklers_arr = play_arr[0][7]
-                elif (
-                    "rushed" in play_desc.lower() and
-                    "fumbles" in play_desc.lower() and
-                    "forced by" in play_desc.lower() and
-                    "fumble recovered by" in play_desc.lower() and
-                    "pushed out of bounds by" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_out_of_bounds"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) rushed ([a-zA-Z]+) ([a-zA-Z]+) for ([\-0-9]+) yard[s]?\. ([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by ([a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by ([A-Z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Pushed out of bounds by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = play_arr[0][1]
-                    temp_df["run_gap"] = play_arr[0][2]
-                    temp_df["rushing_yards"] = int(play_arr[0][3])
-                    temp_df["yards_gained"] = int(play_arr[0][3])
-
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][4]
-
-                    temp_df["forced_fumble_player_1_team"] = defteam
-                    temp_df["forced_fumble_player_1_play"] = play_arr[0][5]
-
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][6]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][7]
-                    temp_df["fumble_recovery_1_yards"] = 0
-
-                    tacklers_arr = play_arr[0][4]
-                elif (
-                    "rushed" in play_desc.lower() and
-                    "pushed out of bounds by" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_out_of_bounds"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) rushed ([a-zA-Z]+) ([a-zA-Z]+) for ([\-0-9]+) yard[s]?\. Pushed out of bounds by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = play_arr[0][1]
-                    temp_df["run_gap"] = play_arr[0][2]
-                    temp_df["rushing_yards"] = int(play_arr[0][3])
-                    temp_df["yards_gained"] = int(play_arr[0][3])
-                    tacklers_arr = play_arr[0][4]
-                elif (
-                    "rushed" in play_desc.lower() and
-                    "up the middle for yards" in play_desc.lower() and
-                    "touchdown" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_rush_touchdown"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) rushed " +
-                        r"up the middle for yard[s]?\. [TOUCHDOWN|touchdown]+",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["rushing_yards"] = 0
-                    temp_df["yards_gained"] = 0
-                elif (
-                    "rushed" in play_desc.lower() and
-                    "up the middle" in play_desc.lower() and
-                    "touchdown" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_rush_touchdown"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) rushed " +
-                        r"up the middle for " +
-                        r"([\-0-9]+) yard[s]?\. [TOUCHDOWN|touchdown]+",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["rushing_yards"] = int(play_arr[0][1])
-                    temp_df["yards_gained"] = int(play_arr[0][1])
-                elif (
-                    "rushed" in play_desc.lower() and
-                    "touchdown" in play_desc.lower() and
-                    "for yards" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_rush_touchdown"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) rushed ([a-zA-Z]+) ([a-zA-Z]+) for yard[s]?\. [TOUCHDOWN|touchdown]+",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = play_arr[0][1]
-                    temp_df["run_gap"] = play_arr[0][2]
-                    temp_df["rushing_yards"] = yardline_100
-                    temp_df["yards_gained"] = yardline_100
-                elif (
-                    "rushed" in play_desc.lower() and
-                    "fumbles" in play_desc.lower() and
-                    "forced by" in play_desc.lower() and
-                    "fumble recovered by" in play_desc.lower() and
-                    "(" not in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_return_touchdown"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumbled_forced"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) rushed ([a-zA-Z]+) ([a-zA-Z]+) for ([\-0-9]+) yard[s]?\. ([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by ([a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by ([A-Z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([a-zA-Z0-9 ]+)\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = play_arr[0][1]
-                    temp_df["run_gap"] = play_arr[0][2]
-                    temp_df["rushing_yards"] = int(play_arr[0][3])
-                    temp_df["yards_gained"] = int(play_arr[0][3])
-
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][4]
-
-                    temp_df["forced_fumble_player_1_team"] = defteam
-                    temp_df["forced_fumble_player_1_play"] = play_arr[0][5]
-
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][6]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][7]
-                    temp_df["fumble_recovery_1_yards"] = 0
-                elif (
-                    "rushed" in play_desc.lower() and
-                    "fumbles" in play_desc.lower() and
-                    "forced by" in play_desc.lower() and
-                    "fumble recovered by" in play_desc.lower() and
-                    "touchdown" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_return_touchdown"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumbled_forced"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) rushed ([a-zA-Z]+) ([a-zA-Z]+) for ([\-0-9]+) yard[s]?\. ([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by ([a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by ([A-Z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([a-zA-Z\'\.\-\,\; ]+) [TOUCHDOWN|touchdown]+",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = play_arr[0][1]
-                    temp_df["run_gap"] = play_arr[0][2]
-                    temp_df["rushing_yards"] = int(play_arr[0][3])
-                    temp_df["yards_gained"] = int(play_arr[0][3])
-
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][4]
-
-                    temp_df["forced_fumble_player_1_team"] = defteam
-                    temp_df["forced_fumble_player_1_play"] = play_arr[0][5]
-
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][6]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][7]
-                    temp_df["fumble_recovery_1_yards"] = 0
-                elif (
-                    "rushed" in play_desc.lower() and
-                    "fumbles" in play_desc.lower() and
-                    "forced by" in play_desc.lower() and
-                    "recovered by" not in play_desc.lower() and
-                    "out of bounds" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_return_touchdown"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumbled_forced"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) rushed ([a-zA-Z]+) ([a-zA-Z]+) for ([\-0-9]+) yard[s]?\. ([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by ([a-zA-Z\'\.\-\,\; ]+)\. Out of bounds\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = play_arr[0][1]
-                    temp_df["run_gap"] = play_arr[0][2]
-                    temp_df["rushing_yards"] = int(play_arr[0][3])
-                    temp_df["yards_gained"] = int(play_arr[0][3])
-
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][4]
-
-                    temp_df["forced_fumble_player_1_team"] = defteam
-                    temp_df["forced_fumble_player_1_play"] = play_arr[0][5]
-                elif (
-                    "rushed" in play_desc.lower() and
-                    "touchdown" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_rush_touchdown"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) rushed " +
-                        r"([a-zA-Z]+) ([a-zA-Z]+) for " +
-                        r"([\-0-9]+) yard[s]?\. [TOUCHDOWN|touchdown]+",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = play_arr[0][1]
-                    temp_df["run_gap"] = play_arr[0][2]
-                    temp_df["rushing_yards"] = int(play_arr[0][3])
-                    temp_df["yards_gained"] = int(play_arr[0][3])
-                # Runs (scrambles)
-                elif (
-                    "scrambles" in play_desc.lower() and
-                    "up the middle for yards" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_qb_scramble"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) scrambles up the middle for yards\. Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = "middle"
-                    temp_df["run_gap"] = "middle"
-                    tacklers_arr = play_arr[0][1]
-                    temp_yl_1 = play_arr[0][2]
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_df["rushing_yards"] = yardline_100 - temp_yl_1
-                    temp_df["yards_gained"] = yardline_100 - temp_yl_1
-                elif (
-                    "scrambles" in play_desc.lower() and
-                    "for yards." in play_desc.lower() and
-                    "forced by" in play_desc.lower() and
-                    "fumble recovered by" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_qb_scramble"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) scrambles ([a-zA-Z]+) ([a-zA-Z]+) for yards\. ([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by ([a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by ([A-Z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["rushing_yards"] = 0
-                    temp_df["yards_gained"] =  0
-                    temp_df["run_location"] = "middle"
-
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][3]
-
-                    temp_df["forced_fumble_player_1_team"] = defteam
-                    temp_df["forced_fumble_player_1_play"] = play_arr[0][4]
-
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][5]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][6]
-                    temp_df["fumble_recovery_1_yards"] = 0
-
-                    tacklers_arr = play_arr[0][8]
-                elif (
-                    "scrambles" in play_desc.lower() and
-                    "for yards" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_qb_scramble"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) scrambles " +
-                        r"([a-zA-Z]+) ([a-zA-Z]+) for yards\. " +
-                        r"Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = play_arr[0][1]
-                    temp_df["run_gap"] = play_arr[0][2]
-                    tacklers_arr = play_arr[0][3]
-                    temp_yl_1 = play_arr[0][4]
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_df["rushing_yards"] = yardline_100 - temp_yl_1
-                    temp_df["yards_gained"] = yardline_100 - temp_yl_1
-                elif (
-                    "scrambles" in play_desc.lower() and
-                    "up the middle" in play_desc.lower() and
-                    "forced by" in play_desc.lower() and
-                    "fumble recovered by" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_qb_scramble"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) scrambles up the middle for ([\-0-9]+) yards\. ([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by ([a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by ([A-Z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["rushing_yards"] = int(play_arr[0][1])
-                    temp_df["yards_gained"] = int(play_arr[0][1])
-                    temp_df["run_location"] = "middle"
-
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][2]
-
-                    temp_df["forced_fumble_player_1_team"] = defteam
-                    temp_df["forced_fumble_player_1_play"] = play_arr[0][3]
-
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][4]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][5]
-                    temp_df["fumble_recovery_1_yards"] = 0
-
-                    tacklers_arr = play_arr[0][8]
-                elif (
-                    "scrambles" in play_desc.lower() and
-                    "up the middle" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_qb_scramble"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) scrambles up the middle for ([\-0-9]+) yard[s]?\. Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["rushing_yards"] = int(play_arr[0][1])
-                    temp_df["yards_gained"] = int(play_arr[0][1])
-                    temp_df["run_location"] = "middle"
-
-                    tacklers_arr = play_arr[0][2]
-                elif (
-                    "scrambles" in play_desc.lower() and
-                    "for yards" in play_desc.lower() and
-                    "pushed out of bounds by" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_qb_scramble"] = True
-                    temp_df["is_out_of_bounds"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) scrambles " +
-                        r"([a-zA-Z]+) ([a-zA-Z]+) for yards\. " +
-                        r"Pushed out of bounds by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = play_arr[0][1]
-                    temp_df["run_gap"] = play_arr[0][2]
-                    # temp_df["rushing_yards"] = int(play_arr[0][3])
-                    # temp_df["yards_gained"] = int(play_arr[0][3])
-
-                    tacklers_arr = play_arr[0][3]
-                elif (
-                    "scrambles up the middle" in play_desc.lower() and
-                    "pushed out of bounds by" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_qb_scramble"] = True
-                    temp_df["is_out_of_bounds"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) scrambles " +
-                        r"up the middle for ([\-0-9]+) yards\. " +
-                        r"Pushed out of bounds by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = "middle"
-                    # temp_df["run_gap"] = play_arr[0][2]
-                    temp_df["rushing_yards"] = int(play_arr[0][1])
-                    temp_df["yards_gained"] = int(play_arr[0][1])
-
-                    tacklers_arr = play_arr[0][2]
-                elif (
-                    "scrambles" in play_desc.lower() and
-                    "up the middle for" in play_desc.lower() and
-                    "touchdown" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_qb_scramble"] = True
-                    temp_df["is_touchdown"] = True
-                    temp_df["is_rush_touchdown"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) scrambles up the middle for ([\-0-9]+) yards\. [TOUCHDOWN|touchdown]+\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = 'middle'
-                    # temp_df["run_gap"] = play_arr[0][2]
-                    temp_df["rushing_yards"] = int(play_arr[0][1])
-                    temp_df["yards_gained"] = int(play_arr[0][1])
-                elif (
-                    "scrambles" in play_desc.lower() and
-                    "touchdown" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_qb_scramble"] = True
-                    temp_df["is_touchdown"] = True
-                    temp_df["is_rush_touchdown"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) scrambles ([a-zA-Z]+) ([a-zA-Z]+) for ([\-0-9]+) yards\. [TOUCHDOWN|touchdown]+\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = play_arr[0][1]
-                    temp_df["run_gap"] = play_arr[0][2]
-                    temp_df["rushing_yards"] = int(play_arr[0][3])
-                    temp_df["yards_gained"] = int(play_arr[0][3])
-                elif (
-                    "scrambles" in play_desc.lower() and
-                    "pushed out of bounds by" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_qb_scramble"] = True
-                    temp_df["is_out_of_bounds"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) scrambles " +
-                        r"([a-zA-Z]+) ([a-zA-Z]+) for ([\-0-9]+) yards\. " +
-                        r"Pushed out of bounds by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = play_arr[0][1]
-                    temp_df["run_gap"] = play_arr[0][2]
-                    temp_df["rushing_yards"] = int(play_arr[0][3])
-                    temp_df["yards_gained"] = int(play_arr[0][3])
-
-                    tacklers_arr = play_arr[0][4]
-                elif (
-                    "scrambles" in play_desc.lower() and
-                    "tackled by at" in play_desc.lower() and
-                    "fumbles" in play_desc.lower() and
-                    "forced by" in play_desc.lower() and
-                    "recovered by" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_qb_scramble"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) scrambles ([a-zA-Z]+) ([a-zA-Z]+) for ([\-0-9]+) yards\. ([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by ([a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by ([A-Z]+)\-([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Tackled by at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = play_arr[0][1]
-                    temp_df["run_gap"] = play_arr[0][2]
-                    temp_df["rushing_yards"] = int(play_arr[0][3])
-                    temp_df["yards_gained"] = int(play_arr[0][3])
-
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][4]
-
-                    temp_df["forced_fumble_player_1_team"] = defteam
-                    temp_df["forced_fumble_player_1_play"] = play_arr[0][5]
-
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][6]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][7]
-                    temp_df["fumble_recovery_1_yards"] = 0
-
-                    # tacklers_arr = play_arr[0][4]
-                elif (
-                    "scrambles" in play_desc.lower() and
-                    "tackled by at" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_qb_scramble"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) scrambles " +
-                        r"([a-zA-Z]+) ([a-zA-Z]+) for ([\-0-9]+) yards\. " +
-                        r"Tackled by at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = play_arr[0][1]
-                    temp_df["run_gap"] = play_arr[0][2]
-                    temp_df["rushing_yards"] = int(play_arr[0][3])
-                    temp_df["yards_gained"] = int(play_arr[0][3])
-
-                    # tacklers_arr = play_arr[0][4]
-                elif (
-                    "scrambles" in play_desc.lower() and
-                    "tackled by" in play_desc.lower() and
-                    "fumbles" in play_desc.lower() and
-                    "forced by" in play_desc.lower() and
-                    "fumble recovered by" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_qb_scramble"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) scrambles ([a-zA-Z]+) ([a-zA-Z]+) for ([\-0-9]+) yards\. ([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by ([a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by ([A-Z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = play_arr[0][1]
-                    temp_df["run_gap"] = play_arr[0][2]
-                    temp_df["rushing_yards"] = int(play_arr[0][3])
-                    temp_df["yards_gained"] = int(play_arr[0][3])
-
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][4]
-
-                    temp_df["forced_fumble_player_1_team"] = defteam
-                    temp_df["forced_fumble_player_1_player_name"] = play_arr[0][5]
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][6]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][7]
-
-                    tacklers_arr = play_arr[0][9]
-                elif (
-                    "scrambles up the middle" in play_desc.lower() and
-                    "ran out of bounds" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_qb_scramble"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) scrambles up the middle for ([\-0-9]+) yards\. ([a-zA-Z\'\.\-\,\; ]+) ran out of bounds\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = "middle"
-                    # temp_df["run_gap"] = play_arr[0][2]
-                    temp_df["rushing_yards"] = int(play_arr[0][1])
-                    temp_df["yards_gained"] = int(play_arr[0][1])
-                elif (
-                    "scrambles" in play_desc.lower() and
-                    "ran out of bounds" in play_desc.lower()
-                ):
-                    temp_df["is_rush_attempt"] = True
-                    temp_df["is_qb_scramble"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) scrambles ([a-zA-Z]+) ([a-zA-Z]+) for ([\-0-9]+) yards\. ([a-zA-Z\'\.\-\,\; ]+) ran out of bounds\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_df["run_location"] = play_arr[0][1]
-                    temp_df["run_gap"] = play_arr[0][2]
-                    temp_df["rushing_yards"] = int(play_arr[0][3])
-                    temp_df["yards_gained"] = int(play_arr[0][3])
-                # Runs (kneeldowns)
-                elif ("kneels at the" in play_desc.lower()):
-                    temp_df["is_qb_kneel"] = True
-                    temp_df["is_rush_attempt"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) kneels at the ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["rusher_player_name"] = play_arr[0][0]
-                    temp_yl_1 = play_arr[0][1]
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_df["rushing_yards"] = yardline_100 - temp_yl_1
-                    temp_df["yards_gained"] = yardline_100 - temp_yl_1
-                    del temp_yl_1
-                # Field Goals
-                elif (
-                    "field goal attempt is returned" in play_desc.lower() and
-                    "end zone" in play_desc.lower() and
-                    "touchdown" in play_desc.lower()
-                ):
-                    temp_df["is_field_goal_attempt"] = True
-                    temp_df["is_return_touchdown"] = True
-                    temp_df["return_team"] = defteam
+    temp_dict["is_punt_attempt"] = True
+    temp_dict["is_out_of_bounds"] = True
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+)( [0-9]+)? yard[s]? field goal attempt is ([a-zA-Z\s]+)\, [Center|center]+\-([a-zA-Z\'\.\-\,\; ]+), [Holder|holder]+\-([a-zA-Z\'\.\-\,\; ]+)\. Returned by ([a-zA-Z\'\.\-\,\; ]+) at ([A-Z]+) [END|end]+ [ZONE|zone]+\. [TOUCHDOWN|touchdown]+",
-                        play_desc
-                    )
+    play_match = PBP_REGEX[
+        "punts_returned_punt_from_pushed_out_bounds"
+    ].search(play_desc)
+    temp_dict["punter_player_name"] = play_match[
+        "punter_player_name"
+    ]
+    temp_yl_3 = play_match["yardline_3"]
+    temp_yl_3 = get_yardline(temp_yl_3, posteam)
+    temp_dict["kick_distance"] = yardline_100 - temp_yl_3
+    temp_dict["long_snapper_player_name"] = play_match[
+        "long_snapper_player_name"
+    ]
+    temp_dict["kickoff_returner_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+    # tacklers_arr = play_arr[0][6]
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_2 = play_match["yardline_2"]
 
-                    temp_df["kicker_player_name"] = play_arr[0][0]
-                    if len(play_arr[0][1]) == 0:
-                        temp_df["kick_distance"] = yardline_100 + 10 + 7
-                    else:
-                        temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_df["field_goal_result"] = "miss"
-                    temp_df["long_snapper_player_name"] = play_arr[0][3]
-                    temp_df["holder_player_name"] = play_arr[0][4]
-                    temp_df["punt_returner_player_name"] = play_arr[0][5]
-                    temp_df["return_yards"] = 100
-                elif (
-                    "four-point field goal attempt is" in play_desc.lower() and
-                    "penalty on" not in play_desc.lower() and
-                    "no play" not in play_desc.lower()
-                ):
-                    temp_df["is_4pt_field_goal_attempt"] = True
-                    temp_df["is_field_goal_attempt"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) ([0-9]+) yard[s]? four-point field goal attempt is ([a-zA-Z\s]+)\, [Center|center]+\-([a-zA-Z\'\.\-\,\; ]+), [Holder|holder]+\-([a-zA-Z\'\.\-\,\; ]+)\.",
-                        play_desc
-                    )
-                    temp_df["kicker_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_df["field_goal_result"] = play_arr[0][2]
-                    temp_df["long_snapper_player_name"] = play_arr[0][3]
-                    temp_df["holder_player_name"] = play_arr[0][4]
-                elif (
-                    "field goal attempt is" in play_desc.lower() and
-                    "penalty on" not in play_desc.lower() and
-                    "no play" not in play_desc.lower()
-                ):
-                    temp_df["is_field_goal_attempt"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) ([0-9]+) yard[s]? field goal attempt is ([a-zA-Z\s]+)\, [Center|center]+\-([a-zA-Z\'\.\-\,\; ]+), [Holder|holder]+\-([a-zA-Z\'\.\-\,\; ]+)\.",
-                        play_desc
-                    )
-                    temp_df["kicker_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_df["field_goal_result"] = play_arr[0][2]
-                    temp_df["long_snapper_player_name"] = play_arr[0][3]
-                    temp_df["holder_player_name"] = play_arr[0][4]
-                elif (
-                    "field goal attempt is" in play_desc.lower() and
-                    "penalty on" in play_desc.lower() and
-                    "no play" in play_desc.lower()
-                ):
-                    temp_df["is_field_goal_attempt"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) yard[s]? field goal attempt is ([a-zA-Z\s]+)\, [Center|center]+\-([a-zA-Z\'\.\-\,\; ]+), [Holder|holder]+\-([a-zA-Z\'\.\-\,\; ]+)\.",
-                        play_desc
-                    )
-                    if len(play_arr) == 0:
-                        play_arr = re.findall(
-                            r"([a-zA-Z\'\.\-\,\; ]+) ([0-9]+) yard[s]? field goal attempt is ([a-zA-Z\s]+)\, [Center|center]+\-([a-zA-Z\'\.\-\,\; ]+), [Holder|holder]+\-([a-zA-Z\'\.\-\,\; ]+)\.",
-                            play_desc
-                        )
-                        temp_df["kicker_player_name"] = play_arr[0][0]
-                        temp_df["kick_distance"] = int(play_arr[0][1])
-                        temp_df["field_goal_result"] = play_arr[0][2]
-                        temp_df["long_snapper_player_name"] = play_arr[0][3]
-                        temp_df["holder_player_name"] = play_arr[0][4]
-                    else:
-                        temp_df["kicker_player_name"] = play_arr[0][0]
-                        # temp_df["kick_distance"] = int(play_arr[0][1])
-                        temp_df["field_goal_result"] = play_arr[0][1]
-                        temp_df["long_snapper_player_name"] = play_arr[0][2]
-                        temp_df["holder_player_name"] = play_arr[0][3]
-                # Kickoff
-                elif (
-                    "kicks yards" in play_desc.lower() and
-                    "muffs catch" in play_desc.lower() and
-                    "fumble recovered by" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    temp_df["is_kickoff_attempt"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumble_not_forced"] = True
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_yl_2 = get_yardline(temp_yl_2, posteam)
+    temp_dict["return_yards"] = temp_yl_1 - temp_yl_2
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) kicks yard[s]? from ([A-Za-z0-9\s]+) to the ([A-Za-z0-9\s]+)\. ([a-zA-Z\'\.\-\,\; ]+) [MUFFS|muffs]+ catch\. Fumble [RECOVERED|recovered]+ by ([A-Za-z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
+    if temp_yl_2 > 80:
+        temp_dict["is_punt_inside_twenty"] = True
+    del temp_yl_1, temp_yl_2
 
-                    temp_df["kicker_player_name"] = play_arr[0][0]
-                    # temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_df["kickoff_returner_player_name"] = play_arr[0][3]
+    return tacklers_arr, sack_players_arr
 
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][3]
 
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][4]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][5]
+def parse_punt_ran_out_bounds_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
 
-                    temp_yl_1 = play_arr[0][6]
-                    temp_yl_2 = play_arr[0][8]
+    Parses `"punt_ran_out_bounds"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
 
-                    tacklers_arr = play_arr[0][7]
+    temp_dict["is_punt_attempt"] = True
+    temp_dict["is_out_of_bounds"] = True
 
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                    # test = temp_yl_1 - temp_yl_2
-                    temp_df["fumble_recovery_1_yards"] = temp_yl_1 - temp_yl_2
-                    temp_df["return_yards"] = 0
+    play_match = PBP_REGEX[
+        "punt_returned_from_ran_out_bounds"
+    ].search(play_desc)
+    temp_dict["punter_player_name"] = play_match[
+        "punter_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_dict["long_snapper_player_name"] = play_match[
+        "long_snapper_player_name"
+    ]
+    temp_dict["kickoff_returner_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+    # tacklers_arr = play_arr[0][6]
+    temp_yl_1 = play_match["yardline_1"]
+    # temp_yl_2 = play_arr[0][7]
 
-                    if temp_yl_2 > 80:
-                        temp_df["is_kickoff_inside_twenty"] = True
-                    del temp_yl_1, temp_yl_2
-                elif (
-                    "kicks" in play_desc.lower() and
-                    "fumbles" in play_desc.lower() and
-                    "forced by" in play_desc.lower() and
-                    "out of bounds." in play_desc.lower()
-                ):
-                    temp_df["is_kickoff_attempt"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumble_forced"] = True
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    # temp_yl_2 = get_yardline(temp_yl_2, posteam)
+    temp_dict["return_yards"] = 0
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) kicks ([\-0-9]+) yard[s]? from ([A-Za-z0-9\s]+) to the ([A-Za-z0-9\s]+)\. ([a-zA-Z\'\.\-\,\; ]+) returns the kickoff\. ([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by ([a-zA-Z\'\.\-\,\; ]+)\. Out of bounds\.",
-                        play_desc
-                    )
+    if temp_yl_1 > 80:
+        temp_dict["is_punt_inside_twenty"] = True
+    del temp_yl_1
 
-                    temp_df["kicker_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_df["kickoff_returner_player_name"] = play_arr[0][4]
+    return tacklers_arr, sack_players_arr
 
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][4]
 
-                    temp_df["forced_fumble_player_1_team"] = defteam
-                    temp_df["forced_fumble_player_1_player_name"] = play_arr[0][6]
+def parse_punt_pushed_out_bounds_2_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
 
-                    temp_yl_1 = play_arr[0][3]
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    Parses `"punt_pushed_out_bounds_2"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
 
-                    if temp_yl_1 > 80:
-                        temp_df["is_kickoff_inside_twenty"] = True
-                    del temp_yl_1
-                elif (
-                    "kicks" in play_desc.lower() and
-                    "fumbles" in play_desc.lower() and
-                    "forced by" in play_desc.lower() and
-                    "fumble recovered by" in play_desc.lower() and
-                    "pushed out of bounds" in play_desc.lower()
-                ):
-                    temp_df["is_kickoff_attempt"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumble_forced"] = True
+    temp_dict["is_punt_attempt"] = True
+    temp_dict["is_out_of_bounds"] = True
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) kicks ([\-0-9]+) yard[s]? from ([A-Za-z0-9\s]+) to the ([A-Za-z0-9\s]+)\. ([a-zA-Z\'\.\-\,\; ]+) returns the kickoff\. ([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by ([a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by ([A-Za-z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Pushed out of bounds by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
+    play_match = PBP_REGEX[
+        "punt_returned_from_pushed_out_bounds"
+    ].search(play_desc)
+    temp_dict["punter_player_name"] = play_match[
+        "punter_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_dict["long_snapper_player_name"] = play_match[
+        "long_snapper_player_name"
+    ]
+    temp_dict["kickoff_returner_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+    tacklers_arr = play_match["tacklers"]
+    temp_yl_1 = play_match["yardline_1"]
+    temp_yl_2 = play_match["yardline_2"]
 
-                    temp_df["kicker_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_df["kickoff_returner_player_name"] = play_arr[0][4]
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_yl_2 = get_yardline(temp_yl_2, posteam)
+    temp_dict["return_yards"] = temp_yl_1 - temp_yl_2
 
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][4]
+    if temp_yl_2 > 80:
+        temp_dict["is_punt_inside_twenty"] = True
+    del temp_yl_1, temp_yl_2
 
-                    temp_df["forced_fumble_player_1_team"] = defteam
-                    temp_df["forced_fumble_player_1_player_name"] = play_arr[0][6]
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][7]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][8]
+    return tacklers_arr, sack_players_arr
 
-                    temp_yl_1 = play_arr[0][9]
-                    temp_yl_2 = play_arr[0][11]
 
-                    # tacklers_arr = play_arr[0][8]
+def parse_punt_touchdown_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
 
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                    # test = temp_yl_1 - temp_yl_2
-                    temp_df["fumble_recovery_1_yards"] = temp_yl_1 -  temp_yl_2
-                    temp_df["return_yards"] = 0
+    Parses `"punt_touchdown"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
+
+    temp_dict["is_punt_attempt"] = True
+    temp_dict["is_touchdown"] = True
+    temp_dict["is_return_touchdown"] = True
+    temp_dict["is_out_of_bounds"] = True
+
+    play_match = PBP_REGEX[
+        "punt_returned_from_touchdown"
+    ].search(play_desc)
+    temp_dict["punter_player_name"] = play_match[
+        "punter_player_name"
+    ]
+    temp_dict["kick_distance"] = int(play_match[
+        "kick_distance"
+    ])
+    temp_dict["long_snapper_player_name"] = play_match[
+        "long_snapper_player_name"
+    ]
+    temp_dict["kickoff_returner_player_name"] = play_match[
+        "kickoff_returner_player_name"
+    ]
+    # tacklers_arr = play_arr[0][6]
+    temp_yl_1 = play_match["yardline_1"]
 
-                    if temp_yl_1 > 80:
-                        temp_df["is_kickoff_inside_twenty"] = True
-                    del temp_yl_1
-                elif (
-                    "kicks" in play_desc.lower() and
-                    "returns the kickoff" in play_desc.lower() and
-                    "pushed out of bounds by" in play_desc.lower()
-                ):
-                    temp_df["is_kickoff_attempt"] = True
-                    temp_df["is_out_of_bounds"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) kicks ([\-0-9]+) yard[s]? from " +
-                        r"([A-Za-z0-9\s]+) to the ([A-Za-z0-9\s]+)\. " +
-                        r"([a-zA-Z\'\.\-\,\; ]+) returns the kickoff\. " +
-                        r"Pushed out of bounds by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["kicker_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_yl_1 = play_arr[0][3]
-                    temp_df["kickoff_returner_player_name"] = play_arr[0][4]
-                    tacklers_arr = play_arr[0][5]
-                    temp_yl_2 = play_arr[0][6]
-
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                    temp_df["return_yards"] = temp_yl_1 - temp_yl_2
-
-                    if temp_yl_2 > 80:
-                        temp_df["is_kickoff_inside_twenty"] = True
-                    del temp_yl_1, temp_yl_2
-                elif (
-                    "kicks" in play_desc.lower() and
-                    "muffs catch" in play_desc.lower() and
-                    "fumble recovered by" in play_desc.lower() and
-                    "ran out of bounds" in play_desc.lower()
-                ):
-                    temp_df["is_kickoff_attempt"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumble_not_forced"] = True
+    temp_yl_1 = get_yardline(temp_yl_1, posteam)
+    temp_dict["return_yards"] = 100 - temp_yl_1
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) kicks ([\-0-9]+) yard[s]? from ([A-Za-z0-9\s]+) to the ([A-Za-z0-9\s]+)\. ([a-zA-Z\'\.\-\,\; ]+) [MUFFS|muffs]+ catch\. Fumble [RECOVERED|recovered]+ by ([A-Za-z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. ([a-zA-Z\.\-\,\'\;\s]+) ran out of bounds\.",
-                        play_desc
-                    )
+    del temp_yl_1
 
-                    temp_df["kicker_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_df["kickoff_returner_player_name"] = play_arr[0][4]
+    return tacklers_arr, sack_players_arr
 
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][4]
 
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][5]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][6]
+def parse_tackled_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
 
-                    temp_yl_1 = play_arr[0][7]
-                    # temp_yl_2 = play_arr[0][9]
+    Parses `"tackled"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
 
-                    # tacklers_arr = play_arr[0][8]
+    # to handle weird situations where this is the only part of the play that still exists.
+    play_match = PBP_REGEX["tackled"].search(play_desc)
+    tacklers_arr = play_match["tacklers"]
 
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    # temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                    temp_df["fumble_recovery_1_yards"] = 0
-                    temp_df["return_yards"] = 0
+    return tacklers_arr, sack_players_arr
 
-                    if temp_yl_1 > 80:
-                        temp_df["is_kickoff_inside_twenty"] = True
-                    del temp_yl_1
-                elif (
-                    "kicks" in play_desc.lower() and
-                    "muffs catch" in play_desc.lower() and
-                    "fumble recovered by" in play_desc.lower() and
-                    "pushed out of bounds by" in play_desc.lower()
-                ):
-                    temp_df["is_kickoff_attempt"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumble_not_forced"] = True
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) kicks ([\-0-9]+) yard[s]? from ([A-Za-z0-9\s]+) to the ([A-Za-z0-9\s]+)\. ([a-zA-Z\'\.\-\,\; ]+) [MUFFS|muffs]+ catch\. Fumble [RECOVERED|recovered]+ by ([A-Za-z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Pushed out of bounds by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
+def parse_penalty_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
 
-                    temp_df["kicker_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_df["kickoff_returner_player_name"] = play_arr[0][4]
+    Parses `"penalty"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
 
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][4]
+    # We'll handle penalty data later.
 
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][5]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][6]
+    return tacklers_arr, sack_players_arr
 
-                    temp_yl_1 = play_arr[0][7]
-                    temp_yl_2 = play_arr[0][9]
 
-                    tacklers_arr = play_arr[0][8]
+def parse_extra_point_play(
+    temp_dict: dict,
+    play_desc: str,
+    posteam: str,
+    defteam: str,
+    yardline_100: int
+) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
 
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                    # test = temp_yl_1 - temp_yl_2
-                    temp_df["fumble_recovery_1_yards"] = temp_yl_1 - temp_yl_2
-                    temp_df["return_yards"] = 0
+    Parses `"extra_point"` plays.
+    """
+    tacklers_arr = []
+    sack_players_arr = []
 
-                    if temp_yl_2 > 80:
-                        temp_df["is_kickoff_inside_twenty"] = True
-                    del temp_yl_1, temp_yl_2
-                elif (
-                    "kicks" in play_desc.lower() and
-                    "muffs catch" in play_desc.lower() and
-                    "out of bounds" in play_desc.lower()
-                ):
-                    temp_df["is_kickoff_attempt"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumble_not_forced"] = True
+    play_match = PBP_REGEX["extra_point"].search(play_desc)
+    # tacklers_arr = play_arr[0][0]
+    temp_dict["extra_point_player_name"] = play_match[
+        "extra_point_player_name"
+    ]
+    temp_dict["extra_point_result"] = play_match[
+        "extra_point_result"
+    ]
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) kicks ([\-0-9]+) yard[s]? from ([A-Za-z0-9\s]+) to the ([A-Za-z0-9\s]+)\. ([a-zA-Z\'\.\-\,\; ]+) [MUFFS|muffs]+ catch\. Out of bounds\.",
-                        play_desc
-                    )
+    return tacklers_arr, sack_players_arr
+
+
+
+# Play classes, in the order they are checked.
+# Each entry is
+# `(play class, keywords, excluded keywords, handler)`,
+# and a play belongs to the first class where every keyword
+# is in the (lowercase) play description,
+# and none of the excluded keywords are.
+PBP_PLAY_CLASSES = (
+    ("end_quarter", ("end quarter",), (), parse_end_quarter_play),
+    ("end_game", ("end game",), (), parse_end_game_play),
+    (
+        "two_minute_warning",
+        ("two minute warning",),
+        (),
+        parse_two_minute_warning_play
+    ),
+    # Handled in `parser()`, since it changes the timeout counts.
+    ("timeout", ("timeout #",), (), None),
+    ("tv_timeout", ("tv timeout",), (), parse_tv_timeout_play),
+    # Conversions
+    (
+        "conversion_pass_catch_tackled",
+        (
+            "-point conversion attempt",
+            "pass",
+            "catch made",
+            "for yards",
+            "tackled by",
+        ),
+        (),
+        parse_conversion_pass_catch_tackled_play
+    ),
+    (
+        "conversion_pass_interception_pushed_out_bounds",
+        (
+            "-point conversion attempt",
+            "pass",
+            "intercept",
+            "pushed out of bounds by",
+        ),
+        (),
+        parse_conversion_pass_interception_pushed_out_bounds_play
+    ),
+    (
+        "conversion_pass_interception_defensive_recovery",
+        (
+            "-point conversion attempt",
+            "pass",
+            "intercept",
+            "defensive conversion recovery succeeds",
+        ),
+        (),
+        parse_conversion_pass_interception_defensive_recovery_play
+    ),
+    (
+        "conversion_pass_catch_pushed_out_bounds",
+        (
+            "-point conversion attempt",
+            "pass",
+            "catch made",
+            "for yards",
+            "pushed out of bounds by",
+        ),
+        (),
+        parse_conversion_pass_catch_pushed_out_bounds_play
+    ),
+    (
+        "conversion_pass_catch",
+        ("-point conversion attempt", "pass", "catch made", "for yards"),
+        (),
+        parse_conversion_pass_catch_play
+    ),
+    (
+        "conversion_pass_interception_tackled_defensive_recovery",
+        (
+            "-point conversion attempt",
+            "pass",
+            "intercepts the ball",
+            "tackled by at",
+            "defensive conversion recovery",
+        ),
+        (),
+        parse_conversion_pass_interception_tackled_defensive_recovery_play
+    ),
+    (
+        "conversion_rush_fumble_defensive_recovery",
+        (
+            "-point conversion attempt",
+            "rushed up the middle",
+            "fumbles",
+            "forced by",
+            "recovers the fumble",
+            "tackled by",
+            "defensive conversion recovery",
+        ),
+        (),
+        parse_conversion_rush_fumble_defensive_recovery_play
+    ),
+    (
+        "conversion_rush_up_middle_tackled",
+        ("-point conversion attempt", "rushed up the middle", "tackled by"),
+        (),
+        parse_conversion_rush_up_middle_tackled_play
+    ),
+    (
+        "conversion_rush_tackled",
+        ("-point conversion attempt", "rushed", "tackled by"),
+        (),
+        parse_conversion_rush_tackled_play
+    ),
+    (
+        "conversion_rush_up_middle",
+        ("-point conversion attempt", "rushed up the middle"),
+        (),
+        parse_conversion_rush_up_middle_play
+    ),
+    (
+        "conversion_rush_pushed_out_bounds",
+        ("-point conversion attempt", "rushed", "pushed out of bounds by "),
+        (),
+        parse_conversion_rush_pushed_out_bounds_play
+    ),
+    (
+        "conversion_rush",
+        ("-point conversion attempt", "rushed"),
+        (),
+        parse_conversion_rush_play
+    ),
+    # Pass Plays
+    (
+        "incomplete_intended",
+        ("incomplete", "intended for"),
+        ("steps back to pass",),
+        parse_incomplete_intended_play
+    ),
+    (
+        "steps_back_pass_incomplete_intended",
+        ("steps back to pass", "incomplete", "intended for."),
+        (),
+        parse_steps_back_pass_incomplete_intended_play
+    ),
+    (
+        "steps_back_pass_incomplete",
+        ("steps back to pass", "incomplete"),
+        (),
+        parse_steps_back_pass_incomplete_play
+    ),
+    (
+        "pass_complete_touchdown",
+        ("pass", "complete", "touchdown", "for yards"),
+        (),
+        parse_pass_complete_touchdown_play
+    ),
+    (
+        "pass_complete_touchdown_2",
+        ("pass", "complete", "touchdown"),
+        (),
+        parse_pass_complete_touchdown_2_play
+    ),
+    (
+        "pass_catch_lateral_tackled_fumble",
+        ("pass", "catch made by", "lateral", "tackled by"),
+        ("forced",),
+        parse_pass_catch_lateral_tackled_fumble_play
+    ),
+    (
+        "pass_complete_fumble_forced_recovered_tackled",
+        (
+            "pass",
+            "complete",
+            "fumble",
+            "forced by",
+            "recovered by",
+            "tackled by at",
+        ),
+        (),
+        parse_pass_complete_fumble_forced_recovered_tackled_play
+    ),
+    (
+        "pass_complete_fumble_forced_recovered_tackled_2",
+        (
+            "pass",
+            "complete",
+            "fumble",
+            "forced by.",
+            "recovered by",
+            "tackled by",
+        ),
+        (),
+        parse_pass_complete_fumble_forced_recovered_tackled_2_play
+    ),
+    (
+        "pass_complete_fumble_forced_recovered",
+        ("pass", "complete", "fumble", "forced by", "recovered by"),
+        ("tackled by",),
+        parse_pass_complete_fumble_forced_recovered_play
+    ),
+    (
+        "pass_complete_fumble_forced_recovered_lateral_tackled",
+        (
+            "pass",
+            "complete",
+            "fumble",
+            "forced by",
+            "recovered by",
+            "lateral to",
+            "tackled by",
+        ),
+        (),
+        parse_pass_complete_fumble_forced_recovered_lateral_tackled_play
+    ),
+    (
+        "pass_complete_fumble_forced_recovered_tackled_3",
+        (
+            "pass",
+            "complete",
+            "for yards",
+            "fumble",
+            "forced by",
+            "recovered by",
+            "tackled by",
+        ),
+        (),
+        parse_pass_complete_fumble_forced_recovered_tackled_3_play
+    ),
+    (
+        "pass_complete_fumble_forced_recovered_tackled_4",
+        (
+            "pass",
+            "complete",
+            "fumble",
+            "forced by",
+            "recovered by",
+            "tackled by",
+        ),
+        (),
+        parse_pass_complete_fumble_forced_recovered_tackled_4_play
+    ),
+    (
+        "pass_complete_ran_out_bounds",
+        ("pass", "complete", "for yards", "ran out of bounds"),
+        (),
+        parse_pass_complete_ran_out_bounds_play
+    ),
+    (
+        "pass_complete_ran_out_bounds_2",
+        ("pass", "complete", "ran out of bounds"),
+        (),
+        parse_pass_complete_ran_out_bounds_2_play
+    ),
+    (
+        "pass_complete_lateral_fumble_out_bounds",
+        ("pass", "complete", "lateral to", "fumbles.", " out of bounds."),
+        (),
+        parse_pass_complete_lateral_fumble_out_bounds_play
+    ),
+    (
+        "pass_complete_tackled",
+        ("pass", "complete", "for yards", "tackled by"),
+        (),
+        parse_pass_complete_tackled_play
+    ),
+    (
+        "pass_complete_tackled_2",
+        ("pass", "complete", "tackled by at"),
+        (),
+        parse_pass_complete_tackled_2_play
+    ),
+    (
+        "pass_complete_lateral_tackled",
+        ("pass", "complete", "lateral to", "tackled by"),
+        (),
+        parse_pass_complete_lateral_tackled_play
+    ),
+    (
+        "pass_complete_tackled_3",
+        ("pass", "complete", "tackled by"),
+        (),
+        parse_pass_complete_tackled_3_play
+    ),
+    (
+        "pass_complete_fumble_forced_out_bounds",
+        ("pass", "complete", "fumbles", "forced by", "out of bounds."),
+        (),
+        parse_pass_complete_fumble_forced_out_bounds_play
+    ),
+    (
+        "pass_complete_fumble_forced_out_bounds_2",
+        ("pass", "complete", "fumbles", "forced by", "out of bounds."),
+        (),
+        parse_pass_complete_fumble_forced_out_bounds_2_play
+    ),
+    (
+        "pass_complete_pushed_out_bounds",
+        ("pass", "complete", "for yards", "pushed out of bounds by"),
+        (),
+        parse_pass_complete_pushed_out_bounds_play
+    ),
+    (
+        "pass_complete_pushed_out_bounds_2",
+        ("pass", "complete", "pushed out of bounds by"),
+        (),
+        parse_pass_complete_pushed_out_bounds_2_play
+    ),
+    (
+        "pass_interception_touchback",
+        ("pass", "intercepted", "touchback."),
+        (),
+        parse_pass_interception_touchback_play
+    ),
+    (
+        "pass_interception_ran_out_bounds",
+        ("pass", "intercepted", "ran out of bounds."),
+        (),
+        parse_pass_interception_ran_out_bounds_play
+    ),
+    (
+        "pass_interception_pushed_out_bounds",
+        ("pass", "intercepted", "pushed out of bounds by"),
+        (),
+        parse_pass_interception_pushed_out_bounds_play
+    ),
+    (
+        "pass_interception_lateral_touchdown",
+        ("pass", "intercepted", "lateral to", "touchdown"),
+        (),
+        parse_pass_interception_lateral_touchdown_play
+    ),
+    (
+        "pass_interception_touchdown",
+        ("pass", "intercepted", "touchdown"),
+        (),
+        parse_pass_interception_touchdown_play
+    ),
+    (
+        "pass_interception_lateral_tackled",
+        ("pass", "intercepted", "lateral to", "tackled by"),
+        (),
+        parse_pass_interception_lateral_tackled_play
+    ),
+    (
+        "pass_interception_lateral_out_bounds",
+        ("pass", "intercepted", "lateral to", "out of bounds"),
+        ("recovered by",),
+        parse_pass_interception_lateral_out_bounds_play
+    ),
+    (
+        "pass_interception_tackled",
+        ("pass", "intercepted", "tackled by at"),
+        (),
+        parse_pass_interception_tackled_play
+    ),
+    (
+        "pass_interception_tackled_2",
+        ("pass", "intercepted", "tackled by"),
+        (),
+        parse_pass_interception_tackled_2_play
+    ),
+    ("spike", ("spikes the ball",), (), parse_spike_play),
+    # Pass (sacks)
+    (
+        "pass_sack",
+        ("pass", "sacked at", "for yards"),
+        (),
+        parse_pass_sack_play
+    ),
+    ("pass_sack_2", ("pass", "sacked at"), (), parse_pass_sack_2_play),
+    # Run plays
+    (
+        "rush_up_middle_fumble_forced_recovered",
+        (
+            "rushed up the middle for",
+            "fumbles",
+            "forced by",
+            "fumble recovered by",
+        ),
+        ("tackled by", "pushed out of bounds by"),
+        parse_rush_up_middle_fumble_forced_recovered_play
+    ),
+    (
+        "rush_up_middle_fumble_forced_recovered_tackled",
+        (
+            "rushed up the middle for",
+            "fumbles",
+            "forced by",
+            "fumble recovered by",
+            "tackled by",
+        ),
+        (),
+        parse_rush_up_middle_fumble_forced_recovered_tackled_play
+    ),
+    (
+        "rush_fumble_forced_recovered_tackled",
+        (
+            "rushed",
+            "fumbles",
+            "forced by",
+            "fumble recovered by",
+            "tackled by",
+        ),
+        (),
+        parse_rush_fumble_forced_recovered_tackled_play
+    ),
+    (
+        "rush_up_middle_tackled",
+        ("rushed up the middle for yards", "tackled by"),
+        (),
+        parse_rush_up_middle_tackled_play
+    ),
+    (
+        "rush_up_middle_tackled_2",
+        ("rushed up the middle for", "tackled by"),
+        (),
+        parse_rush_up_middle_tackled_2_play
+    ),
+    (
+        "rush_tackled",
+        ("rushed", "tackled by at", "for yards"),
+        (),
+        parse_rush_tackled_play
+    ),
+    (
+        "rush_tackled_2",
+        ("rushed", "tackled by", "for yards"),
+        (),
+        parse_rush_tackled_2_play
+    ),
+    (
+        "rush_ran_out_bounds",
+        ("rushed", "ran out of bounds."),
+        (),
+        parse_rush_ran_out_bounds_play
+    ),
+    (
+        "rush_tackled_3",
+        ("rushed", "tackled by at"),
+        (),
+        parse_rush_tackled_3_play
+    ),
+    (
+        "rush_fumble_forced_out_bounds",
+        ("rushed", "fumbles", "forced by", "out of bounds"),
+        ("recovered by",),
+        parse_rush_fumble_forced_out_bounds_play
+    ),
+    (
+        "rush_fumble_recovered_tackled_touchback",
+        (
+            "rushed",
+            "fumbles",
+            "fumble recovered by",
+            "tackled by",
+            "touchback",
+        ),
+        (),
+        parse_rush_fumble_recovered_tackled_touchback_play
+    ),
+    (
+        "rush_fumble_recovered",
+        ("rushed", "fumbles", "fumble recovered by"),
+        ("forced by",),
+        parse_rush_fumble_recovered_play
+    ),
+    (
+        "rush_tackled_4",
+        ("rushed", "tackled by"),
+        (),
+        parse_rush_tackled_4_play
+    ),
+    (
+        "rush_pushed_out_bounds",
+        ("rushed", "for yards", "pushed out of bounds by"),
+        (),
+        parse_rush_pushed_out_bounds_play
+    ),
+    (
+        "rush_up_middle_pushed_out_bounds",
+        ("rushed up the middle", "pushed out of bounds by"),
+        (),
+        parse_rush_up_middle_pushed_out_bounds_play
+    ),
+    (
+        "rush_lateral_pushed_out_bounds",
+        ("rushed", "lateral to ", "pushed out of bounds by"),
+        (),
+        parse_rush_lateral_pushed_out_bounds_play
+    ),
+    (
+        "rush_fumble_forced_recovered_pushed_out_bounds",
+        (
+            "rushed",
+            "fumbles",
+            "forced by",
+            "fumble recovered by",
+            "pushed out of bounds by",
+        ),
+        (),
+        parse_rush_fumble_forced_recovered_pushed_out_bounds_play
+    ),
+    (
+        "rush_pushed_out_bounds_2",
+        ("rushed", "pushed out of bounds by"),
+        (),
+        parse_rush_pushed_out_bounds_2_play
+    ),
+    (
+        "rush_up_middle_touchdown",
+        ("rushed", "up the middle for yards", "touchdown"),
+        (),
+        parse_rush_up_middle_touchdown_play
+    ),
+    (
+        "rush_up_middle_touchdown_2",
+        ("rushed", "up the middle", "touchdown"),
+        (),
+        parse_rush_up_middle_touchdown_2_play
+    ),
+    (
+        "rush_touchdown",
+        ("rushed", "touchdown", "for yards"),
+        (),
+        parse_rush_touchdown_play
+    ),
+    (
+        "rush_fumble_forced_recovered",
+        ("rushed", "fumbles", "forced by", "fumble recovered by"),
+        ("(",),
+        parse_rush_fumble_forced_recovered_play
+    ),
+    (
+        "rush_fumble_forced_recovered_touchdown",
+        ("rushed", "fumbles", "forced by", "fumble recovered by", "touchdown"),
+        (),
+        parse_rush_fumble_forced_recovered_touchdown_play
+    ),
+    (
+        "rush_fumble_forced_out_bounds_2",
+        ("rushed", "fumbles", "forced by", "out of bounds"),
+        ("recovered by",),
+        parse_rush_fumble_forced_out_bounds_2_play
+    ),
+    (
+        "rush_touchdown_2",
+        ("rushed", "touchdown"),
+        (),
+        parse_rush_touchdown_2_play
+    ),
+    # Runs (scrambles)
+    (
+        "scramble_up_middle_tackled",
+        ("scrambles", "up the middle for yards", "tackled by"),
+        (),
+        parse_scramble_up_middle_tackled_play
+    ),
+    (
+        "scramble_forced_fumble_recovered_tackled",
+        (
+            "scrambles",
+            "for yards.",
+            "forced by",
+            "fumble recovered by",
+            "tackled by",
+        ),
+        (),
+        parse_scramble_forced_fumble_recovered_tackled_play
+    ),
+    (
+        "scramble_tackled",
+        ("scrambles", "for yards", "tackled by"),
+        (),
+        parse_scramble_tackled_play
+    ),
+    (
+        "scramble_up_middle_forced_fumble_recovered_tackled",
+        (
+            "scrambles",
+            "up the middle",
+            "forced by",
+            "fumble recovered by",
+            "tackled by",
+        ),
+        (),
+        parse_scramble_up_middle_forced_fumble_recovered_tackled_play
+    ),
+    (
+        "scramble_up_middle_tackled_2",
+        ("scrambles", "up the middle", "tackled by"),
+        (),
+        parse_scramble_up_middle_tackled_2_play
+    ),
+    (
+        "scramble_pushed_out_bounds",
+        ("scrambles", "for yards", "pushed out of bounds by"),
+        (),
+        parse_scramble_pushed_out_bounds_play
+    ),
+    (
+        "scramble_up_middle_pushed_out_bounds",
+        ("scrambles up the middle", "pushed out of bounds by"),
+        (),
+        parse_scramble_up_middle_pushed_out_bounds_play
+    ),
+    (
+        "scramble_up_middle_touchdown",
+        ("scrambles", "up the middle for", "touchdown"),
+        (),
+        parse_scramble_up_middle_touchdown_play
+    ),
+    (
+        "scramble_touchdown",
+        ("scrambles", "touchdown"),
+        (),
+        parse_scramble_touchdown_play
+    ),
+    (
+        "scramble_pushed_out_bounds_2",
+        ("scrambles", "pushed out of bounds by"),
+        (),
+        parse_scramble_pushed_out_bounds_2_play
+    ),
+    (
+        "scramble_tackled_fumble_forced_recovered",
+        ("scrambles", "tackled by at", "fumbles", "forced by", "recovered by"),
+        (),
+        parse_scramble_tackled_fumble_forced_recovered_play
+    ),
+    (
+        "scramble_tackled_2",
+        ("scrambles", "tackled by at"),
+        (),
+        parse_scramble_tackled_2_play
+    ),
+    (
+        "scramble_tackled_fumble_forced_recovered_2",
+        (
+            "scrambles",
+            "tackled by",
+            "fumbles",
+            "forced by",
+            "fumble recovered by",
+        ),
+        (),
+        parse_scramble_tackled_fumble_forced_recovered_2_play
+    ),
+    (
+        "scramble_up_middle_ran_out_bounds",
+        ("scrambles up the middle", "ran out of bounds"),
+        (),
+        parse_scramble_up_middle_ran_out_bounds_play
+    ),
+    (
+        "scramble_ran_out_bounds",
+        ("scrambles", "ran out of bounds"),
+        (),
+        parse_scramble_ran_out_bounds_play
+    ),
+    # Runs (kneeldowns)
+    ("kneel", ("kneels at the",), (), parse_kneel_play),
+    # Field Goals
+    (
+        "field_goal_end_zone_touchdown",
+        ("field goal attempt is returned", "end zone", "touchdown"),
+        (),
+        parse_field_goal_end_zone_touchdown_play
+    ),
+    (
+        "four_point_field_goal",
+        ("four-point field goal attempt is",),
+        ("penalty on", "no play"),
+        parse_four_point_field_goal_play
+    ),
+    (
+        "field_goal",
+        ("field goal attempt is",),
+        ("penalty on", "no play"),
+        parse_field_goal_play
+    ),
+    (
+        "field_goal_penalty_on_play",
+        ("field goal attempt is", "penalty on", "no play"),
+        (),
+        parse_field_goal_penalty_on_play_play
+    ),
+    # Kickoff
+    (
+        "kickoff_muff_catch_fumble_recovered_tackled",
+        ("kicks yards", "muffs catch", "fumble recovered by", "tackled by"),
+        (),
+        parse_kickoff_muff_catch_fumble_recovered_tackled_play
+    ),
+    (
+        "kickoff_fumble_forced_out_bounds",
+        ("kicks", "fumbles", "forced by", "out of bounds."),
+        (),
+        parse_kickoff_fumble_forced_out_bounds_play
+    ),
+    (
+        "kickoff_fumble_forced_recovered_pushed_out_bounds",
+        (
+            "kicks",
+            "fumbles",
+            "forced by",
+            "fumble recovered by",
+            "pushed out of bounds",
+        ),
+        (),
+        parse_kickoff_fumble_forced_recovered_pushed_out_bounds_play
+    ),
+    (
+        "kickoff_pushed_out_bounds",
+        ("kicks", "returns the kickoff", "pushed out of bounds by"),
+        (),
+        parse_kickoff_pushed_out_bounds_play
+    ),
+    (
+        "kickoff_muff_catch_fumble_recovered_ran_out_bounds",
+        ("kicks", "muffs catch", "fumble recovered by", "ran out of bounds"),
+        (),
+        parse_kickoff_muff_catch_fumble_recovered_ran_out_bounds_play
+    ),
+    (
+        "kickoff_muff_catch_fumble_recovered_pushed_out_bounds",
+        (
+            "kicks",
+            "muffs catch",
+            "fumble recovered by",
+            "pushed out of bounds by",
+        ),
+        (),
+        parse_kickoff_muff_catch_fumble_recovered_pushed_out_bounds_play
+    ),
+    (
+        "kickoff_muff_catch_out_bounds",
+        ("kicks", "muffs catch", "out of bounds"),
+        (),
+        parse_kickoff_muff_catch_out_bounds_play
+    ),
+    (
+        "kickoff_muff_catch_fumble_recovered_tackled_2",
+        ("kicks", "muffs catch", "fumble recovered by", "tackled by"),
+        (),
+        parse_kickoff_muff_catch_fumble_recovered_tackled_2_play
+    ),
+    (
+        "kickoff_fumble_forced_recovered_tackled",
+        (
+            "kicks",
+            "returns the kickoff",
+            "fumbles",
+            "forced by",
+            "fumble recovered by",
+            "tackled by",
+        ),
+        (),
+        parse_kickoff_fumble_forced_recovered_tackled_play
+    ),
+    (
+        "kickoff_fumble_forced_recovered",
+        (
+            "kicks",
+            "returns the kickoff",
+            "fumbles",
+            "forced by",
+            "fumble recovered by",
+        ),
+        (),
+        parse_kickoff_fumble_forced_recovered_play
+    ),
+    (
+        "kickoff_fumble_recovered",
+        ("kicks", "returns the kickoff", "fumbles", "fumble recovered by"),
+        ("tackled by",),
+        parse_kickoff_fumble_recovered_play
+    ),
+    (
+        "kickoff_lateral_tackled",
+        ("kicks", "returns the kickoff", "lateral to", "tackled by"),
+        (),
+        parse_kickoff_lateral_tackled_play
+    ),
+    (
+        "kickoff_tackled",
+        ("kicks", "returns the kickoff", "tackled by"),
+        (),
+        parse_kickoff_tackled_play
+    ),
+    (
+        "kickoff_ran_out_bounds",
+        ("kicks", "returns the kickoff", "ran out of bounds"),
+        (),
+        parse_kickoff_ran_out_bounds_play
+    ),
+    (
+        "kickoff_touchdown",
+        ("kicks", "returns the kickoff", "touchdown"),
+        (),
+        parse_kickoff_touchdown_play
+    ),
+    (
+        "kickoff_touchback",
+        ("kicks", "touchback"),
+        (),
+        parse_kickoff_touchback_play
+    ),
+    (
+        "kickoff_fair_catch",
+        ("kicks", "fair catch"),
+        (),
+        parse_kickoff_fair_catch_play
+    ),
+    # Punts
+    (
+        "punt_fumble_forced_recovered_tackled",
+        (
+            "punt",
+            "returned punt from",
+            "fumbles, forced by",
+            "fumble recovered by",
+            "tackled by at",
+        ),
+        (),
+        parse_punt_fumble_forced_recovered_tackled_play
+    ),
+    (
+        "punt_fumble_forced_recovered_tackled_2",
+        (
+            "punts yards",
+            "returned punt from",
+            "fumbles, forced by",
+            "fumble recovered by",
+            "tackled by",
+        ),
+        (),
+        parse_punt_fumble_forced_recovered_tackled_2_play
+    ),
+    (
+        "punt_fumble_forced_recovered",
+        (
+            "punt",
+            "returned punt from",
+            "fumbles, forced by",
+            "fumble recovered by",
+        ),
+        (),
+        parse_punt_fumble_forced_recovered_play
+    ),
+    (
+        "punt_tackled",
+        ("punts yards", "returned punt from", "tackled by"),
+        (),
+        parse_punt_tackled_play
+    ),
+    (
+        "punt_tackled_2",
+        ("punt", "returned punt from", "tackled by"),
+        (),
+        parse_punt_tackled_2_play
+    ),
+    (
+        "punt_muff_catch_fumble_out_bounds",
+        ("punts", "muffs catch", "fumbles, out of bounds"),
+        (),
+        parse_punt_muff_catch_fumble_out_bounds_play
+    ),
+    (
+        "punt_muff_catch_fumble_recovered_tackled",
+        ("punts", "muffs catch", "fumble recovered by", "tackled by at"),
+        (),
+        parse_punt_muff_catch_fumble_recovered_tackled_play
+    ),
+    (
+        "punt_muff_catch_fumble_recovered_tackled_2",
+        ("punts", "muffs catch", "fumble recovered by", "tackled by"),
+        (),
+        parse_punt_muff_catch_fumble_recovered_tackled_2_play
+    ),
+    (
+        "punt_muff_catch_fumble_recovered",
+        ("punts", "muffs catch", "fumble recovered by"),
+        (),
+        parse_punt_muff_catch_fumble_recovered_play
+    ),
+    (
+        "punt_out_bounds",
+        ("punts yards", "out of bounds"),
+        ("returned punt from",),
+        parse_punt_out_bounds_play
+    ),
+    (
+        "punt_out_bounds_2",
+        ("punt", "out of bounds"),
+        ("returned punt from",),
+        parse_punt_out_bounds_2_play
+    ),
+    ("punt_touchback", ("punt", "touchback"), (), parse_punt_touchback_play),
+    (
+        "punt_fair_catch_play",
+        ("punts yards", "fair catch by", "no play"),
+        (),
+        parse_punt_fair_catch_play_play
+    ),
+    (
+        "punt_fair_catch",
+        ("punt", "fair catch by"),
+        (),
+        parse_punt_fair_catch_play
+    ),
+    ("punt_downed", ("punts yards", "downed by"), (), parse_punt_downed_play),
+    ("punt_downed_2", ("punt", "downed by"), (), parse_punt_downed_2_play),
+    (
+        "punt_pushed_out_bounds",
+        ("punts yards", "returned punt from", "pushed out of bounds by"),
+        (),
+        parse_punt_pushed_out_bounds_play
+    ),
+    (
+        "punt_ran_out_bounds",
+        ("punt", "returned punt from", "ran out of bounds"),
+        (),
+        parse_punt_ran_out_bounds_play
+    ),
+    (
+        "punt_pushed_out_bounds_2",
+        ("punt", "returned punt from", "pushed out of bounds by"),
+        (),
+        parse_punt_pushed_out_bounds_2_play
+    ),
+    (
+        "punt_touchdown",
+        ("punt", "returned punt from", "touchdown"),
+        (),
+        parse_punt_touchdown_play
+    ),
+    ("tackled", ("tackled by",), (), parse_tackled_play),
+    # Penalties (before the snap)
+    ("penalty", ("penalty",), (), parse_penalty_play),
+    ("extra_point", ("extra point is",), (), parse_extra_point_play),
+)
+
+# Classes that also need a keyword to appear an exact number of times.
+PBP_PLAY_KEYWORD_COUNTS = {
+    "pass_catch_lateral_tackled_fumble": ("fumbles.", 2),
+    "pass_complete_fumble_forced_out_bounds": ("fumbles, ", 2),
+    "rush_fumble_forced_out_bounds": ("fumbles", 2),
+}
+
+# Play descriptions that are an exact match for a class.
+PBP_EXACT_PLAY_CLASSES = {
+    "timeout": "timeout_no_team",
+}
+
+PBP_PLAY_HANDLERS = {
+    play_class: handler
+    for play_class, _, _, handler in PBP_PLAY_CLASSES
+}
+PBP_PLAY_HANDLERS["timeout_no_team"] = parse_timeout_no_team_play
+
+
+# Every keyword used by `PBP_PLAY_CLASSES`.
+PBP_PLAY_KEYWORDS = sorted(
+    {
+        keyword
+        for _, keywords, excluded_keywords, _ in PBP_PLAY_CLASSES
+        for keyword in keywords + excluded_keywords
+    }
+)
+
+# A keyword can only be in a play description
+# if every keyword inside of it is there as well
+# (ex. "tackled by at" needs "tackled by").
+# Keywords are filed under the longest keyword they contain,
+# so `classify_play()` only looks for a keyword
+# once the keyword it's filed under has been found.
+PBP_PLAY_ROOT_KEYWORDS = []
+PBP_PLAY_CHILD_KEYWORDS = {}
+for keyword in PBP_PLAY_KEYWORDS:
+    parent_keywords = [
+        x for x in PBP_PLAY_KEYWORDS if x != keyword and x in keyword
+    ]
+    if len(parent_keywords) == 0:
+        PBP_PLAY_ROOT_KEYWORDS.append(keyword)
+    else:
+        PBP_PLAY_CHILD_KEYWORDS.setdefault(
+            max(parent_keywords, key=len), []
+        ).append(keyword)
+
+# Maps a keyword to the (position of the) play classes that need it,
+# so `classify_play()` only checks classes that can still match.
+# Each class is filed under its least common keyword.
+PBP_PLAY_CLASS_INDEX = {}
+for i, (_, keywords, _, _) in enumerate(PBP_PLAY_CLASSES):
+    keyword = min(
+        keywords,
+        key=lambda x: sum(x in k for _, k, _, _ in PBP_PLAY_CLASSES)
+    )
+    PBP_PLAY_CLASS_INDEX.setdefault(keyword, []).append(i)
+del i, keywords, keyword, parent_keywords
 
-                    temp_df["kicker_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_df["kickoff_returner_player_name"] = play_arr[0][4]
 
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][4]
+def classify_play(play_desc_lower: str) -> str | None:
+    """
+    Finds the play class of a play description.
 
-                    # temp_df["fumble_recovery_1_team"] = play_arr[0][5]
-                    # temp_df["fumble_recovery_1_player_name"] = play_arr[0][6]
+    Parameters
+    ----------
 
-                    temp_yl_1 = play_arr[0][3]
-                    # temp_yl_2 = play_arr[0][9]
+    `play_desc_lower` (str, mandatory):
+        The play description, in lowercase.
 
-                    # tacklers_arr = play_arr[0][8]
+    Returns
+    ----------
+    The first play class in `PBP_PLAY_CLASSES`
+    (or `PBP_EXACT_PLAY_CLASSES`) that matches this play description,
+    or `None` if nothing matches.
+    """
+    if play_desc_lower in PBP_EXACT_PLAY_CLASSES:
+        return PBP_EXACT_PLAY_CLASSES[play_desc_lower]
 
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    # temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                    temp_df["fumble_recovery_1_yards"] = 0
-                    temp_df["return_yards"] = 0
+    new_keywords = [
+        x for x in PBP_PLAY_ROOT_KEYWORDS if x in play_desc_lower
+    ]
+    found_keywords = set()
+    while len(new_keywords) > 0:
+        found_keywords.update(new_keywords)
+        new_keywords = [
+            x
+            for keyword in new_keywords
+            for x in PBP_PLAY_CHILD_KEYWORDS.get(keyword, ())
+            if x in play_desc_lower
+        ]
+
+    candidates = sorted(
+        i for keyword in found_keywords
+        for i in PBP_PLAY_CLASS_INDEX.get(keyword, ())
+    )
 
-                    if temp_yl_1 > 80:
-                        temp_df["is_kickoff_inside_twenty"] = True
-                    del temp_yl_1
-                elif (
-                    "kicks" in play_desc.lower() and
-                    "muffs catch" in play_desc.lower() and
-                    "fumble recovered by" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    temp_df["is_kickoff_attempt"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumble_not_forced"] = True
+    for i in candidates:
+        play_class, keywords, excluded_keywords, _ = PBP_PLAY_CLASSES[i]
+        if not found_keywords.issuperset(keywords):
+            continue
+        elif not found_keywords.isdisjoint(excluded_keywords):
+            continue
+        elif play_class in PBP_PLAY_KEYWORD_COUNTS:
+            keyword, count = PBP_PLAY_KEYWORD_COUNTS[play_class]
+            if play_desc_lower.count(keyword) != count:
+                continue
+        return play_class
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) kicks ([\-0-9]+) yard[s]? from ([A-Za-z0-9\s]+) to the ([A-Za-z0-9\s]+)\. ([a-zA-Z\'\.\-\,\; ]+) [MUFFS|muffs]+ catch\. Fumble [RECOVERED|recovered]+ by ([A-Za-z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
+    return None
 
-                    temp_df["kicker_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_df["kickoff_returner_player_name"] = play_arr[0][4]
-
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][4]
-
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][5]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][6]
-
-                    temp_yl_1 = play_arr[0][7]
-                    temp_yl_2 = play_arr[0][9]
-
-                    tacklers_arr = play_arr[0][8]
-
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                    # test = temp_yl_1 - temp_yl_2
-                    temp_df["fumble_recovery_1_yards"] = temp_yl_1 - temp_yl_2
-                    temp_df["return_yards"] = 0
-
-                    if temp_yl_2 > 80:
-                        temp_df["is_kickoff_inside_twenty"] = True
-                    del temp_yl_1, temp_yl_2
-                elif (
-                    "kicks" in play_desc.lower() and
-                    "returns the kickoff" in play_desc.lower() and
-                    "fumbles" in play_desc.lower() and
-                    "forced by" in play_desc.lower() and
-                    "fumble recovered by" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    temp_df["is_kickoff_attempt"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumble_forced"] = True
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) kicks ([\-0-9]+) yard[s]? from ([A-Za-z0-9\s]+) to the ([A-Za-z0-9\s]+)\. ([a-zA-Z\'\.\-\,\; ]+) returns the kickoff\. ([a-zA-Z\'\.\-\,\; ]+) FUMBLES, forced by ([a-zA-Z\'\.\-\,\; ]+)\. Fumble RECOVERED by ([A-Za-z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
+def parser(
+    game_json: dict,
+    ufl_game_id: int,
+    season: int,
+    season_type: str,
+    week: int,
+) -> pd.DataFrame:
+    """ """
+    # Static data
+    pbp_df = pd.DataFrame()
+    # Plays are accumulated column-by-column,
+    # and turned into a `DataFrame` once at the end of the game.
+    pbp_columns = {}
+    play_count = 0
 
-                    temp_df["kicker_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_df["kickoff_returner_player_name"] = play_arr[0][4]
+    temp_dict = {}
 
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][5]
+    away_team, home_team = get_event_teams(game_json)
 
-                    temp_df["forced_fumble_player_1_team"] = defteam
-                    temp_df["forced_fumble_player_1_player_name"] = play_arr[0][6]
+    away_team_id = away_team["team_id"]
+    away_team_abv = away_team["team_abv"]
 
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][7]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][8]
+    home_team_id = home_team["team_id"]
+    home_team_abv = home_team["team_abv"]
 
-                    temp_yl_1 = play_arr[0][9]
-                    temp_yl_2 = play_arr[0][11]
+    game_id = f"{season}_{week:02d}_{away_team_abv}_{home_team_abv}"
 
-                    tacklers_arr = play_arr[0][10]
+    # Used by `get_ufl_pbp(incremental=True)`
+    # to tell which games are already final.
+    game_status = game_json["header"].get("statusLine", "")
 
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                    temp_df["fumble_recovery_1_yards"] = temp_yl_2 - temp_yl_1
-                    temp_df["return_yards"] = 0
+    stadium = game_json["header"]["venueName"]
+    game_datetime_str = game_json["header"]["eventTime"]
+    game_datetime = datetime.strptime(game_datetime_str, "%Y-%m-%dT%H:%M:%SZ")
+    # Volatile data
+    play_id = 0
+    drive_id = 0
+    posteam = ""
+    posteam_type = ""
+    defteam = ""
 
-                    if temp_yl_2 > 80:
-                        temp_df["is_kickoff_inside_twenty"] = True
-                    del temp_yl_1, temp_yl_2
-                elif (
-                    "kicks" in play_desc.lower() and
-                    "returns the kickoff" in play_desc.lower() and
-                    "fumbles" in play_desc.lower() and
-                    "forced by" in play_desc.lower() and
-                    "fumble recovered by" in play_desc.lower()
-                ):
-                    temp_df["is_kickoff_attempt"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumble_forced"] = True
+    game_half = ""
+    quarter_num = 0
+    half_num = 0
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) kicks ([\-0-9]+) yard[s]? from ([A-Za-z0-9\s]+) to the ([A-Za-z0-9\s]+)\. ([a-zA-Z\'\.\-\,\; ]+) returns the kickoff\. ([a-zA-Z\'\.\-\,\; ]+) FUMBLES, forced by ([a-zA-Z\'\.\-\,\; ]+)\. Fumble RECOVERED by ([A-Za-z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
+    total_away_score = 0
+    total_home_score = 0
 
-                    temp_df["kicker_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_df["kickoff_returner_player_name"] = play_arr[0][4]
+    away_timeouts_remaining = 3
+    home_timeouts_remaining = 3
 
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][5]
+    quarter_seconds_remaining = 900
+    half_seconds_remaining = 1800
+    game_seconds_remaining = 3600
 
-                    temp_df["forced_fumble_player_1_team"] = defteam
-                    temp_df["forced_fumble_player_1_player_name"] = play_arr[0][6]
+    home_opening_kickoff = 0
 
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][7]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][8]
+    if "pbp" in game_json:
+        pass
+    else:
+        return pbp_df
 
-                    # temp_yl_1 = play_arr[0][9]
-                    temp_yl_2 = play_arr[0][9]
+    for quarter in game_json["pbp"]["sections"]:
+        if quarter["title"] == "1ST QUARTER":
+            quarter_num = 1
+            half_num = 1
+            game_half = "Half1"
+        elif quarter["title"] == "2ND QUARTER":
+            quarter_num = 2
+            half_num = 1
+            game_half = "Half1"
+        elif quarter["title"] == "3RD QUARTER":
+            quarter_num = 3
+            half_num = 2
+            game_half = "Half1"
+            away_timeouts_remaining = 3
+            home_timeouts_remaining = 3
+        elif quarter["title"] == "4TH QUARTER":
+            quarter_num = 4
+            half_num = 2
+            game_half = "Half1"
+        elif quarter["title"] == "OVERTIME":
+            quarter_num = 5
+            half_num = 3
+            game_half = "Overtime"
+        else:
+            q_title = quarter["title"]
+            raise ValueError(f"Unhandled quarter name {q_title}")
 
-                    # tacklers_arr = play_arr[0][10]
+        for drive in quarter["groups"]:
 
-                    # temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                    temp_df["fumble_recovery_1_yards"] = 0
-                    temp_df["return_yards"] = 0
+            # Variables that have to be cleared every drive
+            is_drive_inside20 = 0
+            posteam_score = 0
+            defteam_score = 0
+            score_differential = 0
+            posteam_score_post = 0
+            defteam_score_post = 0
+            score_differential_post = 0
+            posteam_timeouts_remaining = 0
+            defteam_timeouts_remaining = 0
+            drive_first_downs = 0
+            drive_ended_with_score = 0
 
-                    if temp_yl_2 > 80:
-                        temp_df["is_kickoff_inside_twenty"] = True
-                    del temp_yl_2
-                elif (
-                    "kicks" in play_desc.lower() and
-                    "returns the kickoff" in play_desc.lower() and
-                    "fumbles" in play_desc.lower() and
-                    "fumble recovered by" in play_desc.lower() and
-                    "tackled by" not in play_desc.lower()
-                ):
-                    temp_df["is_kickoff_attempt"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumble_forced"] = True
+            drive_id = drive["id"]
+            fixed_drive_result = drive["title"]
+            drive_desc = drive["subtitle"]
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) kicks ([\-0-9]+) yard[s]? from ([A-Za-z0-9\s]+) to the ([A-Za-z0-9\s]+)\. ([a-zA-Z\'\.\-\,\; ]+) returns the kickoff\. ([a-zA-Z\'\.\-\,\; ]+) FUMBLES\. Fumble RECOVERED by ([A-Za-z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
+            if " · " in drive_desc:
+                drive_desc = drive_desc.split(" · ")
+            elif " • " in drive_desc:
+                drive_desc = drive_desc.split(" • ")
+            elif " Â· " in drive_desc:
+                drive_desc = drive_desc.split(" Â· ")
+            # print(drive_desc)
+            drive_play_count = int(drive_desc[0].replace(" plays", ""))
+            # drive_yards = int(drive_desc[1].replace(" yards", ""))
+            drive_time_of_possession = drive_desc[2]
+            drive_min, drive_sec = drive_time_of_possession.split(":")
 
-                    temp_df["kicker_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_df["kickoff_returner_player_name"] = play_arr[0][4]
+            pos_team_temp = int(drive["entityLink"]["layout"]["tokens"]["id"])
+            if pos_team_temp == away_team_id:
+                posteam = away_team_abv
+                defteam = home_team_abv
+                posteam_type = "away"
+                posteam_timeouts_remaining = away_timeouts_remaining
+                defteam_timeouts_remaining = home_timeouts_remaining
+            elif pos_team_temp == home_team_id:
+                posteam = home_team_abv
+                defteam = away_team_abv
+                posteam_type = "home"
+                posteam_timeouts_remaining = home_timeouts_remaining
+                defteam_timeouts_remaining = away_timeouts_remaining
+            else:
+                ValueError(f"Unhandled team ID {pos_team_temp}")
 
-                    temp_df["fumbled_1_team"] = posteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][5]
+            if posteam == away_team_abv:
+                posteam_score = total_away_score
+                defteam_score = total_home_score
+            elif posteam == home_team_abv:
+                posteam_score = total_home_score
+                defteam_score = total_away_score
 
-                    # temp_df["forced_fumble_player_1_team"] = defteam
-                    # temp_df["forced_fumble_player_1_player_name"] = play_arr[0][6]
+            for play in drive["plays"]:
+                play_id += 1
+                tacklers_arr = []
+                sack_players_arr = []
+                score_differential = posteam_score_post - defteam_score_post
+                posteam_score = posteam_score_post
+                defteam_score = defteam_score_post
 
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][6]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][7]
+                play_id = int(play["id"])
+                try:
+                    down_and_distance_temp = play["title"]
+                except Exception:
+                    down_and_distance_temp = ""
+                down = 0
+                yds_to_go = 0
+                try:
+                    down, yds_to_go = down_and_distance_temp.lower().split(" and ")
+                    down = int(down)
+                    yds_to_go = int(yds_to_go)
+                except Exception as e:
+                    logging.info("Could not parse down and distance" + f"\nreason: {e}")
+                    down = 0
+                    yds_to_go = 0
 
-                    # temp_yl_1 = play_arr[0][9]
-                    temp_yl_2 = play_arr[0][8]
+                try:
+                    yrdln = play["subtitle"]
+                except Exception:
+                    yrdln = None
 
-                    # tacklers_arr = play_arr[0][10]
+                time = play["timeOfPlay"]
+                time_min, time_sec = time.split(":")
+                time_min = int(time_min)
+                time_sec = int(time_sec)
 
-                    # temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                    temp_df["fumble_recovery_1_yards"] = 0
-                    temp_df["return_yards"] = 0
+                play_desc = play["playDescription"]
 
-                    if temp_yl_2 > 80:
-                        temp_df["is_kickoff_inside_twenty"] = True
-                    del temp_yl_2
-                elif (
-                    "kicks" in play_desc.lower() and
-                    "returns the kickoff" in play_desc.lower() and
-                    "lateral to" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    temp_df["is_kickoff_attempt"] = True
-                    temp_df["is_lateral_return"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) kicks ([\-0-9]+) yard[s]? from ([A-Za-z0-9\s]+) to the ([A-Za-z0-9\s]+)\. ([a-zA-Z\'\.\-\,\; ]+) returns the kickoff\. Lateral to ([a-zA-Z\'\.\-\,\; ]+) to ([A-Za-z0-9\s]+) for ([0-9\-]+) yard[s]?\. Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["kicker_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_yl_1 = play_arr[0][3]
-                    temp_df["kickoff_returner_player_name"] = play_arr[0][4]
-                    tacklers_arr = play_arr[0][8]
-                    temp_yl_2 = play_arr[0][9]
-                    temp_df["lateral_kickoff_returner_player_name"] = play_arr[0][5]
-
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                    temp_df["return_yards"] = temp_yl_1 - temp_yl_2
-
-                    if temp_yl_2 > 80:
-                        temp_df["is_kickoff_inside_twenty"] = True
-                    del temp_yl_1, temp_yl_2
-                elif (
-                    "kicks" in play_desc.lower() and
-                    "returns the kickoff" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    temp_df["is_kickoff_attempt"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) kicks ([\-0-9]+) yard[s]? from " +
-                        r"([A-Za-z0-9\s]+) to the ([A-Za-z0-9\s]+)\. " +
-                        r"([a-zA-Z\'\.\-\,\; ]+) returns the kickoff\. " +
-                        r"Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["kicker_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_yl_1 = play_arr[0][3]
-                    temp_df["kickoff_returner_player_name"] = play_arr[0][4]
-                    tacklers_arr = play_arr[0][5]
-                    temp_yl_2 = play_arr[0][6]
-
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                    temp_df["return_yards"] = temp_yl_1 - temp_yl_2
-
-                    if temp_yl_2 > 80:
-                        temp_df["is_kickoff_inside_twenty"] = True
-                    del temp_yl_1, temp_yl_2
-                elif (
-                    "kicks" in play_desc.lower() and
-                    "returns the kickoff" in play_desc.lower() and
-                    "ran out of bounds" in play_desc.lower()
-                ):
-                    temp_df["is_kickoff_attempt"] = True
-                    # temp_df["is_touchback"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) kicks ([\-0-9]+) yard[s]? from ([A-Za-z0-9\s]+) to the ([A-Za-z0-9\s]+)\. ([a-zA-Z\'\.\-\,\; ]+) returns the kickoff\. ([a-zA-Z\'\.\-\,\; ]+) ran out of bounds\.",
-                        play_desc
-                    )
-                    temp_df["kicker_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_yl_1 = play_arr[0][3]
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-
-                    temp_df["kickoff_returner_player_name"] = play_arr[0][3]
-                    temp_df["return_yards"] = 0
-                    if temp_yl_1 > 80:
-                        temp_df["is_kickoff_inside_twenty"] = True
-                    del temp_yl_1
-                elif (
-                    "kicks" in play_desc.lower() and
-                    "returns the kickoff" in play_desc.lower() and
-                    "touchdown" in play_desc.lower()
-                ):
-                    temp_df["is_kickoff_attempt"] = True
-                    # temp_df["is_touchback"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) kicks ([\-0-9]+) yard[s]? from ([A-Za-z0-9\s]+) to the ([A-Za-z0-9\s]+)\. ([a-zA-Z\'\.\-\,\; ]+) returns the kickoff\. [TOUCHDOWN|touchdown]+\.",
-                        play_desc
-                    )
-                    temp_df["kicker_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_yl_1 = play_arr[0][3]
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-
-                    temp_df["kickoff_returner_player_name"] = play_arr[0][4]
-                    temp_df["return_yards"] = 100 - temp_yl_1
-                    if temp_yl_1 > 80:
-                        temp_df["is_kickoff_inside_twenty"] = True
-                    del temp_yl_1
-                elif (
-                    "kicks" in play_desc.lower() and
-                    "touchback" in play_desc.lower()
-                ):
-                    temp_df["is_kickoff_attempt"] = True
-                    temp_df["is_touchback"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) kicks ([\-0-9]+) yard[s]? from ([A-Za-z0-9\s]+) to the ([A-Za-z0-9\s]+)\. Touchback\.",
-                        play_desc
-                    )
-                    temp_df["kicker_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_yl_1 = play_arr[0][3]
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    if temp_yl_1 > 80:
-                        temp_df["is_kickoff_inside_twenty"] = True
-                    del temp_yl_1
-                elif (
-                    "kicks" in play_desc.lower() and
-                    "fair catch" in play_desc.lower()
-                ):
-                    temp_df["is_kickoff_attempt"] = True
-                    temp_df["is_touchback"] = True
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) kicks ([\-0-9]+) yard[s]? from ([A-Za-z0-9\s]+) to the ([A-Za-z0-9\s]+)\. Fair catch by ([a-zA-Z\'\.\-\,\; ]+)\.",
-                        play_desc
+                # PBP text clean up
+                # play_desc = play_desc.replace("[", "")
+                # play_desc = play_desc.replace("]", "")
+                play_desc = play_desc.replace(
+                    "Face Mask (15 Yards),",
+                    "Face Mask,"
+                )
+                play_desc = play_desc.replace(
+                    " forced by. ",
+                    " forced by TEAM. "
+                )
+                if yrdln is not None:
+                    side_of_field = PBP_REGEX["yardline_digits"].sub(
+                        "", yrdln
                     )
-                    temp_df["kicker_player_name"] = play_arr[0][0]
-                    temp_df["kickoff_returner_player_name"] = play_arr[0][4]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_yl_1 = play_arr[0][3]
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    # if temp_yl_1 > 80:
-                    #     temp_df["is_kickoff_inside_twenty"] = True
-                    del temp_yl_1
-                # Punts
-                elif (
-                    "punt" in play_desc.lower() and
-                    "returned punt from" in play_desc.lower() and
-                    "fumbles, forced by" in play_desc.lower() and
-                    "fumble recovered by" in play_desc.lower() and
-                    "tackled by at" in play_desc.lower()
-                ):
-                    temp_df["is_punt_attempt"] = True
+                    yardline_100 = get_yardline(yrdln, posteam)
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) punts ([\-0-9]+) yard[s]? to ([A-Za-z0-9\s]+), [center|Center]+\-? ?([a-zA-Z\'\.\-\,\; ]+)\. ([a-zA-Z\'\.\-\,\; ]+) returned punt from the ([A-Za-z0-9\s]+)\. ([a-zA-Z\'\.\-\,\; ]+) FUMBLES\, forced by ([a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by ([A-Za-z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Tackled by at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["punter_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_df["long_snapper_player_name"] = play_arr[0][3]
-                    temp_df["kickoff_returner_player_name"] = play_arr[0][4]
-                    temp_df["fumbled_1_team"] = defteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][6]
-                    temp_df["forced_fumble_player_1_team"] = posteam
-                    temp_df["forced_fumble_player_1_player_name"] = play_arr[0][7]
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][8]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][9]
-
-                    temp_yl_1 = play_arr[0][10]
-                    temp_yl_2 = play_arr[0][11]
-
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                    temp_df["fumble_recovery_1_yards"] = temp_yl_1 - temp_yl_2
-                    temp_df["return_yards"] = 0
-
-                    if temp_yl_2 > 80:
-                        temp_df["is_punt_inside_twenty"] = True
-                    del temp_yl_1, temp_yl_2
-                elif (
-                    "punts yards" in play_desc.lower() and
-                    "returned punt from" in play_desc.lower() and
-                    "fumbles, forced by" in play_desc.lower() and
-                    "fumble recovered by" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    temp_df["is_punt_attempt"] = True
+                else:
+                    side_of_field = "50"
+                    yardline_100 = 50
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) punts yard[s]? to ([A-Za-z0-9\s]+), [center|Center]+\-? ?([a-zA-Z\'\.\-\,\; ]+)\. ([a-zA-Z\'\.\-\,\; ]+) returned punt from the ([A-Za-z0-9\s]+)\. ([a-zA-Z\'\.\-\,\; ]+) FUMBLES\, forced by ([a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by ([A-Za-z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Tackled by ([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    if len(play_arr) == 0:
-                        play_arr = re.findall(
-                            r"([a-zA-Z\'\.\-\,\; ]+) punts yard[s]? to ([A-Za-z0-9\s]+), [center|Center]+\-? ?([a-zA-Z\'\.\-\,\; ]+)\. ([a-zA-Z\'\.\-\,\; ]+) returned punt from the ([A-Za-z0-9\s]+)\. ([a-zA-Z\'\.\-\,\; ]+) FUMBLES\, forced by ([a-zA-Z\'\.\-\,\; ]+)\. Tackled by ([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Fumble [RECOVERED|recovered]+ by ([A-Za-z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\.",
-                            play_desc
-                        )
-                        temp_df["punter_player_name"] = play_arr[0][0]
-                        # temp_df["kick_distance"] = int(play_arr[0][1])
-                        temp_df["long_snapper_player_name"] = play_arr[0][2]
-                        temp_df["kickoff_returner_player_name"] = play_arr[0][3]
-                        temp_df["fumbled_1_team"] = defteam
-                        temp_df["fumbled_1_player_name"] = play_arr[0][5]
-                        temp_df["forced_fumble_player_1_team"] = posteam
-                        temp_df["forced_fumble_player_1_player_name"] = play_arr[0][6]
-                        temp_df["fumble_recovery_1_team"] = play_arr[0][9]
-                        temp_df["fumble_recovery_1_player_name"] = play_arr[0][10]
-
-                        temp_yl_1 = play_arr[0][11]
-                        temp_yl_2 = play_arr[0][8]
-
-                        temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                        temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                        temp_df["fumble_recovery_1_yards"] = temp_yl_1 - temp_yl_2
-                        temp_df["return_yards"] = 0
-                        tacklers_arr = play_arr[0][8]
-                    else:
-                        temp_df["punter_player_name"] = play_arr[0][0]
-                        # temp_df["kick_distance"] = int(play_arr[0][1])
-                        temp_df["long_snapper_player_name"] = play_arr[0][2]
-                        temp_df["kickoff_returner_player_name"] = play_arr[0][3]
-                        temp_df["fumbled_1_team"] = defteam
-                        temp_df["fumbled_1_player_name"] = play_arr[0][5]
-                        temp_df["forced_fumble_player_1_team"] = posteam
-                        temp_df["forced_fumble_player_1_player_name"] = play_arr[0][6]
-                        temp_df["fumble_recovery_1_team"] = play_arr[0][7]
-                        temp_df["fumble_recovery_1_player_name"] = play_arr[0][8]
-
-                        temp_yl_1 = play_arr[0][9]
-                        temp_yl_2 = play_arr[0][11]
-
-                        temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                        temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                        temp_df["fumble_recovery_1_yards"] = temp_yl_1 - temp_yl_2
-                        temp_df["return_yards"] = 0
-                        tacklers_arr = play_arr[0][10]
-                    if temp_yl_2 > 80:
-                        temp_df["is_punt_inside_twenty"] = True
-                    del temp_yl_1, temp_yl_2
-                elif (
-                    "punt" in play_desc.lower() and
-                    "returned punt from" in play_desc.lower() and
-                    "fumbles, forced by" in play_desc.lower() and
-                    "fumble recovered by" in play_desc.lower()
-                ):
-                    temp_df["is_punt_attempt"] = True
+                # Quarter number
+                temp_quarter = ""
+                temp_quarter_num = 0
+                temp_half_num = 0
+                temp_game_half = ""
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) punts ([\-0-9]+) yard[s]? to ([A-Za-z0-9\s]+), [center|Center]+\-? ?([a-zA-Z\'\.\-\,\; ]+)\. ([a-zA-Z\'\.\-\,\; ]+) returned punt from the ([A-Za-z0-9\s]+)\. ([a-zA-Z\'\.\-\,\; ]+) FUMBLES\, forced by ([a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by ([A-Za-z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["punter_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_df["long_snapper_player_name"] = play_arr[0][3]
-                    temp_df["kickoff_returner_player_name"] = play_arr[0][4]
-                    temp_df["fumbled_1_team"] = defteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][6]
-                    temp_df["forced_fumble_player_1_team"] = posteam
-                    temp_df["forced_fumble_player_1_player_name"] = play_arr[0][7]
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][8]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][9]
-
-                    # temp_yl_1 = play_arr[0][10]
-                    temp_yl_2 = play_arr[0][10]
-
-                    # temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                    # temp_df["fumble_recovery_1_yards"] = temp_yl_1 - temp_yl_2
-                    temp_df["fumble_recovery_1_yards"] = 0
-                    temp_df["return_yards"] = 0
-
-                    if temp_yl_2 > 80:
-                        temp_df["is_punt_inside_twenty"] = True
-                    del temp_yl_2
-                elif (
-                    "punts yards" in play_desc.lower() and
-                    "returned punt from" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    temp_df["is_punt_attempt"] = True
+                try:
+                    temp_quarter = play["periodOfPlay"]
+                    temp_quarter_num = int(temp_quarter[0])
+                except Exception:
+                    logging.info("No temp quarter found.")
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) punts yard[s]? to ([A-Za-z0-9\s]+), [center|Center]+\-? ?([a-zA-Z\'\.\-\,\; ]+)\. ([a-zA-Z\'\.\-\,\; ]+) returned punt from the ([A-Za-z0-9\s]+)\. Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["punter_player_name"] = play_arr[0][0]
-                    # temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_df["long_snapper_player_name"] = play_arr[0][2]
-                    temp_df["kickoff_returner_player_name"] = play_arr[0][3]
-                    tacklers_arr = play_arr[0][5]
-                    # temp_yl_1 = play_arr[0][5]
-                    # temp_yl_2 = play_arr[0][7]
-
-                    # temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    # temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                    # temp_df["return_yards"] = temp_yl_1 - temp_yl_2
-
-                    # if temp_yl_2 > 80:
-                    #     temp_df["is_punt_inside_twenty"] = True
-                    # del temp_yl_1, temp_yl_2
-                elif (
-                    "punt" in play_desc.lower() and
-                    "returned punt from" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    temp_df["is_punt_attempt"] = True
+                drive_quarter_start = quarter_num
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) punts ([\-0-9]+) yard[s]? to ([A-Za-z0-9\s]+), [center|Center]+\-? ?([a-zA-Z\'\.\-\,\; ]+)\. ([a-zA-Z\'\.\-\,\; ]+) returned punt from the ([A-Za-z0-9\s]+)\. Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
+                if temp_quarter_num != 0:
+                    drive_quarter_start = temp_quarter_num
+                    play_quarter_num = temp_quarter_num
+                else:
+                    play_quarter_num = drive_quarter_start
+
+                del temp_quarter, temp_quarter_num
+                del temp_half_num, temp_game_half
+
+                if half_num == 1:
+                    quarter_seconds_remaining = (time_min * 60) + time_sec
+                    half_seconds_remaining = (
+                        ((2 - play_quarter_num) * 900) +
+                        (time_min * 60) + time_sec
+                    )
+                    game_seconds_remaining = (
+                        ((4 - play_quarter_num) * 900) +
+                        (time_min * 60) + time_sec
                     )
-                    temp_df["punter_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_df["long_snapper_player_name"] = play_arr[0][3]
-                    temp_df["kickoff_returner_player_name"] = play_arr[0][4]
-                    tacklers_arr = play_arr[0][6]
-                    temp_yl_1 = play_arr[0][5]
-                    temp_yl_2 = play_arr[0][7]
-
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                    temp_df["return_yards"] = temp_yl_1 - temp_yl_2
-
-                    if temp_yl_2 > 80:
-                        temp_df["is_punt_inside_twenty"] = True
-                    del temp_yl_1, temp_yl_2
-                elif (
-                    "punts" in play_desc.lower() and
-                    "muffs catch" in play_desc.lower() and
-                    "fumbles, out of bounds" in play_desc.lower()
-                ):
-                    temp_df["is_punt_attempt"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumble_not_forced"] = True
-
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) punts ([0-9]+) yards to ([A-Za-z0-9\s]+), [center|Center]+\-? ?([a-zA-Z\'\.\-\,\; ]+)\. ([a-zA-Z\'\.\-\,\; ]+) [MUFFS|muffs]+ catch\. ([a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, out of bounds",
-                        play_desc
+                elif half_num == 2:
+                    quarter_seconds_remaining = (time_min * 60) + time_sec
+                    half_seconds_remaining = (
+                        ((4 - play_quarter_num) * 900) +
+                        (time_min * 60) + time_sec
                     )
-                    temp_df["punter_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_df["long_snapper_player_name"] = play_arr[0][3]
-                    temp_df["kickoff_returner_player_name"] = play_arr[0][4]
-                    temp_df["fumbled_1_team"] = defteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][4]
-
-                    # temp_df["fumble_recovery_1_team"] = play_arr[0][5]
-                    # temp_df["fumble_recovery_1_player_name"] = play_arr[0][6]
-                    # tacklers_arr = play_arr[0][8]
-                    # temp_yl_1 = play_arr[0][7]
-                    temp_yl_2 = play_arr[0][2]
-
-                    # temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                    # temp_df["fumble_recovery_1_yards"] = temp_yl_1 - temp_yl_2
-                    temp_df["return_yards"] = 0
-
-                    if temp_yl_2 > 80:
-                        temp_df["is_punt_inside_twenty"] = True
-                    del temp_yl_2
-                elif (
-                    "punts" in play_desc.lower() and
-                    "muffs catch" in play_desc.lower() and
-                    "fumble recovered by" in play_desc.lower() and
-                    "tackled by at" in play_desc.lower()
-                ):
-                    temp_df["is_punt_attempt"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumble_not_forced"] = True
-
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) punts ([0-9]+) yards to ([A-Za-z0-9\s]+), [center|Center]+\-? ?([a-zA-Z\'\.\-\,\; ]+)\. ([a-zA-Z\'\.\-\,\; ]+) [MUFFS|muffs]+ catch\. Fumble [RECOVERED|recovered]+ by ([A-Za-z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Tackled by at ([A-Za-z0-9\s]+)\.",
-                        play_desc
+                    game_seconds_remaining = (
+                        ((4 - play_quarter_num) * 900) +
+                        (time_min * 60) + time_sec
                     )
-                    temp_df["punter_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_df["long_snapper_player_name"] = play_arr[0][3]
-                    temp_df["kickoff_returner_player_name"] = play_arr[0][4]
-                    temp_df["fumbled_1_team"] = defteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][4]
-
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][5]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][6]
-                    # tacklers_arr = play_arr[0][8]
-                    temp_yl_1 = play_arr[0][7]
-                    temp_yl_2 = play_arr[0][8]
-
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                    temp_df["fumble_recovery_1_yards"] = temp_yl_1 - temp_yl_2
-                    temp_df["return_yards"] = 0
-
-                    if temp_yl_2 > 80:
-                        temp_df["is_punt_inside_twenty"] = True
-                    del temp_yl_1, temp_yl_2
-                elif (
-                    "punts" in play_desc.lower() and
-                    "muffs catch" in play_desc.lower() and
-                    "fumble recovered by" in play_desc.lower() and
-                    "tackled by" in play_desc.lower()
-                ):
-                    temp_df["is_punt_attempt"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumble_not_forced"] = True
+                elif half_num == 3:
+                    quarter_seconds_remaining = 0
+                    half_seconds_remaining = 0
+                    game_seconds_remaining = 0
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) punts ([0-9]+) yards to ([A-Za-z0-9\s]+), [center|Center]+\-? ?([a-zA-Z\'\.\-\,\; ]+)\. ([a-zA-Z\'\.\-\,\; ]+) [MUFFS|muffs]+ catch\. Fumble [RECOVERED|recovered]+ by ([A-Za-z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\. Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["punter_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_df["long_snapper_player_name"] = play_arr[0][3]
-                    temp_df["kickoff_returner_player_name"] = play_arr[0][4]
-                    temp_df["fumbled_1_team"] = defteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][4]
-
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][5]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][6]
-                    tacklers_arr = play_arr[0][8]
-                    temp_yl_1 = play_arr[0][7]
-                    temp_yl_2 = play_arr[0][9]
-
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                    temp_df["fumble_recovery_1_yards"] = temp_yl_1 - temp_yl_2
-                    temp_df["return_yards"] = 0
-
-                    if temp_yl_2 > 80:
-                        temp_df["is_punt_inside_twenty"] = True
-                    del temp_yl_1, temp_yl_2
-                elif (
-                    "punts" in play_desc.lower() and
-                    "muffs catch" in play_desc.lower() and
-                    "fumble recovered by" in play_desc.lower()
-                ):
-                    temp_df["is_punt_attempt"] = True
-                    temp_df["is_fumble"] = True
-                    temp_df["is_fumble_not_forced"] = True
+                temp_dict = {
+                    "season": game_datetime.year,
+                    "play_id": play_id,
+                    "game_id": game_id,
+                    "ufl_game_id": int(ufl_game_id),
+                    "game_status": game_status,
+                    "home_team": home_team_abv,
+                    "away_team": away_team_abv,
+                    "season_type": season_type,
+                    "week": week,
+                    "posteam": posteam,
+                    "posteam_type": posteam_type,
+                    "defteam": defteam,
+                    "side_of_field": side_of_field,
+                    "yardline_100": yardline_100,
+                    "game_date": game_datetime.strftime("%Y-%m-%d"),
+                    "quarter_seconds_remaining": quarter_seconds_remaining,
+                    "half_seconds_remaining": half_seconds_remaining,
+                    "game_seconds_remaining": game_seconds_remaining,
+                    "game_half": game_half,
+                    "is_quarter_end": False,
+                    "drive": drive_id,
+                    "is_scoring_play": False,
+                    "qtr": quarter_num,
+                    "down": down,
+                    "is_goal_to_go": False,
+                    "time": time,
+                    "yrdln": yrdln,
+                    "ydstogo": yds_to_go,
+                    "ydsnet": 0,
+                    "desc": play_desc,
+                    "play_type": None,
+                    "yards_gained": 0,
+                    "is_shotgun": False,
+                    "is_no_huddle": False,
+                    "is_qb_dropback": False,
+                    "is_qb_kneel": False,
+                    "is_qb_spike": False,
+                    "is_qb_scramble": False,
+                    "pass_length": None,
+                    "pass_location": None,
+                    "air_yards": None,
+                    "yards_after_catch": None,
+                    "run_location": None,
+                    "run_gap": None,
+                    "field_goal_result": None,
+                    "kick_distance": None,
+                    "extra_point_result": None,
+                    "two_point_conv_result": None,
+                    "home_timeouts_remaining": home_timeouts_remaining,
+                    "away_timeouts_remaining": away_timeouts_remaining,
+                    "is_timeout": False,
+                    "timeout_team": None,
+                    "td_team": None,
+                    "td_player_name": None,
+                    "td_player_id": None,
+                    "posteam_timeouts_remaining":
+                        posteam_timeouts_remaining,
+                    "defteam_timeouts_remaining":
+                        defteam_timeouts_remaining,
+                    "total_home_score": total_home_score,
+                    "total_away_score": total_away_score,
+                    "posteam_score": posteam_score,
+                    "defteam_score": defteam_score,
+                    "score_differential": score_differential,
+                    "posteam_score_post": posteam_score_post,
+                    "defteam_score_post": defteam_score_post,
+                    "score_differential_post": defteam_score_post,
+                    "is_4th_and_12_onside_play": False,
+                    "is_punt_blocked": False,
+                    "is_first_down_rush": False,
+                    "is_first_down_pass": False,
+                    "is_first_down_penalty": False,
+                    "is_third_down_converted": False,
+                    "is_third_down_failed": False,
+                    "is_fourth_down_converted": False,
+                    "is_fourth_down_failed": False,
+                    "is_incomplete_pass": False,
+                    "is_touchback": False,
+                    "is_interception": False,
+                    "is_punt_inside_twenty": False,
+                    "is_punt_in_endzone": False,
+                    "is_punt_out_of_bounds": False,
+                    "is_punt_downed": False,
+                    "is_punt_fair_catch": False,
+                    "is_kickoff_inside_twenty": False,
+                    "is_kickoff_in_endzone": False,
+                    "is_kickoff_out_of_bounds": False,
+                    "is_kickoff_downed": False,
+                    "is_kickoff_fair_catch": False,
+                    "is_fumble_forced": False,
+                    "is_fumble_not_forced": False,
+                    "is_fumble_out_of_bounds": False,
+                    "is_solo_tackle": False,
+                    "is_safety": False,
+                    "is_penalty": False,
+                    "is_tackled_for_loss": False,
+                    "is_fumble_lost": False,
+                    "is_own_kickoff_recovery": False,
+                    "is_own_kickoff_recovery_td": False,
+                    "is_qb_hit": False,
+                    "is_rush_attempt": False,
+                    "is_pass_attempt": False,
+                    "is_sack": False,
+                    "is_touchdown": False,
+                    "is_pass_touchdown": False,
+                    "is_rush_touchdown": False,
+                    "is_return_touchdown": False,
+                    "is_extra_point_attempt": False,
+                    "is_one_point_attempt": False,
+                    "is_one_point_attempt_success": False,
+                    "is_two_point_attempt": False,
+                    "is_two_point_attempt_success": False,
+                    "is_three_point_attempt": False,
+                    "is_three_point_attempt_success": False,
+                    "is_field_goal_attempt": False,
+                    "is_kickoff_attempt": False,
+                    "is_punt_attempt": False,
+                    "is_fumble": False,
+                    "is_complete_pass": False,
+                    "is_assist_tackle": False,
+                    "is_lateral_reception": False,
+                    "is_lateral_rush": False,
+                    "is_lateral_return": False,
+                    "is_lateral_recovery": False,
+                    "passer_player_id": None,
+                    "passer_player_name": None,
+                    "passing_yards": None,
+                    "receiver_player_id": None,
+                    "receiver_player_name": None,
+                    "receiving_yards": None,
+                    "rusher_player_id": None,
+                    "rusher_player_name": None,
+                    "rushing_yards": None,
+                    "lateral_receiver_player_id": None,
+                    "lateral_receiver_player_name": None,
+                    "lateral_receiving_yards": None,
+                    "lateral_rusher_player_id": None,
+                    "lateral_rusher_player_name": None,
+                    "lateral_rushing_yards": None,
+                    "lateral_sack_player_id": None,
+                    "lateral_sack_player_name": None,
+                    "interception_player_id": None,
+                    "interception_player_name": None,
+                    "lateral_interception_player_id": None,
+                    "lateral_interception_player_name": None,
+                    "punt_returner_player_id": None,
+                    "punt_returner_player_name": None,
+                    "lateral_punt_returner_player_id": None,
+                    "lateral_punt_returner_player_name": None,
+                    "kickoff_returner_player_name": None,
+                    "kickoff_returner_player_id": None,
+                    "lateral_kickoff_returner_player_id": None,
+                    "lateral_kickoff_returner_player_name": None,
+                    "punter_player_id": None,
+                    "punter_player_name": None,
+                    "kicker_player_name": None,
+                    "kicker_player_id": None,
+                    "own_kickoff_recovery_player_id": None,
+                    "own_kickoff_recovery_player_name": None,
+                    "blocked_player_id": None,
+                    "blocked_player_name": None,
+                    "long_snapper_player_id": None,
+                    "long_snapper_player_name": None,
+                    "holder_player_id": None,
+                    "holder_player_name": None,
+                    "tackle_for_loss_1_player_id": None,
+                    "tackle_for_loss_1_player_name": None,
+                    "tackle_for_loss_2_player_id": None,
+                    "tackle_for_loss_2_player_name": None,
+                    "qb_hit_1_player_id": None,
+                    "qb_hit_1_player_name": None,
+                    "qb_hit_2_player_id": None,
+                    "qb_hit_2_player_name": None,
+                    "forced_fumble_player_1_team": None,
+                    "forced_fumble_player_1_player_id": None,
+                    "forced_fumble_player_1_player_name": None,
+                    "forced_fumble_player_2_team": None,
+                    "forced_fumble_player_2_player_id": None,
+                    "forced_fumble_player_2_player_name": None,
+                    "solo_tackle_1_team": None,
+                    "solo_tackle_2_team": None,
+                    "solo_tackle_1_player_id": None,
+                    "solo_tackle_2_player_id": None,
+                    "solo_tackle_1_player_name": None,
+                    "solo_tackle_2_player_name": None,
+                    "assist_tackle_1_player_id": None,
+                    "assist_tackle_1_player_name": None,
+                    "assist_tackle_1_team": None,
+                    "assist_tackle_2_player_id": None,
+                    "assist_tackle_2_player_name": None,
+                    "assist_tackle_2_team": None,
+                    "assist_tackle_3_player_id": None,
+                    "assist_tackle_3_player_name": None,
+                    "assist_tackle_3_team": None,
+                    "assist_tackle_4_player_id": None,
+                    "assist_tackle_4_player_name": None,
+                    "assist_tackle_4_team": None,
+                    "tackle_with_assist": None,
+                    "tackle_with_assist_1_player_id": None,
+                    "tackle_with_assist_1_player_name": None,
+                    "tackle_with_assist_1_team": None,
+                    "tackle_with_assist_2_player_id": None,
+                    "tackle_with_assist_2_player_name": None,
+                    "tackle_with_assist_2_team": None,
+                    "pass_defense_1_player_id": None,
+                    "pass_defense_1_player_name": None,
+                    "pass_defense_2_player_id": None,
+                    "pass_defense_2_player_name": None,
+                    "fumbled_1_team": None,
+                    "fumbled_1_player_id": None,
+                    "fumbled_1_player_name": None,
+                    "fumbled_2_player_id": None,
+                    "fumbled_2_player_name": None,
+                    "fumbled_2_team": None,
+                    "fumble_recovery_1_team": None,
+                    "fumble_recovery_1_yards": None,
+                    "fumble_recovery_1_player_id": None,
+                    "fumble_recovery_1_player_name": None,
+                    "fumble_recovery_2_team": None,
+                    "fumble_recovery_2_yards": None,
+                    "fumble_recovery_2_player_id": None,
+                    "fumble_recovery_2_player_name": None,
+                    "sack_player_id": None,
+                    "sack_player_name": None,
+                    "half_sack_1_player_id": None,
+                    "half_sack_1_player_name": None,
+                    "half_sack_2_player_id": None,
+                    "half_sack_2_player_name": None,
+                    "return_team": None,
+                    "return_yards": None,
+                    "penalty_team": None,
+                    "penalty_player_id": None,
+                    "penalty_player_name": None,
+                    "penalty_yards": None,
+                    "replay_or_challenge": None,
+                    "replay_or_challenge_result": None,
+                    "penalty_type": None,
+                    "is_defensive_two_point_attempt": False,
+                    "is_defensive_two_point_conv": False,
+                    "is_defensive_extra_point_attempt": False,
+                    "is_defensive_extra_point_conv": False,
+                    "safety_player_name": None,
+                    "safety_player_id": None,
+                    "extra_point_player_id": None,
+                    "extra_point_player_name": None,
+                    "extra_point_result": None,
+                    "series": None,
+                    "series_success": None,
+                    "series_result": None,
+                    "start_time": game_datetime.strftime("%H:%M:%S"),
+                    "time_of_day": None,
+                    "stadium": None,
+                    "weather": None,
+                    "special_teams_play": False,
+                    "st_play_type": None,
+                    "end_yard_line": None,
+                    "game_stadium": None,
+                    "aborted_play": False,
+                    "success": False,
+                    "is_out_of_bounds": False,
+                }
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) punts ([0-9]+) yards to ([A-Za-z0-9\s]+), [center|Center]+\-? ?([a-zA-Z\'\.\-\,\; ]+)\. ([a-zA-Z\'\.\-\,\; ]+) [MUFFS|muffs]+ catch\. Fumble [RECOVERED|recovered]+ by ([A-Za-z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["punter_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_df["long_snapper_player_name"] = play_arr[0][3]
-                    temp_df["kickoff_returner_player_name"] = play_arr[0][4]
-                    temp_df["fumbled_1_team"] = defteam
-                    temp_df["fumbled_1_player_name"] = play_arr[0][4]
-
-                    temp_df["fumble_recovery_1_team"] = play_arr[0][5]
-                    temp_df["fumble_recovery_1_player_name"] = play_arr[0][6]
-                    # tacklers_arr = play_arr[0][8]
-                    # temp_yl_1 = play_arr[0][7]
-                    temp_yl_2 = play_arr[0][7]
-
-                    # temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                    temp_df["fumble_recovery_1_yards"] = 0
-                    temp_df["return_yards"] = 0
-
-                    if temp_yl_2 > 80:
-                        temp_df["is_punt_inside_twenty"] = True
-                    del temp_yl_2
-                elif (
-                    "punts yards" in play_desc.lower() and
-                    "returned punt from" not in play_desc.lower() and
-                    "out of bounds" in play_desc.lower()
-                ):
-                    temp_df["is_punt_attempt"] = True
-                    temp_df["is_punt_out_of_bounds"] = True
+                if yardline_100 == yds_to_go:
+                    # This is auto-set to `0`,
+                    # unless it's an actual goal to go situation.
+                    temp_dict["is_goal_to_go"] = True
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) punts yard[s]? to ([A-Za-z0-9\s]+), [center|Center]+\-? ?([a-zA-Z\'\.\-\,\; ]+)\. Out of bounds\.",
-                        play_desc
-                    )
-                    temp_df["punter_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = 0
-                    temp_df["long_snapper_player_name"] = play_arr[0][2]
-
-                    # temp_yl_1 = play_arr[0][2]
-                    # temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    # if temp_yl_1 > 80:
-                    #     temp_df["is_punt_inside_twenty"] = True
-                elif (
-                    "punt" in play_desc.lower() and
-                    "returned punt from" not in play_desc.lower() and
-                    "out of bounds" in play_desc.lower()
+                # PBP clean up, replay official overturns play
+                if (
+                    "the replay official reviewed" in play_desc.lower() and
+                    "and the play was overturned." in play_desc.lower()
                 ):
-                    temp_df["is_punt_attempt"] = True
-                    temp_df["is_punt_out_of_bounds"] = True
-
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) punts ([\-0-9]+) yard[s]? to ([A-Za-z0-9\s]+), [center|Center]+\-? ?([a-zA-Z\'\.\-\,\; ]+)\. Out of bounds\.",
-                        play_desc
-                    )
-                    temp_df["punter_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_df["long_snapper_player_name"] = play_arr[0][3]
-
-                    temp_yl_1 = play_arr[0][2]
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    if temp_yl_1 > 80:
-                        temp_df["is_punt_inside_twenty"] = True
-                elif (
-                    "punt" in play_desc.lower() and
-                    "touchback" in play_desc.lower()
+                    play_desc = play_desc.split(
+                        "and the play was overturned."
+                    )[-1]
+                if (
+                    "challenged the" in play_desc.lower() and
+                    "and the play was overturned." in play_desc.lower()
                 ):
-                    temp_df["is_punt_attempt"] = True
-                    temp_df["is_touchback"] = True
-                    temp_df["is_punt_in_endzone"] = True
+                    play_desc = play_desc.split(
+                        "and the play was overturned."
+                    )[-1]
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) punts ([\-0-9]+) yard[s]? to ([A-Za-z]+) [End|end]+ [Zone|zone]+, [center|Center]+\-? ?([a-zA-Z\'\.\-\,\; ]+)\. Touchback\.",
-                        play_desc
-                    )
-                    temp_df["punter_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_df["long_snapper_player_name"] = play_arr[0][3]
-                elif (
-                    "punts yards" in play_desc.lower() and
-                    "fair catch by" in play_desc.lower() and
-                    "no play" in play_desc.lower()
-                ):
-                    temp_df["is_punt_attempt"] = True
-                    temp_df["is_punt_downed"] = True
+                # Handler for aborted plays (fumbled snap)
+                if "fumbles (aborted)." in play_desc.lower():
+                    play_match = PBP_REGEX["fumbles_aborted"].search(play_desc)
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) punts yard[s]? to ([A-Za-z0-9\s]+), [center|Center]+\-? ?([a-zA-Z\'\.\-\,\; ]+)\. Fair catch by ([a-zA-Z\'\.\-\,\; ]+)\.",
+                    play_desc = PBP_REGEX["fumbles_aborted"].sub(
+                        "",
                         play_desc
                     )
-                    temp_df["punter_player_name"] = play_arr[0][0]
-                    # temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_df["long_snapper_player_name"] = play_arr[0][2]
-                    temp_df["punt_returner_player_name"] = play_arr[0][3]
-
-                    temp_yl_1 = play_arr[0][1]
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    if temp_yl_1 > 80:
-                        temp_df["is_punt_inside_twenty"] = True
-                elif (
-                    "punt" in play_desc.lower() and
-                    "fair catch by" in play_desc.lower()
-                ):
-                    temp_df["is_punt_attempt"] = True
-                    temp_df["is_punt_downed"] = True
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) punts ([\-0-9]+) yard[s]? to ([A-Za-z0-9\s]+), [center|Center]+\-? ?([a-zA-Z\'\.\-\,\; ]+)\. Fair catch by ([a-zA-Z\'\.\-\,\; ]+)\.",
-                        play_desc
-                    )
-                    temp_df["punter_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_df["long_snapper_player_name"] = play_arr[0][3]
-                    temp_df["punt_returner_player_name"] = play_arr[0][4]
-
-                    temp_yl_1 = play_arr[0][2]
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    if temp_yl_1 > 80:
-                        temp_df["is_punt_inside_twenty"] = True
-                elif (
-                    "punts yards" in play_desc.lower() and
-                    "downed by" in play_desc.lower()
-                ):
-                    temp_df["is_punt_attempt"] = True
-                    temp_df["is_punt_downed"] = True
+                    temp_dict["fumbled_2_team"] = posteam
+                    temp_dict["fumbled_2_player_name"] = play_match[
+                        "fumbled_2_player_name"
+                    ]
+                    temp_dict["fumble_recovery_1_team"] = play_match[
+                        "fumble_recovery_1_team"
+                    ]
+                    temp_dict["fumble_recovery_1_player_name"] = play_match[
+                        "fumble_recovery_1_player_name"
+                    ]
+                    temp_dict["fumble_recovery_1_yards"] = 0
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) punts yard[s]? to ([A-Za-z0-9\s]+), [center|Center]+\-? ?([a-zA-Z\'\.\-\,\; ]+)\. Downed by ([a-zA-Z\'\.\-\,\; ]+)\.",
-                        play_desc
+                # 4th and 12 onside play
+                if "alternative kickoff" in play_desc.lower():
+                    play_desc = play_desc.replace(
+                        "Alternative kickoff", ""
                     )
-                    temp_df["punter_player_name"] = play_arr[0][0]
-                    temp_yl_1 = play_arr[0][1]
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-
-                    temp_df["kick_distance"] = yardline_100 - temp_yl_1
-                    temp_df["long_snapper_player_name"] = play_arr[0][2]
-
-                    if temp_yl_1 > 80:
-                        temp_df["is_punt_inside_twenty"] = True
-                elif (
-                    "punt" in play_desc.lower() and
-                    "downed by" in play_desc.lower()
-                ):
-                    temp_df["is_punt_attempt"] = True
-                    temp_df["is_punt_downed"] = True
-
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) punts ([\-0-9]+) yard[s]? to ([A-Za-z0-9\s]+), [center|Center]+\-? ?([a-zA-Z\'\.\-\,\; ]+)\. Downed by ([a-zA-Z\'\.\-\,\; ]+)\.",
-                        play_desc
+                    play_desc = play_desc.replace(
+                        "Alternative Kickoff", ""
                     )
-                    temp_df["punter_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_df["long_snapper_player_name"] = play_arr[0][3]
-
-                    temp_yl_1 = play_arr[0][2]
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    if temp_yl_1 > 80:
-                        temp_df["is_punt_inside_twenty"] = True
-                elif (
-                    "punts yards" in play_desc.lower() and
-                    "returned punt from" in play_desc.lower() and
-                    "pushed out of bounds by" in play_desc.lower()
-                ):
-                    temp_df["is_punt_attempt"] = True
-                    temp_df["is_out_of_bounds"] = True
-
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) punts yard[s]? to ([A-Za-z0-9\s]+), [center|Center]+\-? ?([a-zA-Z\'\.\-\,\; ]+)\. ([a-zA-Z\'\.\-\,\; ]+) returned punt from the ([A-Za-z0-9\s]+)\. Pushed out of bounds by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
+                    play_desc = play_desc.replace(
+                        "alternative kickoff", ""
                     )
-                    temp_df["punter_player_name"] = play_arr[0][0]
-                    temp_yl_3 = play_arr[0][1]
-                    temp_yl_3 = get_yardline(temp_yl_3, posteam)
-                    temp_df["kick_distance"] = yardline_100 - temp_yl_3
-                    temp_df["long_snapper_player_name"] = play_arr[0][2]
-                    temp_df["kickoff_returner_player_name"] = play_arr[0][3]
-                    # tacklers_arr = play_arr[0][6]
-                    temp_yl_1 = play_arr[0][4]
-                    temp_yl_2 = play_arr[0][6]
-
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                    temp_df["return_yards"] = temp_yl_1 - temp_yl_2
-
-                    if temp_yl_2 > 80:
-                        temp_df["is_punt_inside_twenty"] = True
-                    del temp_yl_1, temp_yl_2
-                elif (
-                    "punt" in play_desc.lower() and
-                    "returned punt from" in play_desc.lower() and
-                    "ran out of bounds" in play_desc.lower()
-                ):
-                    temp_df["is_punt_attempt"] = True
-                    temp_df["is_out_of_bounds"] = True
+                    temp_dict["is_4th_and_12_onside_play"] = True
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) punts ([\-0-9]+) yard[s]? to ([A-Za-z0-9\s]+), [center|Center]+\-? ?([a-zA-Z\'\.\-\,\; ]+)\. ([a-zA-Z\'\.\-\,\; ]+) returned punt from the ([A-Za-z0-9\s]+)\. ([a-zA-Z\.\-\,\'\;\s]+) ran out of bounds\.",
-                        play_desc
-                    )
-                    temp_df["punter_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_df["long_snapper_player_name"] = play_arr[0][3]
-                    temp_df["kickoff_returner_player_name"] = play_arr[0][4]
-                    # tacklers_arr = play_arr[0][6]
-                    temp_yl_1 = play_arr[0][5]
-                    # temp_yl_2 = play_arr[0][7]
-
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    # temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                    temp_df["return_yards"] = 0
-
-                    if temp_yl_1 > 80:
-                        temp_df["is_punt_inside_twenty"] = True
-                    del temp_yl_1
-                elif (
-                    "punt" in play_desc.lower() and
-                    "returned punt from" in play_desc.lower() and
-                    "pushed out of bounds by" in play_desc.lower()
-                ):
-                    temp_df["is_punt_attempt"] = True
-                    temp_df["is_out_of_bounds"] = True
+                # Play type
+                play_class = classify_play(play_desc.lower())
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) punts ([\-0-9]+) yard[s]? to ([A-Za-z0-9\s]+), [center|Center]+\-? ?([a-zA-Z\'\.\-\,\; ]+)\. ([a-zA-Z\'\.\-\,\; ]+) returned punt from the ([A-Za-z0-9\s]+)\. Pushed out of bounds by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["punter_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_df["long_snapper_player_name"] = play_arr[0][3]
-                    temp_df["kickoff_returner_player_name"] = play_arr[0][4]
-                    tacklers_arr = play_arr[0][6]
-                    temp_yl_1 = play_arr[0][5]
-                    temp_yl_2 = play_arr[0][7]
-
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_yl_2 = get_yardline(temp_yl_2, posteam)
-                    temp_df["return_yards"] = temp_yl_1 - temp_yl_2
-
-                    if temp_yl_2 > 80:
-                        temp_df["is_punt_inside_twenty"] = True
-                    del temp_yl_1, temp_yl_2
-                elif (
-                    "punt" in play_desc.lower() and
-                    "returned punt from" in play_desc.lower() and
-                    "touchdown" in play_desc.lower()
-                ):
-                    temp_df["is_punt_attempt"] = True
-                    temp_df["is_touchdown"] = True
-                    temp_df["is_return_touchdown"] = True
-                    temp_df["is_out_of_bounds"] = True
+                if play_class == "timeout":
+                    temp_dict["is_timeout"] = True
 
-                    play_arr = re.findall(
-                        r"([a-zA-Z\'\.\-\,\; ]+) punts ([\-0-9]+) yard[s]? to ([A-Za-z0-9\s]+), [center|Center]+\-? ?([a-zA-Z\'\.\-\,\; ]+)\. ([a-zA-Z\'\.\-\,\; ]+) returned punt from the ([A-Za-z0-9\s]+)\. [TOUCHDOWN|touchdown]+",
-                        play_desc
-                    )
-                    temp_df["punter_player_name"] = play_arr[0][0]
-                    temp_df["kick_distance"] = int(play_arr[0][1])
-                    temp_df["long_snapper_player_name"] = play_arr[0][3]
-                    temp_df["kickoff_returner_player_name"] = play_arr[0][4]
-                    # tacklers_arr = play_arr[0][6]
-                    temp_yl_1 = play_arr[0][5]
-
-                    temp_yl_1 = get_yardline(temp_yl_1, posteam)
-                    temp_df["return_yards"] = 100 - temp_yl_1
-
-                    del temp_yl_1
-                elif (
-                    "tackled by" in play_desc.lower()
-                ):
-                    # to handle weird situations where this is the only part of the play that still exists.
-                    play_arr = re.findall(
-                        r"Tackled by ([a-zA-Z\.\-\,\'\;\s]+) at ([A-Za-z0-9\s]+)\.",
-                        play_desc
-                    )
-                    tacklers_arr = play_arr[0][0]
-                # Penalties (before the snap)
-                elif (
-                    "penalty" in play_desc.lower()
-                ):
-                    # We'll handle penalty data later.
-                    pass
-                elif (
-                    "extra point is" in play_desc.lower()
-                ):
-                    play_arr = re.findall(
-                        r"([a-zA-Z\.\-\,\'\;\s]+) extra point is ([a-zA-Z\s]+)\.",
-                        play_desc
+                    play_match = PBP_REGEX["timeout"].search(play_desc)
+                    temp_dict["timeout_team"] = play_match["timeout_team"]
+                    if play_match["timeout_team"] == away_team_abv:
+                        away_timeouts_remaining -= 1
+                    elif play_match["timeout_team"] == home_team_abv:
+                        home_timeouts_remaining -= 1
+                    else:
+                        temp_team = play_match["timeout_team"]
+                        raise ValueError(
+                            f"Unhandled team abbreviation {temp_team}"
+                        )
+                    # if play_arr[0][1] == posteam:
+                    #     posteam_timeouts_remaining -= 1
+                    # elif play_arr[0][1] == defteam:
+                    #     defteam_timeouts_remaining -= 1
+                    # else:
+                    #     temp_team = play_arr[0][1]
+                    #     raise ValueError(
+                    #         f"Unhandled team abbreviation {temp_team}"
+                    #     )
+                elif play_class is not None:
+                    (
+                        tacklers_arr,
+                        sack_players_arr
+                    ) = PBP_PLAY_HANDLERS[play_class](
+                        temp_dict, play_desc, posteam, defteam, yardline_100
                     )
-                    # tacklers_arr = play_arr[0][0]
-                    temp_df["extra_point_player_name"] = play_arr[0][0]
-                    temp_df["extra_point_result"] = play_arr[0][1]
-                    
                 elif len(play_desc) == 0:
                     logging.warning(
                         f"\nEmpty play found with game ID {game_id} " +
@@ -4242,49 +8150,178 @@ def parser(
                     )
 
                 if len(tacklers_arr) > 0 and "," in tacklers_arr:
-                    temp_df[[
-                        "assist_tackle_1_player_name",
-                        "assist_tackle_2_player_name"
-                    ]] = tacklers_arr.split(",")
+                    (
+                        temp_dict["assist_tackle_1_player_name"],
+                        temp_dict["assist_tackle_2_player_name"]
+                    ) = tacklers_arr.split(",")
                 if len(tacklers_arr) > 0 and ";" in tacklers_arr:
-                    temp_df[[
-                        "assist_tackle_1_player_name",
-                        "assist_tackle_2_player_name"
-                    ]] = tacklers_arr.split(";")
+                    (
+                        temp_dict["assist_tackle_1_player_name"],
+                        temp_dict["assist_tackle_2_player_name"]
+                    ) = tacklers_arr.split(";")
                 elif len(tacklers_arr) > 0:
-                    temp_df["solo_tackle_1_player_name"] = tacklers_arr
+                    temp_dict["solo_tackle_1_player_name"] = tacklers_arr
                 del tacklers_arr
 
                 if len(sack_players_arr) > 0 and "," in sack_players_arr:
-                    temp_df[[
-                        "half_sack_1_player_name",
-                        "half_sack_2_player_name"
-                    ]] = sack_players_arr.split(",")
+                    (
+                        temp_dict["half_sack_1_player_name"],
+                        temp_dict["half_sack_2_player_name"]
+                    ) = sack_players_arr.split(",")
                 if len(sack_players_arr) > 0 and ";" in sack_players_arr:
-                    temp_df[[
-                        "half_sack_1_player_name",
-                        "half_sack_2_player_name"
-                    ]] = sack_players_arr.split(";")
+                    (
+                        temp_dict["half_sack_1_player_name"],
+                        temp_dict["half_sack_2_player_name"]
+                    ) = sack_players_arr.split(";")
                 elif len(sack_players_arr) > 0:
-                    temp_df["sack_player_name"] = sack_players_arr
+                    temp_dict["sack_player_name"] = sack_players_arr
                 del sack_players_arr
 
                 if ("penalty" in play_desc.lower()):
-                    temp_df["is_penalty"] = True
+                    temp_dict["is_penalty"] = True
+
+                    play_match = PBP_REGEX["penalty"].search(play_desc)
+                    temp_dict["penalty_team"] = play_match["penalty_team"]
+                    temp_dict["penalty_player_name"] = play_match[
+                        "penalty_player_name"
+                    ]
+                    temp_dict["penalty_type"] = play_match["penalty_type"]
+                    temp_dict["penalty_yards"] = int(play_match[
+                        "penalty_yards"
+                    ])
+
+                append_play_to_columns(pbp_columns, temp_dict, play_count)
+                play_count += 1
+                del temp_dict
+
+    pbp_df = pd.DataFrame(pbp_columns)
+    return pbp_df
 
-                    play_arr = re.findall(
-                        r"PENALTY on ([A-Z]+)\-? ?([a-zA-Z\'\.\-\,\; ]+)\, ([a-zA-Z\s\/\-]+)\, ([0-9]+) yard[s]?,\.? ([a-zA-Z\s]+)\.",
-                        play_desc
-                    )
-                    temp_df["penalty_team"] = play_arr[0][0]
-                    temp_df["penalty_player_name"] = play_arr[0][1]
-                    temp_df["penalty_type"] = play_arr[0][2]
-                    temp_df["penalty_yards"] = int(play_arr[0][3])
 
-                pbp_df_arr.append(temp_df)
-                del temp_df
+def get_week_num(week_title: str) -> int:
+    """
+    Turns a FOX Sports week title (ex. "Week 3", "Playoffs")
+    into a week number.
+
+    Parameters
+    ----------
+
+    `week_title` (str, mandatory):
+        The week title from the UFL schedule.
+
+    Returns
+    ----------
+    The week number, as an `int`.
+    """
+    week = int(
+        week_title.lower().replace(
+            "week ", ""
+        ).replace(
+            "playoffs", "11"
+        ).replace(
+            "championship", "12"
+        )
+    )
+    return week
+
+
+def combine_ufl_pbp(
+    pbp_df_arr: list,
+    season: int,
+    save_csv: bool = False,
+    save_parquet: bool = False,
+) -> pd.DataFrame:
+    """
+    Combines parsed UFL games into one play-by-play (PBP) `DataFrame`,
+    and saves it if requested.
+
+    Parameters
+    ----------
+
+    `pbp_df_arr` (list, mandatory):
+        A `list` of `DataFrame`s from `parser()`, one per game.
+        Games from an earlier run (that already have `last_updated`)
+        can be mixed in.
+
+    `season` (int, mandatory):
+        The UFL season these games are from.
+
+    `save_csv` (bool, optional):
+        If set to `True`, the resulting `DataFrame`
+        will be saved to a `.csv` file.
+
+    `save_parquet` (bool, optional):
+        If set to `True`, the resulting `DataFrame`
+        will be saved to a `.parquet` file.
+
+    Returns
+    ----------
+    A pandas `DataFrame` object with UFL PBP data.
+    """
+    now = datetime.now(UTC).isoformat()
 
     pbp_df = pd.concat(pbp_df_arr, ignore_index=True)
+    # Plays carried over from an earlier run keep their `last_updated`.
+    if "last_updated" in pbp_df.columns:
+        pbp_df["last_updated"] = pbp_df["last_updated"].fillna(now)
+    else:
+        pbp_df["last_updated"] = now
+    # print(pbp_df)
+
+    pbp_df = pbp_df.astype(
+        {"lateral_receiving_yards": "string"}
+    )
+
+    if save_csv is True:
+        pbp_df.to_csv(
+            f"pbp/{season}_ufl_pbp.csv",
+            index=False
+        )
+
+    if save_parquet is True:
+        pbp_df.to_parquet(
+            f"pbp/{season}_ufl_pbp.parquet",
+            index=False
+        )
+
+    return pbp_df
+
+
+def get_final_ufl_pbp(season: int) -> pd.DataFrame:
+    """
+    Loads the plays of games that were already final
+    the last time `pbp/{season}_ufl_pbp.parquet` was saved.
+
+    Parameters
+    ----------
+
+    `season` (int, mandatory):
+        The UFL season you want PBP data from.
+
+    Returns
+    ----------
+    A pandas `DataFrame` with the plays of every final game,
+    or an empty `DataFrame` if there's nothing to reuse.
+    """
+    try:
+        pbp_df = pd.read_parquet(f"pbp/{season}_ufl_pbp.parquet")
+    except Exception as e:
+        logging.warning(
+            f"Could not load existing PBP data for the {season} " +
+            f"UFL season. Full exception: {e}"
+        )
+        return pd.DataFrame()
+
+    if "game_status" not in pbp_df.columns:
+        logging.warning(
+            f"Existing PBP data for the {season} UFL season " +
+            "doesn't have game statuses. Every game will be refreshed."
+        )
+        return pd.DataFrame()
+
+    pbp_df = pbp_df[
+        pbp_df["game_status"].fillna("").str.upper().str.startswith("FINAL")
+    ]
     return pbp_df
 
 
@@ -4293,6 +8330,9 @@ def get_ufl_pbp(
     save_csv: bool = False,
     save_parquet: bool = False,
     # save_json: bool = True,
+    max_workers: int = 8,
+    incremental: bool = False,
+    offline: bool = False,
 ) -> pd.DataFrame:
     """
     Retrieves UFL play-by-play (PBP) data,
@@ -4312,156 +8352,222 @@ def get_ufl_pbp(
         If set to `True`, `get_ufl_standings()` will save
         the resulting `DataFrame` to a `.parquet` file.
 
+    `max_workers` (int, optional):
+        Optional argument.
+        How many games can be downloaded at the same time.
+        Games are still parsed one at a time (in schedule order),
+        while the next games are being downloaded.
+        Set to `1` to download games one at a time.
+
+    `incremental` (bool, optional):
+        Optional argument.
+        If set to `True`, games that were already final
+        in `pbp/{season}_ufl_pbp.parquet` are reused as-is,
+        and only new or in-progress games are downloaded and parsed.
+
+    `offline` (bool, optional):
+        Optional argument.
+        If set to `True`, `get_ufl_pbp()` will rebuild this season
+        from archived games (`raw_game_json/`, `usfl_game_logs/`)
+        instead of the FOX Sports API.
+        No API key or internet connection is needed.
+
     Returns
     ----------
     A pandas `DataFrame` object with UFL PBP data.
 
     """
-    fox_key = get_fox_api_key()
     # columns_order = []
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4)"
-        + " AppleWebKit/537.36 (KHTML, like Gecko) "
-        + "Chrome/147.0.7727.56 Safari/537.36",
-        # "Referer": "https://www.theufl.com/",
-    }
-    now = datetime.now(UTC).isoformat()
     pbp_df = pd.DataFrame()
     pbp_df_arr = []
 
-    schedule_df = pd.read_parquet(
-        "https://github.com/armstjc/ufl-data-repository/releases/download/" +
-        f"ufl-schedule/{season}_ufl_schedule.parquet"
-    )
+    if offline is True:
+        schedule_df = get_archived_ufl_games(season)
+    else:
+        fox_key = get_fox_api_key()
+        schedule_df = get_played_ufl_games(season)
 
-    # schedule_df = schedule_df[
-    #     (schedule_df["away_score"] > -1) | (schedule_df["home_score"] > -1)
-    # ]
-    schedule_df = schedule_df.astype(
-        {
-            "game_date":"datetime64[ms]"
-        },
-    )
+    all_game_id_arr = schedule_df["ufl_game_id"].to_numpy()
+    final_pbp_df = pd.DataFrame()
+    game_pbp = {}
 
-    schedule_df = schedule_df[
-        schedule_df["game_date"] <= datetime.now()
-    ]
+    if incremental is True:
+        final_pbp_df = get_final_ufl_pbp(season)
+
+    if len(final_pbp_df) > 0:
+        for ufl_game_id, game_df in final_pbp_df.groupby(
+            "ufl_game_id", sort=False
+        ):
+            game_pbp[ufl_game_id] = game_df
 
-    if len(schedule_df) == 0:
-        schedule_df = pd.read_parquet(
-            "https://github.com/armstjc/ufl-data-repository/releases/"
-            + f"download/ufl-schedule/{season}_ufl_schedule.parquet"
-        )
         schedule_df = schedule_df[
-            schedule_df["week_num"] == 1
-        ]    
+            ~schedule_df["ufl_game_id"].isin(game_pbp.keys())
+        ]
+        logging.info(
+            f"Reusing {len(game_pbp)} final games, " +
+            f"refreshing {len(schedule_df)} games."
+        )
 
     ufl_game_id_arr = schedule_df["ufl_game_id"].to_numpy()
     ufl_game_type_arr = schedule_df["season_type"].to_numpy()
     week_title_arr = schedule_df["week_title"].to_numpy()
 
-    for g in tqdm(range(0, len(ufl_game_id_arr))):
-        ufl_game_id = ufl_game_id_arr[g]
+    # Downloads run in the background (up to `max_workers` at a time),
+    # and `executor.map()` hands them back in schedule order,
+    # so games are parsed while the next ones are still downloading.
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        if offline is True:
+            game_json_iter = executor.map(
+                load_archived_game_json,
+                schedule_df["file_path"].to_numpy()
+            )
+        else:
+            game_json_iter = executor.map(
+                lambda x: get_ufl_event_json(
+                    ufl_game_id=x,
+                    fox_key=fox_key
+                ),
+                ufl_game_id_arr
+            )
+
+        for g, game_json in enumerate(
+            tqdm(game_json_iter, total=len(ufl_game_id_arr))
+        ):
+            ufl_game_id = ufl_game_id_arr[g]
 
-        url = (
-            "https://api.foxsports.com/bifrost/v1/ufl/event/"
-            + f"{ufl_game_id}/data?apikey={fox_key}"
-        )
-        # play_id = 0
-
-        response = requests.get(url=url, headers=headers)
-        game_json = json.loads(response.text)
-
-        season_type = ufl_game_type_arr[g]
-        week = int(
-            week_title_arr[g].lower().replace(
-                "week ", ""
-            ).replace(
-                "playoffs", "11"
-            ).replace(
-                "championship", "12"
+            season_type = ufl_game_type_arr[g]
+            week = get_week_num(week_title_arr[g])
+
+            plays_df = parser(
+                game_json=game_json,
+                ufl_game_id=ufl_game_id,
+                season=season,
+                season_type=season_type,
+                week=week
             )
-        )
 
-        plays_df = parser(
-            game_json=game_json,
-            ufl_game_id=ufl_game_id,
-            season=season,
-            season_type=season_type,
-            week=week
-        )
+            game_pbp[ufl_game_id] = plays_df
 
-        pbp_df_arr.append(plays_df)
+    # Keeps games in schedule order,
+    # no matter if they were reused or refreshed.
+    for ufl_game_id in all_game_id_arr:
+        if ufl_game_id in game_pbp:
+            pbp_df_arr.append(game_pbp[ufl_game_id])
 
-    pbp_df = pd.concat(pbp_df_arr, ignore_index=True)
-    pbp_df["last_updated"] = now
-    # print(pbp_df)
+    pbp_df = combine_ufl_pbp(
+        pbp_df_arr=pbp_df_arr,
+        season=season,
+        save_csv=save_csv,
+        save_parquet=save_parquet
+    )
 
-    pbp_df = pbp_df.astype(
-        {"lateral_receiving_yards": "string"}
+    return pbp_df
+
+
+def parse_usfl_game(usfl_game: str) -> bytes:
+    """
+    Parses a single archived USFL game in `usfl_game_logs/`.
+
+    DO NOT CALL DIRECTLY!
+    This is what each worker process in `parse_usfl_pbp()` runs.
+
+    Parameters
+    ----------
+
+    `usfl_game` (str, mandatory):
+        The path to the archived USFL game.
+
+    Returns
+    ----------
+    The PBP data for this game, as an Arrow IPC stream (`bytes`).
+    Sending this back to the main process is much cheaper
+    than sending a pickled pandas `DataFrame`.
+    """
+    f_path = format_folder_path(usfl_game)
+    game_id = int(f_path.split('/')[1].split(".")[0])
+
+    with open(f_path, "r") as f:
+        json_data = json.loads(f.read())
+    season = int(str(json_data["header"]["eventTime"]).split("-")[0])
+    week = json_data["metadata"]["parameters"]["canonicalUrl"]
+    week = week.replace("/usfl/week-", "")
+    week = week.split("-")[0]
+
+    if "playoffs" in str(week):
+        week = 11
+    elif "semifinals" in str(week):
+        week = 11
+    elif "championship" in str(week):
+        week = 12
+    else:
+        week = int(week)
+
+    temp_df = parser(
+        game_json=json_data,
+        ufl_game_id=game_id,
+        season=season,
+        season_type="REGULAR SEASON",
+        week=week
     )
+    del json_data
 
-    if save_csv is True:
-        pbp_df.to_csv(
-            f"pbp/{season}_ufl_pbp.csv",
-            index=False
-        )
+    # Columns that mix numbers and text can't be stored in Arrow as-is.
+    for col in temp_df.columns[temp_df.dtypes == object]:
+        if temp_df[col].dropna().map(type).nunique() > 1:
+            temp_df[col] = temp_df[col].astype("string")
 
-    if save_parquet is True:
-        pbp_df.to_parquet(
-            f"pbp/{season}_ufl_pbp.parquet",
-            index=False
-        )
+    temp_table = pa.Table.from_pandas(temp_df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, temp_table.schema) as writer:
+        writer.write_table(temp_table)
 
-    return pbp_df
+    return sink.getvalue().to_pybytes()
+
+
+def parse_usfl_pbp(max_workers: int = None):
+    """
+    Parses every archived USFL game in `usfl_game_logs/`,
+    and saves the result to `pbp/usfl_pbp.csv`.
 
+    Parameters
+    ----------
+
+    `max_workers` (int, optional):
+        Optional argument.
+        How many games can be parsed at the same time
+        (each in its own process).
+        Defaults to the number of CPU cores.
+        Set to `1` to parse games one at a time.
 
-def parse_usfl_pbp():
+    Returns
+    ----------
+    A pandas `DataFrame` object with USFL PBP data.
+    """
     path = "usfl_game_logs/*.json"
-    json_files_arr = glob(pathname=path)
+    # Sorted, so the output is always in the same game/play order.
+    json_files_arr = sorted(glob(pathname=path))
     now = datetime.now()
     pbp_df_arr = []
     pbp_df = pd.DataFrame()
-    # print(json_files_arr)
-    for usfl_game in tqdm(json_files_arr):
-        f_path = format_folder_path(usfl_game)
-        # print(f_path)
-        game_id = int(f_path.split('/')[1].split(".")[0])
-
-        with open(f_path, "r") as f:
-            json_data = json.loads(f.read())
-        season = int(str(json_data["header"]["eventTime"]).split("-")[0])
-        week = json_data["metadata"]["parameters"]["canonicalUrl"]
-        week = week.replace("/usfl/week-", "")
-        week = week.split("-")[0]
-
-        if "playoffs" in str(week):
-            week = 11
-        if "semifinals" in str(week):
-            week = 11
-        elif "championship" in str(week):
-            week = 12
-        else:
-            week = int(week)
-
-        temp_df = parser(
-            game_json=json_data,
-            ufl_game_id=game_id,
-            season=season,
-            season_type="REGULAR SEASON",
-            week=week
-        )
-        pbp_df_arr.append(temp_df)
 
-        del f_path
-        del game_id
-        del json_data
-        del season
-        del temp_df
+    if max_workers == 1:
+        game_ipc_iter = map(parse_usfl_game, json_files_arr)
+        for game_ipc in tqdm(game_ipc_iter, total=len(json_files_arr)):
+            pbp_df_arr.append(pa.ipc.open_stream(game_ipc).read_pandas())
+    else:
+        # `executor.map()` returns games in the order they were submitted,
+        # no matter which process finishes first.
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            game_ipc_iter = executor.map(parse_usfl_game, json_files_arr)
+            for game_ipc in tqdm(game_ipc_iter, total=len(json_files_arr)):
+                pbp_df_arr.append(
+                    pa.ipc.open_stream(game_ipc).read_pandas()
+                )
 
     pbp_df = pd.concat(pbp_df_arr, ignore_index=True)
     pbp_df["last_updated"] = now
     pbp_df.to_csv("pbp/usfl_pbp.csv", index=False)
+    return pbp_df
 
 
 def main():
@@ -4478,35 +8584,59 @@ def main():
     arg_parser.add_argument(
         "--save_json", default=False, action=BooleanOptionalAction
     )
+    arg_parser.add_argument(
+        "--max_workers", default=8, type=int
+    )
+    arg_parser.add_argument(
+        "--incremental", default=False, action=BooleanOptionalAction
+    )
+    arg_parser.add_argument(
+        "--offline", default=False, action=BooleanOptionalAction
+    )
+    arg_parser.add_argument(
+        "--season", default=None, type=int
+    )
 
     args = arg_parser.parse_args()
     # parse_usfl_pbp()
 
-    if now.month == 3 and now.day >= 28:
+    if args.season is not None:
+        get_ufl_pbp(
+            season=args.season,
+            save_csv=args.save_csv,
+            save_parquet=args.save_parquet,
+            max_workers=args.max_workers,
+            incremental=args.incremental,
+            offline=args.offline
+        )
+    elif now.month == 3 and now.day >= 28:
         get_ufl_pbp(
             season=now.year,
             save_csv=args.save_csv,
-            save_parquet=args.save_parquet
+            save_parquet=args.save_parquet,
+            max_workers=args.max_workers,
+            incremental=args.incremental,
+            offline=args.offline
         )
     elif now.month > 3:
         get_ufl_pbp(
             season=now.year,
             save_csv=args.save_csv,
-            save_parquet=args.save_parquet
+            save_parquet=args.save_parquet,
+            max_workers=args.max_workers,
+            incremental=args.incremental,
+            offline=args.offline
         )
     else:
         get_ufl_pbp(
             season=now.year-1,
             save_csv=args.save_csv,
-            save_parquet=args.save_parquet
+            save_parquet=args.save_parquet,
+            max_workers=args.max_workers,
+            incremental=args.incremental,
+            offline=args.offline
         )
 
 
 if __name__ == "__main__":
-    # main()
-    for i in range(2026, 2025, -1):
-        get_ufl_pbp(
-            season=i,
-            save_csv=True,
-            save_parquet=True
-        )
+    main()
@@ -1,6 +1,6 @@
 """
 # Creation Date: 03/30/2024 10:01 AM EDT
-# Last Updated Date: 04/19/2024 05:13 PM EDT
+# Last Updated Date: 10/19/2026 11:55 AM EDT
 # Author: Joseph Armstrong (armstrongjoseph08@gmail.com)
 # File Name: get_ufl_rosters.py
 # Purpose: Allows one to get UFL roster data.
@@ -10,22 +10,95 @@
 import json
 import logging
 from argparse import ArgumentParser, BooleanOptionalAction
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from os import mkdir
-from urllib.error import HTTPError
 
 import pandas as pd
-import requests
 # from tqdm import tqdm
 
-from get_ufl_standings import get_ufl_standings
-from utils import get_fox_api_key
+from ufl_teams import get_ufl_team_ids
+from utils import fox_api_get, get_fox_api_key, get_ufl_schedule
+
+
+def parse_ufl_team_roster(json_data: dict, t_id: int) -> pd.DataFrame:
+    """
+    Parses the roster of a single UFL team.
+
+    DO NOT CALL DIRECTLY!
+
+    Parameters
+    ----------
+
+    `json_data` (dict, mandatory):
+        The FOX Sports roster JSON for this team.
+
+    `t_id` (int, mandatory):
+        The FOX Sports team ID of this team.
+
+    Returns
+    ----------
+    A pandas `DataFrame` with the players on this team.
+    """
+    team_df = pd.DataFrame()
+    team_df_arr = []
+
+    for group in json_data["groups"]:
+        # print(len(group["rows"]))
+        if len(group["rows"]) > 1:
+            for player in group["rows"]:
+                player_id = player["entityLink"]["layout"]["tokens"]["id"]
+                temp_df = pd.DataFrame({"player_id": player_id}, index=[0])
+
+                try:
+                    temp_df["player_analytics_name"] = player[
+                        "entityLink"
+                    ][
+                        "analyticsName"
+                    ]
+                except Exception:
+                    temp_df["player_analytics_name"] = None
+                temp_df["team_id"] = t_id
+                temp_df["player_num"] = player[
+                    "columns"][0]["superscript"].replace("#", "")
+                temp_df["player_name"] = player["columns"][0]["text"]
+                temp_df["player_headshot"] = player[
+                    "columns"][0]["imageUrl"]
+                temp_df["position"] = player["columns"][1]["text"]
+                try:
+                    temp_df["player_age"] = int(
+                        player["columns"][2]["text"]
+                    )
+                except Exception as e:
+                    logging.info(
+                        f"Unhandled exception `{e}`"
+                    )
+                    temp_df["player_age"] = None
+
+                temp_df["player_height_ft_in"] = player[
+                    "columns"][3]["text"]
+                temp_df["player_weight"] = int(
+                    player["columns"][4]["text"].replace(" lbs", "")
+                )
+                try:
+                    temp_df["college"] = player["columns"][5]["text"]
+                except Exception:
+                    temp_df["college"] = None
+
+                team_df_arr.append(temp_df)
+                del temp_df, player_id
+
+    if len(team_df_arr) > 0:
+        team_df = pd.concat(team_df_arr, ignore_index=True)
+
+    return team_df
 
 
 def ufl_roster_data(
     season: int,
     save_csv: bool = False,
-    save_parquet: bool = False
+    save_parquet: bool = False,
+    max_workers: int = 8,
 ):
     """
     Retrieves roster data from the UFL,
@@ -53,6 +126,11 @@ def ufl_roster_data(
         If set to `True`, `get_ufl_standings()` will save
         a version of the JSON response as a `.json` file.
 
+    `max_workers` (int, optional):
+        Optional argument.
+        How many team rosters can be downloaded at the same time.
+        Set to `1` to download rosters one at a time.
+
     Returns
     ----------
     A pandas `DataFrame` object with UFL roster data.
@@ -77,12 +155,6 @@ def ufl_roster_data(
         "last_updated",
         "player_headshot",
     ]
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4)"
-        + " AppleWebKit/537.36 (KHTML, like Gecko) "
-        + "Chrome/147.0.7727.56 Safari/537.36",
-        # "Referer": "https://www.theufl.com/",
-    }
     now = datetime.now(UTC)
 
     temp_df = pd.DataFrame()
@@ -90,12 +162,22 @@ def ufl_roster_data(
 
     roster_df_arr = []
 
-    teams_df = get_ufl_standings(
-        season=now.year
-    )
-    team_ids_arr = teams_df["team_id"].to_list()
+    team_ids_arr = get_ufl_team_ids(now.year)
+
+    if len(team_ids_arr) == 0:
+        # ex. the schedule for this season isn't out yet.
+        logging.warning(
+            f"Could not find any {now.year} UFL teams, " +
+            f"using the {now.year - 1} UFL teams instead."
+        )
+        team_ids_arr = get_ufl_team_ids(now.year - 1)
 
-    del teams_df
+    if len(team_ids_arr) == 0:
+        logging.error(
+            f"Could not find any {now.year} or {now.year - 1} UFL teams, " +
+            "so no rosters can be downloaded."
+        )
+        return pd.DataFrame()
 
     now = datetime.now(UTC).isoformat()
 
@@ -112,23 +194,13 @@ def ufl_roster_data(
 
     # Get the current week for these rosters
     try:
-        url = (
-            "https://github.com/armstjc/ufl-data-repository/releases/download/"
-            + f"ufl-schedule/{season}_ufl_schedule.parquet"
-        )
-        schedule_df = pd.read_parquet(
-            "https://github.com/armstjc/ufl-data-repository/releases/download/"
-            + f"ufl-schedule/{season}_ufl_schedule.parquet"
-        )
-    except HTTPError:
-        url = (
-            "https://github.com/armstjc/ufl-data-repository/releases/download/"
-            + f"ufl-schedule/{season-1}_ufl_schedule.parquet"
-        )
-        schedule_df = pd.read_parquet(
-            "https://github.com/armstjc/ufl-data-repository/releases/download/"
-            + f"ufl-schedule/{season-1}_ufl_schedule.parquet"
+        schedule_df = get_ufl_schedule(season)
+    except Exception as e:
+        logging.warning(
+            f"Could not get the {season} UFL schedule, " +
+            f"using the {season-1} UFL schedule instead. Full exception: {e}"
         )
+        schedule_df = get_ufl_schedule(season - 1)
     try:
         schedule_df = schedule_df[schedule_df["home_score"] > 0]
         current_week = int(schedule_df["week_num"].max())
@@ -145,60 +217,27 @@ def ufl_roster_data(
 
     del current_month
 
-    for t_id in team_ids_arr:
-        url = (
-            "https://api.foxsports.com/bifrost/v1/ufl/team/"
-            + f"{t_id}/roster?apikey={fox_key}"
+    # Rosters are downloaded in the background (up to `max_workers` at a time),
+    # and each one is parsed as soon as it (and the ones before it) arrive.
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        roster_json_iter = executor.map(
+            lambda x: json.loads(
+                fox_api_get(
+                    "https://api.foxsports.com/bifrost/v1/ufl/team/"
+                    + f"{x}/roster?apikey={fox_key}"
+                ).text
+            ),
+            team_ids_arr
         )
 
-        response = requests.get(url, headers=headers)
-
-        json_data = json.loads(response.text)
-
-        for group in json_data["groups"]:
-            # print(len(group["rows"]))
-            if len(group["rows"]) > 1:
-                for player in group["rows"]:
-                    player_id = player["entityLink"]["layout"]["tokens"]["id"]
-                    temp_df = pd.DataFrame({"player_id": player_id}, index=[0])
-
-                    try:
-                        temp_df["player_analytics_name"] = player[
-                            "entityLink"
-                        ][
-                            "analyticsName"
-                        ]
-                    except Exception:
-                        temp_df["player_analytics_name"] = None
-                    temp_df["team_id"] = t_id
-                    temp_df["player_num"] = player[
-                        "columns"][0]["superscript"].replace("#", "")
-                    temp_df["player_name"] = player["columns"][0]["text"]
-                    temp_df["player_headshot"] = player[
-                        "columns"][0]["imageUrl"]
-                    temp_df["position"] = player["columns"][1]["text"]
-                    try:
-                        temp_df["player_age"] = int(
-                            player["columns"][2]["text"]
-                        )
-                    except Exception as e:
-                        logging.info(
-                            f"Unhandled exception `{e}`"
-                        )
-                        temp_df["player_age"] = None
-
-                    temp_df["player_height_ft_in"] = player[
-                        "columns"][3]["text"]
-                    temp_df["player_weight"] = int(
-                        player["columns"][4]["text"].replace(" lbs", "")
-                    )
-                    try:
-                        temp_df["college"] = player["columns"][5]["text"]
-                    except Exception:
-                        temp_df["college"] = None
-
-                    roster_df_arr.append(temp_df)
-                    del temp_df, player_id
+        for t, json_data in enumerate(roster_json_iter):
+            roster_df_arr.append(
+                parse_ufl_team_roster(
+                    json_data=json_data,
+                    t_id=team_ids_arr[t]
+                )
+            )
+            del json_data
 
     roster_df = pd.concat(roster_df_arr, ignore_index=True)
 
@@ -267,6 +306,9 @@ if __name__ == "__main__":
     parser.add_argument(
         "--save_parquet", default=False, action=BooleanOptionalAction
     )
+    parser.add_argument(
+        "--max_workers", default=8, type=int
+    )
 
     args = parser.parse_args()
 
@@ -285,5 +327,6 @@ if __name__ == "__main__":
     ufl_roster_data(
         season=now.year,
         save_csv=args.save_csv,
-        save_parquet=args.save_parquet
+        save_parquet=args.save_parquet,
+        max_workers=args.max_workers
     )
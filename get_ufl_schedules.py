@@ -1,32 +1,254 @@
 """
 # Creation Date: 03/30/2024 03:41 PM EDT
-# Last Updated Date: 04/19/2024 05:13 PM EDT
+# Last Updated Date: 10/19/2026 10:05 AM EDT
 # Author: Joseph Armstrong (armstrongjoseph08@gmail.com)
 # File Name: get_ufl_schedules.py
 # Purpose: Allows one to get UFL schedule data.
 ###############################################################################
 """
 
-import json
 from argparse import ArgumentParser, BooleanOptionalAction
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 import logging
 from os import mkdir
 
 # import numpy as np
 import pandas as pd
-import requests
 from tqdm import tqdm
-from utils import get_fox_api_key
+from utils import get_fox_api_key, get_fox_json, get_ufl_schedule
 
 # from bs4 import BeautifulSoup
 
 
+def parse_ufl_schedule_week(
+    week_json: dict,
+    season: int,
+    season_type: str,
+    week_id: str,
+    week_title: str,
+    week_num: int,
+) -> pd.DataFrame:
+    """
+    Parses the games in a single UFL schedule week.
+
+    DO NOT CALL DIRECTLY!
+
+    Parameters
+    ----------
+
+    `week_json` (dict, mandatory):
+        The FOX Sports JSON for this week.
+
+    `season` (int, mandatory):
+        The UFL season this week is in.
+
+    `season_type` (str, mandatory):
+        The season type (ex. "REGULAR SEASON") of this week.
+
+    `week_id` (str, mandatory):
+        The FOX Sports ID of this week.
+
+    `week_title` (str, mandatory):
+        The title of this week (ex. "Week 3").
+
+    `week_num` (int, mandatory):
+        The week number.
+
+    Returns
+    ----------
+    A pandas `DataFrame` with the games in this week.
+    """
+    week_df = pd.DataFrame()
+    week_df_arr = []
+
+    for day in week_json["tables"]:
+        u_date = day["title"]
+        u_date = f"{u_date} {season}"
+        game_date = datetime.strptime(u_date, "%a, %b %d %Y")
+
+        for game in day["rows"]:
+            temp_df = pd.DataFrame(
+                {
+                    "week_id": week_id,
+                    "season_type": season_type,
+                    "season": season,
+                    "week_title": week_title,
+                    "week_num": week_num,
+                    "game_date": game_date,
+                },
+                index=[0],
+            )
+            try:
+                temp_df["away_team_id"] = game["linkList"][
+                    0
+                ]["entityLink"]["layout"]["tokens"]["id"]
+                temp_df["away_team_analytics_name"] = game["linkList"][
+                    0
+                ]["entityLink"]["analyticsName"]
+                temp_df["away_team_name"] = game["linkList"][
+                    0
+                ]["entityLink"]["title"].title()
+            except Exception:
+                temp_df["away_team_id"] = None
+                temp_df["away_team_analytics_name"] = None
+                temp_df["away_team_name"] = "TBD"
+
+            try:
+                temp_df["home_team_id"] = game["linkList"][
+                    1
+                ]["entityLink"]["layout"]["tokens"]["id"]
+                temp_df["home_team_analytics_name"] = game["linkList"][
+                    1
+                ]["entityLink"]["analyticsName"]
+                temp_df["home_team_name"] = game["linkList"][
+                    1
+                ]["entityLink"]["title"].title()
+            except Exception:
+                temp_df["home_team_id"] = None
+                temp_df["home_team_analytics_name"] = None
+                temp_df["home_team_name"] = "TBD"
+
+                if game["columns"][3]["subtext"] != "FINAL":
+                    temp_df["scheduled_date"] = game["columns"][
+                        3
+                    ]["text"]
+                    temp_df["broadcast_network"] = game["columns"][
+                        3
+                    ]["subtext"]
+                else:
+                    score = game["columns"][3]["text"]
+                    away_score, home_score = score.split("-")
+                    temp_df["away_score"] = int(away_score)
+                    temp_df["home_score"] = int(home_score)
+            # try:
+            #     if game["columns"][3]["subtext"] != "FINAL":
+            #         temp_df["scheduled_date"] = game["columns"][
+            #             3
+            #         ]["text"]
+            #         temp_df["broadcast_network"] = game["columns"][
+            #             3
+            #         ]["subtext"]
+            #     else:
+            #         score = game["columns"][3]["text"]
+            #         away_score, home_score = score.split("-")
+            #         temp_df["away_score"] = int(away_score)
+            #         temp_df["home_score"] = int(home_score)
+            # except Exception as e:
+            #     logging.warning(
+            #         "Could not parse game state. " +
+            #         f"Full exception `{e}`"
+            #     )
+            try:
+                temp_df["game_status"] = game["columns"][3]["subtext"]
+            except Exception:
+                temp_df["game_status"] = None
+
+            temp_df["stadium"] = game["columns"][4]["text"]
+            temp_df["location"] = game["columns"][4]["subtext"]
+
+            try:
+                temp_df["fox_bet_odds"] = game["columns"][5]["text"]
+            except Exception:
+                temp_df["fox_bet_odds"] = None
+
+            temp_df["ufl_game_id"] = game["linkList"][2]["entityLink"][
+                "layout"
+            ]["tokens"]["id"]
+
+            week_df_arr.append(temp_df)
+            del temp_df
+
+    if len(week_df_arr) > 0:
+        week_df = pd.concat(week_df_arr, ignore_index=True)
+
+    return week_df
+
+
+def get_schedule_weeks_to_refresh(
+    week_arr: list,
+    previous_df: pd.DataFrame,
+    lookahead_weeks: int,
+    today: datetime,
+) -> list:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Picks the weeks `get_ufl_schedules(incremental=True)` downloads:
+    - Weeks that aren't in the previous schedule.
+    - Weeks with a game that isn't final,
+        if that week's first game was on or before `today`.
+    - The next `lookahead_weeks` weeks
+        that haven't started yet (as of `today`).
+
+    Every other week is reused from `previous_df`.
+    A game that never goes final (ex. a postponed game)
+    only keeps its own week refreshed, not every week after it.
+
+    Parameters
+    ----------
+
+    `week_arr` (list, mandatory):
+        Every week in this season (in order),
+        as a `dict` with at least a `week_id`.
+
+    `previous_df` (pandas.DataFrame, mandatory):
+        The previous version of this schedule.
+
+    `lookahead_weeks` (int, mandatory):
+        How many weeks that haven't started yet are downloaded.
+
+    `today` (datetime, mandatory):
+        The current date.
+
+    Returns
+    ----------
+    A `list` with the weeks in `week_arr` that should be downloaded.
+    """
+    previous_df = previous_df.assign(
+        is_final=previous_df["game_status"].fillna("").str.startswith(
+            "FINAL"
+        ),
+        game_date=pd.to_datetime(previous_df["game_date"], errors="coerce")
+    )
+    previous_weeks_df = previous_df.groupby("week_id").agg(
+        is_final=("is_final", "all"),
+        first_game_date=("game_date", "min"),
+    )
+    today = pd.Timestamp(today).normalize()
+
+    download_week_arr = []
+    upcoming_weeks = 0
+
+    for week in week_arr:
+        if week["week_id"] not in previous_weeks_df.index:
+            download_week_arr.append(week)
+            continue
+
+        previous_week = previous_weeks_df.loc[week["week_id"]]
+        if previous_week["is_final"]:
+            continue
+
+        if (
+            pd.notna(previous_week["first_game_date"]) and
+            previous_week["first_game_date"] <= today
+        ):
+            download_week_arr.append(week)
+        elif upcoming_weeks < lookahead_weeks:
+            download_week_arr.append(week)
+            upcoming_weeks += 1
+
+    return download_week_arr
+
+
 def get_ufl_schedules(
     season: int,
     save_csv: bool = False,
     save_parquet: bool = False,
-):
+    max_workers: int = 8,
+    incremental: bool = False,
+    lookahead_weeks: int = 1,
+) -> pd.DataFrame:
     """
     Retrieves schedule data from the UFL,
     and parses the data.
@@ -48,6 +270,25 @@ def get_ufl_schedules(
         If set to `True`, `get_ufl_standings()` will save
         the resulting `DataFrame` to a `.parquet` file.
 
+    `max_workers` (int, optional):
+        Optional argument.
+        How many weeks can be downloaded at the same time.
+        Set to `1` to download weeks one at a time.
+
+    `incremental` (bool, optional):
+        Optional argument.
+        If set to `True`, `get_ufl_schedules()` will start from the
+        previous version of this schedule (see `get_ufl_schedule()`),
+        and only download weeks that have started
+        and still have games that aren't final,
+        plus the next `lookahead_weeks` weeks that haven't started yet.
+        Every other week is reused as-is.
+
+    `lookahead_weeks` (int, optional):
+        Optional argument.
+        In `incremental` mode, how many weeks
+        that haven't started yet are also downloaded.
+
     Returns
     ----------
     A pandas `DataFrame` object with UFL schedule data.
@@ -72,6 +313,7 @@ def get_ufl_schedules(
         "home_team_name",
         "away_score",
         "home_score",
+        "game_status",
         "stadium",
         "location",
         "fox_bet_odds",
@@ -80,11 +322,6 @@ def get_ufl_schedules(
         "last_updated",
     ]
 
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4)"
-        + " AppleWebKit/537.36 (KHTML, like Gecko) "
-        + "Chrome/147.0.7727.56 Safari/537.36"
-    }
     url = (
         "https://api.foxsports.com/bifrost/v1/ufl/league/schedule"
         + f"?season={season}&apikey={fox_key}"
@@ -108,15 +345,17 @@ def get_ufl_schedules(
         logging.info("`standings/weekly_standings` already exists.")
 
     # Get the JSON file
-    response = requests.get(url, headers=headers)
-
-    season_week_json = json.loads(response.text)
+    season_week_json = get_fox_json(
+        url=url,
+        cache_key=f"schedule_{season}"
+    )
 
+    week_arr = []
     for s_type in season_week_json["selectionGroupList"]:
         season_type = s_type["title"]
         print(f"Getting all {season_type.title()} games in {season}.")
 
-        for week in tqdm(s_type["selectionList"]):
+        for week in s_type["selectionList"]:
             week_id = week["id"]
             try:
                 week_title = week["title"]
@@ -130,102 +369,82 @@ def get_ufl_schedules(
             if sea_sec == 2:
                 week_num += 10
 
-            week_url = week["uri"]
-            week_url = f"{week_url}?apikey={fox_key}"
-            response = requests.get(week_url, headers=headers)
-
-            json_data = json.loads(response.text)
-            for day in json_data["tables"]:
-                u_date = day["title"]
-                u_date = f"{u_date} {season}"
-                game_date = datetime.strptime(u_date, "%a, %b %d %Y")
-
-                for game in day["rows"]:
-                    temp_df = pd.DataFrame(
-                        {
-                            "week_id": week_id,
-                            "season_type": season_type,
-                            "season": season,
-                            "week_title": week_title,
-                            "week_num": week_num,
-                            "game_date": game_date,
-                        },
-                        index=[0],
-                    )
-                    try:
-                        temp_df["away_team_id"] = game["linkList"][
-                            0
-                        ]["entityLink"]["layout"]["tokens"]["id"]
-                        temp_df["away_team_analytics_name"] = game["linkList"][
-                            0
-                        ]["entityLink"]["analyticsName"]
-                        temp_df["away_team_name"] = game["linkList"][
-                            0
-                        ]["entityLink"]["title"].title()
-                    except Exception:
-                        temp_df["away_team_id"] = None
-                        temp_df["away_team_analytics_name"] = None
-                        temp_df["away_team_name"] = "TBD"
-
-                    try:
-                        temp_df["home_team_id"] = game["linkList"][
-                            1
-                        ]["entityLink"]["layout"]["tokens"]["id"]
-                        temp_df["home_team_analytics_name"] = game["linkList"][
-                            1
-                        ]["entityLink"]["analyticsName"]
-                        temp_df["home_team_name"] = game["linkList"][
-                            1
-                        ]["entityLink"]["title"].title()
-                    except Exception:
-                        temp_df["home_team_id"] = None
-                        temp_df["home_team_analytics_name"] = None
-                        temp_df["home_team_name"] = "TBD"
-
-                        if game["columns"][3]["subtext"] != "FINAL":
-                            temp_df["scheduled_date"] = game["columns"][
-                                3
-                            ]["text"]
-                            temp_df["broadcast_network"] = game["columns"][
-                                3
-                            ]["subtext"]
-                        else:
-                            score = game["columns"][3]["text"]
-                            away_score, home_score = score.split("-")
-                            temp_df["away_score"] = int(away_score)
-                            temp_df["home_score"] = int(home_score)
-                    # try:
-                    #     if game["columns"][3]["subtext"] != "FINAL":
-                    #         temp_df["scheduled_date"] = game["columns"][
-                    #             3
-                    #         ]["text"]
-                    #         temp_df["broadcast_network"] = game["columns"][
-                    #             3
-                    #         ]["subtext"]
-                    #     else:
-                    #         score = game["columns"][3]["text"]
-                    #         away_score, home_score = score.split("-")
-                    #         temp_df["away_score"] = int(away_score)
-                    #         temp_df["home_score"] = int(home_score)
-                    # except Exception as e:
-                    #     logging.warning(
-                    #         "Could not parse game state. " +
-                    #         f"Full exception `{e}`"
-                    #     )
-                    temp_df["stadium"] = game["columns"][4]["text"]
-                    temp_df["location"] = game["columns"][4]["subtext"]
-
-                    try:
-                        temp_df["fox_bet_odds"] = game["columns"][5]["text"]
-                    except Exception:
-                        temp_df["fox_bet_odds"] = None
-
-                    temp_df["ufl_game_id"] = game["linkList"][2]["entityLink"][
-                        "layout"
-                    ]["tokens"]["id"]
-
-                    schedule_df_arr.append(temp_df)
-                    del temp_df
+            week_arr.append(
+                {
+                    "season_type": season_type,
+                    "week_id": week_id,
+                    "week_title": week_title,
+                    "week_num": week_num,
+                    "week_url": f"{week['uri']}?apikey={fox_key}",
+                }
+            )
+
+    previous_df = pd.DataFrame()
+    download_week_arr = week_arr
+
+    if incremental is True:
+        try:
+            previous_df = get_ufl_schedule(season)
+        except Exception as e:
+            logging.warning(
+                f"Could not load the previous {season} UFL schedule, "
+                + f"downloading every week instead. Full exception: {e}"
+            )
+            previous_df = pd.DataFrame()
+
+    if "game_status" in previous_df.columns:
+        download_week_arr = get_schedule_weeks_to_refresh(
+            week_arr=week_arr,
+            previous_df=previous_df,
+            lookahead_weeks=lookahead_weeks,
+            today=datetime.now()
+        )
+        logging.info(
+            f"Refreshing {len(download_week_arr)} of {len(week_arr)} weeks."
+        )
+    elif incremental is True and len(previous_df) > 0:
+        logging.warning(
+            "The previous schedule doesn't have a `game_status` column, "
+            + "downloading every week instead."
+        )
+
+    week_df_dict = {}
+
+    # Weeks are downloaded in the background (up to `max_workers` at a time),
+    # and `executor.map()` hands them back in the same order as `week_arr`,
+    # so the schedule stays in week order.
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        week_json_iter = executor.map(
+            lambda x: get_fox_json(
+                url=x["week_url"],
+                cache_key=f"schedule_{season}_{x['week_id']}"
+            ),
+            download_week_arr
+        )
+
+        for w, week_json in enumerate(
+            tqdm(week_json_iter, total=len(download_week_arr))
+        ):
+            week = download_week_arr[w]
+            week_df = parse_ufl_schedule_week(
+                week_json=week_json,
+                season=season,
+                season_type=week["season_type"],
+                week_id=week["week_id"],
+                week_title=week["week_title"],
+                week_num=week["week_num"]
+            )
+            week_df_dict[week["week_id"]] = week_df
+            del week_json
+
+    # Keeps weeks in order, no matter if they were reused or refreshed.
+    for week in week_arr:
+        if week["week_id"] in week_df_dict:
+            schedule_df_arr.append(week_df_dict[week["week_id"]])
+        else:
+            schedule_df_arr.append(
+                previous_df[previous_df["week_id"] == week["week_id"]]
+            )
 
     schedule_df = pd.concat(schedule_df_arr, ignore_index=True)
     schedule_df["last_updated"] = now
@@ -244,6 +463,8 @@ def get_ufl_schedules(
             index=False,
         )
 
+    return schedule_df
+
 
 if __name__ == "__main__":
     now = datetime.now()
@@ -260,9 +481,23 @@ if __name__ == "__main__":
         default=False,
         action=BooleanOptionalAction
     )
+    parser.add_argument(
+        "--max_workers", default=8, type=int
+    )
+    parser.add_argument(
+        "--incremental", default=False, action=BooleanOptionalAction
+    )
+    parser.add_argument(
+        "--lookahead_weeks", default=1, type=int
+    )
 
     args = parser.parse_args()
 
     get_ufl_schedules(
-        season=now.year, save_csv=args.save_csv, save_parquet=args.save_parquet
+        season=now.year,
+        save_csv=args.save_csv,
+        save_parquet=args.save_parquet,
+        max_workers=args.max_workers,
+        incremental=args.incremental,
+        lookahead_weeks=args.lookahead_weeks
     )
@@ -1,6 +1,6 @@
 """
 # Creation Date: 03/29/2024 06:27 PM EDT
-# Last Updated Date: 03/30/2024 02:05 PM EDT
+# Last Updated Date: 10/18/2026 06:00 PM EDT
 # Author: Joseph Armstrong (armstrongjoseph08@gmail.com)
 # File Name: get_ufl_standings.py
 # Purpose: Allows one to get UFL standings data.
@@ -15,8 +15,7 @@ from os import mkdir
 
 import numpy as np
 import pandas as pd
-import requests
-from utils import get_fox_api_key
+from utils import get_fox_api_key, get_fox_json
 
 # from bs4 import BeautifulSoup
 
@@ -89,11 +88,6 @@ def get_ufl_standings(
         "team_logo",
     ]
 
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4)"
-        + " AppleWebKit/537.36 (KHTML, like Gecko) "
-        + "Chrome/147.0.7727.56 Safari/537.36"
-    }
     url = (
         "https://api.foxsports.com/bifrost/v1/ufl/league/standings"
         + f"?season={season}&apikey={fox_key}"
@@ -120,14 +114,10 @@ def get_ufl_standings(
         logging.info("`standings/weekly_standings` already exists.")
 
     # Get the JSON file
-    response = requests.get(url, headers=headers)
-
-    # orj_json_text = response.text
-    # json_text = orj_json_text[:-1].replace("callback({", "{")
-
-    # del orj_json_text
-
-    json_data = json.loads(response.text)
+    json_data = get_fox_json(
+        url=url,
+        cache_key=f"standings_{season}"
+    )
     conf_json_data = {}
     lg_json_data = {}
 
@@ -1,574 +1,1014 @@
 """
 # Creation Date: 05/17/2024 01:20 PM EDT
-# Last Updated Date: 05/17/2024 06:45 PM EDT
+# Last Updated Date: 10/19/2026 12:40 PM EDT
 # Author: Joseph Armstrong (armstrongjoseph08@gmail.com)
 # File Name: parse_ufl_season_stats.py
 # Purpose: Allows one to get UFL season stats.
 ###############################################################################
 """
 
+from argparse import ArgumentParser, BooleanOptionalAction
 from datetime import UTC, datetime
 import logging
-from os import mkdir
+from os import makedirs, mkdir
+from os.path import exists
+
+import numpy as np
 import pandas as pd
+from pyarrow.parquet import read_schema
 
+from get_ufl_game_stats import (
+    GAME_STATS_ID_DTYPES,
+    PLAYER_GAME_STATS_DTYPES,
+    TEAM_GAME_STATS_DTYPES,
+)
+from utils import get_ufl_schedule
 # from utils import format_folder_path
 
+# Every game that went into a season's stats is kept here,
+# so `parse_ufl_player_season_stats(incremental=True)`
+# and `parse_ufl_team_season_stats(incremental=True)`
+# can take a game back out if it changes.
+SEASON_STATS_STATE_DIR = "season_stats/state"
 
-def parse_ufl_player_season_stats(season: int):
-    """ """
-    columns = [
-        "season",
-        "league",
-        "team_id",
-        "team_abv",
-        "team_analytics_id",
-        "team_name",
-        "team_nickname",
-        "player_id",
-        "player_name",
-        "games_played",
-        "passing_COMP",
-        "passing_ATT",
-        "passing_COMP%",
-        "passing_YDS",
-        "passing_TD",
-        "passing_INT",
-        "passing_Y/A",
-        "passing_AY/A",
-        "passing_Y/C",
-        "passing_NFL_QBR",
-        "passing_CFB_QBR",
-        "rushing_ATT",
-        "rushing_YDS",
-        "rushing_TD",
-        "rushing_LONG",
-        "rushing_AVG",
-        "receiving_TGT",
-        "receiving_REC",
-        "receiving_YDS",
-        "receiving_AVG",
-        "receiving_TD",
-        "receiving_LONG",
-        "receiving_CATCH%",
-        "receiving_YDS/TGT",
-        "fumbles_FUM",
-        "fumbles_FUM_LOST",
-        "defense_TAK",
-        "defense_SOLO",
-        "defense_AST",
-        "defense_TFL",
-        "defense_SACKS",
-        "defense_INT",
-        "defense_PD",
-        "defense_TD",
-        "defense_FF",
-        "defense_FR",
-        "kicking_FGM",
-        "kicking_FGA",
-        "kicking_FG%",
-        "kicking_FG_LONG",
-        "punting_NO",
-        "punting_GROSS_YDS",
-        "punting_GROSS_AVG",
-        "punting_IN_20",
-        "punting_IN_20%",
-        "punting_TB",
-        "punting_TB%",
-        "punting_LONG",
-        "punting_BLK",
-        "kick_return_KR",
-        "kick_return_YDS",
-        "kick_return_AVG",
-        "kick_return_LONG",
-        "kick_return_TD",
-        "punt_return_PR",
-        "punt_return_YDS",
-        "punt_return_AVG",
-        "punt_return_LONG",
-        "punt_return_TD",
-        "last_updated",
-    ]
+# Where season-to-date stats for every week are saved
+# (see `parse_ufl_player_weekly_season_stats()`).
+SEASON_STATS_WEEKLY_DIR = "season_stats/weekly"
 
-    base_df = pd.read_csv(
-        f"game_stats/player/{season}_ufl_player_game_stats.csv"
-    )
+# What player season stats are grouped by.
+PLAYER_SEASON_STATS_KEYS = [
+    "season",
+    "league",
+    "team_id",
+    "team_abv",
+    "team_analytics_id",
+    "team_name",
+    "team_nickname",
+    "player_id",
+    "player_name",
+]
 
-    final_df = base_df.groupby(
-        [
-            "season",
-            "league",
-            "team_id",
-            "team_abv",
-            "team_analytics_id",
-            "team_name",
-            "team_nickname",
-            "player_id",
-            "player_name",
-        ],
+# How each player game stat is added up into a season stat.
+# "sum" stats are running totals, and "max" stats are the best game.
+PLAYER_SEASON_STATS_AGG = {
+    "passing_COMP": "sum",
+    "passing_ATT": "sum",
+    "passing_YDS": "sum",
+    "passing_TD": "sum",
+    "passing_INT": "sum",
+    "rushing_ATT": "sum",
+    "rushing_YDS": "sum",
+    "rushing_TD": "sum",
+    "rushing_LONG": "max",
+    "receiving_TGT": "sum",
+    "receiving_REC": "sum",
+    "receiving_YDS": "sum",
+    "receiving_TD": "sum",
+    "receiving_LONG": "max",
+    "fumbles_FUM": "sum",
+    "fumbles_FUM_LOST": "sum",
+    "defense_TAK": "sum",
+    "defense_SOLO": "sum",
+    "defense_AST": "sum",
+    "defense_TFL": "sum",
+    "defense_SACKS": "sum",
+    "defense_INT": "sum",
+    "defense_PD": "sum",
+    "defense_TD": "sum",
+    "defense_FF": "sum",
+    "defense_FR": "sum",
+    "kicking_FGM": "sum",
+    "kicking_FGA": "sum",
+    "kicking_FG_LONG": "max",
+    "punting_NO": "sum",
+    "punting_GROSS_YDS": "sum",
+    "punting_IN_20": "sum",
+    "punting_TB": "sum",
+    "punting_LONG": "max",
+    "punting_BLK": "sum",
+    "kick_return_KR": "sum",
+    "kick_return_YDS": "sum",
+    "kick_return_LONG": "max",
+    "kick_return_TD": "sum",
+    "punt_return_PR": "sum",
+    "punt_return_YDS": "sum",
+    "punt_return_LONG": "max",
+    "punt_return_TD": "sum",
+}
+
+PLAYER_SEASON_STATS_COLUMNS = [
+    "season",
+    "league",
+    "team_id",
+    "team_abv",
+    "team_analytics_id",
+    "team_name",
+    "team_nickname",
+    "player_id",
+    "player_name",
+    "games_played",
+    "passing_COMP",
+    "passing_ATT",
+    "passing_COMP%",
+    "passing_YDS",
+    "passing_TD",
+    "passing_INT",
+    "passing_Y/A",
+    "passing_AY/A",
+    "passing_Y/C",
+    "passing_NFL_QBR",
+    "passing_CFB_QBR",
+    "rushing_ATT",
+    "rushing_YDS",
+    "rushing_TD",
+    "rushing_LONG",
+    "rushing_AVG",
+    "receiving_TGT",
+    "receiving_REC",
+    "receiving_YDS",
+    "receiving_AVG",
+    "receiving_TD",
+    "receiving_LONG",
+    "receiving_CATCH%",
+    "receiving_YDS/TGT",
+    "fumbles_FUM",
+    "fumbles_FUM_LOST",
+    "defense_TAK",
+    "defense_SOLO",
+    "defense_AST",
+    "defense_TFL",
+    "defense_SACKS",
+    "defense_INT",
+    "defense_PD",
+    "defense_TD",
+    "defense_FF",
+    "defense_FR",
+    "kicking_FGM",
+    "kicking_FGA",
+    "kicking_FG%",
+    "kicking_FG_LONG",
+    "punting_NO",
+    "punting_GROSS_YDS",
+    "punting_GROSS_AVG",
+    "punting_IN_20",
+    "punting_IN_20%",
+    "punting_TB",
+    "punting_TB%",
+    "punting_LONG",
+    "punting_BLK",
+    "kick_return_KR",
+    "kick_return_YDS",
+    "kick_return_AVG",
+    "kick_return_LONG",
+    "kick_return_TD",
+    "punt_return_PR",
+    "punt_return_YDS",
+    "punt_return_AVG",
+    "punt_return_LONG",
+    "punt_return_TD",
+    "last_updated",
+]
+
+# What team season stats are grouped by.
+TEAM_SEASON_STATS_KEYS = [
+    "season",
+    "league",
+    "team_id",
+]
+
+# How each team game stat is added up into a season stat.
+TEAM_SEASON_STATS_AGG = {
+    # "TOP": "sum",
+    "total_drives": "sum",
+    "total_plays": "sum",
+    "total_yards": "sum",
+    # "yards_per_play",
+    "redzone_TDs": "sum",
+    "redzone_attempts": "sum",
+    "turnovers": "sum",
+    "passing_COMP": "sum",
+    "passing_ATT": "sum",
+    "passing_YDS": "sum",
+    "passing_TD": "sum",
+    "passing_INT": "sum",
+    "rushing_ATT": "sum",
+    "rushing_YDS": "sum",
+    "rushing_TD": "sum",
+    "rushing_LONG": "max",
+    "fumbles_FUM": "sum",
+    "fumbles_FUM_LOST": "sum",
+    "defense_TAK": "sum",
+    "defense_SOLO": "sum",
+    "defense_AST": "sum",
+    "defense_TFL": "sum",
+    "defense_SACKS": "sum",
+    "defense_INT": "sum",
+    "defense_PD": "sum",
+    "defense_TD": "sum",
+    "defense_FF": "sum",
+    "defense_FR": "sum",
+    "kicking_FGM": "sum",
+    "kicking_FGA": "sum",
+    "kicking_FG_LONG": "max",
+    "punting_NO": "sum",
+    "punting_GROSS_YDS": "sum",
+    # "punting_AVG",
+    "punting_IN_20": "sum",
+    "punting_TB": "sum",
+    "punting_BLK": "sum",
+    "punting_LONG": "max",
+    "kick_return_KR": "sum",
+    "kick_return_YDS": "sum",
+    "kick_return_TD": "sum",
+    "kick_return_LONG": "max",
+    "punt_return_PR": "sum",
+    "punt_return_YDS": "sum",
+    "punt_return_TD": "sum",
+    "punt_return_LONG": "max",
+}
+
+TEAM_SEASON_STATS_COLUMNS = [
+    "season",
+    "league",
+    "team_id",
+    "games_played",
+    "total_drives",
+    "total_plays",
+    "total_yards",
+    "yards_per_play",
+    "redzone_TDs",
+    "redzone_attempts",
+    "turnovers",
+    "passing_COMP",
+    "passing_ATT",
+    "passing_COMP%",
+    "passing_YDS",
+    "passing_TD",
+    "passing_INT",
+    "passing_Y/A",
+    "passing_AY/A",
+    "passing_Y/C",
+    "passing_NFL_QBR",
+    "passing_CFB_QBR",
+    "rushing_ATT",
+    "rushing_YDS",
+    "rushing_TD",
+    "rushing_LONG",
+    "rushing_AVG",
+    "fumbles_FUM",
+    "fumbles_FUM_LOST",
+    "defense_TAK",
+    "defense_SOLO",
+    "defense_AST",
+    "defense_TFL",
+    "defense_SACKS",
+    "defense_INT",
+    "defense_PD",
+    "defense_TD",
+    "defense_FF",
+    "defense_FR",
+    "kicking_FGM",
+    "kicking_FGA",
+    "kicking_FG%",
+    "kicking_FG_LONG",
+    "punting_NO",
+    "punting_GROSS_YDS",
+    "punting_GROSS_AVG",
+    "punting_IN_20",
+    "punting_IN_20%",
+    "punting_TB",
+    "punting_TB%",
+    "punting_LONG",
+    "punting_BLK",
+    "kick_return_KR",
+    "kick_return_YDS",
+    "kick_return_AVG",
+    "kick_return_LONG",
+    "kick_return_TD",
+    "punt_return_PR",
+    "punt_return_YDS",
+    "punt_return_AVG",
+    "punt_return_LONG",
+    "punt_return_TD",
+    "last_updated",
+]
+
+
+# How every rate stat in season stats is calculated,
+# in the order they're calculated in.
+# Each rate stat maps to
+# `(numerator, denominator, offset, scale, clamp, decimals)`:
+# - The numerator is a `tuple` of `(column, weight)` pairs,
+#   which are multiplied and added together.
+#   A column can be an earlier rate stat.
+# - The denominator is a column (players/teams without a denominator
+#   above `0` get `NaN`), or a number.
+# - The result is `((numerator / denominator) + offset) * scale`.
+# - The clamp is `(low, high)`, or `None`.
+# - The result is rounded to `decimals` decimals (`None` to not round).
+SEASON_RATE_STATS = {
+    "yards_per_play": (
+        (("total_yards", 1),), "total_plays", 0, 1, None, None
+    ),
+    # Passing
+    "passing_COMP%": ((("passing_COMP", 1),), "passing_ATT", 0, 1, None, 4),
+    "passing_Y/A": ((("passing_YDS", 1),), "passing_ATT", 0, 1, None, 3),
+    "passing_AY/A": (
+        (("passing_YDS", 1), ("passing_TD", 20), ("passing_INT", -45)),
+        "passing_ATT", 0, 1, None, 3
+    ),
+    "passing_Y/C": ((("passing_YDS", 1),), "passing_COMP", 0, 1, None, 3),
+    # NFL Passer Rating segments.
+    # Clamping each segment between 0 and 2.375
+    # is a required step in the formula.
+    "passing_NFL_QBR_A": (
+        (("passing_COMP", 1),), "passing_ATT", -0.3, 5, (0, 2.375), None
+    ),
+    "passing_NFL_QBR_B": (
+        (("passing_YDS", 1),), "passing_ATT", -3, 0.25, (0, 2.375), None
+    ),
+    "passing_NFL_QBR_C": (
+        (("passing_TD", 1),), "passing_ATT", 0, 20, (0, 2.375), None
+    ),
+    "passing_NFL_QBR_D": (
+        (("passing_INT", -25),), "passing_ATT", 2.375, 1, (0, 2.375), None
+    ),
+    "passing_NFL_QBR": (
+        (
+            ("passing_NFL_QBR_A", 1),
+            ("passing_NFL_QBR_B", 1),
+            ("passing_NFL_QBR_C", 1),
+            ("passing_NFL_QBR_D", 1),
+        ),
+        6, 0, 100, None, 3
+    ),
+    "passing_CFB_QBR": (
+        (
+            ("passing_YDS", 8.4),
+            ("passing_COMP", 100),
+            ("passing_TD", 330),
+            ("passing_INT", -200),
+        ),
+        "passing_ATT", 0, 1, None, 3
+    ),
+    # Rushing
+    "rushing_AVG": ((("rushing_YDS", 1),), "rushing_ATT", 0, 1, None, 3),
+    # Receiving
+    "receiving_AVG": (
+        (("receiving_YDS", 1),), "receiving_REC", 0, 1, None, 3
+    ),
+    "receiving_CATCH%": (
+        (("receiving_REC", 1),), "receiving_TGT", 0, 1, None, 4
+    ),
+    "receiving_YDS/TGT": (
+        (("receiving_YDS", 1),), "receiving_TGT", 0, 1, None, 3
+    ),
+    # Kicking
+    "kicking_FG%": ((("kicking_FGM", 1),), "kicking_FGA", 0, 1, None, 4),
+    # Punting
+    "punting_GROSS_AVG": (
+        (("punting_GROSS_YDS", 1),), "punting_NO", 0, 1, None, 3
+    ),
+    "punting_TB%": ((("punting_TB", 1),), "punting_NO", 0, 1, None, 4),
+    "punting_IN_20%": (
+        (("punting_IN_20", 1),), "punting_NO", 0, 1, None, 4
+    ),
+    # Returns
+    "kick_return_AVG": (
+        (("kick_return_YDS", 1),), "kick_return_KR", 0, 1, None, 3
+    ),
+    "punt_return_AVG": (
+        (("punt_return_YDS", 1),), "punt_return_PR", 0, 1, None, 3
+    ),
+}
+
+
+def get_season_stats_settings(stats_type: str) -> tuple:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Gets what player (`stats_type="player"`)
+    or team (`stats_type="team"`) season stats are grouped by,
+    how each stat is aggregated, the dtypes of the game stats
+    they're made from, and the columns in season stats
+    (in that order).
+    """
+    if stats_type == "player":
+        return (
+            PLAYER_SEASON_STATS_KEYS,
+            PLAYER_SEASON_STATS_AGG,
+            GAME_STATS_ID_DTYPES | PLAYER_GAME_STATS_DTYPES,
+            PLAYER_SEASON_STATS_COLUMNS,
+        )
+    elif stats_type == "team":
+        return (
+            TEAM_SEASON_STATS_KEYS,
+            TEAM_SEASON_STATS_AGG,
+            GAME_STATS_ID_DTYPES | TEAM_GAME_STATS_DTYPES,
+            TEAM_SEASON_STATS_COLUMNS,
+        )
+    raise ValueError(f"Unhandled stats type {stats_type}")
+
+
+def aggregate_season_stats(
+    game_stats_df: pd.DataFrame,
+    group_keys: list,
+    agg: dict,
+) -> pd.DataFrame:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Adds up game stats into season stats (see `PLAYER_SEASON_STATS_AGG`),
+    and counts the games played.
+    Rate stats aren't calculated here.
+    """
+    final_df = game_stats_df.groupby(
+        group_keys,
         group_keys=False,
         as_index=False,
-    ).agg(
-        {
-            "game_id": "count",
-            "passing_COMP": "sum",
-            "passing_ATT": "sum",
-            "passing_YDS": "sum",
-            "passing_TD": "sum",
-            "passing_INT": "sum",
-            "rushing_ATT": "sum",
-            "rushing_YDS": "sum",
-            "rushing_TD": "sum",
-            "rushing_LONG": "max",
-            "receiving_TGT": "sum",
-            "receiving_REC": "sum",
-            "receiving_YDS": "sum",
-            "receiving_TD": "sum",
-            "receiving_LONG": "max",
-            "fumbles_FUM": "sum",
-            "fumbles_FUM_LOST": "sum",
-            "defense_TAK": "sum",
-            "defense_SOLO": "sum",
-            "defense_AST": "sum",
-            "defense_TFL": "sum",
-            "defense_SACKS": "sum",
-            "defense_INT": "sum",
-            "defense_PD": "sum",
-            "defense_TD": "sum",
-            "defense_FF": "sum",
-            "defense_FR": "sum",
-            "kicking_FGM": "sum",
-            "kicking_FGA": "sum",
-            "kicking_FG_LONG": "max",
-            "punting_NO": "sum",
-            "punting_GROSS_YDS": "sum",
-            "punting_IN_20": "sum",
-            "punting_TB": "sum",
-            "punting_LONG": "max",
-            "punting_BLK": "sum",
-            "kick_return_KR": "sum",
-            "kick_return_YDS": "sum",
-            "kick_return_LONG": "max",
-            "kick_return_TD": "sum",
-            "punt_return_PR": "sum",
-            "punt_return_YDS": "sum",
-            "punt_return_LONG": "max",
-            "punt_return_TD": "sum",
-        }
-    )
+    ).agg({"game_id": "count"} | agg)
 
     final_df.rename(columns={"game_id": "games_played"}, inplace=True)
-    final_df.loc[final_df["passing_ATT"] > 0, "passing_COMP%"] = (
-        final_df["passing_COMP"] / final_df["passing_ATT"]
-    )
-    final_df.loc[final_df["passing_ATT"] > 0, "passing_Y/A"] = (
-        final_df["passing_YDS"] / final_df["passing_ATT"]
+    # Season totals don't always fit in the dtypes used for game stats.
+    final_df = final_df.astype({x: "float64" for x in agg})
+    return final_df
+
+
+def calculate_rate_stats(
+    final_df: pd.DataFrame,
+    columns: list,
+) -> pd.DataFrame:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Calculates every rate stat in `SEASON_RATE_STATS`
+    that is in `columns` (or that another rate stat needs),
+    from the season totals in `final_df`.
+
+    Returns
+    ----------
+    `final_df`, with every rate stat calculated and rounded,
+    and only the columns in `columns` (in that order).
+    """
+    rate_columns = {x for x in SEASON_RATE_STATS if x in columns}
+    # Season totals the rate stats in `columns` need,
+    # and any rate stat they're calculated from.
+    input_columns = set()
+    for column, (terms, denominator, _, _, _, _) in reversed(
+        SEASON_RATE_STATS.items()
+    ):
+        if column not in rate_columns:
+            continue
+
+        for x in [y for y, _ in terms] + [denominator]:
+            if x in SEASON_RATE_STATS:
+                rate_columns.add(x)
+            elif isinstance(x, str):
+                input_columns.add(x)
+
+    stats = {
+        x: final_df[x].to_numpy(dtype="float64", na_value=np.nan)
+        for x in input_columns
+    }
+    rate_stats = {}
+
+    for column, (
+        terms, denominator, offset, scale, clamp, decimals
+    ) in SEASON_RATE_STATS.items():
+        if column not in rate_columns:
+            continue
+
+        numerator = stats[terms[0][0]] * terms[0][1]
+        for term, weight in terms[1:]:
+            numerator = numerator + (stats[term] * weight)
+
+        if isinstance(denominator, str):
+            values = np.divide(
+                numerator,
+                stats[denominator],
+                out=np.full(len(final_df), np.nan),
+                where=stats[denominator] > 0
+            )
+        else:
+            values = numerator / denominator
+
+        values = (values + offset) * scale
+        if clamp is not None:
+            values = np.clip(values, *clamp)
+
+        stats[column] = values
+        if column in columns:
+            rate_stats[column] = (
+                np.round(values, decimals)
+                if decimals is not None else values
+            )
+
+    final_df = final_df.drop(
+        columns=[x for x in rate_stats if x in final_df.columns]
     )
-    final_df.loc[final_df["passing_ATT"] > 0, "passing_AY/A"] = (
-        final_df["passing_YDS"]
-        + (final_df["passing_TD"] * 20)
-        - (final_df["passing_INT"] * 45)
-    ) / final_df["passing_ATT"]
-    final_df.loc[final_df["passing_COMP"] > 0, "passing_Y/C"] = (
-        final_df["passing_YDS"] / final_df["passing_COMP"]
+    final_df = pd.concat(
+        [final_df, pd.DataFrame(rate_stats, index=final_df.index)],
+        axis=1
     )
+    return final_df.reindex(columns=columns)
 
-    # NFL Passer Rating segments
-    final_df.loc[final_df["passing_ATT"] > 0, "passing_NFL_QBR_A"] = (
-        (final_df["passing_COMP"] / final_df["passing_ATT"]) - 0.3
-    ) * 5
-    final_df.loc[final_df["passing_ATT"] > 0, "passing_NFL_QBR_B"] = (
-        (final_df["passing_YDS"] / final_df["passing_ATT"]) - 3
-    ) * 0.25
-    final_df.loc[final_df["passing_ATT"] > 0, "passing_NFL_QBR_C"] = (
-        final_df["passing_TD"] / final_df["passing_ATT"]
-    ) * 20
-    final_df.loc[final_df["passing_ATT"] > 0, "passing_NFL_QBR_D"] = 2.375 - (
-        (final_df["passing_INT"] / final_df["passing_ATT"]) * 25
-    )
 
-    # Yes, this is a required step in the formula.
-    final_df.loc[
-        final_df["passing_NFL_QBR_A"] > 2.375, "passing_NFL_QBR_A"
-    ] = 2.375
-    final_df.loc[
-        final_df["passing_NFL_QBR_A"] > 2.375, "passing_NFL_QBR_B"
-    ] = 2.375
-    final_df.loc[
-        final_df["passing_NFL_QBR_C"] > 2.375, "passing_NFL_QBR_C"
-    ] = 2.375
-    final_df.loc[
-        final_df["passing_NFL_QBR_D"] > 2.375, "passing_NFL_QBR_D"
-    ] = 2.375
-
-    # See above comment.
-    final_df.loc[final_df["passing_NFL_QBR_A"] < 0, "passing_NFL_QBR_A"] = 0
-    final_df.loc[final_df["passing_NFL_QBR_A"] < 0, "passing_NFL_QBR_B"] = 0
-    final_df.loc[final_df["passing_NFL_QBR_C"] < 0, "passing_NFL_QBR_C"] = 0
-    final_df.loc[final_df["passing_NFL_QBR_D"] < 0, "passing_NFL_QBR_D"] = 0
-
-    final_df.loc[final_df["passing_ATT"] > 0, "passing_NFL_QBR"] = (
-        (
-            final_df["passing_NFL_QBR_A"]
-            + final_df["passing_NFL_QBR_B"]
-            + final_df["passing_NFL_QBR_C"]
-            + final_df["passing_NFL_QBR_D"]
+def load_game_stats(
+    season: int,
+    stats_type: str,
+    columns: list,
+    dtypes: dict,
+) -> pd.DataFrame:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Loads only `columns` from a season's player (`stats_type="player"`)
+    or team (`stats_type="team"`) game stats.
+
+    The `.parquet` file is used if it exists,
+    and the `.csv` file (read with `dtypes`) if not.
+    Columns that aren't in that file (ex. `last_updated`
+    in older team game stats) are skipped.
+    """
+    file_path = f"game_stats/{stats_type}/{season}_ufl_{stats_type}" + \
+        "_game_stats"
+
+    if exists(f"{file_path}.parquet"):
+        file_columns = read_schema(f"{file_path}.parquet").names
+        game_stats_df = pd.read_parquet(
+            f"{file_path}.parquet",
+            columns=[x for x in columns if x in file_columns]
+        )
+    else:
+        logging.info(
+            f"`{file_path}.parquet` isn't on this computer, "
+            + f"loading `{file_path}.csv` instead."
+        )
+        game_stats_df = pd.read_csv(
+            f"{file_path}.csv",
+            usecols=lambda x: x in columns,
+            dtype={x: y for x, y in dtypes.items() if x in columns}
         )
-        / 6
-    ) * 100
-
-    final_df.loc[final_df["passing_ATT"] > 0, "passing_CFB_QBR"] = (
-        (final_df["passing_YDS"] * 8.4)
-        + (final_df["passing_COMP"] * 100)
-        + (final_df["passing_TD"] * 330)
-        - (final_df["passing_INT"] * 200)
-    ) / final_df["passing_ATT"]
-
-    final_df.loc[final_df["rushing_ATT"] > 0, "rushing_AVG"] = (
-        final_df["rushing_YDS"] / final_df["rushing_ATT"]
-    )
 
-    final_df.loc[final_df["receiving_REC"] > 0, "receiving_AVG"] = (
-        final_df["receiving_YDS"] / final_df["receiving_REC"]
+    # Older `.parquet` files weren't saved with these dtypes.
+    return game_stats_df.astype(
+        {x: y for x, y in dtypes.items() if x in game_stats_df.columns}
     )
 
-    final_df.loc[final_df["receiving_TGT"] > 0, "receiving_CATCH%"] = (
-        final_df["receiving_REC"] / final_df["receiving_TGT"]
-    )
 
-    final_df.loc[final_df["receiving_TGT"] > 0, "receiving_YDS/TGT"] = (
-        final_df["receiving_YDS"] / final_df["receiving_TGT"]
-    )
+def update_season_stats(
+    game_stats_df: pd.DataFrame,
+    previous_df: pd.DataFrame,
+    state_df: pd.DataFrame,
+    group_keys: list,
+    agg: dict,
+    columns: list,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    DO NOT CALL DIRECTLY!
 
-    final_df.loc[final_df["kicking_FGA"] > 0, "kicking_FG%"] = (
-        final_df["kicking_FGM"] / final_df["kicking_FGA"]
-    )
+    Applies every game that was added or changed
+    since the last time season stats were made.
 
-    final_df.loc[final_df["punting_NO"] > 0, "punting_GROSS_AVG"] = (
-        final_df["punting_GROSS_YDS"] / final_df["punting_NO"]
-    )
+    Games are told apart by their `game_id` and `last_updated`.
+    A changed (or removed) game is taken back out of the running totals
+    using the rows it was added with (kept in `state_df`),
+    and the new version of that game is added in.
+    "max" stats can't be taken back out,
+    so they're found again from `state_df`, but only for the
+    players (or teams) in those games.
+    Rate stats are only recalculated for those players (or teams).
 
-    final_df.loc[final_df["punting_NO"] > 0, "punting_TB%"] = (
-        final_df["punting_TB"] / final_df["punting_NO"]
-    )
+    Returns
+    ----------
+    A `tuple` with the updated season stats, and the updated `state_df`
+    (in that order).
+    Both are `None` if no games have changed.
+    """
+    sum_columns = [x for x, y in agg.items() if y == "sum"]
+    max_columns = [x for x, y in agg.items() if y == "max"]
 
-    final_df.loc[final_df["punting_NO"] > 0, "punting_IN_20%"] = (
-        final_df["punting_IN_20"] / final_df["punting_NO"]
+    current_games = dict(
+        zip(game_stats_df["game_id"], game_stats_df["last_updated"])
     )
+    applied_games = dict(zip(state_df["game_id"], state_df["last_updated"]))
 
-    final_df.loc[final_df["kick_return_KR"] > 0, "kick_return_AVG"] = (
-        final_df["kick_return_YDS"] / final_df["kick_return_KR"]
-    )
+    changed_game_ids = [
+        x for x, y in current_games.items() if applied_games.get(x) != y
+    ]
+    removed_game_ids = [x for x in applied_games if x not in current_games]
 
-    final_df.loc[final_df["punt_return_PR"] > 0, "punt_return_AVG"] = (
-        final_df["punt_return_YDS"] / final_df["punt_return_PR"]
-    )
-    final_df = final_df.reindex(columns=columns)
-
-    final_df = final_df.round(
-        {
-            "passing_COMP%": 4,
-            "passing_Y/A": 3,
-            "passing_AY/A": 3,
-            "passing_Y/C": 3,
-            "passing_NFL_QBR": 3,
-            "passing_CFB_QBR": 3,
-            "rushing_AVG": 3,
-            "receiving_AVG": 3,
-            "receiving_CATCH%": 4,
-            "receiving_YDS/TGT": 3,
-            "kicking_FG%": 4,
-            "punting_GROSS_AVG": 3,
-            "punting_IN_20%": 4,
-            "punting_TB%": 4,
-            "kick_return_AVG": 3,
-            "punt_return_AVG": 3,
-        }
-    )
-    final_df["last_updated"] = datetime.now(UTC).isoformat()
-    print(final_df)
-    final_df.to_csv(
-        f"season_stats/player/{season}_ufl_player_season_stats.csv",
-        index=False
-    )
-    final_df.to_parquet(
-        f"season_stats/player/{season}_ufl_player_season_stats.parquet",
-        index=False
+    if len(changed_game_ids) == 0 and len(removed_game_ids) == 0:
+        return None, None
+
+    logging.info(
+        f"Applying {len(changed_game_ids)} new or changed games, "
+        + f"and removing {len(removed_game_ids)} games."
     )
-    # print(base_df.columns)
-
-
-def parse_ufl_team_season_stats(season: int):
-    """ """
-    columns = [
-        "season",
-        "league",
-        "team_id",
-        "games_played",
-        "total_drives",
-        "total_plays",
-        "total_yards",
-        "yards_per_play",
-        "redzone_TDs",
-        "redzone_attempts",
-        "turnovers",
-        "passing_COMP",
-        "passing_ATT",
-        "passing_COMP%",
-        "passing_YDS",
-        "passing_TD",
-        "passing_INT",
-        "passing_Y/A",
-        "passing_AY/A",
-        "passing_Y/C",
-        "passing_NFL_QBR",
-        "passing_CFB_QBR",
-        "rushing_ATT",
-        "rushing_YDS",
-        "rushing_TD",
-        "rushing_LONG",
-        "rushing_AVG",
-        "fumbles_FUM",
-        "fumbles_FUM_LOST",
-        "defense_TAK",
-        "defense_SOLO",
-        "defense_AST",
-        "defense_TFL",
-        "defense_SACKS",
-        "defense_INT",
-        "defense_PD",
-        "defense_TD",
-        "defense_FF",
-        "defense_FR",
-        "kicking_FGM",
-        "kicking_FGA",
-        "kicking_FG%",
-        "kicking_FG_LONG",
-        "punting_NO",
-        "punting_GROSS_YDS",
-        "punting_GROSS_AVG",
-        "punting_IN_20",
-        "punting_IN_20%",
-        "punting_TB",
-        "punting_TB%",
-        "punting_LONG",
-        "punting_BLK",
-        "kick_return_KR",
-        "kick_return_YDS",
-        "kick_return_AVG",
-        "kick_return_LONG",
-        "kick_return_TD",
-        "punt_return_PR",
-        "punt_return_YDS",
-        "punt_return_AVG",
-        "punt_return_LONG",
-        "punt_return_TD",
-        "last_updated",
-    ]
-    base_df = pd.read_csv(f"game_stats/team/{season}_ufl_team_game_stats.csv")
 
-    # base_df["time_of_possession"] = pd.to_datetime(
-    #     base_df["time_of_possession"],
-    #     format="%M:%S"
-    # ).dt.time
+    old_rows_df = state_df[
+        state_df["game_id"].isin(changed_game_ids + removed_game_ids)
+    ]
+    new_rows_df = game_stats_df[
+        game_stats_df["game_id"].isin(changed_game_ids)
+    ][state_df.columns]
 
-    # base_df["TOP"] = base_df["time_of_possession"].dt.total_seconds()
-    final_df = base_df.groupby(
+    state_df = pd.concat(
         [
-            "season",
-            "league",
-            "team_id",
+            state_df[
+                ~state_df["game_id"].isin(changed_game_ids + removed_game_ids)
+            ],
+            new_rows_df,
         ],
-        group_keys=False,
-        as_index=False,
-    ).agg(
-        {
-            # "TOP": "sum",
-            "game_id": "count",
-            "total_drives": "sum",
-            "total_plays": "sum",
-            "total_yards": "sum",
-            # "yards_per_play",
-            "redzone_TDs": "sum",
-            "redzone_attempts": "sum",
-            "turnovers": "sum",
-            "passing_COMP": "sum",
-            "passing_ATT": "sum",
-            "passing_YDS": "sum",
-            "passing_TD": "sum",
-            "passing_INT": "sum",
-            "rushing_ATT": "sum",
-            "rushing_YDS": "sum",
-            "rushing_TD": "sum",
-            "rushing_LONG": "max",
-            "fumbles_FUM": "sum",
-            "fumbles_FUM_LOST": "sum",
-            "defense_TAK": "sum",
-            "defense_SOLO": "sum",
-            "defense_AST": "sum",
-            "defense_TFL": "sum",
-            "defense_SACKS": "sum",
-            "defense_INT": "sum",
-            "defense_PD": "sum",
-            "defense_TD": "sum",
-            "defense_FF": "sum",
-            "defense_FR": "sum",
-            "kicking_FGM": "sum",
-            "kicking_FGA": "sum",
-            "kicking_FG_LONG": "max",
-            "punting_NO": "sum",
-            "punting_GROSS_YDS": "sum",
-            # "punting_AVG",
-            "punting_IN_20": "sum",
-            "punting_TB": "sum",
-            "punting_BLK": "sum",
-            "punting_LONG": "max",
-            "kick_return_KR": "sum",
-            "kick_return_YDS": "sum",
-            "kick_return_TD": "sum",
-            "kick_return_LONG": "max",
-            "punt_return_PR": "sum",
-            "punt_return_YDS": "sum",
-            "punt_return_TD": "sum",
-            "punt_return_LONG": "max",
-        }
+        ignore_index=True
     )
-    final_df.rename(columns={"game_id": "games_played"}, inplace=True)
 
-    final_df.loc[final_df["total_plays"] > 0, "yards_per_play"] = (
-        final_df["total_yards"] / final_df["total_plays"]
+    # Each game adds one game played (and its stats) to a running total,
+    # and each old version of a game takes them back out.
+    delta_df = pd.concat(
+        [
+            new_rows_df[group_keys + sum_columns].assign(games_played=1),
+            old_rows_df[group_keys].assign(
+                **{x: -old_rows_df[x].astype("float64") for x in sum_columns},
+                games_played=-1
+            ),
+        ],
+        ignore_index=True
+    ).groupby(group_keys)[["games_played"] + sum_columns].sum()
+
+    totals_df = previous_df.set_index(group_keys).reindex(delta_df.index)[
+        ["games_played"] + sum_columns
+    ].fillna(0) + delta_df
+
+    max_df = state_df.merge(
+        delta_df.index.to_frame(index=False),
+        how="inner",
+        on=group_keys
+    ).groupby(group_keys)[max_columns].max()
+
+    updated_df = totals_df.join(max_df).reset_index()
+    # Players (or teams) without any games left are removed.
+    updated_df = updated_df[updated_df["games_played"] > 0]
+    updated_df = updated_df.astype(
+        {"games_played": "int64"} | {x: "float64" for x in agg}
     )
+    updated_df = calculate_rate_stats(updated_df, columns)
+    updated_df["last_updated"] = datetime.now(UTC).isoformat()
 
-    final_df.loc[final_df["passing_ATT"] > 0, "passing_COMP%"] = (
-        final_df["passing_COMP"] / final_df["passing_ATT"]
+    final_df = previous_df.merge(
+        delta_df.index.to_frame(index=False),
+        how="left",
+        on=group_keys,
+        indicator=True
     )
-    final_df.loc[final_df["passing_ATT"] > 0, "passing_Y/A"] = (
-        final_df["passing_YDS"] / final_df["passing_ATT"]
+    final_df = final_df[final_df["_merge"] == "left_only"].drop(
+        columns=["_merge"]
     )
-    final_df.loc[final_df["passing_ATT"] > 0, "passing_AY/A"] = (
-        final_df["passing_YDS"]
-        + (final_df["passing_TD"] * 20)
-        - (final_df["passing_INT"] * 45)
-    ) / final_df["passing_ATT"]
-    final_df.loc[final_df["passing_COMP"] > 0, "passing_Y/C"] = (
-        final_df["passing_YDS"] / final_df["passing_COMP"]
+    final_df = pd.concat([final_df, updated_df], ignore_index=True)
+    # Sorted the same way `aggregate_season_stats()` sorts season stats.
+    final_df = final_df.sort_values(by=group_keys, ignore_index=True)
+    final_df = final_df.reindex(columns=previous_df.columns)
+
+    return final_df, state_df
+
+
+def parse_ufl_season_stats(
+    season: int,
+    stats_type: str,
+    incremental: bool = False,
+) -> pd.DataFrame:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Makes player (`stats_type="player"`) or team (`stats_type="team"`)
+    season stats. See `parse_ufl_player_season_stats()`.
+    """
+    group_keys, agg, dtypes, columns = get_season_stats_settings(
+        stats_type
     )
 
-    # NFL Passer Rating segments
-    final_df.loc[final_df["passing_ATT"] > 0, "passing_NFL_QBR_A"] = (
-        (final_df["passing_COMP"] / final_df["passing_ATT"]) - 0.3
-    ) * 5
-    final_df.loc[final_df["passing_ATT"] > 0, "passing_NFL_QBR_B"] = (
-        (final_df["passing_YDS"] / final_df["passing_ATT"]) - 3
-    ) * 0.25
-    final_df.loc[final_df["passing_ATT"] > 0, "passing_NFL_QBR_C"] = (
-        final_df["passing_TD"] / final_df["passing_ATT"]
-    ) * 20
-    final_df.loc[final_df["passing_ATT"] > 0, "passing_NFL_QBR_D"] = 2.375 - (
-        (final_df["passing_INT"] / final_df["passing_ATT"]) * 25
+    file_path = f"season_stats/{stats_type}/{season}_ufl_{stats_type}" + \
+        "_season_stats"
+    state_path = f"{SEASON_STATS_STATE_DIR}/{season}_ufl_{stats_type}" + \
+        "_season_stats_state.parquet"
+
+    base_df = load_game_stats(
+        season=season,
+        stats_type=stats_type,
+        columns=group_keys + ["game_id", "last_updated"] + list(agg),
+        dtypes=dtypes
     )
+    # Rows without one of these aren't in season stats
+    # (`groupby()` drops them), so they aren't kept in the state either.
+    base_df = base_df.dropna(subset=group_keys)
 
-    # Yes, this is a required step in the formula.
-    final_df.loc[
-        final_df["passing_NFL_QBR_A"] > 2.375, "passing_NFL_QBR_A"
-    ] = 2.375
-    final_df.loc[
-        final_df["passing_NFL_QBR_A"] > 2.375, "passing_NFL_QBR_B"
-    ] = 2.375
-    final_df.loc[
-        final_df["passing_NFL_QBR_C"] > 2.375, "passing_NFL_QBR_C"
-    ] = 2.375
-    final_df.loc[
-        final_df["passing_NFL_QBR_D"] > 2.375, "passing_NFL_QBR_D"
-    ] = 2.375
-
-    # See above comment.
-    final_df.loc[final_df["passing_NFL_QBR_A"] < 0, "passing_NFL_QBR_A"] = 0
-    final_df.loc[final_df["passing_NFL_QBR_A"] < 0, "passing_NFL_QBR_B"] = 0
-    final_df.loc[final_df["passing_NFL_QBR_C"] < 0, "passing_NFL_QBR_C"] = 0
-    final_df.loc[final_df["passing_NFL_QBR_D"] < 0, "passing_NFL_QBR_D"] = 0
-
-    final_df.loc[final_df["passing_ATT"] > 0, "passing_NFL_QBR"] = (
-        (
-            final_df["passing_NFL_QBR_A"]
-            + final_df["passing_NFL_QBR_B"]
-            + final_df["passing_NFL_QBR_C"]
-            + final_df["passing_NFL_QBR_D"]
+    final_df = None
+    state_df = None
+
+    if incremental is True and "last_updated" not in base_df.columns:
+        logging.warning(
+            f"The {season} UFL {stats_type} game stats don't have a "
+            + "`last_updated` column, making season stats from scratch."
+        )
+    elif (
+        incremental is True and
+        exists(f"{file_path}.parquet") and
+        exists(state_path)
+    ):
+        final_df, state_df = update_season_stats(
+            game_stats_df=base_df,
+            previous_df=pd.read_parquet(f"{file_path}.parquet"),
+            state_df=pd.read_parquet(state_path),
+            group_keys=group_keys,
+            agg=agg,
+            columns=columns,
         )
-        / 6
-    ) * 100
-
-    final_df.loc[final_df["passing_ATT"] > 0, "passing_CFB_QBR"] = (
-        (final_df["passing_YDS"] * 8.4)
-        + (final_df["passing_COMP"] * 100)
-        + (final_df["passing_TD"] * 330)
-        - (final_df["passing_INT"] * 200)
-    ) / final_df["passing_ATT"]
-
-    final_df.loc[final_df["rushing_ATT"] > 0, "rushing_AVG"] = (
-        final_df["rushing_YDS"] / final_df["rushing_ATT"]
-    )
 
-    final_df.loc[final_df["kicking_FGA"] > 0, "kicking_FG%"] = (
-        final_df["kicking_FGM"] / final_df["kicking_FGA"]
-    )
+        if final_df is None:
+            logging.info(
+                f"No {season} UFL games have changed "
+                + "since season stats were last made."
+            )
+            return pd.read_parquet(f"{file_path}.parquet")
+    elif incremental is True:
+        logging.warning(
+            f"The {season} UFL {stats_type} season stats aren't saved "
+            + "on this computer, making season stats from scratch."
+        )
 
-    final_df.loc[final_df["punting_NO"] > 0, "punting_GROSS_AVG"] = (
-        final_df["punting_GROSS_YDS"] / final_df["punting_NO"]
-    )
+    if final_df is None:
+        final_df = aggregate_season_stats(
+            game_stats_df=base_df,
+            group_keys=group_keys,
+            agg=agg
+        )
+        final_df = calculate_rate_stats(final_df, columns)
+        final_df["last_updated"] = datetime.now(UTC).isoformat()
+
+        if "last_updated" in base_df.columns:
+            state_df = base_df[
+                group_keys + ["game_id", "last_updated"] + list(agg)
+            ]
+
+    print(final_df)
+    final_df.to_csv(f"{file_path}.csv", index=False)
+    final_df.to_parquet(f"{file_path}.parquet", index=False)
+
+    if state_df is not None:
+        makedirs(SEASON_STATS_STATE_DIR, exist_ok=True)
+        state_df.to_parquet(state_path, index=False)
+
+    return final_df
+
+
+def aggregate_weekly_season_stats(
+    game_stats_df: pd.DataFrame,
+    group_keys: list,
+    agg: dict,
+) -> pd.DataFrame:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Makes season-to-date totals for every player (or team),
+    as of every week in `game_stats_df["week"]`.
+
+    Game stats are grouped by week once,
+    and then every week is added to the weeks before it
+    (`cumsum()` for "sum" stats, `cummax()` for "max" stats).
+    Players (or teams) get a row for every week
+    after their first game, even if they didn't play that week.
+    Rate stats aren't calculated here.
+    """
+    sum_columns = [x for x, y in agg.items() if y == "sum"]
+    max_columns = [x for x, y in agg.items() if y == "max"]
 
-    final_df.loc[final_df["punting_NO"] > 0, "punting_TB%"] = (
-        final_df["punting_TB"] / final_df["punting_NO"]
+    weekly_df = aggregate_season_stats(
+        game_stats_df=game_stats_df,
+        group_keys=group_keys + ["week"],
+        agg=agg
     )
+    weekly_df["key_id"] = weekly_df.groupby(group_keys).ngroup()
 
-    final_df.loc[final_df["punting_NO"] > 0, "punting_IN_20%"] = (
-        final_df["punting_IN_20"] / final_df["punting_NO"]
+    keys_df = weekly_df.drop_duplicates(subset=["key_id"])[
+        ["key_id"] + group_keys
+    ]
+    weeks_arr = np.sort(weekly_df["week"].unique())
+
+    weekly_df = weekly_df.set_index(["key_id", "week"])[
+        ["games_played"] + sum_columns + max_columns
+    ].reindex(
+        pd.MultiIndex.from_product(
+            [keys_df["key_id"], weeks_arr], names=["key_id", "week"]
+        )
     )
 
-    final_df.loc[final_df["kick_return_KR"] > 0, "kick_return_AVG"] = (
-        final_df["kick_return_YDS"] / final_df["kick_return_KR"]
+    totals_df = weekly_df[["games_played"] + sum_columns].fillna(0).groupby(
+        level="key_id"
+    ).cumsum()
+    # `-inf` stands in for "no stat yet",
+    # so a week without a stat keeps the best stat before it.
+    max_df = weekly_df[max_columns].fillna(-np.inf).groupby(
+        level="key_id"
+    ).cummax().replace(-np.inf, np.nan)
+
+    weekly_df = totals_df.join(max_df).reset_index()
+    weekly_df = weekly_df[weekly_df["games_played"] > 0]
+    weekly_df = keys_df.merge(weekly_df, how="inner", on="key_id")
+    weekly_df = weekly_df.drop(columns=["key_id"])
+    weekly_df = weekly_df.astype({"games_played": "int64"})
+    return weekly_df
+
+
+def parse_ufl_weekly_season_stats(
+    season: int,
+    stats_type: str,
+) -> pd.DataFrame:
+    """
+    DO NOT CALL DIRECTLY!
+
+    Makes weekly player (`stats_type="player"`)
+    or team (`stats_type="team"`) season-to-date stats.
+    See `parse_ufl_player_weekly_season_stats()`.
+    """
+    group_keys, agg, dtypes, columns = get_season_stats_settings(
+        stats_type
     )
+    weekly_columns = ["season", "week"] + [
+        x for x in columns if x != "season"
+    ]
 
-    final_df.loc[final_df["punt_return_PR"] > 0, "punt_return_AVG"] = (
-        final_df["punt_return_YDS"] / final_df["punt_return_PR"]
+    base_df = load_game_stats(
+        season=season,
+        stats_type=stats_type,
+        columns=group_keys + ["game_id"] + list(agg),
+        dtypes=dtypes
     )
-    final_df = final_df.reindex(columns=columns)
-
-    final_df = final_df.round(
-        {
-            "passing_COMP%": 4,
-            "passing_Y/A": 3,
-            "passing_AY/A": 3,
-            "passing_Y/C": 3,
-            "passing_NFL_QBR": 3,
-            "passing_CFB_QBR": 3,
-            "rushing_AVG": 3,
-            "kicking_FG%": 4,
-            "punting_GROSS_AVG": 3,
-            "punting_IN_20%": 4,
-            "punting_TB%": 4,
-            "kick_return_AVG": 3,
-            "punt_return_AVG": 3,
-        }
+    base_df = base_df.dropna(subset=group_keys)
+
+    schedule_df = get_ufl_schedule(season)
+    schedule_df = schedule_df.dropna(subset=["ufl_game_id"])
+    week_dict = dict(
+        zip(
+            schedule_df["ufl_game_id"].astype("int64"),
+            schedule_df["week_num"].astype("int64")
+        )
     )
-    final_df = final_df.reindex(columns=columns)
+    base_df["week"] = base_df["game_id"].map(week_dict)
+
+    if base_df["week"].isna().any():
+        logging.warning(
+            "These games aren't in the "
+            + f"{season} UFL schedule, and won't be in weekly stats: "
+            + f"{base_df.loc[base_df['week'].isna(), 'game_id'].unique()}"
+        )
+        base_df = base_df.dropna(subset=["week"])
+
+    base_df = base_df.astype({"week": "int64"})
 
+    final_df = aggregate_weekly_season_stats(
+        game_stats_df=base_df,
+        group_keys=group_keys,
+        agg=agg
+    )
+    final_df = calculate_rate_stats(final_df, weekly_columns)
     final_df["last_updated"] = datetime.now(UTC).isoformat()
-    print(final_df)
-    final_df.to_csv(
-        f"season_stats/team/{season}_ufl_team_season_stats.csv",
-        index=False
+
+    file_path = f"{SEASON_STATS_WEEKLY_DIR}/{season}_ufl_{stats_type}" + \
+        "_weekly_season_stats"
+
+    makedirs(SEASON_STATS_WEEKLY_DIR, exist_ok=True)
+    final_df.to_csv(f"{file_path}.csv", index=False)
+    final_df.to_parquet(f"{file_path}.parquet", index=False)
+
+    return final_df
+
+
+def parse_ufl_player_season_stats(
+    season: int,
+    incremental: bool = False,
+) -> pd.DataFrame:
+    """
+    Makes UFL player season stats from UFL player game stats
+    (`game_stats/player/{season}_ufl_player_game_stats.parquet`,
+    or the `.csv` file if that isn't on this computer),
+    and saves them to `season_stats/player/`.
+
+    Parameters
+    ----------
+
+    `season` (int, mandatory):
+        Mandatory argument.
+        Indicates the season you want UFL player season stats from.
+
+    `incremental` (bool, optional):
+        Optional argument.
+        If set to `True`, only games that were added or changed
+        since the last time season stats were made are applied
+        to the season stats that were already saved,
+        and only the players in those games are recalculated.
+        If those season stats aren't saved on this computer,
+        season stats are made from scratch.
+
+    Returns
+    ----------
+    A pandas `DataFrame` object with UFL player season stats.
+    """
+    return parse_ufl_season_stats(
+        season=season,
+        stats_type="player",
+        incremental=incremental
     )
-    final_df.to_parquet(
-        f"season_stats/team/{season}_ufl_team_season_stats.parquet",
-        index=False
+
+
+def parse_ufl_team_season_stats(
+    season: int,
+    incremental: bool = False,
+) -> pd.DataFrame:
+    """
+    Makes UFL team season stats from UFL team game stats
+    (`game_stats/team/{season}_ufl_team_game_stats.parquet`,
+    or the `.csv` file if that isn't on this computer),
+    and saves them to `season_stats/team/`.
+
+    Parameters
+    ----------
+
+    `season` (int, mandatory):
+        Mandatory argument.
+        Indicates the season you want UFL team season stats from.
+
+    `incremental` (bool, optional):
+        Optional argument.
+        If set to `True`, only games that were added or changed
+        since the last time season stats were made are applied
+        to the season stats that were already saved,
+        and only the teams in those games are recalculated.
+        If those season stats aren't saved on this computer,
+        season stats are made from scratch.
+
+    Returns
+    ----------
+    A pandas `DataFrame` object with UFL team season stats.
+    """
+    return parse_ufl_season_stats(
+        season=season,
+        stats_type="team",
+        incremental=incremental
     )
 
 
+def parse_ufl_player_weekly_season_stats(season: int) -> pd.DataFrame:
+    """
+    Makes UFL player season stats as of every week of a season
+    (ex. a player's passing yards through week 3),
+    and saves them to `season_stats/weekly/`.
+
+    Every player gets a row for every week after their first game.
+    Weeks come from the `week_num` column of the UFL schedule.
+
+    Parameters
+    ----------
+
+    `season` (int, mandatory):
+        Mandatory argument.
+        Indicates the season you want weekly UFL player season stats from.
+
+    Returns
+    ----------
+    A pandas `DataFrame` object with UFL player season stats,
+    with one row per player, per week.
+    """
+    return parse_ufl_weekly_season_stats(season=season, stats_type="player")
+
+
+def parse_ufl_team_weekly_season_stats(season: int) -> pd.DataFrame:
+    """
+    Makes UFL team season stats as of every week of a season
+    (ex. a team's passing yards through week 3),
+    and saves them to `season_stats/weekly/`.
+
+    Every team gets a row for every week after their first game.
+    Weeks come from the `week_num` column of the UFL schedule.
+
+    Parameters
+    ----------
+
+    `season` (int, mandatory):
+        Mandatory argument.
+        Indicates the season you want weekly UFL team season stats from.
+
+    Returns
+    ----------
+    A pandas `DataFrame` object with UFL team season stats,
+    with one row per team, per week.
+    """
+    return parse_ufl_weekly_season_stats(season=season, stats_type="team")
+
+
 if __name__ == "__main__":
     now = datetime.now()
     current_year = now.year
-    
+
     if now.month < 3:
         current_year -= 1
 
@@ -582,5 +1022,26 @@ if __name__ == "__main__":
     except Exception as e:
         logging.warning(f"Unhandled exception {e}")
 
-    parse_ufl_player_season_stats(current_year)
-    parse_ufl_team_season_stats(current_year)
+    parser = ArgumentParser()
+
+    parser.add_argument(
+        "--incremental", default=False, action=BooleanOptionalAction
+    )
+    parser.add_argument(
+        "--season", default=None, type=int
+    )
+    parser.add_argument(
+        "--weekly", default=False, action=BooleanOptionalAction
+    )
+
+    args = parser.parse_args()
+
+    if args.season is not None:
+        current_year = args.season
+
+    parse_ufl_player_season_stats(current_year, incremental=args.incremental)
+    parse_ufl_team_season_stats(current_year, incremental=args.incremental)
+
+    if args.weekly is True:
+        parse_ufl_player_weekly_season_stats(current_year)
+        parse_ufl_team_weekly_season_stats(current_year)
@@ -0,0 +1,452 @@
+"""
+# Creation Date: 10/18/2026 11:05 AM EDT
+# Last Updated Date: 10/18/2026 11:05 AM EDT
+# Author: Joseph Armstrong (armstrongjoseph08@gmail.com)
+# File Name: pbp_regex.py
+# Purpose: Holds the precompiled regular expressions
+    used to parse UFL play-by-play (PBP) descriptions.
+###############################################################################
+"""
+
+import re
+
+# Every pattern here is compiled once, when this module is imported.
+# Capture groups are named after the `parser()` column (or local variable)
+# they populate, so `parser()` can read them with `play_match["name"]`
+# instead of positional `play_arr[0][7]` indexing.
+# Groups that `parser()` never reads are non-capturing.
+#
+# Keys are built from the play description keywords that
+# `parser()` checks before it uses that pattern.
+# Keys that end with `_alt` are fallbacks, used when the first pattern
+# for that kind of play does not match.
+PBP_REGEX = {
+    # Yardlines (`get_yardline()` and `side_of_field`)
+    "yardline_number": re.compile(
+        r"(?P<yardline_number>[0-9]+)"
+    ),
+    "yardline_digits": re.compile(
+        r"[0-9\s]+"
+    ),
+    # Play descriptions
+    "fumbles_aborted": re.compile(
+        r"(?P<fumbled_2_player_name>[a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+ \(aborted\)\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[a-zA-Z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "timeout": re.compile(
+        r"Timeout #(?:[1-3]) by (?P<timeout_team>[a-zA-Z]+)\."
+    ),
+    "conversion_pass_catch_made_tackled": re.compile(
+        r"(?P<conversion_type>[A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. (?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) steps back to pass\. Catch made by (?P<receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) for yards\. Tackled by (?:[a-zA-Z\'\.\-\,\; ]+) at (?:[A-Za-z0-9\s]+)\. (?:[A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ (?P<conversion_result>[a-zA-Z]+)\."
+    ),
+    "conversion_pass_intercept_pushed_out_bounds": re.compile(
+        r"(?P<conversion_type>[A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. (?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) steps back to pass\. (?P<interception_player_name>[a-zA-Z\'\.\-\,\; ]+) intercepts the ball\. Pushed out of bounds by (?:[a-zA-Z\'\.\-\,\; ]+) at (?:[A-Za-z0-9\s]+)\. (?:[A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ (?P<conversion_result>[a-zA-Z]+)\. [DEFENSIVE|defensive]+ [CONVERSION|conversion]+ [RECOVERY|recovery]+ (?:[a-zA-Z]+)\."
+    ),
+    "conversion_pass_intercept_defensive_recovery_succeeds": re.compile(
+        r"(?P<conversion_type>[A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. (?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) steps back to pass\. (?P<interception_player_name>[a-zA-Z\'\.\-\,\; ]+) intercepts the ball\. (?:[A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ (?P<conversion_result>[a-zA-Z]+)\. [DEFENSIVE|defensive]+ [CONVERSION|conversion]+ [RECOVERY|recovery]+ (?P<defensive_conversion_result>[a-zA-Z]+)\."
+    ),
+    "conversion_pass_catch_made_pushed_out_bounds": re.compile(
+        r"(?P<conversion_type>[A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. (?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) steps back to pass\. Catch made by (?P<receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) for yards\. Pushed out of bounds by (?P<tacklers>[a-zA-Z\'\.\-\,\; ]+) at (?:[A-Z0-9 ]+)\. (?:[A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ (?P<conversion_result>[a-zA-Z]+)\."
+    ),
+    "conversion_pass_catch_made": re.compile(
+        r"(?P<conversion_type>[A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. (?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) steps back to pass\. Catch made by (?P<receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) for yards\. (?:[A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ (?P<conversion_result>[a-zA-Z]+)\."
+    ),
+    "conversion_pass_intercepts_ball_tackled_defensive_recovery": re.compile(
+        r"(?P<conversion_type>[A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. (?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) steps back to pass\. (?P<interception_player_name>[a-zA-Z\'\.\-\,\; ]+) intercepts the ball\. Tackled by at (?:[A-Za-z0-9\s]+)\. (?:[A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ (?P<conversion_result>[a-zA-Z]+)\. [DEFENSIVE|defensive]+ [CONVERSION|conversion]+ [RECOVERY|recovery]+ (?P<defensive_conversion_result>[A-Z]+)\."
+    ),
+    "conversion_rushed_up_middle_fumbles_forced_recovers_fumble_tackled_defensive_recovery": re.compile(
+        r"(?P<conversion_type>[A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. (?P<rusher_player_name>[a-zA-Z\'\.\-\, ]+) rushed up the middle to (?:[A-Za-z0-9\s]+) for yard[s]?\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\, ]+) [FUMBLES|fumbles]+\, forced by (?P<forced_fumble_player_1_player_name>[a-zA-Z\'\.\-\, ]+)\. (?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\, ]+) recovers the fumble\. Tackled by (?P<tacklers>[a-zA-Z\'\.\-\,\; ]+) at (?:[A-Za-z0-9\s]+)\. (?:[A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ (?P<conversion_result>[a-zA-Z]+)\. [DEFENSIVE|defensive]+ [CONVERSION|conversion]+ [RECOVERY|recovery]+ (?P<defensive_conversion_result>[A-Z]+)\."
+    ),
+    "conversion_rushed_up_middle_tackled": re.compile(
+        r"(?P<conversion_type>[A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. (?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed up the middle to (?:[A-Za-z0-9\s]+) for yard[s]?\. Tackled by (?:[a-zA-Z\'\.\-\,\; ]+) at (?:[A-Za-z0-9\s]+)\. (?:[A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ (?P<conversion_result>[a-zA-Z]+)\."
+    ),
+    "conversion_rushed_tackled": re.compile(
+        r"(?P<conversion_type>[A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. (?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed (?P<run_gap>[a-zA-Z]+) (?:[a-zA-Z]+) to (?:[A-Za-z0-9\s]+) for yard[s]?\. Tackled by (?:[a-zA-Z\;\'\.\-\, ]+) at (?:[A-Za-z0-9\s]+)\. (?:[A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ (?P<conversion_result>[a-zA-Z]+)\."
+    ),
+    "conversion_rushed_tackled_alt": re.compile(
+        r"(?P<conversion_type>[A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. (?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed to (?:[A-Za-z0-9\s]+) for yard[s]?\. Tackled by (?:[a-zA-Z\;\'\.\-\, ]+) at (?:[A-Za-z0-9\s]+)\. (?:[A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ (?P<conversion_result>[a-zA-Z]+)\."
+    ),
+    "conversion_rushed_up_middle": re.compile(
+        r"(?P<conversion_type>[A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. (?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed up the middle to (?:[A-Za-z0-9\s]+) for yard[s]?\. (?:[A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ (?P<conversion_result>[a-zA-Z]+)\."
+    ),
+    "conversion_rushed_pushed_out_bounds": re.compile(
+        r"(?P<conversion_type>[A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. (?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed to (?P<run_gap>[A-Za-z0-9\s]+) for yard[s]?\. Pushed out of bounds by (?:[a-zA-Z\;\'\.\-\, ]+) at (?:[A-Za-z0-9\s]+)\. (?:[A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ (?P<conversion_result>[a-zA-Z]+)\."
+    ),
+    "conversion_rushed": re.compile(
+        r"(?P<conversion_type>[A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. (?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed (?P<run_gap>[a-zA-Z]+) (?:[a-zA-Z]+) to (?:[A-Za-z0-9\s]+) for yard[s]?\. (?:[A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ (?P<conversion_result>[a-zA-Z]+)\."
+    ),
+    "conversion_rushed_alt": re.compile(
+        r"(?P<conversion_type>[A-Za-z ]+)\-? ?[POINT|point]+ [CONVERSION|conversion]+ [ATTEMPT|attempt]+\. (?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed to (?:[A-Za-z0-9\s]+) for yard[s]?\. (?:[A-Za-z ]+)\-? ?[POINT|point]+ [ATTEMPT|attempt]+ (?P<conversion_result>[a-zA-Z]+)\."
+    ),
+    "steps_back_pass_incomplete_intended": re.compile(
+        r"[PASS|pass]+ incomplete (?P<pass_length>[A-Za-z]+) (?P<pass_location>[A-Za-z]+) intended for (?P<receiver_player_name>[a-zA-Z\'\.\-\,\; ]+)"
+    ),
+    "steps_back_pass_incomplete_intended_2": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) steps back to pass\. Pass incomplete (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) intended for\."
+    ),
+    "steps_back_pass_incomplete": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) steps back to pass\. Pass incomplete (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) intended for \(?(?P<receiver_player_name>[a-zA-Z\'\.\-\,\; ]+)\)?\."
+    ),
+    "steps_back_pass_incomplete_alt": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) steps back to pass\. Pass incomplete (?P<pass_location>[a-zA-Z]+) intended for (?P<receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) \((?P<pass_defense_1_player_name>[a-zA-Z\'\.\-\,\; ]+)\)?\."
+    ),
+    "pass_complete_touchdown": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by (?P<receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) for yard[s]?\. TOUCHDOWN\."
+    ),
+    "pass_complete_touchdown_2": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by (?P<receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) for (?P<receiving_yards>[0-9\-]+) yard[s]?\. TOUCHDOWN\."
+    ),
+    "pass_catch_made_forced_lateral_tackled_fumbles": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by (?P<receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) for (?P<receiving_yards>[0-9\-]+) yard[s]?\. Lateral to (?P<lateral_receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) to (?:[A-Za-z0-9\s]+) for (?P<lateral_receiving_yards>[0-9\-]+) yard[s]?\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[a-zA-Z]+)\-? ?(?:[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_1>[A-Za-z0-9\s]+)\. (?P<fumbled_2_player_name>[a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_2_team>[a-zA-Z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_2>[A-Za-z0-9\s]+)\. Tackled by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "pass_complete_fumble_forced_recovered_tackled": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by (?P<receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) for (?P<receiving_yards>[0-9\-]+) yard[s]?\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by (?P<forced_fumble_player_1_player_name>[a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[a-zA-Z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_1>[A-Za-z0-9\s]+)\. Tackled by at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "pass_complete_fumble_forced_recovered_tackled_2": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by (?P<receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) for (?P<receiving_yards>[0-9\-]+) yard[s]?\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[a-zA-Z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_1>[A-Za-z0-9\s]+)\. Tackled by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "pass_complete_fumble_forced_recovered_tackled_3": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by (?P<receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) for (?P<receiving_yards>[0-9\-]+) yard[s]?\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by (?P<forced_fumble_player_1_player_name>[a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[a-zA-Z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "pass_complete_fumble_forced_recovered_lateral_tackled": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by (?P<receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) for (?P<receiving_yards>[0-9\-]+) yard[s]?\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by (?P<forced_fumble_player_1_player_name>[a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[a-zA-Z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_1>[A-Za-z0-9\s]+)\. Lateral to (?P<lateral_receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) to (?:[A-Za-z0-9\s]+) for (?P<lateral_receiving_yards>[\-0-9]+) yard[s]?\. Tackled by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "pass_complete_fumble_forced_recovered_lateral_tackled_alt": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by (?P<receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) for (?P<receiving_yards>[0-9\-]+) yard[s]?\. Lateral to (?P<lateral_receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) to (?:[A-Za-z0-9\s]+) for (?P<lateral_receiving_yards>[\-0-9]+) yard[s]?\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by (?P<forced_fumble_player_1_player_name>[a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[a-zA-Z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_1>[A-Za-z0-9\s]+)\. Tackled by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "pass_complete_fumble_forced_recovered_tackled_4": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by (?P<receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) for yard[s]?\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by (?P<forced_fumble_player_1_player_name>[a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[a-zA-Z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_1>[A-Za-z0-9\s]+)\. Tackled by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "pass_complete_fumble_forced_recovered_tackled_5": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by (?P<receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) for (?P<receiving_yards>[0-9\-]+) yard[s]?\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by (?P<forced_fumble_player_1_player_name>[a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[a-zA-Z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_1>[A-Za-z0-9\s]+)\. Tackled by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "pass_complete_ran_out_bounds": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by (?P<receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) for yard[s]?\. (?:[a-zA-Z\'\.\-\,\; ]+) ran out of bounds\."
+    ),
+    "pass_complete_ran_out_bounds_2": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by (?P<receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) for (?P<receiving_yards>[0-9\-]+) yard[s]?\. (?:[a-zA-Z\'\.\-\,\; ]+) ran out of bounds\."
+    ),
+    "pass_complete_lateral_fumbles_out_bounds": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by (?P<receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) for (?P<receiving_yards>[0-9\-]+) yard[s]?\. Lateral to (?P<lateral_receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) to (?:[A-Za-z0-9\s]+) for (?P<lateral_receiving_yards>[\-0-9]+) yard[s]?\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\. Out of bounds\."
+    ),
+    "pass_complete_tackled": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by (?P<receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) for yard[s]?\. Tackled by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "pass_complete_tackled_2": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by (?P<receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) for (?P<receiving_yards>[0-9\-]+) yard[s]?\. Tackled by at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "pass_complete_lateral_tackled": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by (?P<receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) for (?P<receiving_yards>[0-9\-]+) yard[s]?\. Lateral to (?P<lateral_receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) to (?:[A-Za-z0-9\s]+) for (?P<lateral_receiving_yards>[\-0-9]+) yard[s]?\. Tackled by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "pass_complete_tackled_3": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by (?P<receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) for (?P<receiving_yards>[0-9\-]+) yard[s]?\. Tackled by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "pass_complete_fumbles_forced_out_bounds": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by (?P<receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) for (?:[0-9\-]+) yard[s]?\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) FUMBLES\, forced by (?P<forced_fumble_player_1_player_name>[a-zA-Z\'\.\-\,\; ]+)\. (?:[a-zA-Z\'\.\-\,\; ]+) FUMBLES\, out of bounds\."
+    ),
+    "pass_complete_fumbles_forced_out_bounds_2": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by (?P<receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) for (?:[0-9\-]+) yard[s]?\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) FUMBLES\, forced by (?P<forced_fumble_player_1_player_name>[a-zA-Z\'\.\-\,\; ]+)\. Out of bounds\."
+    ),
+    "pass_complete_pushed_out_bounds": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by (?P<receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) for yard[s]?\. Pushed out of bounds by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "pass_complete_pushed_out_bounds_2": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Catch made by (?P<receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) for (?P<receiving_yards>[0-9\-]+) yard[s]?\. Pushed out of bounds by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "pass_complete_pushed_out_bounds_alt": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) complete[\[\] a-zA-Z\'\.\-\,\s]*\. Pushed out of bounds by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?:[A-Za-z0-9\s]+)\. Catch made by (?P<receiver_player_name>[a-zA-Z\'\.\-\,\; ]+) for (?P<receiving_yards>[0-9\-]+) yard[s]?\."
+    ),
+    "pass_intercepted_touchback": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) [INTERCEPTED|intercepted]+ at (?:[A-Za-z0-9\s]+)[\[\] a-zA-Z\'\.\-\,\s]*\. Intercepted by (?P<interception_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?:[A-Za-z0-9\s]+)\. Touchback\."
+    ),
+    "pass_intercepted_ran_out_bounds": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) [INTERCEPTED|intercepted]+ at (?:[A-Za-z0-9\s]+)[\[\] a-zA-Z\'\.\-\,\s]*\. Intercepted by (?P<interception_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?:[A-Za-z0-9\s]+)\. (?:[a-zA-Z\'\.\-\,\; ]+) ran out of bounds\."
+    ),
+    "pass_intercepted_pushed_out_bounds": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) [INTERCEPTED|intercepted]+ at (?:[A-Za-z0-9\s]+)\. Intercepted by (?P<interception_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_1>[A-Za-z0-9\s]+)\. Pushed out of bounds by (?P<tacklers>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "pass_intercepted_pushed_out_bounds_alt": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) [INTERCEPTED|intercepted]+ at (?:[A-Za-z0-9\s]+) \[(?P<qb_hit_1_player_name>[a-zA-Z\'\.\-\,\; ]+)\]\. Intercepted by (?P<interception_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_1>[A-Za-z0-9\s]+)\. Pushed out of bounds by (?P<tacklers>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "pass_intercepted_lateral_touchdown": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) [INTERCEPTED|intercepted]+ at (?:[A-Za-z0-9\s]+)[\[\] a-zA-Z\'\.\-\,\s]*\. Intercepted by (?P<interception_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_1>[A-Za-z0-9\s]+)\. Lateral to (?P<lateral_interception_player_name>[a-zA-Z\'\.\-\,\; ]+) to (?P<yardline_2>[A-Za-z0-9\s]+) for (?:[\-0-9]+) yard[s]?\. [TOUCHDOWN|touchdown]+\."
+    ),
+    "pass_intercepted_touchdown": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) [INTERCEPTED|intercepted]+ at (?:[A-Za-z0-9\s]+)[\[\] a-zA-Z\'\.\-\,\s]*\. Intercepted by (?P<interception_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_1>[A-Za-z0-9\s]+)\. [TOUCHDOWN|touchdown]+\."
+    ),
+    "pass_intercepted_lateral_tackled": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) [INTERCEPTED|intercepted]+ at (?:[A-Za-z0-9\s]+)[\[\] a-zA-Z\'\.\-\,\s]*\. Intercepted by (?P<interception_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_1>[A-Za-z0-9\s]+)\. Lateral to (?P<lateral_interception_player_name>[a-zA-Z\'\.\-\,\; ]+) to (?:[A-Za-z0-9\s]+) for (?:[\-0-9]+) yard[s]?\. Tackled by (?P<tacklers>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "pass_intercepted_tackled": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) [INTERCEPTED|intercepted]+ at (?:[A-Za-z0-9\s]+)[\[\] a-zA-Z\'\.\-\,\s]*\. Intercepted by (?P<interception_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_1>[A-Za-z0-9\s]+)\. Tackled by at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "pass_intercepted_tackled_2": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) pass (?P<pass_length>[a-zA-Z]+) (?P<pass_location>[a-zA-Z]+) [INTERCEPTED|intercepted]+ at (?:[A-Za-z0-9\s]+)[\[\] a-zA-Z\'\.\-\,\s]*\. Intercepted by (?P<interception_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_1>[A-Za-z0-9\s]+)\. Tackled by (?P<tacklers>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "spikes_ball": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) spikes the ball\."
+    ),
+    "pass_sacked": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) steps back to pass\. Sacked at (?:[A-Za-z0-9\s]+) for yard[s]? \((?P<tacklers>[a-zA-Z\'\.\;\-\, ]+)\)\."
+    ),
+    "pass_sacked_2": re.compile(
+        r"(?P<passer_player_name>[a-zA-Z\'\.\-\,\; ]+) steps back to pass\. Sacked at (?:[A-Za-z0-9\s]+) for (?P<yards_gained>[\-0-9]+) yard[s]? \((?P<tacklers>[a-zA-Z\'\.\;\-\, ]+)\)\."
+    ),
+    "rushed_up_middle_fumbles_forced_fumble_recovered_tackled_pushed_out_bounds": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed up the middle for (?P<rushing_yards>[\-0-9]+) yard[s]?\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by (?P<forced_fumble_player_1_player_name>[a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[A-Za-z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "rushed_up_middle_fumbles_forced_fumble_recovered_tackled": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed up the middle for (?P<rushing_yards>[\-0-9]+) yard[s]?\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by (?:[a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[A-Za-z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<forced_fumble_player_1_player_name>[A-Za-z0-9\s]+)\. Tackled by (?P<tacklers>[a-zA-Z\'\.\-\,\; ]+) at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "rushed_fumbles_forced_fumble_recovered_tackled": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed (?P<run_location>[a-zA-Z]+) (?P<run_gap>[a-zA-Z]+) for (?P<rushing_yards>[\-0-9]+) yard[s]?\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by (?:[a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by (?P<forced_fumble_player_1_player_name>[A-Za-z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?:[A-Za-z0-9\s]+)\. Tackled by (?P<tacklers>[a-zA-Z\'\.\-\,\; ]+) at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "rushed_up_middle_tackled": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed up the middle for yard[s]?\. Tackled by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "rushed_up_middle_tackled_2": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed up the middle for (?P<rushing_yards>[\-0-9]+) yard[s]?\. Tackled by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "rushed_tackled": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed (?P<run_location>[a-zA-Z]+) (?P<run_gap>[a-zA-Z]+) for yard[s]?\. Tackled by at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "rushed_tackled_2": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed (?P<run_location>[a-zA-Z]+) (?P<run_gap>[a-zA-Z]+) for yard[s]?\. Tackled by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "rushed_ran_out_bounds": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed (?P<run_location>[a-zA-Z]+) (?P<run_gap>[a-zA-Z]+) for (?P<rushing_yards>[\-0-9]+) yard[s]?\. (?:[a-zA-Z\'\.\-\,\; ]+) ran out of bounds\."
+    ),
+    "rushed_tackled_3": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed (?P<run_location>[a-zA-Z]+) (?P<run_gap>[a-zA-Z]+) for (?P<rushing_yards>[\-0-9]+) yard[s]?\. Tackled by at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "rushed_fumbles_forced_recovered_out_bounds": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed (?P<run_location>[a-zA-Z]+) (?P<run_gap>[a-zA-Z]+) for (?P<rushing_yards>[\-0-9]+) yard[s]?\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by (?P<forced_fumble_player_1_player_name>[a-zA-Z\'\.\-\,\; ]+)\. (?:[a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, out of bounds\."
+    ),
+    "rushed_fumbles_fumble_recovered_tackled_touchback": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed (?P<run_location>[a-zA-Z]+) (?P<run_gap>[a-zA-Z]+) for (?P<rushing_yards>[\-0-9]+) yard[s]?\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\. Fumble RECOVERED by (?P<fumble_recovery_1_team>[A-Za-z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?:[A-Za-z0-9\s]+)\. Tackled by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?:[A-Za-z0-9\s]+)\. Touchback\."
+    ),
+    "rushed_fumbles_fumble_recovered_forced": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed (?P<run_location>[a-zA-Z]+) (?P<run_gap>[a-zA-Z]+) for (?P<rushing_yards>[\-0-9]+) yard[s]?\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[A-Z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?:[A-Za-z0-9\s]+)\. Tackled by (?:[a-zA-Z\.\-\,\'\;\s]+) at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "rushed_tackled_4": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed (?P<run_location>[a-zA-Z]+) (?P<run_gap>[a-zA-Z]+) for (?P<rushing_yards>[\-0-9]+) yard[s]?\. Tackled by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "rushed_pushed_out_bounds": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed (?P<run_location>[a-zA-Z]+) (?P<run_gap>[a-zA-Z]+) for yard[s]?\. Pushed out of bounds by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "rushed_up_middle_pushed_out_bounds": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed up the middle for (?P<rushing_yards>[\-0-9]+) yard[s]?\. Pushed out of bounds by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "rushed_lateral_pushed_out_bounds": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed (?P<run_location>[a-zA-Z]+) (?P<run_gap>[a-zA-Z]+) for (?P<rushing_yards>[\-0-9]+) yard[s]?\. Lateral to (?P<lateral_rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) to (?:[A-Za-z0-9\s]+) for (?P<lateral_rushing_yards>[0-9\-]) yard[s]?\. Pushed out of bounds by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "rushed_fumbles_forced_fumble_recovered_pushed_out_bounds": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed (?P<run_location>[a-zA-Z]+) (?P<run_gap>[a-zA-Z]+) for (?P<rushing_yards>[\-0-9]+) yard[s]?\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by (?P<forced_fumble_player_1_play>[a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[A-Z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?:[A-Za-z0-9\s]+)\. Pushed out of bounds by (?:[a-zA-Z\.\-\,\'\;\s]+) at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "rushed_pushed_out_bounds_2": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed (?P<run_location>[a-zA-Z]+) (?P<run_gap>[a-zA-Z]+) for (?P<rushing_yards>[\-0-9]+) yard[s]?\. Pushed out of bounds by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "rushed_up_middle_touchdown": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed up the middle for yard[s]?\. [TOUCHDOWN|touchdown]+"
+    ),
+    "rushed_up_middle_touchdown_2": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed up the middle for (?P<rushing_yards>[\-0-9]+) yard[s]?\. [TOUCHDOWN|touchdown]+"
+    ),
+    "rushed_touchdown": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed (?P<run_location>[a-zA-Z]+) (?P<run_gap>[a-zA-Z]+) for yard[s]?\. [TOUCHDOWN|touchdown]+"
+    ),
+    "rushed_fumbles_forced_fumble_recovered": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed (?P<run_location>[a-zA-Z]+) (?P<run_gap>[a-zA-Z]+) for (?P<rushing_yards>[\-0-9]+) yard[s]?\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by (?P<forced_fumble_player_1_play>[a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[A-Z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?:[a-zA-Z0-9 ]+)\."
+    ),
+    "rushed_fumbles_forced_fumble_recovered_touchdown": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed (?P<run_location>[a-zA-Z]+) (?P<run_gap>[a-zA-Z]+) for (?P<rushing_yards>[\-0-9]+) yard[s]?\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by (?P<forced_fumble_player_1_play>[a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[A-Z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?:[a-zA-Z\'\.\-\,\; ]+) [TOUCHDOWN|touchdown]+"
+    ),
+    "rushed_fumbles_forced_recovered_out_bounds_2": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed (?P<run_location>[a-zA-Z]+) (?P<run_gap>[a-zA-Z]+) for (?P<rushing_yards>[\-0-9]+) yard[s]?\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by (?P<forced_fumble_player_1_play>[a-zA-Z\'\.\-\,\; ]+)\. Out of bounds\."
+    ),
+    "rushed_touchdown_2": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) rushed (?P<run_location>[a-zA-Z]+) (?P<run_gap>[a-zA-Z]+) for (?P<rushing_yards>[\-0-9]+) yard[s]?\. [TOUCHDOWN|touchdown]+"
+    ),
+    "scrambles_up_middle_tackled": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) scrambles up the middle for yards\. Tackled by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?P<yardline_1>[A-Za-z0-9\s]+)\."
+    ),
+    "scrambles_forced_fumble_recovered_tackled": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) scrambles (?:[a-zA-Z]+) (?:[a-zA-Z]+) for yards\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by (?P<forced_fumble_player_1_play>[a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[A-Z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?:[A-Za-z0-9\s]+)\. Tackled by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "scrambles_tackled": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) scrambles (?P<run_location>[a-zA-Z]+) (?P<run_gap>[a-zA-Z]+) for yards\. Tackled by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?P<yardline_1>[A-Za-z0-9\s]+)\."
+    ),
+    "scrambles_up_middle_forced_fumble_recovered_tackled": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) scrambles up the middle for (?P<rushing_yards>[\-0-9]+) yards\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by (?P<forced_fumble_player_1_play>[a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[A-Z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?:[A-Za-z0-9\s]+)\. Tackled by (?:[a-zA-Z\.\-\,\'\;\s]+) at (?P<tacklers>[A-Za-z0-9\s]+)\."
+    ),
+    "scrambles_up_middle_tackled_2": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) scrambles up the middle for (?P<rushing_yards>[\-0-9]+) yard[s]?\. Tackled by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "scrambles_pushed_out_bounds": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) scrambles (?P<run_location>[a-zA-Z]+) (?P<run_gap>[a-zA-Z]+) for yards\. Pushed out of bounds by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "scrambles_up_middle_pushed_out_bounds": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) scrambles up the middle for (?P<rushing_yards>[\-0-9]+) yards\. Pushed out of bounds by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "scrambles_up_middle_touchdown": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) scrambles up the middle for (?P<rushing_yards>[\-0-9]+) yards\. [TOUCHDOWN|touchdown]+\."
+    ),
+    "scrambles_touchdown": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) scrambles (?P<run_location>[a-zA-Z]+) (?P<run_gap>[a-zA-Z]+) for (?P<rushing_yards>[\-0-9]+) yards\. [TOUCHDOWN|touchdown]+\."
+    ),
+    "scrambles_pushed_out_bounds_2": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) scrambles (?P<run_location>[a-zA-Z]+) (?P<run_gap>[a-zA-Z]+) for (?P<rushing_yards>[\-0-9]+) yards\. Pushed out of bounds by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "scrambles_tackled_fumbles_forced_recovered": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) scrambles (?P<run_location>[a-zA-Z]+) (?P<run_gap>[a-zA-Z]+) for (?P<rushing_yards>[\-0-9]+) yards\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by (?P<forced_fumble_player_1_play>[a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[A-Z]+)\-(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?:[A-Za-z0-9\s]+)\. Tackled by at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "scrambles_tackled_2": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) scrambles (?P<run_location>[a-zA-Z]+) (?P<run_gap>[a-zA-Z]+) for (?P<rushing_yards>[\-0-9]+) yards\. Tackled by at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "scrambles_tackled_fumbles_forced_fumble_recovered": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) scrambles (?P<run_location>[a-zA-Z]+) (?P<run_gap>[a-zA-Z]+) for (?P<rushing_yards>[\-0-9]+) yards\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by (?P<forced_fumble_player_1_player_name>[a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[A-Z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?:[A-Za-z0-9\s]+)\. Tackled by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "scrambles_up_middle_ran_out_bounds": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) scrambles up the middle for (?P<rushing_yards>[\-0-9]+) yards\. (?:[a-zA-Z\'\.\-\,\; ]+) ran out of bounds\."
+    ),
+    "scrambles_ran_out_bounds": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) scrambles (?P<run_location>[a-zA-Z]+) (?P<run_gap>[a-zA-Z]+) for (?P<rushing_yards>[\-0-9]+) yards\. (?:[a-zA-Z\'\.\-\,\; ]+) ran out of bounds\."
+    ),
+    "kneels": re.compile(
+        r"(?P<rusher_player_name>[a-zA-Z\'\.\-\,\; ]+) kneels at the (?P<yardline_1>[A-Za-z0-9\s]+)\."
+    ),
+    "field_goal_attempt_returned_end_zone_touchdown": re.compile(
+        r"(?P<kicker_player_name>[a-zA-Z\'\.\-\,\; ]+)(?P<kick_distance> [0-9]+)? yard[s]? field goal attempt is (?:[a-zA-Z\s]+)\, [Center|center]+\-(?P<long_snapper_player_name>[a-zA-Z\'\.\-\,\; ]+), [Holder|holder]+\-(?P<holder_player_name>[a-zA-Z\'\.\-\,\; ]+)\. Returned by (?P<punt_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?:[A-Z]+) [END|end]+ [ZONE|zone]+\. [TOUCHDOWN|touchdown]+"
+    ),
+    "four_point_field_goal_attempt_penalty_on_play": re.compile(
+        r"(?P<kicker_player_name>[a-zA-Z\'\.\-\,\; ]+) (?P<kick_distance>[0-9]+) yard[s]? four-point field goal attempt is (?P<field_goal_result>[a-zA-Z\s]+)\, [Center|center]+\-(?P<long_snapper_player_name>[a-zA-Z\'\.\-\,\; ]+), [Holder|holder]+\-(?P<holder_player_name>[a-zA-Z\'\.\-\,\; ]+)\."
+    ),
+    "field_goal_attempt_penalty_on_play": re.compile(
+        r"(?P<kicker_player_name>[a-zA-Z\'\.\-\,\; ]+) (?P<kick_distance>[0-9]+) yard[s]? field goal attempt is (?P<field_goal_result>[a-zA-Z\s]+)\, [Center|center]+\-(?P<long_snapper_player_name>[a-zA-Z\'\.\-\,\; ]+), [Holder|holder]+\-(?P<holder_player_name>[a-zA-Z\'\.\-\,\; ]+)\."
+    ),
+    "field_goal_attempt_penalty_on_play_2": re.compile(
+        r"(?P<kicker_player_name>[a-zA-Z\'\.\-\,\; ]+) yard[s]? field goal attempt is (?P<field_goal_result>[a-zA-Z\s]+)\, [Center|center]+\-(?P<long_snapper_player_name>[a-zA-Z\'\.\-\,\; ]+), [Holder|holder]+\-(?P<holder_player_name>[a-zA-Z\'\.\-\,\; ]+)\."
+    ),
+    "kicks_muffs_catch_fumble_recovered_tackled": re.compile(
+        r"(?P<kicker_player_name>[a-zA-Z\'\.\-\,\; ]+) kicks yard[s]? from (?:[A-Za-z0-9\s]+) to the (?:[A-Za-z0-9\s]+)\. (?P<kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) [MUFFS|muffs]+ catch\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[A-Za-z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_1>[A-Za-z0-9\s]+)\. Tackled by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "kicks_fumbles_forced_out_bounds": re.compile(
+        r"(?P<kicker_player_name>[a-zA-Z\'\.\-\,\; ]+) kicks (?P<kick_distance>[\-0-9]+) yard[s]? from (?:[A-Za-z0-9\s]+) to the (?P<yardline_1>[A-Za-z0-9\s]+)\. (?P<kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) returns the kickoff\. (?:[a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by (?P<forced_fumble_player_1_player_name>[a-zA-Z\'\.\-\,\; ]+)\. Out of bounds\."
+    ),
+    "kicks_fumbles_forced_fumble_recovered_pushed_out_bounds": re.compile(
+        r"(?P<kicker_player_name>[a-zA-Z\'\.\-\,\; ]+) kicks (?P<kick_distance>[\-0-9]+) yard[s]? from (?:[A-Za-z0-9\s]+) to the (?:[A-Za-z0-9\s]+)\. (?P<kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) returns the kickoff\. (?:[a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, forced by (?P<forced_fumble_player_1_player_name>[a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[A-Za-z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_1>[A-Za-z0-9\s]+)\. Pushed out of bounds by (?:[a-zA-Z\.\-\,\'\;\s]+) at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "kicks_returns_kickoff_pushed_out_bounds": re.compile(
+        r"(?P<kicker_player_name>[a-zA-Z\'\.\-\,\; ]+) kicks (?P<kick_distance>[\-0-9]+) yard[s]? from (?:[A-Za-z0-9\s]+) to the (?P<yardline_1>[A-Za-z0-9\s]+)\. (?P<kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) returns the kickoff\. Pushed out of bounds by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "kicks_muffs_catch_fumble_recovered_ran_out_bounds": re.compile(
+        r"(?P<kicker_player_name>[a-zA-Z\'\.\-\,\; ]+) kicks (?P<kick_distance>[\-0-9]+) yard[s]? from (?:[A-Za-z0-9\s]+) to the (?:[A-Za-z0-9\s]+)\. (?P<kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) [MUFFS|muffs]+ catch\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[A-Za-z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_1>[A-Za-z0-9\s]+)\. (?:[a-zA-Z\.\-\,\'\;\s]+) ran out of bounds\."
+    ),
+    "kicks_muffs_catch_fumble_recovered_pushed_out_bounds": re.compile(
+        r"(?P<kicker_player_name>[a-zA-Z\'\.\-\,\; ]+) kicks (?P<kick_distance>[\-0-9]+) yard[s]? from (?:[A-Za-z0-9\s]+) to the (?:[A-Za-z0-9\s]+)\. (?P<kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) [MUFFS|muffs]+ catch\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[A-Za-z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_1>[A-Za-z0-9\s]+)\. Pushed out of bounds by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "kicks_muffs_catch_out_bounds": re.compile(
+        r"(?P<kicker_player_name>[a-zA-Z\'\.\-\,\; ]+) kicks (?P<kick_distance>[\-0-9]+) yard[s]? from (?:[A-Za-z0-9\s]+) to the (?P<yardline_1>[A-Za-z0-9\s]+)\. (?P<kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) [MUFFS|muffs]+ catch\. Out of bounds\."
+    ),
+    "kicks_muffs_catch_fumble_recovered_tackled_2": re.compile(
+        r"(?P<kicker_player_name>[a-zA-Z\'\.\-\,\; ]+) kicks (?P<kick_distance>[\-0-9]+) yard[s]? from (?:[A-Za-z0-9\s]+) to the (?:[A-Za-z0-9\s]+)\. (?P<kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) [MUFFS|muffs]+ catch\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[A-Za-z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_1>[A-Za-z0-9\s]+)\. Tackled by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "kicks_returns_kickoff_fumbles_forced_fumble_recovered_tackled": re.compile(
+        r"(?P<kicker_player_name>[a-zA-Z\'\.\-\,\; ]+) kicks (?P<kick_distance>[\-0-9]+) yard[s]? from (?:[A-Za-z0-9\s]+) to the (?:[A-Za-z0-9\s]+)\. (?P<kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) returns the kickoff\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) FUMBLES, forced by (?P<forced_fumble_player_1_player_name>[a-zA-Z\'\.\-\,\; ]+)\. Fumble RECOVERED by (?P<fumble_recovery_1_team>[A-Za-z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_1>[A-Za-z0-9\s]+)\. Tackled by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "kicks_returns_kickoff_fumbles_forced_fumble_recovered": re.compile(
+        r"(?P<kicker_player_name>[a-zA-Z\'\.\-\,\; ]+) kicks (?P<kick_distance>[\-0-9]+) yard[s]? from (?:[A-Za-z0-9\s]+) to the (?:[A-Za-z0-9\s]+)\. (?P<kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) returns the kickoff\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) FUMBLES, forced by (?P<forced_fumble_player_1_player_name>[a-zA-Z\'\.\-\,\; ]+)\. Fumble RECOVERED by (?P<fumble_recovery_1_team>[A-Za-z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "kicks_returns_kickoff_fumbles_fumble_recovered_tackled": re.compile(
+        r"(?P<kicker_player_name>[a-zA-Z\'\.\-\,\; ]+) kicks (?P<kick_distance>[\-0-9]+) yard[s]? from (?:[A-Za-z0-9\s]+) to the (?:[A-Za-z0-9\s]+)\. (?P<kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) returns the kickoff\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) FUMBLES\. Fumble RECOVERED by (?P<fumble_recovery_1_team>[A-Za-z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "kicks_returns_kickoff_lateral_tackled": re.compile(
+        r"(?P<kicker_player_name>[a-zA-Z\'\.\-\,\; ]+) kicks (?P<kick_distance>[\-0-9]+) yard[s]? from (?:[A-Za-z0-9\s]+) to the (?P<yardline_1>[A-Za-z0-9\s]+)\. (?P<kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) returns the kickoff\. Lateral to (?P<lateral_kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) to (?:[A-Za-z0-9\s]+) for (?:[0-9\-]+) yard[s]?\. Tackled by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "kicks_returns_kickoff_tackled": re.compile(
+        r"(?P<kicker_player_name>[a-zA-Z\'\.\-\,\; ]+) kicks (?P<kick_distance>[\-0-9]+) yard[s]? from (?:[A-Za-z0-9\s]+) to the (?P<yardline_1>[A-Za-z0-9\s]+)\. (?P<kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) returns the kickoff\. Tackled by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "kicks_returns_kickoff_ran_out_bounds": re.compile(
+        r"(?P<kicker_player_name>[a-zA-Z\'\.\-\,\; ]+) kicks (?P<kick_distance>[\-0-9]+) yard[s]? from (?:[A-Za-z0-9\s]+) to the (?P<yardline_1>[A-Za-z0-9\s]+)\. (?:[a-zA-Z\'\.\-\,\; ]+) returns the kickoff\. (?:[a-zA-Z\'\.\-\,\; ]+) ran out of bounds\."
+    ),
+    "kicks_returns_kickoff_touchdown": re.compile(
+        r"(?P<kicker_player_name>[a-zA-Z\'\.\-\,\; ]+) kicks (?P<kick_distance>[\-0-9]+) yard[s]? from (?:[A-Za-z0-9\s]+) to the (?P<yardline_1>[A-Za-z0-9\s]+)\. (?P<kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) returns the kickoff\. [TOUCHDOWN|touchdown]+\."
+    ),
+    "kicks_touchback": re.compile(
+        r"(?P<kicker_player_name>[a-zA-Z\'\.\-\,\; ]+) kicks (?P<kick_distance>[\-0-9]+) yard[s]? from (?:[A-Za-z0-9\s]+) to the (?P<yardline_1>[A-Za-z0-9\s]+)\. Touchback\."
+    ),
+    "kicks_fair_catch": re.compile(
+        r"(?P<kicker_player_name>[a-zA-Z\'\.\-\,\; ]+) kicks (?P<kick_distance>[\-0-9]+) yard[s]? from (?:[A-Za-z0-9\s]+) to the (?P<yardline_1>[A-Za-z0-9\s]+)\. Fair catch by (?P<kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+)\."
+    ),
+    "punt_returned_from_fumbles_forced_fumble_recovered_tackled": re.compile(
+        r"(?P<punter_player_name>[a-zA-Z\'\.\-\,\; ]+) punts (?P<kick_distance>[\-0-9]+) yard[s]? to (?:[A-Za-z0-9\s]+), [center|Center]+\-? ?(?P<long_snapper_player_name>[a-zA-Z\'\.\-\,\; ]+)\. (?P<kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) returned punt from the (?:[A-Za-z0-9\s]+)\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) FUMBLES\, forced by (?P<forced_fumble_player_1_player_name>[a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[A-Za-z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_1>[A-Za-z0-9\s]+)\. Tackled by at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "punts_returned_punt_from_fumbles_forced_fumble_recovered_tackled": re.compile(
+        r"(?P<punter_player_name>[a-zA-Z\'\.\-\,\; ]+) punts yard[s]? to (?:[A-Za-z0-9\s]+), [center|Center]+\-? ?(?P<long_snapper_player_name>[a-zA-Z\'\.\-\,\; ]+)\. (?P<kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) returned punt from the (?:[A-Za-z0-9\s]+)\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) FUMBLES\, forced by (?P<forced_fumble_player_1_player_name>[a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[A-Za-z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_1>[A-Za-z0-9\s]+)\. Tackled by (?P<tacklers>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "punts_returned_punt_from_fumbles_forced_fumble_recovered_tackled_alt": re.compile(
+        r"(?P<punter_player_name>[a-zA-Z\'\.\-\,\; ]+) punts yard[s]? to (?:[A-Za-z0-9\s]+), [center|Center]+\-? ?(?P<long_snapper_player_name>[a-zA-Z\'\.\-\,\; ]+)\. (?P<kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) returned punt from the (?:[A-Za-z0-9\s]+)\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) FUMBLES\, forced by (?P<forced_fumble_player_1_player_name>[a-zA-Z\'\.\-\,\; ]+)\. Tackled by (?:[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_2>[A-Za-z0-9\s]+)\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[A-Za-z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_1>[A-Za-z0-9\s]+)\."
+    ),
+    "punt_returned_from_fumbles_forced_fumble_recovered": re.compile(
+        r"(?P<punter_player_name>[a-zA-Z\'\.\-\,\; ]+) punts (?P<kick_distance>[\-0-9]+) yard[s]? to (?:[A-Za-z0-9\s]+), [center|Center]+\-? ?(?P<long_snapper_player_name>[a-zA-Z\'\.\-\,\; ]+)\. (?P<kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) returned punt from the (?:[A-Za-z0-9\s]+)\. (?P<fumbled_1_player_name>[a-zA-Z\'\.\-\,\; ]+) FUMBLES\, forced by (?P<forced_fumble_player_1_player_name>[a-zA-Z\'\.\-\,\; ]+)\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[A-Za-z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "punts_returned_punt_from_tackled": re.compile(
+        r"(?P<punter_player_name>[a-zA-Z\'\.\-\,\; ]+) punts yard[s]? to (?:[A-Za-z0-9\s]+), [center|Center]+\-? ?(?P<long_snapper_player_name>[a-zA-Z\'\.\-\,\; ]+)\. (?P<kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) returned punt from the (?:[A-Za-z0-9\s]+)\. Tackled by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "punt_returned_from_tackled": re.compile(
+        r"(?P<punter_player_name>[a-zA-Z\'\.\-\,\; ]+) punts (?P<kick_distance>[\-0-9]+) yard[s]? to (?:[A-Za-z0-9\s]+), [center|Center]+\-? ?(?P<long_snapper_player_name>[a-zA-Z\'\.\-\,\; ]+)\. (?P<kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) returned punt from the (?P<yardline_1>[A-Za-z0-9\s]+)\. Tackled by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "punts_muffs_catch_fumbles_out_bounds": re.compile(
+        r"(?P<punter_player_name>[a-zA-Z\'\.\-\,\; ]+) punts (?P<kick_distance>[0-9]+) yards to (?P<yardline_2>[A-Za-z0-9\s]+), [center|Center]+\-? ?(?P<long_snapper_player_name>[a-zA-Z\'\.\-\,\; ]+)\. (?P<kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) [MUFFS|muffs]+ catch\. (?:[a-zA-Z\'\.\-\,\; ]+) [FUMBLES|fumbles]+\, out of bounds"
+    ),
+    "punts_muffs_catch_fumble_recovered_tackled": re.compile(
+        r"(?P<punter_player_name>[a-zA-Z\'\.\-\,\; ]+) punts (?P<kick_distance>[0-9]+) yards to (?:[A-Za-z0-9\s]+), [center|Center]+\-? ?(?P<long_snapper_player_name>[a-zA-Z\'\.\-\,\; ]+)\. (?P<kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) [MUFFS|muffs]+ catch\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[A-Za-z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_1>[A-Za-z0-9\s]+)\. Tackled by at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "punts_muffs_catch_fumble_recovered_tackled_2": re.compile(
+        r"(?P<punter_player_name>[a-zA-Z\'\.\-\,\; ]+) punts (?P<kick_distance>[0-9]+) yards to (?:[A-Za-z0-9\s]+), [center|Center]+\-? ?(?P<long_snapper_player_name>[a-zA-Z\'\.\-\,\; ]+)\. (?P<kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) [MUFFS|muffs]+ catch\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[A-Za-z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_1>[A-Za-z0-9\s]+)\. Tackled by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "punts_muffs_catch_fumble_recovered": re.compile(
+        r"(?P<punter_player_name>[a-zA-Z\'\.\-\,\; ]+) punts (?P<kick_distance>[0-9]+) yards to (?:[A-Za-z0-9\s]+), [center|Center]+\-? ?(?P<long_snapper_player_name>[a-zA-Z\'\.\-\,\; ]+)\. (?P<kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) [MUFFS|muffs]+ catch\. Fumble [RECOVERED|recovered]+ by (?P<fumble_recovery_1_team>[A-Za-z]+)\-? ?(?P<fumble_recovery_1_player_name>[a-zA-Z\'\.\-\,\; ]+) at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "punts_returned_punt_from_out_bounds": re.compile(
+        r"(?P<punter_player_name>[a-zA-Z\'\.\-\,\; ]+) punts yard[s]? to (?:[A-Za-z0-9\s]+), [center|Center]+\-? ?(?P<long_snapper_player_name>[a-zA-Z\'\.\-\,\; ]+)\. Out of bounds\."
+    ),
+    "punt_returned_from_out_bounds": re.compile(
+        r"(?P<punter_player_name>[a-zA-Z\'\.\-\,\; ]+) punts (?P<kick_distance>[\-0-9]+) yard[s]? to (?P<yardline_1>[A-Za-z0-9\s]+), [center|Center]+\-? ?(?P<long_snapper_player_name>[a-zA-Z\'\.\-\,\; ]+)\. Out of bounds\."
+    ),
+    "punt_touchback": re.compile(
+        r"(?P<punter_player_name>[a-zA-Z\'\.\-\,\; ]+) punts (?P<kick_distance>[\-0-9]+) yard[s]? to (?:[A-Za-z]+) [End|end]+ [Zone|zone]+, [center|Center]+\-? ?(?P<long_snapper_player_name>[a-zA-Z\'\.\-\,\; ]+)\. Touchback\."
+    ),
+    "punts_fair_catch_play": re.compile(
+        r"(?P<punter_player_name>[a-zA-Z\'\.\-\,\; ]+) punts yard[s]? to (?P<yardline_1>[A-Za-z0-9\s]+), [center|Center]+\-? ?(?P<long_snapper_player_name>[a-zA-Z\'\.\-\,\; ]+)\. Fair catch by (?P<punt_returner_player_name>[a-zA-Z\'\.\-\,\; ]+)\."
+    ),
+    "punt_fair_catch": re.compile(
+        r"(?P<punter_player_name>[a-zA-Z\'\.\-\,\; ]+) punts (?P<kick_distance>[\-0-9]+) yard[s]? to (?P<yardline_1>[A-Za-z0-9\s]+), [center|Center]+\-? ?(?P<long_snapper_player_name>[a-zA-Z\'\.\-\,\; ]+)\. Fair catch by (?P<punt_returner_player_name>[a-zA-Z\'\.\-\,\; ]+)\."
+    ),
+    "punts_downed": re.compile(
+        r"(?P<punter_player_name>[a-zA-Z\'\.\-\,\; ]+) punts yard[s]? to (?P<yardline_1>[A-Za-z0-9\s]+), [center|Center]+\-? ?(?P<long_snapper_player_name>[a-zA-Z\'\.\-\,\; ]+)\. Downed by (?:[a-zA-Z\'\.\-\,\; ]+)\."
+    ),
+    "punt_downed": re.compile(
+        r"(?P<punter_player_name>[a-zA-Z\'\.\-\,\; ]+) punts (?P<kick_distance>[\-0-9]+) yard[s]? to (?P<yardline_1>[A-Za-z0-9\s]+), [center|Center]+\-? ?(?P<long_snapper_player_name>[a-zA-Z\'\.\-\,\; ]+)\. Downed by (?:[a-zA-Z\'\.\-\,\; ]+)\."
+    ),
+    "punts_returned_punt_from_pushed_out_bounds": re.compile(
+        r"(?P<punter_player_name>[a-zA-Z\'\.\-\,\; ]+) punts yard[s]? to (?P<yardline_3>[A-Za-z0-9\s]+), [center|Center]+\-? ?(?P<long_snapper_player_name>[a-zA-Z\'\.\-\,\; ]+)\. (?P<kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) returned punt from the (?P<yardline_1>[A-Za-z0-9\s]+)\. Pushed out of bounds by (?:[a-zA-Z\.\-\,\'\;\s]+) at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "punt_returned_from_ran_out_bounds": re.compile(
+        r"(?P<punter_player_name>[a-zA-Z\'\.\-\,\; ]+) punts (?P<kick_distance>[\-0-9]+) yard[s]? to (?:[A-Za-z0-9\s]+), [center|Center]+\-? ?(?P<long_snapper_player_name>[a-zA-Z\'\.\-\,\; ]+)\. (?P<kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) returned punt from the (?P<yardline_1>[A-Za-z0-9\s]+)\. (?:[a-zA-Z\.\-\,\'\;\s]+) ran out of bounds\."
+    ),
+    "punt_returned_from_pushed_out_bounds": re.compile(
+        r"(?P<punter_player_name>[a-zA-Z\'\.\-\,\; ]+) punts (?P<kick_distance>[\-0-9]+) yard[s]? to (?:[A-Za-z0-9\s]+), [center|Center]+\-? ?(?P<long_snapper_player_name>[a-zA-Z\'\.\-\,\; ]+)\. (?P<kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) returned punt from the (?P<yardline_1>[A-Za-z0-9\s]+)\. Pushed out of bounds by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?P<yardline_2>[A-Za-z0-9\s]+)\."
+    ),
+    "punt_returned_from_touchdown": re.compile(
+        r"(?P<punter_player_name>[a-zA-Z\'\.\-\,\; ]+) punts (?P<kick_distance>[\-0-9]+) yard[s]? to (?:[A-Za-z0-9\s]+), [center|Center]+\-? ?(?P<long_snapper_player_name>[a-zA-Z\'\.\-\,\; ]+)\. (?P<kickoff_returner_player_name>[a-zA-Z\'\.\-\,\; ]+) returned punt from the (?P<yardline_1>[A-Za-z0-9\s]+)\. [TOUCHDOWN|touchdown]+"
+    ),
+    "tackled": re.compile(
+        r"Tackled by (?P<tacklers>[a-zA-Z\.\-\,\'\;\s]+) at (?:[A-Za-z0-9\s]+)\."
+    ),
+    "extra_point": re.compile(
+        r"(?P<extra_point_player_name>[a-zA-Z\.\-\,\'\;\s]+) extra point is (?P<extra_point_result>[a-zA-Z\s]+)\."
+    ),
+    "penalty": re.compile(
+        r"PENALTY on (?P<penalty_team>[A-Z]+)\-? ?(?P<penalty_player_name>[a-zA-Z\'\.\-\,\; ]+)\, (?P<penalty_type>[a-zA-Z\s\/\-]+)\, (?P<penalty_yards>[0-9]+) yard[s]?,\.? (?:[a-zA-Z\s]+)\."
+    ),
+}
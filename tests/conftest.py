@@ -0,0 +1,6 @@
+import sys
+from os.path import abspath, dirname
+
+# The scripts in this repository aren't a package,
+# so they're imported from the repository root.
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
@@ -0,0 +1,33 @@
+import json
+from os.path import dirname, join
+
+from get_ufl_game_stats import parse_ufl_game_stats
+
+REPO_DIR = dirname(dirname(__file__))
+
+
+def test_repeated_player_rows_are_not_double_counted():
+    # FOX Sports lists both of these players twice in the "FUMBLES" table.
+    with open(join(REPO_DIR, "usfl_game_logs", "15.json"), "r") as f:
+        game_json = json.load(f)
+
+    player_df, _ = parse_ufl_game_stats(game_json, 15, 2023)
+    player_df = player_df.set_index("player_name")
+
+    assert player_df.index.is_unique
+    assert player_df.loc["KYLE SLOTER", "fumbles_FUM"] == 1
+    assert player_df.loc["KYLE SLOTER", "fumbles_FUM_LOST"] == 1
+    assert player_df.loc["JOHNNIE DIXON", "fumbles_FUM"] == 2
+
+
+def test_different_player_rows_are_added_up():
+    # FOX Sports lists this player twice in the "FUMBLES" table,
+    # and the forced fumble is only in the second row.
+    with open(join(REPO_DIR, "usfl_game_logs", "06.json"), "r") as f:
+        game_json = json.load(f)
+
+    player_df, _ = parse_ufl_game_stats(game_json, 6, 2023)
+    player_df = player_df.set_index("player_name")
+
+    assert player_df.loc["TERRELL BONDS", "fumbles_FUM"] == 1
+    assert player_df.loc["TERRELL BONDS", "defense_FF"] == 1
@@ -0,0 +1,23 @@
+import get_ufl_rosters
+
+
+def test_no_teams_returns_empty_rosters(monkeypatch, tmp_path):
+    requested_seasons = []
+
+    def get_ufl_team_ids(season: int) -> list:
+        requested_seasons.append(season)
+        return []
+
+    def fox_api_get(url: str):
+        raise AssertionError(f"Requested a roster: {url}")
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(get_ufl_rosters, "get_fox_api_key", lambda: "key")
+    monkeypatch.setattr(get_ufl_rosters, "get_ufl_team_ids", get_ufl_team_ids)
+    monkeypatch.setattr(get_ufl_rosters, "fox_api_get", fox_api_get)
+
+    roster_df = get_ufl_rosters.ufl_roster_data(season=2026)
+
+    # The previous season's teams are tried before giving up.
+    assert requested_seasons[1] == requested_seasons[0] - 1
+    assert len(roster_df) == 0
@@ -0,0 +1,162 @@
+from datetime import datetime
+
+import pandas as pd
+
+import get_ufl_schedules
+
+
+def make_week(week_num: int, game_date: str, game_status: str) -> dict:
+    """
+    Makes a FOX Sports schedule week with one game.
+    """
+    return {
+        "tables": [
+            {
+                "title": datetime.strptime(game_date, "%Y-%m-%d").strftime(
+                    "%a, %b %d"
+                ),
+                "rows": [
+                    {
+                        "linkList": [
+                            {
+                                "entityLink": {
+                                    "layout": {"tokens": {"id": "1"}},
+                                    "analyticsName": "away-team",
+                                    "title": "AWAY TEAM",
+                                }
+                            },
+                            {
+                                "entityLink": {
+                                    "layout": {"tokens": {"id": "2"}},
+                                    "analyticsName": "home-team",
+                                    "title": "HOME TEAM",
+                                }
+                            },
+                            {
+                                "entityLink": {
+                                    "layout": {
+                                        "tokens": {"id": str(100 + week_num)}
+                                    }
+                                }
+                            },
+                        ],
+                        "columns": [
+                            {},
+                            {},
+                            {},
+                            {"text": "1-0", "subtext": game_status},
+                            {"text": "Stadium", "subtext": "City, ST"},
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+def make_previous_schedule(weeks: dict) -> pd.DataFrame:
+    """
+    Makes a previous schedule with one game per week.
+    `weeks` maps a week ID to `(game_date, game_status)`.
+    """
+    return pd.DataFrame(
+        [
+            {
+                "week_id": week_id,
+                "game_date": pd.Timestamp(game_date),
+                "game_status": game_status,
+            }
+            for week_id, (game_date, game_status) in weeks.items()
+        ]
+    )
+
+
+def test_postponed_game_does_not_freeze_later_weeks(
+    monkeypatch, tmp_path
+):
+    # Week 1 has a postponed game, which never goes final.
+    # Weeks 2 and 3 are final, and week 4 was last seen in progress.
+    season = 2024
+    game_dates = {
+        1: "2024-03-30",
+        2: "2024-04-06",
+        3: "2024-04-13",
+        4: "2024-04-20",
+    }
+    previous_df = make_previous_schedule(
+        {
+            "2024-1-1": (game_dates[1], "POSTPONED"),
+            "2024-2-1": (game_dates[2], "FINAL"),
+            "2024-3-1": (game_dates[3], "FINAL"),
+            "2024-4-1": (game_dates[4], "3RD QTR"),
+        }
+    )
+    previous_df["ufl_game_id"] = ["101", "102", "103", "104"]
+
+    season_json = {
+        "selectionGroupList": [
+            {
+                "title": "REGULAR SEASON",
+                "selectionList": [
+                    {"id": f"2024-{x}-1", "title": f"WEEK {x}", "uri": str(x)}
+                    for x in game_dates
+                ],
+            }
+        ]
+    }
+    downloaded_weeks = []
+
+    def get_fox_json(url: str, cache_key: str) -> dict:
+        if cache_key == f"schedule_{season}":
+            return season_json
+        week_num = int(url.split("?")[0])
+        downloaded_weeks.append(week_num)
+        return make_week(week_num, game_dates[week_num], "FINAL")
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(get_ufl_schedules, "get_fox_api_key", lambda: "key")
+    monkeypatch.setattr(get_ufl_schedules, "get_fox_json", get_fox_json)
+    monkeypatch.setattr(
+        get_ufl_schedules, "get_ufl_schedule", lambda season: previous_df
+    )
+
+    schedule_df = get_ufl_schedules.get_ufl_schedules(
+        season=season,
+        incremental=True,
+        max_workers=1,
+    )
+
+    assert downloaded_weeks == [1, 4]
+    assert schedule_df["week_id"].tolist() == [
+        "2024-1-1", "2024-2-1", "2024-3-1", "2024-4-1"
+    ]
+    assert schedule_df["game_status"].tolist() == [
+        "FINAL", "FINAL", "FINAL", "FINAL"
+    ]
+
+
+def test_refresh_window_is_anchored_on_today():
+    week_arr = [{"week_id": f"2024-{x}-1"} for x in range(1, 7)]
+    previous_df = make_previous_schedule(
+        {
+            "2024-1-1": ("2024-03-30", "POSTPONED"),
+            "2024-2-1": ("2024-04-06", "FINAL"),
+            "2024-3-1": ("2024-04-13", "FINAL"),
+            "2024-4-1": ("2024-04-20", ""),
+            "2024-5-1": ("2024-04-27", ""),
+            "2024-6-1": ("2024-05-04", ""),
+        }
+    )
+
+    download_week_arr = get_ufl_schedules.get_schedule_weeks_to_refresh(
+        week_arr=week_arr,
+        previous_df=previous_df,
+        lookahead_weeks=1,
+        today=datetime(2024, 4, 20, 15, 0),
+    )
+
+    # Week 1 (postponed) and week 4 (today) have started,
+    # week 5 is the one week of lookahead, and week 6 is reused.
+    assert [x["week_id"] for x in download_week_arr] == [
+        "2024-1-1", "2024-4-1", "2024-5-1"
+    ]
@@ -0,0 +1,93 @@
+import json
+from os import makedirs
+from os.path import dirname, join
+from shutil import copy
+
+import pandas as pd
+import pytest
+import requests
+
+import get_ufl_game_stats
+import get_ufl_pbp
+import utils
+
+REPO_DIR = dirname(dirname(__file__))
+
+
+@pytest.fixture
+def offline_archive(monkeypatch, tmp_path):
+    """
+    Copies two archived USFL games into a temporary folder,
+    and makes every HTTP request raise.
+    """
+    archive_dir = tmp_path / "usfl_game_logs"
+    makedirs(archive_dir)
+    for file_name in ("01.json", "02.json"):
+        copy(join(REPO_DIR, "usfl_game_logs", file_name), archive_dir)
+    copy(join(REPO_DIR, "teams.csv"), tmp_path)
+
+    for folder in ("game_stats/player", "game_stats/team", "pbp"):
+        makedirs(tmp_path / folder)
+
+    def blocked_request(*args, **kwargs):
+        raise AssertionError(f"Offline mode made a request: {args}")
+
+    monkeypatch.setattr(requests.Session, "request", blocked_request)
+    monkeypatch.setattr(
+        utils, "ARCHIVED_GAME_DIRS", ("raw_game_json", "usfl_game_logs")
+    )
+    monkeypatch.chdir(tmp_path)
+
+    with open(archive_dir / "01.json", "r") as f:
+        season = int(json.load(f)["header"]["eventTime"][:4])
+    return season
+
+
+def test_offline_game_stats_make_no_requests(offline_archive):
+    stats_df = get_ufl_game_stats.get_ufl_game_stats(
+        season=offline_archive,
+        parse_team_stats=True,
+        save_csv=True,
+        save_json=False,
+        offline=True
+    )
+
+    assert stats_df["game_id"].nunique() == 2
+
+
+def test_offline_pbp_makes_no_requests(offline_archive, monkeypatch):
+    # `parser()` can't handle the play descriptions in `usfl_game_logs/`
+    # yet, so only the offline download path is checked here.
+    monkeypatch.setattr(
+        get_ufl_pbp,
+        "parser",
+        lambda game_json, ufl_game_id, season, season_type, week:
+            pd.DataFrame({"ufl_game_id": [ufl_game_id], "week": [week]})
+    )
+    monkeypatch.setattr(
+        get_ufl_pbp,
+        "combine_ufl_pbp",
+        lambda pbp_df_arr, season, save_csv, save_parquet:
+            pd.concat(pbp_df_arr, ignore_index=True)
+    )
+
+    pbp_df = get_ufl_pbp.get_ufl_pbp(season=offline_archive, offline=True)
+
+    assert pbp_df["ufl_game_id"].nunique() == 2
+
+
+def test_raw_game_json_copy_wins(offline_archive, tmp_path):
+    with open(tmp_path / "usfl_game_logs" / "01.json", "r") as f:
+        game_json = json.load(f)
+
+    makedirs(tmp_path / "raw_game_json")
+    with open(tmp_path / "raw_game_json" / "copy.json", "w") as f:
+        f.write(json.dumps(game_json))
+
+    games_df = utils.get_archived_ufl_games(offline_archive)
+    game_df = games_df[
+        games_df["ufl_game_id"] == int(game_json["header"]["id"])
+    ]
+
+    assert len(game_df) == 1
+    assert game_df["file_path"].iloc[0].startswith("raw_game_json")
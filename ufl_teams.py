@@ -0,0 +1,344 @@
+"""
+# Creation Date: 10/18/2026 08:40 PM EDT
+# Last Updated Date: 10/18/2026 09:10 PM EDT
+# Author: Joseph Armstrong (armstrongjoseph08@gmail.com)
+# File Name: ufl_teams.py
+# Purpose: Allows one to look up UFL teams (and the XFL/USFL teams before them)
+    by any of their identifiers, without going to the FOX Sports API.
+###############################################################################
+"""
+
+import logging
+from os.path import exists
+
+import pandas as pd
+
+from utils import get_ufl_schedule
+
+# Columns in `teams.csv` that identify a team.
+# Each one gets its own index in `get_team_registry()`.
+TEAM_ID_COLUMNS = (
+    "stats_crew_team_id",
+    "fox_sports_team_id",
+    "fox_sports_analytics_name",
+    "team_name",
+)
+
+# `teams.csv`, once it has been loaded and indexed.
+_team_registry = None
+# Team indexes that were already built, by season.
+_team_index_cache = {}
+
+
+def load_teams_csv() -> pd.DataFrame:
+    """
+    Loads `teams.csv`.
+
+    Returns
+    ----------
+    A pandas `DataFrame` with every team in `teams.csv`.
+    Every column is loaded as text, and blank cells are `NaN`.
+    """
+    # `teams.csv` starts with a byte order mark (BOM).
+    return pd.read_csv("teams.csv", encoding="utf-8-sig", dtype=str)
+
+
+def get_team_registry(refresh: bool = False) -> dict:
+    """
+    Loads `teams.csv` (only once),
+    and indexes every team by every column in `TEAM_ID_COLUMNS`.
+
+    Not every team has every identifier
+    (ex. XFL and USFL teams don't have a FOX Sports team ID).
+    Blank identifiers are `None`, and aren't indexed.
+
+    Parameters
+    ----------
+
+    `refresh` (bool, optional):
+        If set to `True`, `teams.csv` is loaded again.
+
+    Returns
+    ----------
+    A `dict` with:
+    - `"teams"`: every team in `teams.csv`, as a `list` of `dict`s.
+    - `"by_season"`: for each column in `TEAM_ID_COLUMNS`,
+        a `dict` that maps `(season, identifier)` to a team.
+    - `"all_seasons"`: for each column in `TEAM_ID_COLUMNS`,
+        a `dict` that maps an identifier to every team
+        (in every season) with that identifier.
+    """
+    global _team_registry
+
+    if refresh is False and _team_registry is not None:
+        return _team_registry
+
+    try:
+        teams_df = load_teams_csv()
+    except FileNotFoundError as e:
+        logging.warning(
+            "Could not load `teams.csv`, so no teams can be looked up "
+            + f"in it. Full exception: {e}"
+        )
+        teams_df = pd.DataFrame(columns=["season", *TEAM_ID_COLUMNS])
+    teams_df = teams_df.astype(object).where(teams_df.notna(), None)
+
+    registry = {
+        "teams": [],
+        "by_season": {x: {} for x in TEAM_ID_COLUMNS},
+        "all_seasons": {x: {} for x in TEAM_ID_COLUMNS},
+    }
+
+    for team in teams_df.to_dict(orient="records"):
+        team["season"] = int(team["season"])
+        if team["fox_sports_team_id"] is not None:
+            team["fox_sports_team_id"] = int(team["fox_sports_team_id"])
+        registry["teams"].append(team)
+
+        for column in TEAM_ID_COLUMNS:
+            if team[column] is None:
+                continue
+            registry["by_season"][column][
+                (team["season"], team[column])
+            ] = team
+            registry["all_seasons"][column].setdefault(
+                team[column], []
+            ).append(team)
+
+    _team_registry = registry
+    return registry
+
+
+def find_team(column: str, identifier, season: int) -> dict | None:
+    """
+    Finds a team in `teams.csv` by one of its identifiers.
+
+    Parameters
+    ----------
+
+    `column` (str, mandatory):
+        The identifier type (one of `TEAM_ID_COLUMNS`).
+
+    `identifier` (str | int, mandatory):
+        The identifier of the team you want
+        (ex. `"XFLSLB"`, `8`, `"st-louis-battlehawks"`).
+
+    `season` (int, mandatory):
+        The season you want this team from.
+
+    Returns
+    ----------
+    A `dict` with this team's row in `teams.csv`,
+    or `None` if this team isn't in `teams.csv` for that season.
+    """
+    return get_team_registry()["by_season"][column].get(
+        (int(season), identifier)
+    )
+
+
+def find_teams(column: str, identifier) -> list:
+    """
+    Finds a team in every season (and league) in `teams.csv`.
+
+    Parameters
+    ----------
+
+    `column` (str, mandatory):
+        The identifier type (one of `TEAM_ID_COLUMNS`).
+
+    `identifier` (str | int, mandatory):
+        The identifier of the team you want
+        (ex. `"XFLSLB"` returns both the 2020 XFL
+        and the 2024 UFL St. Louis Battlehawks).
+
+    Returns
+    ----------
+    A `list` of `dict`s, one per season, in `teams.csv` order.
+    """
+    return get_team_registry()["all_seasons"][column].get(identifier, [])
+
+
+def get_event_teams(game_json: dict) -> tuple[dict, dict]:
+    """
+    Gets both teams in a FOX Sports event (game).
+
+    Parameters
+    ----------
+
+    `game_json` (dict, mandatory):
+        The raw game JSON from FOX Sports.
+
+    Returns
+    ----------
+    A `tuple` with two `dict`s, the away team and the home team
+    (in that order). Each one has the `team_id`, `team_abv`,
+    `team_analytics_id`, `team_name` and `team_nickname` of that team
+    (`None` if FOX Sports didn't include it),
+    and its `stats_crew_team_id` (`None` if it isn't in `teams.csv`).
+    """
+    season = int(str(game_json["header"]["eventTime"])[:4])
+    teams_arr = []
+
+    for side in ("leftTeam", "rightTeam"):
+        team = game_json["header"][side]
+        entity_link = team["entityLink"]
+        team_info = {
+            "team_id": int(entity_link["layout"]["tokens"]["id"]),
+            "team_abv": team["name"],
+            "team_analytics_id": entity_link.get("analyticsName"),
+            "team_name": team.get("alternateName"),
+            "team_nickname": (
+                str(team["longName"]).upper()
+                if team.get("longName") is not None else None
+            ),
+        }
+
+        csv_team = find_team(
+            "fox_sports_team_id", team_info["team_id"], season
+        )
+        if csv_team is None:
+            csv_team = find_team(
+                "fox_sports_analytics_name",
+                team_info["team_analytics_id"],
+                season
+            )
+        team_info["stats_crew_team_id"] = (
+            csv_team["stats_crew_team_id"] if csv_team is not None else None
+        )
+        teams_arr.append(team_info)
+
+    return teams_arr[0], teams_arr[1]
+
+
+def get_ufl_team_index(season: int, refresh: bool = False) -> dict:
+    """
+    Builds (or gets the cached) team index for a UFL season.
+
+    Teams come from `teams.csv`, and from the `away_team_id`
+    and `home_team_id` columns of the schedule for this season.
+    Team abbreviations come from this season's game stats
+    (`game_stats/player/{season}_ufl_player_game_stats.parquet`),
+    if that file is on this computer.
+
+    Parameters
+    ----------
+
+    `season` (int, mandatory):
+        The UFL season you want teams from.
+
+    `refresh` (bool, optional):
+        If set to `True`, the team index is rebuilt,
+        even if it was already built for this season.
+
+    Returns
+    ----------
+    A `dict` with three indexes, `"fox_id"`, `"abv"` and `"analytics_name"`.
+    Each one maps that identifier to a `dict` with the
+    `team_id`, `team_abv`, `team_analytics_name` and `team_name`
+    of that team.
+    """
+    if refresh is False and season in _team_index_cache:
+        return _team_index_cache[season]
+
+    teams_df_arr = []
+
+    teams_df_arr.append(
+        pd.DataFrame(
+            [
+                {
+                    "team_id": x["fox_sports_team_id"],
+                    "team_analytics_name": x["fox_sports_analytics_name"],
+                    "team_name": x["team_name"],
+                }
+                for x in get_team_registry()["teams"]
+                if x["season"] == season and
+                x["fox_sports_team_id"] is not None
+            ],
+            columns=["team_id", "team_analytics_name", "team_name"]
+        )
+    )
+
+    try:
+        schedule_df = get_ufl_schedule(season)
+    except Exception as e:
+        logging.warning(
+            f"Could not get the {season} UFL schedule. Full exception: {e}"
+        )
+        schedule_df = pd.DataFrame()
+
+    for side in ("away", "home"):
+        if f"{side}_team_id" not in schedule_df.columns:
+            continue
+        teams_df_arr.append(
+            pd.DataFrame(
+                {
+                    "team_id": schedule_df[f"{side}_team_id"],
+                    "team_analytics_name": schedule_df[
+                        f"{side}_team_analytics_name"
+                    ],
+                    "team_name": schedule_df[f"{side}_team_name"],
+                }
+            )
+        )
+
+    stats_path = f"game_stats/player/{season}_ufl_player_game_stats.parquet"
+    if exists(stats_path):
+        stats_df = pd.read_parquet(
+            stats_path, columns=["team_id", "team_abv"]
+        )
+        teams_df_arr.append(stats_df.drop_duplicates())
+
+    teams_df = pd.concat(teams_df_arr, ignore_index=True)
+    # Schedule games without a team yet (TBD) don't have a team ID.
+    teams_df = teams_df[teams_df["team_id"].notna()]
+    teams_df = teams_df.astype({"team_id": "int64"})
+
+    team_index = {
+        "fox_id": {},
+        "abv": {},
+        "analytics_name": {},
+    }
+
+    for team in teams_df.to_dict(orient="records"):
+        team_id = team["team_id"]
+        if team_id not in team_index["fox_id"]:
+            team_index["fox_id"][team_id] = {
+                "team_id": team_id,
+                "team_abv": None,
+                "team_analytics_name": None,
+                "team_name": None,
+            }
+        team_info = team_index["fox_id"][team_id]
+
+        # The first source with a value wins.
+        for key in ("team_abv", "team_analytics_name", "team_name"):
+            if team_info[key] is None and pd.notna(team.get(key)):
+                team_info[key] = team[key]
+
+    for team_info in team_index["fox_id"].values():
+        if team_info["team_abv"] is not None:
+            team_index["abv"][team_info["team_abv"]] = team_info
+        if team_info["team_analytics_name"] is not None:
+            team_index["analytics_name"][
+                team_info["team_analytics_name"]
+            ] = team_info
+
+    _team_index_cache[season] = team_index
+    return team_index
+
+
+def get_ufl_team_ids(season: int) -> list:
+    """
+    Gets the FOX Sports team ID of every UFL team in a season.
+
+    Parameters
+    ----------
+
+    `season` (int, mandatory):
+        The UFL season you want teams from.
+
+    Returns
+    ----------
+    A sorted `list` of FOX Sports team IDs.
+    """
+    return sorted(get_ufl_team_index(season)["fox_id"].keys())
@@ -1,6 +1,6 @@
 """
 # Creation Date: 03/29/2024 09:27 PM EDT
-# Last Updated Date: 03/29/2024 09:27 PM EDT
+# Last Updated Date: 10/19/2026 11:30 AM EDT
 # Author: Joseph Armstrong (armstrongjoseph08@gmail.com)
 # File Name: utils.py
 # Purpose: Holds utility functions that are not exclusive
@@ -8,10 +8,57 @@
 ###############################################################################
 """
 
+import gzip
 import json
 import logging
-from os import environ, mkdir
-from os.path import expanduser
+import random
+import threading
+import time
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from glob import glob
+from os import environ, makedirs, mkdir, replace
+from os.path import exists, expanduser, getmtime
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def write_file_atomic(
+    file_path: str,
+    data: bytes | str,
+    compress: bool = False,
+) -> None:
+    """
+    Writes `data` to `file_path`.
+
+    `data` is written to a temporary file first,
+    which then replaces `file_path`,
+    so an interrupted run never leaves a half-written file behind.
+
+    Parameters
+    ----------
+
+    `file_path` (str, mandatory):
+        The file you want to write.
+
+    `data` (bytes | str, mandatory):
+        What you want written to that file.
+
+    `compress` (bool, optional):
+        If set to `True`, `data` is compressed with gzip.
+    """
+    mode = "wb" if isinstance(data, bytes) else "wt"
+
+    if compress is True:
+        with gzip.open(f"{file_path}.tmp", mode) as f:
+            f.write(data)
+    else:
+        with open(f"{file_path}.tmp", mode) as f:
+            f.write(data)
+
+    replace(f"{file_path}.tmp", file_path)
 
 
 def format_folder_path(folder_path: str) -> str:
@@ -65,5 +112,661 @@ def get_fox_api_key() -> str:
         )
 
 
+# Default headers for every request to the FOX Sports API.
+FOX_API_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4)"
+    + " AppleWebKit/537.36 (KHTML, like Gecko) "
+    + "Chrome/147.0.7727.56 Safari/537.36",
+    "Accept-Encoding": "gzip, deflate",
+    # "Referer": "https://www.theufl.com/",
+}
+# (connect, read) timeouts, in seconds.
+FOX_API_TIMEOUT = (5, 30)
+# How many times a failed request is retried before giving up.
+FOX_API_MAX_RETRIES = 4
+# The base delay (in seconds) between retries.
+# This doubles after every failed attempt.
+FOX_API_BACKOFF = 0.5
+# HTTP status codes that are worth retrying.
+FOX_API_RETRY_STATUS = (429, 500, 502, 503, 504)
+# The longest we'll wait when the API asks us to slow down
+# (`Retry-After`), in seconds.
+FOX_API_MAX_RETRY_AFTER = 120
+
+# Where `get_fox_json()` keeps raw FOX Sports API responses.
+FOX_CACHE_DIR = "fox_api_cache"
+
+_fox_session = None
+_fox_session_lock = threading.Lock()
+
+
+class FoxApiRateLimiter:
+    """
+    A token bucket rate limiter for the FOX Sports API,
+    shared by every thread (and every script) in this process.
+
+    Requests can be sent in bursts of up to `burst` requests,
+    and after that, at a steady `rate` requests per second.
+
+    Parameters
+    ----------
+
+    `rate` (float, mandatory):
+        How many requests can be sent per second, on average.
+
+    `burst` (int, mandatory):
+        How many requests can be sent at once.
+
+    `request_budget` (int, optional):
+        The most requests that can be sent in one run.
+        If not set, there's no limit.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        request_budget: int = None,
+    ):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.request_budget = request_budget
+        self.requests_sent = 0
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Waits until another request can be sent.
+
+        Raises
+        ----------
+        `RuntimeError` if this run has used up its request budget.
+        """
+        while True:
+            with self._lock:
+                if (
+                    self.request_budget is not None and
+                    self.requests_sent >= self.request_budget
+                ):
+                    raise RuntimeError(
+                        "The FOX Sports API request budget for this run "
+                        + f"({self.request_budget} requests) has been used up."
+                    )
+
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst,
+                    self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    self.requests_sent += 1
+                    return
+
+                wait_time = max(
+                    self._paused_until - now,
+                    (1 - self._tokens) / self.rate
+                )
+
+            time.sleep(wait_time)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Stops every thread from sending requests for `seconds` seconds
+        (ex. after the API responds with `429 Too Many Requests`).
+        """
+        with self._lock:
+            self._paused_until = max(
+                self._paused_until, time.monotonic() + seconds
+            )
+            self._tokens = 0.0
+
+
+# Can be tuned with the `FOX_API_RATE`, `FOX_API_BURST`
+# and `FOX_API_REQUEST_BUDGET` environment variables.
+FOX_API_RATE_LIMITER = FoxApiRateLimiter(
+    rate=float(environ.get("FOX_API_RATE", 10)),
+    burst=int(environ.get("FOX_API_BURST", 20)),
+    request_budget=(
+        int(environ["FOX_API_REQUEST_BUDGET"])
+        if environ.get("FOX_API_REQUEST_BUDGET")
+        else None
+    ),
+)
+
+
+def get_retry_after(response: requests.Response) -> float | None:
+    """
+    Gets how long the API asked us to wait
+    (the `Retry-After` header of a response), in seconds.
+
+    Parameters
+    ----------
+
+    `response` (requests.Response, mandatory):
+        The response from the API.
+
+    Returns
+    ----------
+    The wait time in seconds (capped at `FOX_API_MAX_RETRY_AFTER`),
+    or `None` if the response doesn't have a usable `Retry-After` header.
+    """
+    retry_after = response.headers.get("Retry-After")
+
+    if retry_after is None:
+        return None
+
+    try:
+        # ex. "Retry-After: 30"
+        wait_time = float(retry_after)
+    except ValueError:
+        # ex. "Retry-After: Sun, 18 Oct 2026 22:00:00 GMT"
+        try:
+            retry_datetime = parsedate_to_datetime(retry_after)
+            wait_time = retry_datetime.timestamp() - time.time()
+        except Exception as e:
+            logging.warning(
+                f"Could not parse `Retry-After: {retry_after}`. "
+                + f"Full exception: {e}"
+            )
+            return None
+
+    return min(max(0.0, wait_time), FOX_API_MAX_RETRY_AFTER)
+
+
+def get_fox_session() -> requests.Session:
+    """
+    Gets the shared `requests.Session` used for the FOX Sports API.
+
+    The session is only created once, and it is shared by every thread,
+    so connections to `api.foxsports.com` are kept alive and reused,
+    instead of opening a new connection for every request.
+
+    Returns
+    ----------
+    A `requests.Session` object.
+    """
+    global _fox_session
+
+    with _fox_session_lock:
+        if _fox_session is None:
+            session = requests.Session()
+            session.headers.update(FOX_API_HEADERS)
+            # `pool_maxsize` should be at least
+            # the largest `max_workers` used by any script.
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _fox_session = session
+
+    return _fox_session
+
+
+def fox_api_get(
+    url: str,
+    headers: dict = None,
+    timeout: tuple = FOX_API_TIMEOUT,
+) -> requests.Response:
+    """
+    Sends a GET request to the FOX Sports API
+    through the shared session (see `get_fox_session()`).
+
+    Every request waits for `FOX_API_RATE_LIMITER` first.
+    Connection errors, timeouts, and server errors
+    (see `FOX_API_RETRY_STATUS`) are retried up to
+    `FOX_API_MAX_RETRIES` times, with exponential backoff and jitter.
+    If the API responds with `429 Too Many Requests`,
+    every request waits for as long as the `Retry-After` header asks.
+
+    Parameters
+    ----------
+
+    `url` (str, mandatory):
+        The URL you want to download.
+
+    `headers` (dict, optional):
+        Extra HTTP headers for this request.
+        These are added on top of `FOX_API_HEADERS`.
+
+    `timeout` (tuple, optional):
+        The (connect, read) timeouts for this request, in seconds.
+
+    Returns
+    ----------
+    A `requests.Response` object.
+
+    Raises
+    ----------
+    `requests.HTTPError` if the API still responds with an error
+    after every retry.
+
+    `RuntimeError` if this run has used up its request budget
+    (see `FoxApiRateLimiter`).
+    """
+    session = get_fox_session()
+    attempt = 0
+
+    while True:
+        FOX_API_RATE_LIMITER.acquire()
+        try:
+            response = session.get(url, headers=headers, timeout=timeout)
+        except (
+            requests.ConnectionError,
+            requests.Timeout
+        ) as e:
+            if attempt >= FOX_API_MAX_RETRIES:
+                raise
+            logging.warning(
+                f"FOX Sports API request failed ({type(e).__name__}). "
+                + "Retrying."
+            )
+        else:
+            if (
+                response.status_code not in FOX_API_RETRY_STATUS or
+                attempt >= FOX_API_MAX_RETRIES
+            ):
+                response.raise_for_status()
+                return response
+            logging.warning(
+                "FOX Sports API responded with "
+                + f"HTTP {response.status_code}. Retrying."
+            )
+
+            retry_after = get_retry_after(response)
+            if response.status_code == 429 or retry_after is not None:
+                # Slow down every thread, not just this one.
+                if retry_after is None:
+                    retry_after = FOX_API_BACKOFF * (2 ** attempt)
+                FOX_API_RATE_LIMITER.pause(retry_after)
+                attempt += 1
+                continue
+
+        # Full jitter, so concurrent requests don't all retry at once.
+        time.sleep(random.uniform(0, FOX_API_BACKOFF * (2 ** attempt)))
+        attempt += 1
+
+
+def get_fox_json(
+    url: str,
+    cache_key: str,
+    headers: dict = None,
+) -> dict:
+    """
+    Downloads a JSON file from the FOX Sports API,
+    with an on-disk cache.
+
+    Each response is saved (gzip-compressed) to
+    `{FOX_CACHE_DIR}/{cache_key}.json.gz`,
+    along with its `ETag` and `Last-Modified` headers
+    in `{FOX_CACHE_DIR}/{cache_key}.meta.json`.
+    The next request for the same `cache_key` is sent as a
+    conditional request, and if the API responds with
+    `304 Not Modified`, the cached response is used instead.
+
+    Parameters
+    ----------
+
+    `url` (str, mandatory):
+        The URL you want to download.
+
+    `cache_key` (str, mandatory):
+        A unique name for this response in the cache
+        (ex. `"event_12345"`).
+
+    `headers` (dict, optional):
+        Extra HTTP headers for this request.
+        These are added on top of `FOX_API_HEADERS`.
+
+    Returns
+    ----------
+    A `dict` with the downloaded JSON.
+    """
+    body_path = f"{FOX_CACHE_DIR}/{cache_key}.json.gz"
+    meta_path = f"{FOX_CACHE_DIR}/{cache_key}.meta.json"
+    request_headers = dict(headers or {})
+    cache_meta = {}
+
+    if exists(body_path) and exists(meta_path):
+        try:
+            with open(meta_path, "r") as f:
+                cache_meta = json.loads(f.read())
+        except Exception as e:
+            logging.warning(
+                f"Could not read `{meta_path}`. Full exception: {e}"
+            )
+            cache_meta = {}
+
+    if cache_meta.get("etag") is not None:
+        request_headers["If-None-Match"] = cache_meta["etag"]
+    if cache_meta.get("last_modified") is not None:
+        request_headers["If-Modified-Since"] = cache_meta["last_modified"]
+
+    response = fox_api_get(url=url, headers=request_headers)
+
+    if response.status_code == 304 and len(cache_meta) > 0:
+        with gzip.open(body_path, "rb") as f:
+            return json.loads(f.read())
+
+    json_data = json.loads(response.content)
+
+    if response.status_code == 200:
+        makedirs(FOX_CACHE_DIR, exist_ok=True)
+        write_file_atomic(body_path, response.content, compress=True)
+        write_file_atomic(
+            meta_path,
+            json.dumps(
+                {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "downloaded": datetime.now().isoformat(),
+                },
+                indent=4
+            )
+        )
+
+    return json_data
+
+
+def get_ufl_event_json(
+    ufl_game_id: int,
+    fox_key: str,
+    headers: dict = None
+) -> dict:
+    """
+    Downloads the FOX Sports event data (the raw game JSON)
+    for a single UFL game.
+
+    Parameters
+    ----------
+
+    `ufl_game_id` (int, mandatory):
+        The UFL game ID (FOX Sports event ID) of the game.
+
+    `fox_key` (str, mandatory):
+        The FOX Sports API key.
+
+    `headers` (dict, optional):
+        Extra HTTP headers for this request.
+        These are added on top of `FOX_API_HEADERS`.
+
+    Returns
+    ----------
+    A `dict` with the raw game JSON.
+    """
+    url = (
+        "https://api.foxsports.com/bifrost/v1/ufl/event/"
+        + f"{ufl_game_id}/data?apikey={fox_key}"
+    )
+    return get_fox_json(
+        url=url,
+        headers=headers,
+        cache_key=f"event_{int(ufl_game_id)}"
+    )
+
+
+# How old (in seconds) a local copy of a UFL schedule can be
+# before `get_ufl_schedule()` downloads it again.
+SCHEDULE_MAX_AGE = 30 * 60
+
+
+def get_ufl_schedule(
+    season: int,
+    max_age: int = SCHEDULE_MAX_AGE,
+) -> pd.DataFrame:
+    """
+    Gets the UFL schedule for a season,
+    without going to GitHub if a recent enough copy is on this computer.
+
+    In order, this checks:
+    1. `schedule/{season}_ufl_schedule.parquet`
+        (the output of `get_ufl_schedules.py`).
+    2. A cached copy of the release asset,
+        in `{FOX_CACHE_DIR}/{season}_ufl_schedule.parquet`.
+    3. The `ufl-schedule` release asset on GitHub
+        (which is then cached).
+
+    If GitHub can't be reached, the newest local copy is used instead,
+    no matter how old it is.
+
+    Parameters
+    ----------
+
+    `season` (int, mandatory):
+        The UFL season you want the schedule for.
+
+    `max_age` (int, optional):
+        How old (in seconds) a local copy can be, and still be used.
+
+    Returns
+    ----------
+    A pandas `DataFrame` with the UFL schedule.
+    """
+    local_paths = [
+        f"schedule/{season}_ufl_schedule.parquet",
+        f"{FOX_CACHE_DIR}/{season}_ufl_schedule.parquet",
+    ]
+    cache_path = local_paths[-1]
+    url = (
+        "https://github.com/armstjc/ufl-data-repository/releases/"
+        + f"download/ufl-schedule/{season}_ufl_schedule.parquet"
+    )
+
+    local_paths = [x for x in local_paths if exists(x)]
+    local_paths.sort(key=getmtime, reverse=True)
+
+    for file_path in local_paths:
+        if time.time() - getmtime(file_path) <= max_age:
+            logging.info(f"Using the UFL schedule in `{file_path}`.")
+            return pd.read_parquet(file_path)
+
+    try:
+        response = get_fox_session().get(url, timeout=FOX_API_TIMEOUT)
+        response.raise_for_status()
+    except Exception as e:
+        if len(local_paths) == 0:
+            raise
+        logging.warning(
+            f"Could not download the {season} UFL schedule. "
+            + f"Using `{local_paths[0]}` instead. Full exception: {e}"
+        )
+        return pd.read_parquet(local_paths[0])
+
+    makedirs(FOX_CACHE_DIR, exist_ok=True)
+    write_file_atomic(cache_path, response.content)
+
+    return pd.read_parquet(cache_path)
+
+
+def get_played_ufl_games(season: int) -> pd.DataFrame:
+    """
+    Gets the UFL games in a season that have already kicked off.
+
+    If no games have kicked off yet,
+    this returns the week 1 games instead.
+
+    Parameters
+    ----------
+
+    `season` (int, mandatory):
+        The UFL season you want games from.
+
+    Returns
+    ----------
+    A pandas `DataFrame` with the UFL schedule for those games.
+    """
+    schedule_df = get_ufl_schedule(season)
+    full_schedule_df = schedule_df.copy()
+
+    # schedule_df = schedule_df[
+    #     (schedule_df["away_score"] > -1) | (schedule_df["home_score"] > -1)
+    # ]
+    schedule_df = schedule_df.astype(
+        {
+            "game_date": "datetime64[ms]"
+        },
+    )
+
+    schedule_df = schedule_df[
+        schedule_df["game_date"] <= datetime.now()
+    ]
+
+    if len(schedule_df) == 0:
+        schedule_df = full_schedule_df[
+            full_schedule_df["week_num"] == 1
+        ]
+
+    return schedule_df
+
+
+# Folders with archived FOX Sports event JSON files,
+# used by `get_archived_ufl_games()`.
+ARCHIVED_GAME_DIRS = ("raw_game_json", "usfl_game_logs")
+
+
+def load_archived_game_json(file_path: str) -> dict:
+    """
+    Loads an archived FOX Sports event JSON file.
+
+    Parameters
+    ----------
+
+    `file_path` (str, mandatory):
+        The path to the archived `.json` file.
+
+    Returns
+    ----------
+    A `dict` with the raw game JSON.
+    """
+    with open(file_path, "r") as f:
+        return json.loads(f.read())
+
+
+def get_archived_ufl_games(season: int) -> pd.DataFrame:
+    """
+    Gets every archived game in a season,
+    without an API key or an internet connection.
+
+    Games are read from the folders in `ARCHIVED_GAME_DIRS`.
+    The season type and week of each game come from the local schedule
+    (`schedule/{season}_ufl_schedule.parquet`) if it has that game,
+    and from the game's canonical URL otherwise.
+
+    Parameters
+    ----------
+
+    `season` (int, mandatory):
+        The UFL season you want games from.
+
+    Returns
+    ----------
+    A pandas `DataFrame` with the same columns `get_played_ufl_games()`
+    uses (`ufl_game_id`, `season_type`, `week_title`),
+    plus the path to each archived game in `file_path`,
+    sorted by kickoff time.
+    """
+    games_df = pd.DataFrame()
+    games_df_arr = []
+
+    for archive_dir in ARCHIVED_GAME_DIRS:
+        for file_path in sorted(glob(f"{archive_dir}/*.json")):
+            try:
+                game_json = load_archived_game_json(file_path)
+                game_header = game_json["header"]
+                game_datetime = datetime.fromisoformat(
+                    game_header["eventTime"]
+                )
+            except Exception as e:
+                logging.warning(
+                    f"Could not read `{file_path}`. Full exception: {e}"
+                )
+                continue
+
+            if game_datetime.year != season:
+                continue
+
+            canonical_url = str(
+                game_json.get("metadata", {}).get(
+                    "parameters", {}
+                ).get("canonicalUrl", "")
+            ).lower()
+
+            if "championship" in canonical_url:
+                season_type = "PLAYOFFS"
+                week_title = "Championship"
+            elif (
+                "playoffs" in canonical_url or
+                "semifinals" in canonical_url
+            ):
+                season_type = "PLAYOFFS"
+                week_title = "Playoffs"
+            else:
+                # ex. "/usfl/week-3-pittsburgh-maulers-vs-..."
+                season_type = "REGULAR SEASON"
+                week_title = "Week " + canonical_url.split(
+                    "week-"
+                )[-1].split("-")[0]
+
+            games_df_arr.append(
+                pd.DataFrame(
+                    {
+                        "ufl_game_id": int(game_header["id"]),
+                        "season_type": season_type,
+                        "week_title": week_title,
+                        "game_datetime": game_datetime,
+                        "file_path": file_path,
+                    },
+                    index=[0]
+                )
+            )
+            del game_json
+
+    if len(games_df_arr) == 0:
+        logging.warning(f"No archived games found for the {season} season.")
+        return pd.DataFrame(
+            columns=[
+                "ufl_game_id", "season_type", "week_title", "file_path"
+            ]
+        )
+
+    games_df = pd.concat(games_df_arr, ignore_index=True)
+    # If a game was archived more than once, keep the first copy
+    # (`raw_game_json/` is checked before `usfl_game_logs/`).
+    # This has to happen before sorting, because every copy of a game
+    # has the same kickoff time and game ID.
+    games_df.drop_duplicates(
+        subset=["ufl_game_id"], keep="first", inplace=True, ignore_index=True
+    )
+    games_df.sort_values(
+        ["game_datetime", "ufl_game_id"], inplace=True, ignore_index=True
+    )
+
+    schedule_path = f"schedule/{season}_ufl_schedule.parquet"
+    if exists(schedule_path):
+        schedule_df = pd.read_parquet(
+            schedule_path,
+            columns=["ufl_game_id", "season_type", "week_title"]
+        )
+        schedule_df = schedule_df.astype({"ufl_game_id": "int64"})
+        games_df = games_df.merge(
+            schedule_df,
+            on="ufl_game_id",
+            how="left",
+            suffixes=("_archive", "")
+        )
+        games_df["season_type"] = games_df["season_type"].fillna(
+            games_df["season_type_archive"]
+        )
+        games_df["week_title"] = games_df["week_title"].fillna(
+            games_df["week_title_archive"]
+        )
+
+    return games_df[["ufl_game_id", "season_type", "week_title", "file_path"]]
+
+
 if __name__ == "__main__":
     print(get_fox_api_key())